@@ -0,0 +1,172 @@
+import threading
+import uuid
+from collections import Counter, defaultdict
+from time import time
+
+from django.core.cache import caches
+from django_redis import get_redis_connection
+
+#: Activity counted for each asset, in the order charts list it
+ACTIVITY_EVENTS = ("saved", "submitted", "accepted", "rejected", "reserved")
+
+# Counts are kept per minute until they are compacted into the database.
+# Unclaimed minutes expire after this long, so a stopped compaction task
+# can't fill the cache.
+MINUTE_RETENTION = 2 * 24 * 60 * 60
+
+
+class ActivityCounter:
+    """
+    Count activity per asset in one-minute buckets.
+
+    Counting by asset means callers don't need to look anything up; counts
+    are grouped by campaign when they are compacted.
+
+    Each minute is a hash in Redis of ``"<asset ID>:<event>"`` to a count,
+    and a sorted set indexes the minutes which have counts, so increments are
+    a single round trip however many web processes are counting. Other
+    backends, such as the local-memory cache used in tests, fall back to a
+    dictionary updated under a process-wide lock.
+    """
+
+    def __init__(self, prefix: str = "activity_series", cache_alias: str = "default"):
+        self.prefix = prefix
+        self.cache_alias = cache_alias
+        self._lock = threading.Lock()
+
+    def _minute_key(self, minute: int) -> str:
+        return f"{self.prefix}:{minute}"
+
+    def increment(self, asset_id: int, event: str) -> None:
+        """
+        Count one `event` for an asset in the current minute.
+
+        Args:
+            asset_id (int): ID of the asset the activity belongs to.
+            event (str): One of `ACTIVITY_EVENTS`.
+        """
+        if event not in ACTIVITY_EVENTS:
+            raise ValueError(f"Unknown activity event {event!r}")
+        minute = int(time() // 60) * 60
+        field = f"{asset_id}:{event}"
+        cache = caches[self.cache_alias]
+        try:
+            connection = get_redis_connection(self.cache_alias)
+        except NotImplementedError:
+            with self._lock:
+                counts = cache.get(self.prefix, {})
+                counts.setdefault(minute, Counter())[field] += 1
+                cache.set(self.prefix, counts, MINUTE_RETENTION)
+            return
+
+        key = cache.make_key(self._minute_key(minute))
+        pipeline = connection.pipeline(transaction=False)
+        pipeline.hincrby(key, field, 1)
+        pipeline.expire(key, MINUTE_RETENTION)
+        pipeline.zadd(cache.make_key(self.prefix), {minute: minute})
+        pipeline.execute()
+
+    def claim_minutes(self, before: int) -> dict[int, dict[tuple[int, str], int]]:
+        """
+        Set aside the counts for every minute before a time and return them.
+
+        Claimed counts stay in the cache until `release_claimed` is called,
+        so callers should only release them once they have been stored. If
+        they never are, for example because the worker was stopped, the next
+        call returns them again along with any newly claimed minutes.
+
+        Args:
+            before (int): Unix timestamp. Minutes starting before it are
+                claimed; callers should leave the current minute, which may
+                still be counting.
+
+        Returns:
+            dict[int, dict[tuple[int, str], int]]: Counts of every claimed
+                minute keyed by the minute's Unix timestamp and then by
+                ``(asset_id, event)``.
+        """
+        cache = caches[self.cache_alias]
+        claimed = defaultdict(Counter)
+        try:
+            connection = get_redis_connection(self.cache_alias)
+        except NotImplementedError:
+            with self._lock:
+                counts = cache.get(self.prefix, {})
+                claimed.update(cache.get(self._claimed_key, {}))
+                for minute in [minute for minute in counts if minute < before]:
+                    claimed[minute].update(counts.pop(minute))
+                cache.set(self._claimed_key, dict(claimed), MINUTE_RETENTION)
+                cache.set(self.prefix, counts, MINUTE_RETENTION)
+            return self._parse_counts(claimed)
+
+        index_key = cache.make_key(self.prefix)
+        claimed_key = cache.make_key(self._claimed_key)
+        minutes = connection.zrangebyscore(index_key, "-inf", f"({before}")
+        for minute in map(int, minutes):
+            # Each claim gets its own key, so a minute counted again after
+            # it was claimed never overwrites an unreleased claim
+            name = f"{minute}:{uuid.uuid4().hex}"
+            pipeline = connection.pipeline(transaction=True)
+            pipeline.rename(
+                cache.make_key(self._minute_key(minute)), self._claim_key(cache, name)
+            )
+            pipeline.zrem(index_key, minute)
+            pipeline.sadd(claimed_key, name)
+            # The minute may have expired after it was indexed, in which
+            # case the rename fails and the claim is empty
+            pipeline.execute(raise_on_error=False)
+
+        for name in connection.smembers(claimed_key):
+            name = name.decode()
+            minute = int(name.split(":", 1)[0])
+            for field, count in connection.hgetall(
+                self._claim_key(cache, name)
+            ).items():
+                claimed[minute][field.decode()] += int(count)
+        return self._parse_counts(claimed)
+
+    def release_claimed(self) -> None:
+        """
+        Delete the counts returned by `claim_minutes` once they are stored.
+        """
+        cache = caches[self.cache_alias]
+        try:
+            connection = get_redis_connection(self.cache_alias)
+        except NotImplementedError:
+            with self._lock:
+                cache.delete(self._claimed_key)
+            return
+
+        claimed_key = cache.make_key(self._claimed_key)
+        names = [name.decode() for name in connection.smembers(claimed_key)]
+        if names:
+            pipeline = connection.pipeline(transaction=True)
+            pipeline.delete(*(self._claim_key(cache, name) for name in names))
+            pipeline.srem(claimed_key, *names)
+            pipeline.execute()
+
+    @property
+    def _claimed_key(self) -> str:
+        return f"{self.prefix}:claimed"
+
+    def _claim_key(self, cache, name: str) -> str:
+        return cache.make_key(f"{self._claimed_key}:{name}")
+
+    @classmethod
+    def _parse_counts(
+        cls, claimed: dict[int, Counter]
+    ) -> dict[int, dict[tuple[int, str], int]]:
+        return {
+            minute: {cls._parse_field(field): count for field, count in counts.items()}
+            for minute, counts in claimed.items()
+            if counts
+        }
+
+    @staticmethod
+    def _parse_field(field: str) -> tuple[int, str]:
+        asset_id, event = field.split(":", 1)
+        return int(asset_id), event
+
+
+#: Counts transcription and reservation activity for the activity charts
+activity_counter = ActivityCounter()
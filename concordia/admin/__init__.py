@@ -7,6 +7,7 @@ from typing import Any
 from django.contrib import admin, messages
 from django.contrib.admin.models import CHANGE, LogEntry
 from django.contrib.admin.options import get_content_type_for_model
+from django.contrib.admin.widgets import AutocompleteSelect
 from django.contrib.auth import get_permission_codename
 from django.contrib.auth.admin import UserAdmin
 from django.contrib.auth.decorators import permission_required
@@ -29,7 +30,11 @@ from django.utils.http import url_has_allowed_host_and_scheme
 from django.views.decorators.csrf import csrf_protect
 
 from exporter import views as exporter_views
-from exporter.tabular_export.admin import export_to_csv_action, export_to_excel_action
+from exporter.tabular_export.admin import (
+    export_to_csv_action,
+    export_to_excel_action,
+    export_to_parquet_action,
+)
 from exporter.tabular_export.core import export_to_csv_response, flatten_queryset
 from importer.tasks.items import import_items_into_project_from_url
 
@@ -119,6 +124,7 @@ from .forms import (
     ProjectTopicInlineForm,
     TopicAdminForm,
 )
+from .paginators import EstimatedCountPaginator
 
 logger = logging.getLogger(__name__)
 
@@ -131,6 +137,9 @@ class ConcordiaUserAdmin(UserAdmin):
     CSV and Excel export actions.
     """
 
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
     list_display = (
         "username",
         "email",
@@ -273,6 +282,20 @@ class CustomListDisplayFieldsMixin:
             return ""
 
 
+class ProjectAutocompleteFilterMediaMixin:
+    """
+    Include the autocomplete widget's assets on changelists whose project
+    filter is loaded through autocomplete rather than listed inline.
+    """
+
+    @property
+    def media(self):
+        project_widget = AutocompleteSelect(
+            Item._meta.get_field("project"), self.admin_site
+        )
+        return super().media + project_widget.media
+
+
 @admin.register(Campaign)
 class CampaignAdmin(admin.ModelAdmin, CustomListDisplayFieldsMixin):
     """
@@ -391,6 +414,11 @@ class CampaignAdmin(admin.ModelAdmin, CustomListDisplayFieldsMixin):
                 exporter_views.ExportCampaignToCSV.as_view(),
                 name=f"{app_label}_{model_name}_export-csv",
             ),
+            path(
+                "exportParquet/<path:campaign_slug>",
+                exporter_views.ExportCampaignToParquet.as_view(),
+                name=f"{app_label}_{model_name}_export-parquet",
+            ),
             path(
                 "exportBagIt/<path:campaign_slug>",
                 exporter_views.ExportCampaignToBagIt.as_view(),
@@ -884,6 +912,11 @@ class ProjectAdmin(admin.ModelAdmin, CustomListDisplayFieldsMixin):
                 exporter_views.ExportProjectToCSV.as_view(),
                 name=f"{app_label}_{model_name}_export-csv",
             ),
+            path(
+                "exportParquet/<path:campaign_slug>/<path:project_slug>/",
+                exporter_views.ExportProjectToParquet.as_view(),
+                name=f"{app_label}_{model_name}_export-parquet",
+            ),
         ]
 
         return custom_urls + urls
@@ -972,7 +1005,10 @@ class ProjectAdmin(admin.ModelAdmin, CustomListDisplayFieldsMixin):
 
 
 @admin.register(Item)
-class ItemAdmin(admin.ModelAdmin):
+class ItemAdmin(ProjectAutocompleteFilterMediaMixin, admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
     form = ItemAdminForm
     list_display = ("title", "item_id", "campaign_title", "project", "published")
     list_display_links = ("title", "item_id")
@@ -1090,6 +1126,9 @@ class ItemAdmin(admin.ModelAdmin):
 class AssetTranscriptionReservationAdmin(
     admin.ModelAdmin, CustomListDisplayFieldsMixin
 ):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
     list_display = (
         "created_on",
         "updated_on",
@@ -1102,7 +1141,12 @@ class AssetTranscriptionReservationAdmin(
 
 
 @admin.register(Asset)
-class AssetAdmin(admin.ModelAdmin, CustomListDisplayFieldsMixin):
+class AssetAdmin(
+    ProjectAutocompleteFilterMediaMixin, admin.ModelAdmin, CustomListDisplayFieldsMixin
+):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
     list_display = (
         "published",
         "transcription_status",
@@ -1140,6 +1184,7 @@ class AssetAdmin(admin.ModelAdmin, CustomListDisplayFieldsMixin):
         unpublish_action,
         export_to_csv_action,
         export_to_excel_action,
+        export_to_parquet_action,
         verify_assets_action,
     )
     status_action_names = (
@@ -1325,6 +1370,9 @@ class AssetAdmin(admin.ModelAdmin, CustomListDisplayFieldsMixin):
 
 @admin.register(Tag)
 class TagAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
     list_display = ("id", "value")
     list_display_links = ("id", "value")
     list_filter = (TagCampaignStatusListFilter, TagCampaignListFilter)
@@ -1396,6 +1444,9 @@ class TagAdmin(admin.ModelAdmin):
 
 @admin.register(UserAssetTagCollection)
 class UserAssetTagCollectionAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
     list_display = ("id", "asset", "user", "created_on", "updated_on")
     list_display_links = ("id", "asset")
     date_hierarchy = "created_on"
@@ -1409,7 +1460,7 @@ class UserAssetTagCollectionAdmin(admin.ModelAdmin):
 
 
 @admin.register(Transcription)
-class TranscriptionAdmin(admin.ModelAdmin):
+class TranscriptionAdmin(ProjectAutocompleteFilterMediaMixin, admin.ModelAdmin):
     list_display = (
         "id",
         "asset",
@@ -1469,6 +1520,7 @@ class TranscriptionAdmin(admin.ModelAdmin):
         "ocr_originated",
     )
 
+    paginator = EstimatedCountPaginator
     show_full_result_count = False
 
     def get_queryset(
@@ -1581,7 +1633,26 @@ class TranscriptionAdmin(admin.ModelAdmin):
             self, request, queryset, field_names=self.EXPORT_FIELDS
         )
 
-    actions = (export_to_csv, export_to_excel)
+    def export_to_parquet(
+        self,
+        request: HttpRequest,
+        queryset: QuerySet[Transcription],
+    ) -> HttpResponse:
+        """
+        Export selected transcriptions as a Parquet file.
+
+        Args:
+            request (HttpRequest): Current admin request.
+            queryset (QuerySet[Transcription]): Transcriptions to export.
+
+        Returns:
+            HttpResponse: Response that streams a Parquet download.
+        """
+        return export_to_parquet_action(
+            self, request, queryset, field_names=self.EXPORT_FIELDS
+        )
+
+    actions = (export_to_csv, export_to_excel, export_to_parquet)
 
 
 @admin.register(CarouselSlide)
@@ -1603,6 +1674,9 @@ class SimplePageAdmin(admin.ModelAdmin):
 
 @admin.register(SiteReport)
 class SiteReportAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
     list_display = ("created_on", "report_type")
     readonly_fields = (
         "created_on",
@@ -1778,11 +1852,33 @@ class SiteReportAdmin(admin.ModelAdmin):
             self, request, queryset, field_names=SiteReport.DEFAULT_EXPORT_FIELDNAMES
         )
 
-    actions = (export_to_csv, export_to_excel)
+    def export_to_parquet(
+        self,
+        request: HttpRequest,
+        queryset: QuerySet[SiteReport],
+    ) -> HttpResponse:
+        """
+        Export selected site reports as a Parquet file.
+
+        Args:
+            request (HttpRequest): Current admin request.
+            queryset (QuerySet[SiteReport]): Site reports to export.
+
+        Returns:
+            HttpResponse: Response that streams a Parquet download.
+        """
+        return export_to_parquet_action(
+            self, request, queryset, field_names=SiteReport.DEFAULT_EXPORT_FIELDNAMES
+        )
+
+    actions = (export_to_csv, export_to_excel, export_to_parquet)
 
 
 @admin.register(UserProfileActivity)
 class UserProfileActivityAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
     list_display = (
         "id",
         "user",
@@ -1901,6 +1997,9 @@ class GuideAdmin(admin.ModelAdmin):
 
 @admin.register(NextTranscribableCampaignAsset)
 class NextTranscribableCampaignAssetAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
     list_display = (
         "asset",
         "transcription_status",
@@ -1932,6 +2031,9 @@ class NextTranscribableCampaignAssetAdmin(admin.ModelAdmin):
 
 @admin.register(NextReviewableCampaignAsset)
 class NextReviewableCampaignAssetAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
     list_display = (
         "asset",
         "campaign",
@@ -1958,6 +2060,9 @@ class NextReviewableCampaignAssetAdmin(admin.ModelAdmin):
 
 @admin.register(NextTranscribableTopicAsset)
 class NextTranscribableTopicAssetAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
     list_display = (
         "asset",
         "transcription_status",
@@ -1989,6 +2094,9 @@ class NextTranscribableTopicAssetAdmin(admin.ModelAdmin):
 
 @admin.register(NextReviewableTopicAsset)
 class NextReviewableTopicAssetAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
     list_display = (
         "asset",
         "topic",
@@ -16,6 +16,7 @@ from ..models import (
     Transcription,
     TranscriptionStatus,
 )
+from ..utils.page_cache import invalidate_page_cache
 from .utils import _bulk_change_status
 
 logger = getLogger(__name__)
@@ -90,6 +91,8 @@ def publish_item_action(
         published=True
     )
 
+    # Bulk updates do not send the signals which invalidate cached pages
+    invalidate_page_cache()
     messages.info(
         request,
         f"Published {count} items and {asset_count} assets",
@@ -126,6 +129,7 @@ def unpublish_item_action(
         published=False
     )
 
+    invalidate_page_cache()
     messages.info(
         request,
         f"Unpublished {count} items and {asset_count} assets",
@@ -155,6 +159,7 @@ def publish_action(
         None
     """
     count = queryset.filter(published=False).update(published=True)
+    invalidate_page_cache()
     messages.info(request, f"Published {count} objects", fail_silently=True)
 
 
@@ -180,6 +185,7 @@ def unpublish_action(
         None
     """
     count = queryset.filter(published=True).update(published=False)
+    invalidate_page_cache()
     messages.info(request, f"Unpublished {count} objects", fail_silently=True)
 
 
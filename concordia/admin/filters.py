@@ -3,6 +3,11 @@ from django.db.models import Exists, OuterRef
 from django.utils.translation import gettext_lazy as _
 
 from ..models import Campaign, Project, Topic, Transcription
+from ..utils.admin_filter_cache import get_cached_filter_options
+
+# Option lists which depend on rows other than campaigns, projects and topics
+# aren't invalidated by saves, so they're only cached briefly
+SHORT_FILTER_OPTIONS_CACHE_TIMEOUT = 5 * 60
 
 
 class NullableTimestampFilter(admin.SimpleListFilter):
@@ -75,10 +80,15 @@ class CampaignListFilter(admin.SimpleListFilter):
     template = "admin/long_name_filter.html"
 
     def lookups(self, request, model_admin):
-        queryset = Campaign.objects.exclude(status=Campaign.Status.RETIRED)
-        if self.status_filter_parameter in request.GET:
-            queryset = queryset.filter(status=request.GET[self.status_filter_parameter])
-        return queryset.values_list("id", "title").order_by("title")
+        status = request.GET.get(self.status_filter_parameter)
+
+        def build():
+            queryset = Campaign.objects.exclude(status=Campaign.Status.RETIRED)
+            if status is not None:
+                queryset = queryset.filter(status=status)
+            return queryset.values_list("id", "title").order_by("title")
+
+        return get_cached_filter_options(f"campaigns:{status}", build)
 
     def queryset(self, request, queryset):
         if self.value():
@@ -126,8 +136,9 @@ class TopicListFilter(admin.SimpleListFilter):
     parameter_name = "topic__id__exact"
 
     def lookups(self, request, model_admin):
-        queryset = Topic.objects.all()
-        return queryset.values_list("id", "title").order_by("title")
+        return get_cached_filter_options(
+            "topics", lambda: Topic.objects.values_list("id", "title").order_by("title")
+        )
 
     def queryset(self, request, queryset):
         if self.value():
@@ -219,7 +230,9 @@ class SiteReportCampaignListFilter(SiteReportCampaignListBaseFilter):
     status_filter_parameter = "campaign__status"
 
     def lookups(self, request, model_admin):
-        return Campaign.objects.values_list("id", "title")
+        return get_cached_filter_options(
+            "site-report-campaigns", lambda: Campaign.objects.values_list("id", "title")
+        )
 
 
 class HelpfulLinkCampaignListFilter(CampaignListFilter):
@@ -249,12 +262,19 @@ class NextAssetCampaignListFilter(CampaignListFilter):
     parameter_name = "campaign__id__exact"
 
     def lookups(self, request, model_admin):
-        campaigns = Campaign.objects.filter(
-            pk__in=model_admin.model.objects.values_list(
-                "campaign_id", flat=True
-            ).distinct()
+        def build():
+            campaigns = Campaign.objects.filter(
+                pk__in=model_admin.model.objects.values_list(
+                    "campaign_id", flat=True
+                ).distinct()
+            )
+            return campaigns.values_list("id", "title").order_by("title")
+
+        return get_cached_filter_options(
+            f"next-asset-campaigns:{model_admin.model._meta.label_lower}",
+            build,
+            timeout=SHORT_FILTER_OPTIONS_CACHE_TIMEOUT,
         )
-        return campaigns.values_list("id", "title").order_by("title")
 
 
 class CampaignProjectListFilter(admin.SimpleListFilter):
@@ -263,6 +283,10 @@ class CampaignProjectListFilter(admin.SimpleListFilter):
 
     Provides a project dropdown whose choices can be narrowed by a related
     campaign filter, then filters the changelist using `project_ref`.
+
+    Once a campaign is selected its projects are listed inline. Until then
+    the list would contain every project, so instead a search box is shown
+    which loads matching projects from the admin autocomplete endpoint.
     """
 
     title = "ProjectRedux"
@@ -270,17 +294,57 @@ class CampaignProjectListFilter(admin.SimpleListFilter):
     related_filter_parameter = ""
     project_ref = ""
     template = "admin/long_name_filter.html"
+    autocomplete_template = "admin/autocomplete_filter.html"
+
+    def __init__(self, request, params, model, model_admin):
+        self.campaign_id = request.GET.get(self.related_filter_parameter)
+        super().__init__(request, params, model, model_admin)
+        if self.campaign_id is None:
+            self.template = self.autocomplete_template
 
     def lookups(self, request, model_admin):
-        list_of_questions = []
-        queryset = Project.objects.order_by("campaign_id")
-        if self.related_filter_parameter in request.GET:
-            queryset = queryset.filter(
-                campaign_id=request.GET[self.related_filter_parameter]
-            )
-        for project in queryset:
-            list_of_questions.append((str(project.id), project.title))
-        return sorted(list_of_questions, key=lambda tp: tp[1])
+        if self.campaign_id is None:
+            # Only the selected project, if any, is needed to render the
+            # autocomplete
+            if not str(self.value() or "").isdigit():
+                return []
+            queryset = Project.objects.filter(pk=self.value())
+            return [
+                (str(pk), title) for pk, title in queryset.values_list("id", "title")
+            ]
+
+        campaign_id = self.campaign_id
+
+        def build():
+            queryset = Project.objects.filter(campaign_id=campaign_id)
+            return [
+                (str(pk), title)
+                for pk, title in queryset.values_list("id", "title").order_by("title")
+            ]
+
+        return get_cached_filter_options(f"projects:{campaign_id}", build)
+
+    def has_output(self):
+        return self.campaign_id is None or super().has_output()
+
+    def choices(self, changelist):
+        if self.campaign_id is not None:
+            yield from super().choices(changelist)
+            return
+
+        query_string = changelist.get_query_string(remove=[self.parameter_name])
+        yield {
+            "selected": self.value() is None,
+            "query_string": query_string,
+            "display": _("All"),
+        }
+        yield {
+            "autocomplete": True,
+            "query_string": query_string,
+            "parameter_name": self.parameter_name,
+            "selected_value": self.value(),
+            "selected_display": dict(self.lookup_choices).get(self.value(), ""),
+        }
 
     def queryset(self, request, queryset):
         if self.value():
@@ -0,0 +1,171 @@
+import hashlib
+import json
+import logging
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import DatabaseError, connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+logger = logging.getLogger(__name__)
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator for admin changelists over very large tables.
+
+    Counting and paging through tables with tens of millions of rows using
+    the default paginator means an exact ``COUNT(*)`` and an ever larger
+    ``OFFSET`` on every changelist page. This paginator avoids both:
+
+    - ``count`` uses PostgreSQL's planner statistics: ``pg_class.reltuples``
+      for an unfiltered list and the row estimate from ``EXPLAIN`` for a
+      filtered or searched one. Only when the estimate is below
+      ``estimate_threshold`` is an exact count run, so small lists still show
+      exact totals.
+    - ``page`` seeks on the primary key instead of using ``OFFSET`` when the
+      list is ordered by primary key. The last key of each page served is
+      cached so that moving to the next page is a plain index range scan.
+      Pages reached any other way, and lists in any other order, only offset
+      over the narrow primary key column before loading the full rows of the
+      page itself.
+
+    Because totals are estimates, the last few pages of a large list may be
+    empty or unreachable; admins using this should also set
+    ``show_full_result_count = False``. Other databases fall back to the
+    default paginator's behavior.
+    """
+
+    #: Estimates below this are replaced with an exact count
+    estimate_threshold = 10_000
+
+    #: How long the last primary key of a page is remembered for seeking
+    page_boundary_timeout = 10 * 60
+
+    @cached_property
+    def count(self):
+        """
+        Return the estimated, or for small lists exact, number of objects.
+        """
+        estimate = self.get_estimated_count()
+        if estimate is not None and estimate >= self.estimate_threshold:
+            return estimate
+        return super().count
+
+    def get_estimated_count(self):
+        """
+        Return the planner's estimate of the size of the object list.
+
+        Returns:
+            int or None: The estimated row count, or None if no estimate is
+                available, such as when not running on PostgreSQL or when the
+                table has never been analyzed.
+        """
+        queryset = self.object_list
+        if not isinstance(queryset, QuerySet):
+            return None
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return None
+
+        try:
+            if not queryset.query.where and not queryset.query.distinct:
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT reltuples::bigint FROM pg_class "
+                        "WHERE oid = %s::regclass",
+                        [queryset.model._meta.db_table],
+                    )
+                    row = cursor.fetchone()
+                # reltuples is -1 for tables which have never been analyzed
+                if row is None or row[0] < 0:
+                    return None
+                return row[0]
+
+            plan = json.loads(queryset.order_by().values("pk").explain(format="json"))
+            return int(plan[0]["Plan"]["Plan Rows"])
+        except DatabaseError:
+            logger.exception("Unable to estimate the size of %s", queryset.model)
+            return None
+
+    def page(self, number):
+        """
+        Return a Page object for the given 1-based page number.
+
+        See the class documentation for how pages are located.
+        """
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        if bottom == 0 or not isinstance(self.object_list, QuerySet):
+            return super().page(number)
+
+        pk_order = self.get_pk_order()
+        if pk_order is None:
+            # Offset over the primary keys alone, then load only this page.
+            page_pks = list(
+                self.object_list.values_list("pk", flat=True)[
+                    bottom : bottom + self.per_page
+                ]
+            )
+            return self._get_page(
+                self.object_list.filter(pk__in=page_pks), number, self
+            )
+
+        boundary = cache.get(self.get_page_boundary_cache_key(number - 1))
+        if boundary is None:
+            # The last key on the previous page, found by offsetting over the
+            # primary keys alone
+            previous_keys = list(
+                self.object_list.values_list("pk", flat=True)[bottom - 1 : bottom]
+            )
+            if not previous_keys:
+                return self._get_page(self.object_list.none(), number, self)
+            boundary = previous_keys[0]
+
+        lookup = "pk__lt" if pk_order == "desc" else "pk__gt"
+        object_list = self.object_list.filter(**{lookup: boundary})[: self.per_page]
+        if len(object_list):
+            cache.set(
+                self.get_page_boundary_cache_key(number),
+                object_list[len(object_list) - 1].pk,
+                self.page_boundary_timeout,
+            )
+        return self._get_page(object_list, number, self)
+
+    def get_pk_order(self):
+        """
+        Return the direction of the object list's ordering on its primary key.
+
+        Returns:
+            str or None: "asc" or "desc" if the list is ordered only by its
+                primary key, otherwise None.
+        """
+        query = self.object_list.query
+        ordering = list(query.order_by)
+        if not ordering and query.default_ordering:
+            ordering = list(self.object_list.model._meta.ordering)
+        if len(ordering) != 1 or not isinstance(ordering[0], str):
+            return None
+
+        field = ordering[0]
+        descending = field.startswith("-")
+        if field.lstrip("-") not in ("pk", self.object_list.model._meta.pk.name):
+            return None
+        return "desc" if descending else "asc"
+
+    def get_page_boundary_cache_key(self, number):
+        """
+        Return the cache key for the last primary key on a page of this list.
+
+        Args:
+            number (int): The 1-based page number.
+
+        Returns:
+            str: A key unique to the list's query, page size and page number.
+        """
+        sql, params = self.object_list.query.sql_with_params()
+        query_hash = hashlib.md5(
+            f"{sql}{params}".encode(), usedforsecurity=False
+        ).hexdigest()
+        return f"admin-paginator:{query_hash}:{self.per_page}:{number}"
@@ -31,32 +31,37 @@ as provisional and subject to change.
 """
 
 import re
+import uuid
 from time import time
-from typing import Optional
+from typing import Optional, Union
 
+from celery.result import AsyncResult
 from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 from django.db.transaction import atomic
 from django.http import HttpRequest
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.utils.timezone import now
+from flags.state import flag_enabled
 from ninja import NinjaAPI, Router
 from ninja.errors import HttpError
 
+from concordia.celery import app as celery_app
 from concordia.exceptions import RateLimitExceededError
 from concordia.logging import ConcordiaLogger
 from concordia.models import (
     Asset,
-    CardFamily,
     ConcordiaUser,
     Guide,
     Transcription,
     TranscriptionStatus,
     TutorialCard,
-    UserAssetTagCollection,
 )
+from concordia.tasks.ocr import generate_ocr_transcription_task
 from concordia.templatetags.concordia_media_tags import asset_media_url
-from concordia.utils import get_anonymous_user
+from concordia.utils import get_anonymous_user, get_default_card_family
 from concordia.utils.constants import URL_REGEX
 from configuration.utils import configuration_value
 
@@ -148,6 +153,16 @@ class TranscriptionOut(CamelSchema):
     redo_available: bool
 
 
+class OcrTaskOut(CamelSchema):
+    """
+    Reference to an OCR transcription that is being generated by the OCR
+    worker pool. Clients poll `status_url` until it returns a transcription.
+    """
+
+    ocr_task_id: str
+    status_url: str
+
+
 def serialize_asset(asset: Asset, request: HttpRequest) -> AssetOut:
     """
     Build the `AssetOut` payload for a single asset.
@@ -169,7 +184,7 @@ def serialize_asset(asset: Asset, request: HttpRequest) -> AssetOut:
             "id": transcription.pk,
             "status": transcription.status,
             "text": transcription.text,
-            "contributors": asset.get_contributor_count(),
+            "contributors": asset.contributor_count,
         }
         if transcription.status in TranscriptionStatus.CHOICE_MAP.values():
             transcription_status = [
@@ -229,14 +244,13 @@ def serialize_asset(asset: Asset, request: HttpRequest) -> AssetOut:
         thumbnail_url = image_url
 
     # Tags
-    tag_groups = UserAssetTagCollection.objects.filter(asset__slug=asset.slug)
-    tags = sorted({tag.value for tg in tag_groups for tag in tg.tags.all()})
+    tags = asset.get_tags()
 
     # Cards
     if project.campaign.card_family:
         card_family = project.campaign.card_family
     else:
-        card_family = CardFamily.objects.filter(default=True).first()
+        card_family = get_default_card_family()
     if card_family:
         cards = list(
             TutorialCard.objects.filter(tutorial=card_family)
@@ -251,8 +265,8 @@ def serialize_asset(asset: Asset, request: HttpRequest) -> AssetOut:
     guides = list(guides_qs) if guides_qs.exists() else None
 
     # Undo/redo availability
-    undo_available = asset.can_rollback()[0] if transcription else False
-    redo_available = asset.can_rollforward()[0] if transcription else False
+    undo_available = asset.undo_available
+    redo_available = asset.redo_available
 
     return AssetOut(
         id=asset.id,
@@ -271,7 +285,7 @@ def serialize_asset(asset: Asset, request: HttpRequest) -> AssetOut:
         image_url=image_url,
         thumbnail_url=thumbnail_url,
         tags=tags,
-        registered_contributors=asset.get_contributor_count(),
+        registered_contributors=asset.contributor_count,
         cards=cards,
         guides=guides,
         languages=list(settings.LANGUAGE_CODES.items()),
@@ -436,18 +450,26 @@ def create_transcription(
         text=transcription.text,
         submission_url=reverse("api:submit_transcription", args=[transcription.pk]),
         asset=serialize_asset(asset, request),
-        undo_available=asset.can_rollback()[0],
-        redo_available=asset.can_rollforward()[0],
+        undo_available=asset.undo_available,
+        redo_available=asset.redo_available,
     )
 
 
-@assets.post("/{asset_id}/transcriptions/ocr", response=TranscriptionOut, by_alias=True)
+@assets.post(
+    "/{asset_id}/transcriptions/ocr",
+    response={200: TranscriptionOut, 202: OcrTaskOut},
+    by_alias=True,
+)
 @atomic
 def create_ocr_transcription(
     request: HttpRequest, asset_id: int, payload: OcrTranscriptionIn
-) -> TranscriptionOut:
+) -> Union[TranscriptionOut, tuple[int, OcrTaskOut]]:
     """
     Create and save a new OCR-generated transcription for an asset.
+
+    When the ``ASYNC_OCR`` flag is enabled, OCR is queued for the OCR worker
+    pool instead and a 202 response referencing the queued task is returned;
+    see `ocr_transcription_status`.
     """
     asset = get_object_or_404(
         Asset.objects.published().select_related("item__project__campaign"),
@@ -518,6 +540,34 @@ def create_ocr_transcription(
             transcription=superseded,
         )
 
+    if flag_enabled("ASYNC_OCR", request=request):
+        task_id = str(uuid.uuid4())
+        # Recorded so that ocr_transcription_status can tell a running task
+        # from one which was lost, since Celery reports both as pending
+        cache.set(
+            settings.OCR_TASK_CACHE_KEY.format(task_id=task_id),
+            user.pk,
+            settings.OCR_TASK_TIMEOUT,
+        )
+        transaction.on_commit(
+            lambda: generate_ocr_transcription_task.apply_async(
+                args=(asset.pk, user.pk, superseded.pk, language), task_id=task_id
+            )
+        )
+        structured_logger.info(
+            "API OCR transcription generation queued",
+            event_code="ocr_generation_queued",
+            user=user,
+            asset=asset,
+            task_id=task_id,
+        )
+        return 202, OcrTaskOut(
+            ocr_task_id=task_id,
+            status_url=reverse(
+                "api:ocr_transcription_status", args=[asset.pk, task_id]
+            ),
+        )
+
     transcription_text = asset.get_ocr_transcript(language)
 
     transcription = Transcription(
@@ -544,8 +594,87 @@ def create_ocr_transcription(
         text=transcription.text,
         submission_url=reverse("api:submit_transcription", args=[transcription.pk]),
         asset=serialize_asset(asset, request),
-        undo_available=asset.can_rollback()[0],
-        redo_available=asset.can_rollforward()[0],
+        undo_available=asset.undo_available,
+        redo_available=asset.redo_available,
+    )
+
+
+@assets.get(
+    "/{asset_id}/transcriptions/ocr/{task_id}",
+    response={200: TranscriptionOut, 202: OcrTaskOut},
+    by_alias=True,
+)
+def ocr_transcription_status(
+    request: HttpRequest, asset_id: int, task_id: uuid.UUID
+) -> Union[TranscriptionOut, tuple[int, OcrTaskOut]]:
+    """
+    Return the transcription produced by a queued OCR task.
+
+    Path Parameters:
+        asset_id (int): ID of the asset OCR was requested for.
+        task_id (UUID): The `ocrTaskId` returned by `create_ocr_transcription`.
+
+    Celery reports lost, expired and unknown tasks as pending, so a task
+    which hasn't finished within `OCR_TASK_TIMEOUT` seconds of being queued
+    by this user is reported as having timed out with a 504 response.
+
+    Returns:
+        TranscriptionOut: The new transcription once OCR has finished, or a
+        202 response with the same `OcrTaskOut` while it is still running.
+    """
+    result = AsyncResult(str(task_id), app=celery_app)
+    user = request.user if not request.user.is_anonymous else get_anonymous_user()
+
+    if not result.ready():
+        queued_by = cache.get(settings.OCR_TASK_CACHE_KEY.format(task_id=task_id))
+        if queued_by != user.pk:
+            structured_logger.warning(
+                "API queued OCR transcription timed out",
+                event_code="ocr_generation_timed_out",
+                reason="The OCR task did not finish within OCR_TASK_TIMEOUT",
+                reason_code="task_timed_out",
+                user=request.user,
+                task_id=str(task_id),
+            )
+            raise HttpError(504, "OCR transcription timed out. Please try again.")
+        return 202, OcrTaskOut(
+            ocr_task_id=str(task_id),
+            status_url=reverse(
+                "api:ocr_transcription_status", args=[asset_id, str(task_id)]
+            ),
+        )
+
+    if result.failed():
+        structured_logger.warning(
+            "API queued OCR transcription failed",
+            event_code="ocr_generation_failed",
+            reason="The OCR task raised an exception",
+            reason_code="task_failed",
+            user=request.user,
+            task_id=str(task_id),
+        )
+        raise HttpError(500, "Unable to generate an OCR transcription")
+
+    outcome = result.result
+    if "error" in outcome:
+        raise HttpError(outcome["status"], outcome["error"])
+
+    transcription = get_object_or_404(
+        Transcription.objects.select_related("asset__item__project__campaign"),
+        pk=outcome["transcription_id"],
+        asset_id=asset_id,
+        user=user,
+    )
+    asset = transcription.asset
+
+    return TranscriptionOut(
+        id=transcription.pk,
+        sent=time(),
+        text=transcription.text,
+        submission_url=reverse("api:submit_transcription", args=[transcription.pk]),
+        asset=serialize_asset(asset, request),
+        undo_available=asset.undo_available,
+        redo_available=asset.redo_available,
     )
 
 
@@ -591,8 +720,8 @@ def rollback(request: HttpRequest, asset_id: int) -> TranscriptionOut:
         text=transcription.text,
         submission_url=reverse("api:submit_transcription", args=[transcription.pk]),
         asset=serialize_asset(asset, request),
-        undo_available=asset.can_rollback()[0],
-        redo_available=asset.can_rollforward()[0],
+        undo_available=asset.undo_available,
+        redo_available=asset.redo_available,
     )
 
 
@@ -638,8 +767,8 @@ def rollforward(request: HttpRequest, asset_id: int) -> TranscriptionOut:
         text=transcription.text,
         submission_url=reverse("api:submit_transcription", args=[transcription.pk]),
         asset=serialize_asset(asset, request),
-        undo_available=asset.can_rollback()[0],
-        redo_available=asset.can_rollforward()[0],
+        undo_available=asset.undo_available,
+        redo_available=asset.redo_available,
     )
 
 
@@ -0,0 +1,251 @@
+"""
+Surrogate-key tagging and purging for the CDN in front of the public site.
+
+Public pages are tagged with surrogate keys naming the campaign, project,
+item and topic they show (see `concordia.views.decorators.scoped_cache_page`).
+When those objects change, `purge_surrogate_keys` asks the CDN to drop every
+page carrying the affected keys, which lets the CDN keep pages for much
+longer than browsers do.
+
+Keys are collected in a set shared by every process and purged together by
+the `flush_pending_purges` periodic task, so the number of purge requests
+depends on how often that task runs rather than on how busy the site is.
+
+Purges are sent by a transport class named by the `CDN_PURGE_TRANSPORT`
+setting, in the same way as Django's `EMAIL_BACKEND`:
+
+- `NullPurgeTransport` discards purges, for sites without a CDN.
+- `LocMemPurgeTransport` records purges in `purged_keys`, for tests.
+- `CloudflarePurgeTransport` sends purges to the Cloudflare API.
+"""
+
+import logging
+import threading
+from typing import Iterable
+from urllib.parse import quote
+
+import requests
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.http import HttpResponse
+from django.utils.module_loading import import_string
+from django_redis import get_redis_connection
+
+logger = logging.getLogger(__name__)
+
+#: Response header listing a page's surrogate keys. Cloudflare reads this
+#: and removes it before the response reaches the browser.
+SURROGATE_KEY_HEADER = "Cache-Tag"
+
+#: Response header giving the CDN its own max-age, separate from the
+#: browser's `Cache-Control`
+CDN_CACHE_CONTROL_HEADER = "CDN-Cache-Control"
+
+#: Purges sent by `LocMemPurgeTransport`, one list of keys per request
+purged_keys: list[list[str]] = []
+
+#: Cache key of the set of surrogate keys waiting to be purged
+PENDING_PURGES_KEY = "cdn_pending_purges"
+
+_pending = threading.local()
+_pending_purges_lock = threading.Lock()
+
+
+class PurgeTransport:
+    """
+    Base class for CDN purge transports.
+
+    Subclasses implement `purge`, which is called with no more than
+    `max_keys_per_request` keys at a time.
+    """
+
+    max_keys_per_request = 256
+
+    def purge(self, keys: list[str]) -> None:
+        """
+        Purge every cached response tagged with any of the given keys.
+
+        Args:
+            keys (list[str]): Surrogate keys to purge.
+        """
+        raise NotImplementedError
+
+
+class NullPurgeTransport(PurgeTransport):
+    """
+    Transport which discards purges.
+    """
+
+    def purge(self, keys: list[str]) -> None:
+        logger.debug("Discarding CDN purge of %s", keys)
+
+
+class LocMemPurgeTransport(PurgeTransport):
+    """
+    Transport which records purges in `concordia.cdn.purged_keys`.
+    """
+
+    def purge(self, keys: list[str]) -> None:
+        purged_keys.append(list(keys))
+
+
+class CloudflarePurgeTransport(PurgeTransport):
+    """
+    Transport which purges keys through the Cloudflare API.
+
+    Cloudflare calls surrogate keys cache tags. Uses the
+    `CLOUDFLARE_ZONE_ID` and `CLOUDFLARE_PURGE_API_TOKEN` settings.
+    """
+
+    max_keys_per_request = 30
+
+    def purge(self, keys: list[str]) -> None:
+        response = requests.post(
+            "https://api.cloudflare.com/client/v4/zones/"
+            f"{settings.CLOUDFLARE_ZONE_ID}/purge_cache",
+            headers={"Authorization": f"Bearer {settings.CLOUDFLARE_PURGE_API_TOKEN}"},
+            json={"tags": keys},
+            timeout=10,
+        )
+        response.raise_for_status()
+
+
+def encode_surrogate_key(key: str) -> str:
+    """
+    Return a surrogate key in the form sent to the CDN.
+
+    Slugs may contain non-ASCII characters, which Django would MIME-encode in
+    a response header. Percent-encoding them instead gives the same ASCII
+    string in the header and in purge requests.
+
+    Args:
+        key (str): The surrogate key.
+
+    Returns:
+        str: The percent-encoded key.
+    """
+    return quote(key, safe="/:")
+
+
+def add_surrogate_keys(response: HttpResponse, keys: Iterable[str]) -> None:
+    """
+    Tag a response with surrogate keys so it can be purged from the CDN.
+
+    Also sets the CDN's max-age to `CDN_PAGE_TTL`, since purging on change
+    lets the CDN keep tagged pages for longer than `DEFAULT_PAGE_TTL`. Only
+    responses which are the same for every visitor may be tagged.
+
+    Args:
+        response (HttpResponse): The response to tag.
+        keys (Iterable[str]): Surrogate keys for the content of the response.
+    """
+    existing = [key for key in response.get(SURROGATE_KEY_HEADER, "").split(",") if key]
+    encoded = [encode_surrogate_key(key) for key in keys]
+    response[SURROGATE_KEY_HEADER] = ",".join(dict.fromkeys([*existing, *encoded]))
+    response[CDN_CACHE_CONTROL_HEADER] = f"max-age={settings.CDN_PAGE_TTL}"
+
+
+def get_purge_transport() -> PurgeTransport:
+    """
+    Return an instance of the configured purge transport.
+
+    Returns:
+        PurgeTransport: An instance of the `CDN_PURGE_TRANSPORT` class.
+    """
+    return import_string(settings.CDN_PURGE_TRANSPORT)()
+
+
+def add_pending_purges(keys: Iterable[str]) -> None:
+    """
+    Add surrogate keys to the set waiting to be purged.
+
+    Uses a Redis set when the default cache is Redis. Other backends, such
+    as the local-memory cache used in tests, fall back to a set stored in
+    the cache and updated under a process-wide lock.
+
+    Args:
+        keys (Iterable[str]): Surrogate keys to purge.
+    """
+    keys = set(keys)
+    if not keys:
+        return
+    cache = caches["default"]
+    try:
+        connection = get_redis_connection("default")
+    except NotImplementedError:
+        with _pending_purges_lock:
+            pending = cache.get(PENDING_PURGES_KEY, set())
+            cache.set(PENDING_PURGES_KEY, pending | keys, timeout=None)
+        return
+    connection.sadd(cache.make_key(PENDING_PURGES_KEY), *keys)
+
+
+def pop_pending_purges() -> set[str]:
+    """
+    Remove and return every surrogate key waiting to be purged.
+
+    Returns:
+        set[str]: The pending keys.
+    """
+    cache = caches["default"]
+    try:
+        connection = get_redis_connection("default")
+    except NotImplementedError:
+        with _pending_purges_lock:
+            pending = cache.get(PENDING_PURGES_KEY, set())
+            cache.delete(PENDING_PURGES_KEY)
+        return pending
+    key = cache.make_key(PENDING_PURGES_KEY)
+    # Read and delete together so no key added in between is lost
+    pipeline = connection.pipeline(transaction=True)
+    pipeline.smembers(key)
+    pipeline.delete(key)
+    pending, _ = pipeline.execute()
+    return {member.decode() for member in pending}
+
+
+class _PurgeBatch:
+    """
+    Surrogate keys purged during one transaction, added to the pending set
+    when it commits.
+    """
+
+    def __init__(self):
+        self.keys: set[str] = set()
+
+    def __call__(self) -> None:
+        if getattr(_pending, "batch", None) is self:
+            _pending.batch = None
+        add_pending_purges(self.keys)
+
+
+def purge_surrogate_keys(keys: Iterable[str]) -> None:
+    """
+    Purge cached pages tagged with any of the given surrogate keys.
+
+    The keys are added to the pending set once the current transaction
+    commits, so the CDN cannot fetch the old data again after the purge,
+    and are purged by the next run of `flush_pending_purges`. Keys purged
+    during the same transaction, for example by several signal handlers
+    responding to one save, are added together.
+
+    Args:
+        keys (Iterable[str]): Surrogate keys to purge.
+    """
+    connection = connections[DEFAULT_DB_ALIAS]
+    keys = [encode_surrogate_key(key) for key in keys]
+    batch = getattr(_pending, "batch", None)
+    # The batch is dropped along with its on_commit callback if its
+    # transaction is rolled back
+    if batch is not None and any(
+        callback is batch
+        for _savepoint_ids, callback, _robust in connection.run_on_commit
+    ):
+        batch.keys.update(keys)
+        return
+
+    batch = _pending.batch = _PurgeBatch()
+    batch.keys.update(keys)
+    # Outside a transaction this adds the keys immediately
+    transaction.on_commit(batch)
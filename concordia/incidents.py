@@ -0,0 +1,116 @@
+"""
+Detection of unusually fast transcription and review activity.
+
+Each detector takes one user's events sorted by time and slides a window
+over them with two pointers, so every event is visited a fixed number of
+times however dense the activity is. ``group_incidents`` applies a
+detector to the rows of a single query ordered by user and time.
+"""
+
+import datetime
+from collections import Counter
+from itertools import groupby
+from operator import itemgetter
+from typing import Callable, Iterable, Optional, Sequence
+
+#: Accepts less than this far apart count as within a minute of each other.
+#: Reports have always compared whole seconds, so 60.9 seconds still counts.
+REVIEW_WINDOW = datetime.timedelta(seconds=61)
+
+#: How soon after a transcription another one counts against it
+TRANSCRIBE_WINDOW = datetime.timedelta(minutes=1)
+
+
+def count_review_incidents(
+    timestamps: Sequence[datetime.datetime],
+    threshold: int,
+    until: Optional[datetime.datetime] = None,
+) -> int:
+    """
+    Count the accepts which start a burst of `threshold` or more accepts.
+
+    Args:
+        timestamps (Sequence[datetime]): One reviewer's accept times, sorted.
+        threshold (int): Number of accepts within a minute, including the
+            first, which makes an incident.
+        until (datetime, optional): Only accepts before this time can start
+            an incident. Later accepts still count towards earlier bursts.
+
+    Returns:
+        int: Number of incidents.
+    """
+    incidents = 0
+    end = 0
+    for start, started_at in enumerate(timestamps):
+        if until is not None and started_at >= until:
+            break
+        end = max(end, start + 1)
+        while end < len(timestamps) and timestamps[end] - started_at < REVIEW_WINDOW:
+            end += 1
+        if end - start >= threshold:
+            incidents += 1
+    return incidents
+
+
+def count_transcribe_incidents(
+    events: Sequence[tuple[datetime.datetime, int]],
+    until: Optional[datetime.datetime] = None,
+) -> int:
+    """
+    Count the transcriptions followed within a minute by one for another asset.
+
+    Args:
+        events (Sequence[tuple[datetime, int]]): One user's
+            ``(submitted, asset_id)`` pairs, sorted by submission time.
+        until (datetime, optional): Only transcriptions submitted before this
+            time can be counted. Later ones still count against earlier ones.
+
+    Returns:
+        int: Number of incidents.
+    """
+    incidents = 0
+    # The window holds the events submitted after the current one and no
+    # more than a minute later, with a count of each asset in it
+    window_start = window_end = 0
+    window_assets = Counter()
+    for submitted, asset_id in events:
+        if until is not None and submitted >= until:
+            break
+        while window_start < len(events) and events[window_start][0] <= submitted:
+            if window_start < window_end:
+                window_assets[events[window_start][1]] -= 1
+            window_start += 1
+        window_end = max(window_end, window_start)
+        limit = submitted + TRANSCRIBE_WINDOW
+        while window_end < len(events) and events[window_end][0] <= limit:
+            window_assets[events[window_end][1]] += 1
+            window_end += 1
+        if window_end - window_start > window_assets[asset_id]:
+            incidents += 1
+    return incidents
+
+
+def group_incidents(
+    rows: Iterable[tuple], count_incidents: Callable[[list], int]
+) -> dict[int, int]:
+    """
+    Count incidents for every user in a set of rows.
+
+    Args:
+        rows (Iterable[tuple]): Rows whose first column is a user ID, ordered
+            by user and then time. The remaining columns are passed to
+            `count_incidents`, as a single value if there is only one.
+        count_incidents (Callable[[list], int]): Counts the incidents in one
+            user's events.
+
+    Returns:
+        dict[int, int]: Incident counts keyed by user ID, for users with at
+            least one incident.
+    """
+    incidents = {}
+    for user_id, user_rows in groupby(rows, key=itemgetter(0)):
+        events = [row[1] if len(row) == 2 else row[1:] for row in user_rows]
+        count = count_incidents(events)
+        if count:
+            incidents[user_id] = count
+    return incidents
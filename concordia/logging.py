@@ -1,8 +1,16 @@
+import copy
+import logging
+import os
+import queue
+import random
 import warnings
+from logging.handlers import QueueHandler, QueueListener
 from types import MappingProxyType
 from typing import Any, Callable, Optional
 
 import structlog
+from django.conf import settings
+from django.utils.module_loading import import_string
 
 
 def get_logging_user_id(user: Any) -> str:
@@ -29,6 +37,83 @@ def get_logging_user_id(user: Any) -> str:
     return str(user_id)
 
 
+def get_sample_rate(event_code: str) -> float:
+    """
+    Return the fraction of debug and info logs to keep for an event code.
+
+    Rates are configured with the `STRUCTURED_LOG_SAMPLE_RATES` setting, a
+    mapping of event code to a rate between 0 and 1. Event codes which are
+    not listed are always logged.
+
+    Args:
+        event_code (str): The event code of the log.
+
+    Returns:
+        rate (float): The fraction of logs to keep.
+    """
+    return getattr(settings, "STRUCTURED_LOG_SAMPLE_RATES", {}).get(event_code, 1.0)
+
+
+class BackgroundHandler(QueueHandler):
+    """
+    A logging handler which formats and writes records on a background thread.
+
+    The calling thread only copies the record onto a queue; a listener thread
+    passes it to a handler of `handler_class`, built from the remaining
+    keyword arguments, so JSON rendering and file writes happen off the
+    request. The formatter assigned to this handler is used by that handler.
+
+    Structured log fields are still extracted on the calling thread since
+    extractors may read the database and need to see the caller's
+    transaction.
+
+    Example LOGGING configuration:
+        ```python
+        "structlog_file": {
+            "class": "concordia.logging.BackgroundHandler",
+            "handler_class": "logging.handlers.TimedRotatingFileHandler",
+            "formatter": "structlog_json",
+            "filename": "concordia-json.log",
+        }
+        ```
+    """
+
+    def __init__(self, handler_class: str, **handler_kwargs: Any):
+        super().__init__(queue.SimpleQueue())
+        self.target = import_string(handler_class)(**handler_kwargs)
+        self._start_listener()
+        # Threads don't survive a fork, so prefork Celery workers need their
+        # own listener
+        os.register_at_fork(after_in_child=self._start_listener)
+
+    def _start_listener(self) -> None:
+        self.queue = queue.SimpleQueue()
+        self.listener = QueueListener(self.queue, self.target)
+        self.listener.start()
+
+    def setFormatter(self, fmt: Optional[logging.Formatter]) -> None:
+        self.target.setFormatter(fmt)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Unlike QueueHandler.prepare, leave the message unformatted since
+        # structlog passes its event dict to the formatter as the message
+        record = copy.copy(record)
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def flush(self) -> None:
+        self.target.flush()
+
+    def close(self) -> None:
+        # Stopping the listener writes any records still queued
+        if self.listener._thread is not None:
+            self.listener.stop()
+        self.target.close()
+        super().close()
+
+
 # Default global registry for semantic context extractors
 _DEFAULT_EXTRACTORS: dict[str, Callable[[Any], dict[str, Any]]] = {}
 
@@ -99,6 +184,8 @@ class ConcordiaLogger:
         - Allows semantic binding of objects (e.g., asset=self) which are expanded
           at log time.
         - Supports binding persistent fields via structlog's context mechanism.
+        - Skips context extraction for levels which are not enabled, and samples
+          debug and info logs per event code (see `get_sample_rate`).
 
     Usage:
     -----
@@ -295,7 +382,19 @@ class ConcordiaLogger:
                 "Warnings and errors must include both 'reason' and 'reason_code'."
             )
 
+        if not self.is_enabled_for(level):
+            return
+
+        # Sampled logs record their rate so counts can be scaled back up
+        sample_rate = 1.0
+        if level in ("debug", "info"):
+            sample_rate = get_sample_rate(event_code)
+            if sample_rate < 1 and random.random() >= sample_rate:  # nosec
+                return
+
         context_data = {"event_code": event_code}
+        if sample_rate < 1:
+            context_data["sample_rate"] = sample_rate
         if reason:
             context_data["reason"] = reason
         if reason_code:
@@ -330,6 +429,29 @@ class ConcordiaLogger:
 
         getattr(self._logger, level)(message, **context_data)
 
+    def is_enabled_for(self, level: str) -> bool:
+        """
+        Return whether logs at the given level would be emitted.
+
+        Checked before extracting context so disabled levels don't pay for
+        walking related objects.
+
+        Args:
+            level (str): Logging level ('debug', 'info', 'warning', 'error').
+
+        Returns:
+            enabled (bool): False if structlog or the underlying standard
+                library logger would drop the log.
+        """
+        levelno = logging.getLevelName(level.upper())
+        is_enabled_for = getattr(self._logger, "is_enabled_for", None)
+        if is_enabled_for is not None and not is_enabled_for(levelno):
+            return False
+        stdlib_logger = getattr(self._logger, "_logger", None)
+        if isinstance(stdlib_logger, logging.Logger):
+            return stdlib_logger.isEnabledFor(levelno)
+        return True
+
     def debug(self, message: str, *, event_code: str, **kwargs):
         """Emit a debug-level structured log."""
         self.log("debug", message, event_code=event_code, **kwargs)
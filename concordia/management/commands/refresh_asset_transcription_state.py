@@ -0,0 +1,45 @@
+"""
+Management command to check and repair the stored transcription summary of
+assets (contributor count and undo/redo availability).
+
+Usage:
+    python manage.py refresh_asset_transcription_state
+    python manage.py refresh_asset_transcription_state --verbosity 2
+"""
+
+from timeit import default_timer
+
+from django.core.management.base import BaseCommand
+
+from concordia.tasks.assets import refresh_asset_transcription_state
+
+
+class Command(BaseCommand):
+    """
+    Run the task which recomputes the stored transcription summary of assets.
+
+    This command invokes
+    `concordia.tasks.assets.refresh_asset_transcription_state()` and, when
+    verbosity is greater than 1, prints how many records were updated and
+    how long the run took.
+    """
+
+    def handle(self, *, verbosity: int, **kwargs) -> None:
+        """
+        Execute the command.
+
+        Args:
+            verbosity (int): Django's verbosity level (0, 1, 2, or 3).
+
+        Returns:
+            None
+        """
+        start_time = default_timer()
+
+        updated_count = refresh_asset_transcription_state()
+
+        if verbosity > 1:
+            print(
+                "Updated %d records in %0.1f seconds"
+                % (updated_count, default_timer() - start_time)
+            )
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("concordia", "0128_alter_campaignretirementprogress_options"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AssetOcrResult",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("checksum", models.CharField(max_length=32)),
+                ("language", models.CharField(blank=True, max_length=20)),
+                ("text", models.TextField(blank=True)),
+                ("created_on", models.DateTimeField(auto_now_add=True)),
+                (
+                    "asset",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="concordia.asset",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("asset", "checksum", "language"),
+                        name="unique_asset_ocr_result",
+                    )
+                ],
+            },
+        ),
+    ]
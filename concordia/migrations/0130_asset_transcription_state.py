@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("concordia", "0129_assetocrresult"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="asset",
+            name="contributor_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="asset",
+            name="redo_available",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name="asset",
+            name="undo_available",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+    ]
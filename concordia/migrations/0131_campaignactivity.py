@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("concordia", "0130_asset_transcription_state"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CampaignActivity",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "resolution",
+                    models.CharField(
+                        choices=[("hour", "Hour"), ("day", "Day")], max_length=4
+                    ),
+                ),
+                ("period_start", models.DateTimeField()),
+                ("saved", models.PositiveIntegerField(default=0)),
+                ("submitted", models.PositiveIntegerField(default=0)),
+                ("accepted", models.PositiveIntegerField(default=0)),
+                ("rejected", models.PositiveIntegerField(default=0)),
+                ("reserved", models.PositiveIntegerField(default=0)),
+                (
+                    "campaign",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="concordia.campaign",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "Campaign activities",
+                "indexes": [
+                    models.Index(
+                        fields=["resolution", "period_start"],
+                        name="concordia_c_resolut_c0bbd0_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("campaign", "resolution", "period_start"),
+                        name="unique_campaign_activity_period",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+from django.db import migrations
+
+
+def create_activity_series_task(apps, schema_editor):
+    IntervalSchedule = apps.get_model("django_celery_beat", "IntervalSchedule")
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+
+    # Ensure an IntervalSchedule of every minute exists (or get it).
+    interval, created = IntervalSchedule.objects.get_or_create(
+        every=1,
+        period="minutes",
+    )
+
+    # Create the PeriodicTask if it doesn’t already exist
+    PeriodicTask.objects.get_or_create(
+        name="Update activity series",
+        task="concordia.tasks.visualizations.update_activity_series",
+        interval=interval,
+        defaults={
+            "enabled": True,
+            "description": "Compacts per-minute activity counts and populates the cache for the activity-last-24-hours and activity-last-28-days visualizations",
+        },
+    )
+
+
+def delete_activity_series_task(apps, schema_editor):
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    PeriodicTask.objects.filter(name="Update activity series").delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("concordia", "0131_campaignactivity"),
+        ("django_celery_beat", "0019_alter_periodictasks_options"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_activity_series_task, delete_activity_series_task),
+    ]
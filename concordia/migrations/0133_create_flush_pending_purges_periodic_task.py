@@ -0,0 +1,42 @@
+from django.db import migrations
+
+
+def create_flush_pending_purges_task(apps, schema_editor):
+    IntervalSchedule = apps.get_model("django_celery_beat", "IntervalSchedule")
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+
+    # Ensure an IntervalSchedule of every minute exists (or get it).
+    interval, created = IntervalSchedule.objects.get_or_create(
+        every=1,
+        period="minutes",
+    )
+
+    # Create the PeriodicTask if it doesn’t already exist
+    PeriodicTask.objects.get_or_create(
+        name="Flush pending CDN purges",
+        task="concordia.tasks.cdn.flush_pending_purges",
+        interval=interval,
+        defaults={
+            "enabled": True,
+            "description": "Purges the surrogate keys of every page changed since the last run from the CDN",
+        },
+    )
+
+
+def delete_flush_pending_purges_task(apps, schema_editor):
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    PeriodicTask.objects.filter(name="Flush pending CDN purges").delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("concordia", "0132_create_activity_series_periodic_task"),
+        ("django_celery_beat", "0019_alter_periodictasks_options"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_flush_pending_purges_task, delete_flush_pending_purges_task
+        ),
+    ]
@@ -0,0 +1,37 @@
+from django.db import migrations
+
+
+def populate_asset_transcription_state(apps, schema_editor):
+    # Nothing to do on a new database. This also avoids loading the current
+    # Asset model, which the task below uses, where it may not match the
+    # schema at this point.
+    Transcription = apps.get_model("concordia", "Transcription")
+    if not Transcription.objects.exists():
+        return
+
+    from concordia.models import Asset
+    from concordia.tasks.assets import refresh_asset_transcription_state
+
+    refresh_asset_transcription_state(
+        Asset.objects.only(
+            "pk", "contributor_count", "undo_available", "redo_available"
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    # The assets are updated in chunks, each committed as it is written,
+    # rather than in one long transaction
+    atomic = False
+
+    dependencies = [
+        ("concordia", "0133_create_flush_pending_purges_periodic_task"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            populate_asset_transcription_state,
+            migrations.RunPython.noop,
+            elidable=True,
+        ),
+    ]
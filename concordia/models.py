@@ -1,6 +1,7 @@
 import calendar
 import csv
 import datetime
+import hashlib
 import io
 import json
 import os.path
@@ -9,7 +10,7 @@ import uuid
 from decimal import Decimal
 from itertools import chain
 from logging import getLogger
-from typing import Optional, Tuple, Union
+from typing import Any, Optional, Tuple, Union
 
 import pytesseract
 from django.conf import settings
@@ -42,7 +43,13 @@ from django.utils.functional import cached_property
 from PIL import Image
 
 from concordia.exceptions import RateLimitExceededError
+from concordia.incidents import (
+    count_review_incidents,
+    count_transcribe_incidents,
+    group_incidents,
+)
 from concordia.logging import ConcordiaLogger
+from concordia.rate_limit import SlidingWindowLimiter
 from concordia.storage import ASSET_STORAGE
 from configuration.utils import configuration_value
 from prometheus_metrics.models import MetricsModelMixin
@@ -59,6 +66,12 @@ ONE_DAY = datetime.timedelta(days=1)
 ONE_DAY_AGO = timezone.now() - ONE_DAY
 THRESHOLD = 2
 
+#: Tracks each reviewer's acceptances within the last minute
+review_accept_limiter = SlidingWindowLimiter(ONE_MINUTE)
+
+#: How long OCR output is cached per (asset, image checksum, language)
+OCR_RESULT_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+
 
 def resource_file_upload_path(instance, filename):
     """
@@ -171,23 +184,12 @@ class ConcordiaUser(User):
         Returns:
             int: Number of detected review incidents.
         """
-        accepts = recent_accepts.filter(reviewed_by=self).values_list(
-            "accepted", flat=True
-        )
-        timestamps = list(accepts)
-        timestamps.sort()
-        incidents = 0
-        for i in range(len(timestamps)):
-            count = 1
-            for j in range(i + 1, len(timestamps)):
-                if (timestamps[j] - timestamps[i]).seconds <= 60:
-                    count += 1
-                    if count == threshold:
-                        incidents += 1
-                        break
-                else:
-                    break
-        return incidents
+        accepts = (
+            recent_accepts.filter(reviewed_by=self)
+            .order_by("accepted")
+            .values_list("accepted", flat=True)
+        )
+        return count_review_incidents(list(accepts), threshold)
 
     def transcribe_incidents(self, transcriptions):
         """
@@ -204,19 +206,12 @@ class ConcordiaUser(User):
         Returns:
             int: Number of detected transcription incidents.
         """
-        transcriptions = transcriptions.filter(user=self).order_by("submitted")
-        incidents = 0
-        for transcription in transcriptions:
-            start = transcription.submitted
-            end = transcription.submitted + datetime.timedelta(minutes=1)
-            if (
-                transcriptions.filter(submitted__lte=end, submitted__gt=start)
-                .exclude(asset=transcription.asset)
-                .count()
-                > 0
-            ):
-                incidents += 1
-        return incidents
+        events = (
+            transcriptions.filter(user=self, submitted__isnull=False)
+            .order_by("submitted")
+            .values_list("submitted", "asset_id")
+        )
+        return count_transcribe_incidents(list(events))
 
     @property
     def transcription_accepted_cache_key(self):
@@ -229,12 +224,13 @@ class ConcordiaUser(User):
         """
         Enforce and update the per-minute accept-rate limit for this user.
 
-        For non-superusers, this loads the recent acceptance timestamps from
-        the cache, discards values older than one minute, and checks the
-        resulting count against the ``review_rate_limit`` configuration
-        value. If recording another acceptance would exceed that limit, a
-        :class:`RateLimitExceededError` is raised. Otherwise, the current
-        timestamp is appended and written back to the cache.
+        For non-superusers, this records the acceptance in the user's
+        one-minute sliding window unless the window already holds
+        ``review_rate_limit`` acceptances, in which case a
+        :class:`RateLimitExceededError` is raised. The check and the update
+        are made atomically, so concurrent acceptances can't both pass the
+        limit. Acceptances aren't limited if ``review_rate_limit`` hasn't
+        been configured.
 
         Args:
             transcription (Transcription): The transcription being accepted.
@@ -245,21 +241,23 @@ class ConcordiaUser(User):
             RateLimitExceededError: If the user would exceed the configured
                 rate limit.
         """
-        if not self.is_superuser:
-            key = self.transcription_accepted_cache_key
-            now = timezone.now()
-            one_minute_ago = now - ONE_MINUTE
-
-            timestamps = cache.get(key, [])
-            valid_timestamps = [ts for ts in timestamps if ts >= one_minute_ago]
+        if self.is_superuser:
+            return
 
-            if len(valid_timestamps) and len(valid_timestamps) >= configuration_value(
-                "review_rate_limit"
-            ):
-                raise RateLimitExceededError()
+        try:
+            limit = configuration_value("review_rate_limit")
+        except ObjectDoesNotExist:
+            structured_logger.warning(
+                "Review rate limit not configured; not limiting accepts.",
+                event_code="review_rate_limit_not_configured",
+                reason="The review_rate_limit configuration value does not exist.",
+                reason_code="configuration_missing",
+                user=self,
+            )
+            return
 
-            valid_timestamps.append(now)
-            cache.set(key, valid_timestamps, 60)
+        if not review_accept_limiter.hit(self.transcription_accepted_cache_key, limit):
+            raise RateLimitExceededError()
 
 
 class UserProfile(MetricsModelMixin("userprofile"), models.Model):
@@ -828,6 +826,14 @@ class Asset(MetricsModelMixin("asset"), models.Model):
 
     difficulty = models.PositiveIntegerField(default=0, blank=True, null=True)
 
+    # These summarize the Transcription records so responses don't have to
+    # query the asset's history. They're kept up to date by the Transcription
+    # signal handlers and can be recomputed with the
+    # refresh_asset_transcription_state management command:
+    contributor_count = models.PositiveIntegerField(editable=False, default=0)
+    undo_available = models.BooleanField(editable=False, default=False)
+    redo_available = models.BooleanField(editable=False, default=False)
+
     storage_image = models.ImageField(
         upload_to=get_storage_path, storage=ASSET_STORAGE, max_length=255
     )
@@ -853,9 +859,31 @@ class Asset(MetricsModelMixin("asset"), models.Model):
             ("reopen_asset", "Can reopen asset"),
         ]
 
+    #: Fields shown on the cached item, project and campaign pages
+    PAGE_FIELDS = ("item_id", "published", "transcription_status")
+
     def __str__(self):
         return self.title
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.saved_page_values = instance.get_page_values()
+        return instance
+
+    def get_page_values(self) -> dict[str, Any]:
+        """
+        Return the loaded values of the fields in `PAGE_FIELDS`.
+
+        Deferred fields are left out, so they only count as changed if they
+        are later loaded or set.
+        """
+        return {
+            name: self.__dict__[name]
+            for name in self.PAGE_FIELDS
+            if name in self.__dict__
+        }
+
     def save(self, *args, **kwargs):
         try:
             self.campaign  # noqa: B018
@@ -914,15 +942,89 @@ class Asset(MetricsModelMixin("asset"), models.Model):
                 allowed_languages=settings.PYTESSERACT_ALLOWED_LANGUAGES,
             )
             language = None
-        structured_logger.info(
-            "Running OCR on asset image.",
-            event_code="ocr_run_started",
-            asset=self,
-            language=language,
-        )
-        return pytesseract.image_to_string(
-            Image.open(self.storage_image), lang=language
+        # Results are stored under the language they were run in, so a
+        # request without one finds the results of pre-OCR
+        language = language or settings.PYTESSERACT_DEFAULT_LANGUAGE
+
+        image_data, checksum = self.get_storage_image_data()
+        cache_key = self.get_ocr_cache_key(checksum, language)
+        transcript = cache.get(cache_key)
+        if transcript is not None:
+            structured_logger.info(
+                "Using cached OCR result for asset image.",
+                event_code="ocr_cache_hit",
+                asset=self,
+                language=language,
+            )
+            return transcript
+
+        transcript = (
+            AssetOcrResult.objects.filter(
+                asset=self, checksum=checksum, language=language
+            )
+            .values_list("text", flat=True)
+            .first()
         )
+        if transcript is not None:
+            structured_logger.info(
+                "Using stored OCR result for asset image.",
+                event_code="ocr_result_hit",
+                asset=self,
+                language=language,
+            )
+        else:
+            structured_logger.info(
+                "Running OCR on asset image.",
+                event_code="ocr_run_started",
+                asset=self,
+                language=language,
+            )
+            transcript = pytesseract.image_to_string(
+                Image.open(io.BytesIO(image_data)), lang=language
+            )
+            AssetOcrResult.objects.bulk_create(
+                [
+                    AssetOcrResult(
+                        asset=self,
+                        checksum=checksum,
+                        language=language,
+                        text=transcript,
+                    )
+                ],
+                ignore_conflicts=True,
+            )
+
+        cache.set(cache_key, transcript, OCR_RESULT_CACHE_TIMEOUT)
+        return transcript
+
+    def get_storage_image_data(self):
+        """
+        Read the asset's image from storage.
+
+        Returns:
+            tuple: The image data and its MD5 hex digest, which OCR results are
+                keyed on.
+        """
+        with self.storage_image.open("rb") as image_file:
+            image_data = image_file.read()
+        return image_data, hashlib.md5(image_data, usedforsecurity=False).hexdigest()
+
+    def get_ocr_cache_key(self, checksum, language=None):
+        """
+        Build the cache key for an OCR result.
+
+        Results are keyed on the image checksum as well as the asset so that
+        replacing an asset's image never returns text for the old image.
+
+        Args:
+            checksum (str): MD5 hex digest of the image data.
+            language (str, optional): Tesseract language code, or None for the
+                default language.
+
+        Returns:
+            str: The cache key.
+        """
+        return f"ocr:{self.pk}:{checksum}:{language or 'default'}"
 
     def get_contributor_count(self):
         transcriptions = Transcription.objects.filter(asset=self)
@@ -935,6 +1037,73 @@ class Asset(MetricsModelMixin("asset"), models.Model):
         user_ids = list(set(list(reviewer_ids) + list(transcriber_ids)))
         return len(user_ids)
 
+    def get_transcription_state(self) -> dict[str, int | bool]:
+        """
+        Compute the summary of this asset's transcriptions stored on the asset.
+
+        Returns:
+            dict: Values for the ``contributor_count``, ``undo_available``
+                and ``redo_available`` fields.
+        """
+        return {
+            "contributor_count": self.get_contributor_count(),
+            "undo_available": self.can_rollback()[0],
+            "redo_available": self.can_rollforward()[0],
+        }
+
+    def update_transcription_state(self) -> None:
+        """
+        Recompute and store the summary of this asset's transcriptions.
+
+        Only the summary fields are written, so this can't overwrite changes
+        made to other fields since the asset was loaded.
+        """
+        state = self.get_transcription_state()
+        for field, value in state.items():
+            setattr(self, field, value)
+        Asset.objects.filter(pk=self.pk).update(**state)
+
+    @staticmethod
+    def get_tags_cache_key(asset_pk: int) -> str:
+        """
+        Return the cache key for the tag values of the asset with this key.
+        """
+        return settings.ASSET_TAGS_CACHE_KEY.format(asset_id=asset_pk)
+
+    def get_tags(self) -> list[str]:
+        """
+        Return the sorted values of every tag applied to this asset.
+
+        The values are cached until the asset's tags change, or for
+        ``ASSET_TAGS_CACHE_TIMEOUT`` seconds.
+
+        Returns:
+            list[str]: Distinct tag values from every user's tag collection.
+        """
+        cache_key = self.get_tags_cache_key(self.pk)
+        tags = cache.get(cache_key)
+        if tags is None:
+            tags = sorted(
+                set(
+                    Tag.objects.filter(userassettagcollection__asset=self).values_list(
+                        "value", flat=True
+                    )
+                )
+            )
+            self.set_cached_tags(tags)
+        return tags
+
+    def set_cached_tags(self, tags: list[str]) -> None:
+        """
+        Store the sorted tag values for this asset in the cache.
+
+        Args:
+            tags (list[str]): The values to store.
+        """
+        cache.set(
+            self.get_tags_cache_key(self.pk), tags, settings.ASSET_TAGS_CACHE_TIMEOUT
+        )
+
     def turn_off_ocr(self):
         return self.disable_ocr or self.item.turn_off_ocr()
 
@@ -1393,6 +1562,36 @@ class Asset(MetricsModelMixin("asset"), models.Model):
         return new_transcription
 
 
+class AssetOcrResult(models.Model):
+    """
+    Store the OCR output for one version of an asset's image in one language.
+
+    Rows are written whenever OCR runs, either on request or ahead of time by
+    the import pipeline, so ``Asset.get_ocr_transcript`` only needs to run
+    tesseract once per image and language. Results are keyed on the image's
+    checksum so a replaced image is never matched with stale text.
+    """
+
+    asset = models.ForeignKey(Asset, on_delete=models.CASCADE)
+    #: MD5 hex digest of the image data the OCR was run on
+    checksum = models.CharField(max_length=32)
+    #: Tesseract language code, or blank for tesseract's default language
+    language = models.CharField(max_length=20, blank=True)
+    text = models.TextField(blank=True)
+    created_on = models.DateTimeField(editable=False, auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["asset", "checksum", "language"],
+                name="unique_asset_ocr_result",
+            )
+        ]
+
+    def __str__(self):
+        return f"OCR of {self.asset_id} ({self.language or 'default'})"
+
+
 class Tag(MetricsModelMixin("tag"), models.Model):
     TAG_VALIDATOR = RegexValidator(r"^[- _À-ž'\w]{1,50}$")
     value = models.CharField(max_length=50, validators=[TAG_VALIDATOR])
@@ -1429,59 +1628,112 @@ class TranscriptionManager(models.Manager):
         START = timezone.now() - datetime.timedelta(days=days)
         return self.review_actions(START)
 
-    def review_incidents(self, start=ONE_DAY_AGO):
-        user_incident_count = []
+    def review_incidents(self, start=ONE_DAY_AGO, end=None):
+        """
+        Find reviewers who accepted transcriptions unusually quickly.
+
+        Every accept since `start` is read in one query, ordered by reviewer
+        and time, and each reviewer's accepts are scanned once.
+
+        Args:
+            start (datetime): Only accepts from this time are considered.
+            end (datetime, optional): Only incidents starting before this
+                time are counted, so the report can be run incrementally
+                over consecutive periods. Accepts up to a minute later are
+                still read so incidents spanning `end` are complete.
+
+        Returns:
+            list[tuple[int, str, int, int]]: The ID, username, incident count
+                and all-time accept count of each reviewer with incidents,
+                ordered by ID.
+        """
         recent_accepts = self.filter(
             accepted__gte=start,
             reviewed_by__is_superuser=False,
             reviewed_by__is_staff=False,
         )
-        user_ids = set(
-            recent_accepts.order_by("reviewed_by").values_list("reviewed_by", flat=True)
+        if end is not None:
+            recent_accepts = recent_accepts.filter(accepted__lt=end + ONE_MINUTE)
+        rows = recent_accepts.order_by("reviewed_by", "accepted").values_list(
+            "reviewed_by", "accepted"
         )
-
-        for user_id in user_ids:
-            user = ConcordiaUser.objects.get(id=user_id)
-            incident_count = user.review_incidents(recent_accepts)
-            if incident_count > 0:
-                accept_count = Transcription.objects.filter(
-                    reviewed_by=user, accepted__isnull=False
-                ).count()
-                user_incident_count.append(
-                    (user.id, user.username, incident_count, accept_count)
-                )
-
-        return user_incident_count
+        incidents = group_incidents(
+            rows.iterator(),
+            lambda timestamps: count_review_incidents(timestamps, THRESHOLD, until=end),
+        )
+        totals = self.filter(reviewed_by__in=incidents, accepted__isnull=False)
+        return self._incident_report(incidents, totals, "reviewed_by")
 
     def recent_transcriptions(self, start=ONE_DAY_AGO):
         return self.get_queryset().filter(
             submitted__gte=start, user__is_superuser=False, user__is_staff=False
         )
 
-    def transcribe_incidents(self, start=ONE_DAY_AGO):
-        user_incident_count = []
+    def transcribe_incidents(self, start=ONE_DAY_AGO, end=None):
+        """
+        Find users who submitted transcriptions unusually quickly.
+
+        Every submission since `start` is read in one query, ordered by user
+        and time, and each user's submissions are scanned once.
+
+        Args:
+            start (datetime): Only submissions from this time are considered.
+            end (datetime, optional): Only incidents starting before this
+                time are counted, so the report can be run incrementally
+                over consecutive periods. Submissions up to a minute later
+                are still read so incidents spanning `end` are complete.
+
+        Returns:
+            list[tuple[int, str, int, int]]: The ID, username, incident count
+                and all-time transcription count of each user with
+                incidents, ordered by ID.
+        """
         transcriptions = self.recent_transcriptions(start)
-        user_ids = (
-            transcriptions.order_by("user")
-            .distinct("user")
-            .values_list("user", flat=True)
-        )
-
-        for user_id in user_ids:
-            user = ConcordiaUser.objects.get(id=user_id)
-            incident_count = user.transcribe_incidents(transcriptions)
-            if incident_count > 0:
-                transcribe_count = Transcription.objects.filter(user=user).count()
-                user_incident_count.append(
-                    (
-                        user.id,
-                        user.username,
-                        incident_count,
-                        transcribe_count,
-                    )
-                )
+        if end is not None:
+            transcriptions = transcriptions.filter(submitted__lt=end + ONE_MINUTE)
+        rows = transcriptions.order_by("user", "submitted").values_list(
+            "user", "submitted", "asset_id"
+        )
+        incidents = group_incidents(
+            rows.iterator(),
+            lambda events: count_transcribe_incidents(events, until=end),
+        )
+        totals = self.filter(user__in=incidents)
+        return self._incident_report(incidents, totals, "user")
+
+    @staticmethod
+    def _incident_report(incidents, totals, user_field):
+        """
+        Combine incident counts with usernames and per-user totals.
+
+        Args:
+            incidents (dict[int, int]): Incident counts keyed by user ID.
+            totals (QuerySet): Transcriptions to count for each user.
+            user_field (str): The field of `totals` holding the user.
 
-        return user_incident_count
+        Returns:
+            list[tuple[int, str, int, int]]: One row per user, ordered by ID.
+        """
+        if not incidents:
+            return []
+        usernames = dict(
+            ConcordiaUser.objects.filter(pk__in=incidents).values_list("pk", "username")
+        )
+        total_counts = dict(
+            totals.order_by()
+            .values(user_field)
+            .annotate(total=Count("pk"))
+            .values_list(user_field, "total")
+        )
+        return [
+            (
+                user_id,
+                usernames[user_id],
+                incidents[user_id],
+                total_counts.get(user_id, 0),
+            )
+            for user_id in sorted(incidents)
+        ]
 
 
 class Transcription(MetricsModelMixin("transcription"), models.Model):
@@ -1554,9 +1806,32 @@ class Transcription(MetricsModelMixin("transcription"), models.Model):
             models.Index(fields=["asset", "user"]),
         ]
 
+    #: Timestamps recording each step of the review workflow, in the order
+    #: the activity charts count them
+    REVIEW_FIELDS = ("accepted", "rejected", "submitted")
+
     def __str__(self):
         return f"Transcription #{self.pk}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.saved_review_values = instance.get_review_values()
+        return instance
+
+    def get_review_values(self) -> dict[str, Any]:
+        """
+        Return the loaded values of the fields in `REVIEW_FIELDS`.
+
+        Deferred fields are left out, so they only count as changed if they
+        are later loaded or set.
+        """
+        return {
+            name: self.__dict__[name]
+            for name in self.REVIEW_FIELDS
+            if name in self.__dict__
+        }
+
     def campaign_slug(self):
         return self.asset.item.project.campaign.slug
 
@@ -3119,6 +3394,42 @@ class UserProfileActivity(models.Model):
         return transcribe_count + review_count
 
 
+class CampaignActivity(models.Model):
+    """
+    Counts of transcription activity on a campaign during an hour or a day.
+
+    Per-minute counts collected by ``concordia.activity_series`` are added to
+    hourly rows, and hourly rows are later combined into daily rows, so the
+    activity charts can be drawn without scanning transcriptions.
+    """
+
+    class Resolution(models.TextChoices):
+        HOUR = "hour", "Hour"
+        DAY = "day", "Day"
+
+    campaign = models.ForeignKey(Campaign, on_delete=models.CASCADE)
+    resolution = models.CharField(max_length=4, choices=Resolution.choices)
+    period_start = models.DateTimeField()
+    saved = models.PositiveIntegerField(default=0)
+    submitted = models.PositiveIntegerField(default=0)
+    accepted = models.PositiveIntegerField(default=0)
+    rejected = models.PositiveIntegerField(default=0)
+    reserved = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["campaign", "resolution", "period_start"],
+                name="unique_campaign_activity_period",
+            )
+        ]
+        indexes = [models.Index(fields=["resolution", "period_start"])]
+        verbose_name_plural = "Campaign activities"
+
+    def __str__(self):
+        return f"{self.campaign} - {self.resolution} of {self.period_start}"
+
+
 class CampaignRetirementProgress(models.Model):
     """
     Track progress while retiring a campaign and deleting related content.
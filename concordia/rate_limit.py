@@ -0,0 +1,98 @@
+import datetime
+import threading
+import uuid
+from time import time
+
+from django.core.cache import caches
+from django_redis import get_redis_connection
+
+# Each limited identifier is a sorted set in Redis whose members are the hits
+# within the window, scored by the time they were made. A Lua script drops
+# expired hits, checks the count and records the new hit in one step, so
+# concurrent requests from the same user can't all pass the limit. Redis'
+# own clock is used so web servers with skewed clocks agree on the window.
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local clock = redis.call("TIME")
+local now = clock[1] * 1000 + math.floor(clock[2] / 1000)
+redis.call("ZREMRANGEBYSCORE", key, "-inf", "(" .. (now - window))
+if redis.call("ZCARD", key) >= limit then
+    return 0
+end
+redis.call("ZADD", key, now, ARGV[3])
+redis.call("PEXPIRE", key, window)
+return 1
+"""
+
+
+class SlidingWindowLimiter:
+    """
+    Limit how many times something may happen within a sliding time window.
+
+    The window is stored in the given cache. When that cache is backed by
+    Redis the check and the update are made atomically by a server-side
+    script; other backends, such as the local-memory cache used in tests,
+    fall back to a list of timestamps updated under a process-wide lock.
+    """
+
+    def __init__(self, window: datetime.timedelta, cache_alias: str = "default"):
+        self.window = window
+        self.cache_alias = cache_alias
+        self._lock = threading.Lock()
+        self._script = None
+
+    def hit(self, key: str, limit: int) -> bool:
+        """
+        Record a hit for `key` unless it has reached `limit` within the window.
+
+        Args:
+            key (str): Cache key identifying what is being limited, such as
+                a per-user key.
+            limit (int): Maximum number of hits allowed within the window.
+
+        Returns:
+            bool: True if the hit was recorded, False if the limit has been
+                reached.
+        """
+        cache = caches[self.cache_alias]
+        try:
+            connection = get_redis_connection(self.cache_alias)
+        except NotImplementedError:
+            return self._hit_locally(cache, key, limit)
+
+        if self._script is None:
+            self._script = connection.register_script(SLIDING_WINDOW_SCRIPT)
+        window_ms = int(self.window.total_seconds() * 1000)
+        return bool(
+            self._script(
+                keys=[cache.make_key(key)],
+                args=[window_ms, limit, uuid.uuid4().hex],
+                client=connection,
+            )
+        )
+
+    def _hit_locally(self, cache, key: str, limit: int) -> bool:
+        window = self.window.total_seconds()
+        with self._lock:
+            now = time()
+            hits = [
+                timestamp
+                for timestamp in cache.get(key, [])
+                if timestamp >= now - window
+            ]
+            if len(hits) >= limit:
+                return False
+            hits.append(now)
+            cache.set(key, hits, window)
+            return True
+
+    def reset(self, key: str) -> None:
+        """
+        Forget every hit recorded for `key`.
+
+        Args:
+            key (str): Cache key passed to `hit`.
+        """
+        caches[self.cache_alias].delete(key)
@@ -0,0 +1,69 @@
+"""
+Session engine which serves sessions from the cache and skips redundant writes.
+
+Use with ``SESSION_ENGINE = "concordia.sessions"``. This is Django's
+``cached_db`` engine, so sessions are read from the ``SESSION_CACHE_ALIAS``
+cache and only read from the ``django_session`` table on a cache miss. Rows
+written by the plain ``db`` engine are therefore picked up on first use, so
+switching engines doesn't log anyone out, and the existing
+``clear_sessions`` task still removes expired rows.
+
+Sessions are also only written back when their data has changed since it
+was loaded. Views often assign values which are already in the session,
+and each of those assignments would otherwise cost a database write. An
+unchanged session is written at most once per ``SESSION_REFRESH_INTERVAL``
+seconds, which is enough to extend its expiry date without writing on
+every request.
+"""
+
+from time import time
+
+from django.conf import settings
+from django.contrib.sessions.backends import cached_db
+
+#: Session key recording when the session was last written
+REFRESHED_AT_KEY = "_session_refreshed_at"
+
+
+class SessionStore(cached_db.SessionStore):
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        # Serialized data as of the last load or save
+        self._saved_state = None
+
+    def _get_state(self, data):
+        return self.serializer().dumps(
+            {key: value for key, value in data.items() if key != REFRESHED_AT_KEY}
+        )
+
+    def load(self):
+        data = super().load()
+        self._saved_state = self._get_state(data)
+        return data
+
+    def is_unchanged(self):
+        """
+        Return whether the session matches what was last loaded or saved.
+
+        Returns:
+            bool: True if the data is unchanged and the session was written
+                less than `SESSION_REFRESH_INTERVAL` seconds ago.
+        """
+        if self._saved_state is None:
+            return False
+        data = self._get_session()
+        refreshed_at = data.get(REFRESHED_AT_KEY, 0)
+        return (
+            time() - refreshed_at < settings.SESSION_REFRESH_INTERVAL
+            and self._get_state(data) == self._saved_state
+        )
+
+    def save(self, must_create=False):
+        if self.session_key is not None and not must_create and self.is_unchanged():
+            return
+
+        data = self._get_session(no_load=must_create)
+        if self.session_key is not None:
+            data[REFRESHED_AT_KEY] = time()
+        super().save(must_create)
+        self._saved_state = self._get_state(self._session)
@@ -59,6 +59,9 @@ SESSION_ENGINE = "django.contrib.sessions.backends.cache"
 
 RATELIMIT_ENABLE = False
 
+# Tests change configuration values directly, so skip the process-local cache
+CONFIGURATION_LOCAL_CACHE_TIMEOUT = 0
+
 # Turnstile settings
 TURNSTILE_JS_API_URL = os.environ.get(
     "TURNSTILE_JS_API_URL", "https://challenges.cloudflare.com/turnstile/v0/api.js"
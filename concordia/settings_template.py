@@ -139,6 +139,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "prometheus_metrics.middleware.PrometheusBeforeMiddleware",
+    "prometheus_metrics.middleware.PrometheusViewInstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     # WhiteNoise serves static files efficiently:
     "whitenoise.middleware.WhiteNoiseMiddleware",
@@ -159,7 +160,7 @@ RATELIMIT_BLOCK = False
 
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "BACKEND": "prometheus_metrics.templates.DjangoTemplates",
         "DIRS": [
             os.path.join(SITE_ROOT_DIR, "templates"),
             os.path.join(CONCORDIA_APP_DIR, "templates"),
@@ -212,28 +213,28 @@ else:
 if REDIS_ADDRESS and REDIS_PORT:
     CACHES = {
         "default": {
-            "BACKEND": "django_redis.cache.RedisCache",
+            "BACKEND": "prometheus_metrics.cache.RedisCache",
             "LOCATION": f"redis://{REDIS_ADDRESS}:{REDIS_PORT}/1",
             "OPTIONS": {
                 "CLIENT_CLASS": "django_redis.client.DefaultClient",
             },
         },
         "view_cache": {
-            "BACKEND": "django_redis.cache.RedisCache",
+            "BACKEND": "prometheus_metrics.cache.RedisCache",
             "LOCATION": f"redis://{REDIS_ADDRESS}:{REDIS_PORT}/2",
             "OPTIONS": {
                 "CLIENT_CLASS": "django_redis.client.DefaultClient",
             },
         },
         "configuration_cache": {
-            "BACKEND": "django_redis.cache.RedisCache",
+            "BACKEND": "prometheus_metrics.cache.RedisCache",
             "LOCATION": f"redis://{REDIS_ADDRESS}:{REDIS_PORT}/3",
             "OPTIONS": {
                 "CLIENT_CLASS": "django_redis.client.DefaultClient",
             },
         },
         "visualization_cache": {
-            "BACKEND": "django_redis.cache.RedisCache",
+            "BACKEND": "prometheus_metrics.cache.RedisCache",
             "LOCATION": f"redis://{REDIS_ADDRESS}:{REDIS_PORT}/4",
             "OPTIONS": {
                 "CLIENT_CLASS": "django_redis.client.DefaultClient",
@@ -243,18 +244,16 @@ if REDIS_ADDRESS and REDIS_PORT:
 else:
     CACHES = {
         "default": {
-            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        },
-        "view_cache": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
-        "configuration_cache": {
-            "BACKEND": "django.core.cache.backends.locmem.LocMemCache"
-        },
-        "visualization_cache": {
-            "BACKEND": "django.core.cache.backends.locmem.LocMemCache"
+            "BACKEND": "prometheus_metrics.cache.LocMemCache",
         },
+        "view_cache": {"BACKEND": "prometheus_metrics.cache.LocMemCache"},
+        "configuration_cache": {"BACKEND": "prometheus_metrics.cache.LocMemCache"},
+        "visualization_cache": {"BACKEND": "prometheus_metrics.cache.LocMemCache"},
     }
 
-SESSION_ENGINE = "django.contrib.sessions.backends.db"
+SESSION_ENGINE = "concordia.sessions"
+#: Unchanged sessions are written at most this often, in seconds
+SESSION_REFRESH_INTERVAL = 24 * 60 * 60
 
 CELERY_BROKER_URL = f"redis://{REDIS_ADDRESS}:{REDIS_PORT}/0"
 CELERY_RESULT_BACKEND = f"redis://{REDIS_ADDRESS}:{REDIS_PORT}/0"
@@ -262,6 +261,12 @@ CELERY_RESULT_BACKEND = f"redis://{REDIS_ADDRESS}:{REDIS_PORT}/0"
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_IMPORTS = ("importer.tasks",)
+# Pre-OCR of imported assets has its own queue so that a large import never
+# delays OCR requested by volunteers; exact task names are matched first
+CELERY_TASK_ROUTES = {
+    "concordia.tasks.ocr.pre_ocr_asset_task": {"queue": "pre_ocr"},
+    "concordia.tasks.ocr.*": {"queue": "ocr"},
+}
 
 CELERY_BROKER_HEARTBEAT = 0
 CELERY_BROKER_CONNECTION_RETRY = True
@@ -321,7 +326,8 @@ LOGGING = {
             "maxBytes": 1024 * 1024 * 100,  # 100 mb
         },
         "structlog_file": {
-            "class": "logging.handlers.TimedRotatingFileHandler",
+            "class": "concordia.logging.BackgroundHandler",
+            "handler_class": "logging.handlers.TimedRotatingFileHandler",
             "level": "INFO",
             "formatter": "structlog_json",
             "filename": f"{SITE_ROOT_DIR}/logs/concordia-json.log",
@@ -353,6 +359,18 @@ LOGGING = {
     },
 }
 
+#: Fraction of debug and info structured logs kept for each event code.
+#: Events not listed are always logged; warnings and errors are never sampled.
+#: The reservation heartbeat runs every few seconds for every open transcription
+#: page, so its routine events are sampled.
+STRUCTURED_LOG_SAMPLE_RATES = {
+    "asset_reserve_start": 0.1,
+    "asset_reserve_updated": 0.1,
+    "reservation_update_start": 0.1,
+    "reservation_update_sql_executed": 0.1,
+    "reservation_update_success": 0.1,
+}
+
 structlog.configure(
     processors=[
         structlog.contextvars.merge_contextvars,
@@ -504,9 +522,40 @@ TRANSCRIPTION_RESERVATION_TOMBSTONE_HOURS = 24
 #: Number of hours until a tombstoned reservation is deleted
 TRANSCRIPTION_RESERVATION_TOMBSTONE_LENGTH_HOURS = 24
 
+#: Seconds that rarely-changing rows such as the anonymous user are kept in
+#: process memory (see concordia.utils.singletons)
+SINGLETON_CACHE_TTL = 5 * 60
+
 #: Web cache policy settings
 DEFAULT_PAGE_TTL = 5 * 60
 
+#: How long the CDN keeps pages tagged with surrogate keys. These are purged
+#: when their content changes (see concordia.cdn), so can be kept far longer
+#: than DEFAULT_PAGE_TTL once purging is configured.
+CDN_PAGE_TTL = int(os.environ.get("CDN_PAGE_TTL", DEFAULT_PAGE_TTL))
+
+#: Class used to purge surrogate keys from the CDN
+CDN_PURGE_TRANSPORT = os.environ.get(
+    "CDN_PURGE_TRANSPORT", "concordia.cdn.NullPurgeTransport"
+)
+CLOUDFLARE_ZONE_ID = os.environ.get("CLOUDFLARE_ZONE_ID", "")
+CLOUDFLARE_PURGE_API_TOKEN = os.environ.get("CLOUDFLARE_PURGE_API_TOKEN", "")
+
+#: Requests taking at least this many seconds are logged with the database
+#: statements which took the most time, up to PROMETHEUS_SLOW_REQUEST_QUERIES
+PROMETHEUS_SLOW_REQUEST_SECONDS = float(
+    os.environ.get("PROMETHEUS_SLOW_REQUEST_SECONDS", 2.0)
+)
+PROMETHEUS_SLOW_REQUEST_QUERIES = 5
+
+#: Directory containing one metrics directory per service. When set, the
+#: metrics endpoint reports totals across every web and Celery process (see
+#: prometheus_metrics.multiprocess).
+PROMETHEUS_MULTIPROC_ROOT = os.environ.get("PROMETHEUS_MULTIPROC_ROOT", "")
+
+#: Celery app whose broker queue lengths are reported by the metrics endpoint
+PROMETHEUS_CELERY_APP = "concordia.celery.app"
+
 # Feature flags
 FLAGS = {
     "ADVERTISE_ACTIVITY_UI": [],
@@ -515,6 +564,11 @@ FLAGS = {
     "SHOW_BANNER": [],
     "DISPLAY_ITEM_DESCRIPTION": [],
     "IMPORT_IMAGE_CHECKSUM": [],
+    "IMPORT_ITEM_BATCH_DOWNLOAD": [],
+    "IMPORT_ITEM_BATCHES": [],
+    "ASYNC_OCR": [],
+    "IMPORT_PRE_OCR": [],
+    "KEY_METRICS_BULK_REBUILD": [],
 }
 
 ASGI_APPLICATION = "concordia.routing.application"
@@ -662,6 +716,14 @@ LANGUAGE_CODES = {
 }
 PYTESSERACT_ALLOWED_LANGUAGES = LANGUAGE_CODES.keys()
 
+#: Language OCR is run in when none is requested, matching tesseract's own
+#: default
+PYTESSERACT_DEFAULT_LANGUAGE = "eng"
+
+#: Languages OCR is run in ahead of time for newly imported assets when the
+#: IMPORT_PRE_OCR flag is enabled
+PRE_OCR_LANGUAGES = os.environ.get("PRE_OCR_LANGUAGES", "eng").split(",")
+
 PYLENIUM_CONFIG = os.path.join(SITE_ROOT_DIR, "pylenium.json")
 
 MAINTENANCE_MODE_STATE_BACKEND = "maintenance_mode.backends.CacheBackend"
@@ -672,10 +734,22 @@ DEFAULT_AXE_SCRIPT = os.path.join(
     SITE_ROOT_DIR, "node_modules", "axe-core", "axe.min.js"
 )
 
-# Used for tracking accepts for the review rate limit
-TRANSCRIPTION_ACCEPTED_TRACKING_KEY = "TRANSCRIPTION_ACCEPTED_{user_id}"
+# Used for tracking accepts for the review rate limit. This is a sorted set
+# in Redis, so it doesn't share a name with the list the limit used to use.
+TRANSCRIPTION_ACCEPTED_TRACKING_KEY = "TRANSCRIPTION_ACCEPTED_WINDOW_{user_id}"
+
+# Sorted tag values for an asset, shared by the asset page and the API
+ASSET_TAGS_CACHE_KEY = "ASSET_TAGS_{asset_id}"
+ASSET_TAGS_CACHE_TIMEOUT = 60 * 60  # One hour
+
+# OCR queued with the ASYNC_OCR flag, keyed by Celery task ID. A task still
+# pending once its entry expires is reported to the user as having failed.
+OCR_TASK_CACHE_KEY = "OCR_TASK_{task_id}"
+OCR_TASK_TIMEOUT = 5 * 60  # Five minutes
 
 CONFIGURATION_CACHE_TIMEOUT = 3600  # One hour
+# Longest a process keeps a configuration value if a change broadcast is missed
+CONFIGURATION_LOCAL_CACHE_TIMEOUT = 30
 
 # The number of assets to store for next_transcribabe/next_reviewable, per campaign
 NEXT_TRANSCRIBABE_ASSET_COUNT = 100
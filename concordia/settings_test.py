@@ -42,6 +42,8 @@ structlog.configure(
     logger_factory=structlog.stdlib.LoggerFactory(),
 )
 
+CDN_PURGE_TRANSPORT = "concordia.cdn.LocMemPurgeTransport"
+
 # These cause Celery to run tasks locally, synchronously and immediately
 CELERY_TASK_ALWAYS_EAGER = True
 CELERY_TASK_EAGER_PROPAGATES = True
@@ -59,6 +61,9 @@ SESSION_ENGINE = "django.contrib.sessions.backends.cache"
 
 RATELIMIT_ENABLE = False
 
+# Tests change configuration values directly, so skip the process-local cache
+CONFIGURATION_LOCAL_CACHE_TIMEOUT = 0
+
 # Turnstile settings
 TURNSTILE_JS_API_URL = os.environ.get(
     "TURNSTILE_JS_API_URL", "https://challenges.cloudflare.com/turnstile/v0/api.js"
@@ -1,6 +1,6 @@
 import logging
 from time import time
-from typing import Any
+from typing import Any, Iterable, Optional, Union
 
 import structlog
 from asgiref.sync import AsyncToSync
@@ -9,8 +9,17 @@ from django.conf import settings
 from django.contrib.auth import login as auth_login
 from django.contrib.auth.models import Group, User
 from django.contrib.auth.signals import user_logged_in, user_login_failed
+from django.core.cache import cache
 from django.core.mail import EmailMultiAlternatives
-from django.db.models.signals import post_delete, post_save
+from django.db import transaction
+from django.db.models import Model, QuerySet
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_migrate,
+    post_save,
+    pre_delete,
+)
 from django.dispatch import receiver
 from django.http import HttpRequest
 from django.http.response import HttpResponseBase
@@ -19,16 +28,30 @@ from django_registration.signals import user_activated, user_registered
 from django_structlog import signals
 from flags.state import flag_enabled
 
+from concordia.activity_series import activity_counter
 from concordia.logging import ConcordiaLogger
 from concordia.models import (
     Asset,
+    Campaign,
+    CardFamily,
+    HelpfulLink,
+    Item,
+    Project,
+    ProjectTopic,
+    Tag,
+    Topic,
     Transcription,
     TranscriptionStatus,
+    UserAssetTagCollection,
     UserProfile,
 )
 from concordia.tasks.assets import calculate_difficulty_values
 from concordia.tasks.useractivity import update_useractivity_cache
+from concordia.utils import get_anonymous_user, get_default_card_family
+from concordia.utils.admin_filter_cache import invalidate_filter_options
 from concordia.utils.next_asset import remove_next_asset_objects
+from concordia.utils.page_cache import invalidate_item_pages, invalidate_page_cache
+from concordia.utils.singletons import invalidate_singletons
 
 from .signals import reservation_obtained, reservation_released
 
@@ -207,10 +230,14 @@ def update_asset_status(
         Derive the asset's new status based on the latest transcription flags
         (accepted, submitted, rejected). Proceed only if the saved instance is
         the asset's current latest transcription. Persist the new status and
-        trigger downstream tasks and cache cleanup.
+        trigger downstream tasks and cache cleanup. Only the status is
+        written, and only if it changed, so unchanged assets don't
+        invalidate their cached pages.
 
     Side Effects:
-        - Saves the `Asset` with an updated `transcription_status`.
+        - Updates the `Asset`'s `transcription_status`.
+        - Invalidates the asset's cached pages if the status changed.
+        - Broadcasts the asset update to the channel layer.
         - Removes next-asset cache entries via `remove_next_asset_objects`.
         - Triggers difficulty calculation on the saved asset.
 
@@ -266,17 +293,159 @@ def update_asset_status(
         new_status,
     )
 
+    # Most saves are drafts which leave the status unchanged. Only write the
+    # status, and only invalidate the asset's cached pages, if it changed;
+    # the instance may be stale, so the database decides.
+    changed = (
+        Asset.objects.filter(pk=asset.pk)
+        .exclude(transcription_status=new_status)
+        .update(transcription_status=new_status)
+    )
     asset.transcription_status = new_status
-    asset.full_clean()
-    asset.save()
-
-    logger.info("Status for %s (%s) updated", asset, asset.id)
+    asset.saved_page_values = asset.get_page_values()
+    if changed:
+        invalidate_item_pages(asset.item_id)
+        logger.info("Status for %s (%s) updated", asset, asset.id)
+    else:
+        logger.info("Status for %s (%s) unchanged", asset, asset.id)
+    send_asset_update(instance=asset)
 
     remove_next_asset_objects(asset.id)
 
     calculate_difficulty_values(Asset.objects.filter(pk=asset.pk))
 
 
+@receiver(post_save, sender=Transcription)
+@receiver(post_delete, sender=Transcription)
+def update_asset_transcription_state(
+    sender: type[Transcription],
+    *,
+    instance: Transcription,
+    **kwargs: Any,
+) -> None:
+    """
+    Refresh the parent asset's contributor count and undo/redo availability.
+
+    Behavior:
+        Recompute the values from the asset's transcription history and
+        store them on the asset. This runs after `update_asset_status`, so
+        its save of the asset can't overwrite them, and inside the
+        transaction which wrote the transcription. Deletions cascading from
+        the asset or its ancestors are skipped, since the asset is going
+        too.
+
+    Args:
+        sender (type[Transcription]): The Transcription model class.
+        instance (Transcription): The saved or deleted transcription.
+
+    Returns:
+        None
+    """
+    origin = kwargs.get("origin")
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if origin is not None and not issubclass(origin_model, Transcription):
+        return
+
+    instance.asset.update_transcription_state()
+
+
+def invalidate_asset_tags(asset_pks: Iterable[int]) -> None:
+    """
+    Discard the cached tag values for the given assets.
+
+    Args:
+        asset_pks (Iterable[int]): Primary keys of the assets.
+    """
+    cache.delete_many([Asset.get_tags_cache_key(pk) for pk in set(asset_pks)])
+
+
+@receiver(m2m_changed, sender=UserAssetTagCollection.tags.through)
+def on_tag_collection_change(
+    sender: type[Model],
+    *,
+    instance: Union[UserAssetTagCollection, Tag],
+    action: str,
+    reverse: bool,
+    pk_set: Optional[set[int]],
+    **kwargs: Any,
+) -> None:
+    """
+    Discard cached asset tags when tags are added to or removed from a
+    collection.
+
+    Behavior:
+        For changes made through a collection, only its asset is affected.
+        For changes made through a tag, the affected collections are looked
+        up; clearing a tag's collections is handled before the rows are
+        removed so they can still be found.
+
+    Args:
+        sender (type[Model]): The collection/tag through model.
+        instance (UserAssetTagCollection | Tag): The object whose relation
+            changed.
+        action (str): The m2m_changed action.
+        reverse (bool): True if the change was made through a tag.
+        pk_set (set[int] | None): Primary keys of the related objects.
+
+    Returns:
+        None
+    """
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            invalidate_asset_tags([instance.asset_id])
+    elif action == "pre_clear":
+        invalidate_asset_tags(
+            instance.userassettagcollection_set.values_list("asset_id", flat=True)
+        )
+    elif action in ("post_add", "post_remove"):
+        invalidate_asset_tags(
+            UserAssetTagCollection.objects.filter(pk__in=pk_set).values_list(
+                "asset_id", flat=True
+            )
+        )
+
+
+@receiver(post_save, sender=Tag)
+@receiver(pre_delete, sender=Tag)
+def on_tag_change(sender: type[Tag], *, instance: Tag, **kwargs: Any) -> None:
+    """
+    Discard cached tags for every asset using a tag which changed or is
+    about to be deleted.
+
+    Args:
+        sender (type[Tag]): The Tag model class.
+        instance (Tag): The saved or deleted tag.
+
+    Returns:
+        None
+    """
+    invalidate_asset_tags(
+        UserAssetTagCollection.objects.filter(tags=instance).values_list(
+            "asset_id", flat=True
+        )
+    )
+
+
+@receiver(post_delete, sender=UserAssetTagCollection)
+def on_tag_collection_delete(
+    sender: type[UserAssetTagCollection],
+    *,
+    instance: UserAssetTagCollection,
+    **kwargs: Any,
+) -> None:
+    """
+    Discard cached tags for the asset of a deleted tag collection.
+
+    Args:
+        sender (type[UserAssetTagCollection]): The collection model class.
+        instance (UserAssetTagCollection): The deleted collection.
+
+    Returns:
+        None
+    """
+    invalidate_asset_tags([instance.asset_id])
+
+
 @receiver(post_save, sender=Asset)
 def send_asset_update(
     *,
@@ -446,6 +615,169 @@ def remove_file_from_s3(
     instance.storage_image.delete(save=False)
 
 
+@receiver(post_save, sender=Campaign)
+@receiver(post_delete, sender=Campaign)
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+@receiver(post_save, sender=Topic)
+@receiver(post_delete, sender=Topic)
+def on_filter_option_change(sender: Any, **kwargs: Any) -> None:
+    """
+    Invalidate the cached admin list filter options.
+
+    The campaign, project and topic filters in the admin cache their option
+    lists; any change to those models may change the options.
+
+    Args:
+        sender (Any): The Campaign, Project or Topic model class.
+        **kwargs: Additional signal data (ignored).
+
+    Returns:
+        None
+    """
+    invalidate_filter_options()
+
+
+@receiver(post_save, sender=Campaign)
+@receiver(post_delete, sender=Campaign)
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+@receiver(post_save, sender=ProjectTopic)
+@receiver(post_delete, sender=ProjectTopic)
+@receiver(post_save, sender=Topic)
+@receiver(post_delete, sender=Topic)
+@receiver(post_save, sender=HelpfulLink)
+@receiver(post_delete, sender=HelpfulLink)
+def on_site_page_content_change(sender: Any, **kwargs: Any) -> None:
+    """
+    Invalidate every cached public page.
+
+    Campaigns, projects and topics, and their links, appear on listing pages
+    throughout the site, and changes to them are made by staff rather than
+    by volunteers, so they invalidate every cached page rather than tracking
+    which pages show them.
+
+    Args:
+        sender (Any): The model class of the changed instance.
+        **kwargs: Additional signal data (ignored).
+
+    Returns:
+        None
+    """
+    invalidate_page_cache()
+
+
+@receiver(post_save, sender=Item)
+@receiver(post_delete, sender=Item)
+@receiver(post_delete, sender=Asset)
+def on_item_page_content_change(
+    sender: Any, *, instance: Item | Asset, **kwargs: Any
+) -> None:
+    """
+    Invalidate cached pages for the changed item or the deleted asset.
+
+    Asset changes alter the counts and lists shown on the pages for the
+    asset's item, project and campaign, so each of those is invalidated.
+
+    Args:
+        sender (Any): The Item or Asset model class.
+        instance (Item | Asset): The changed item or deleted asset.
+        **kwargs: Additional signal data (ignored).
+
+    Returns:
+        None
+    """
+    item_pk = instance.pk if isinstance(instance, Item) else instance.item_id
+    invalidate_item_pages(item_pk)
+
+
+@receiver(post_save, sender=Asset)
+def on_asset_page_content_change(
+    sender: type[Asset], *, instance: Asset, created: bool, **kwargs: Any
+) -> None:
+    """
+    Invalidate cached pages for a saved asset if anything they show changed.
+
+    Assets are saved far more often than the pages showing them change, for
+    example after every draft transcription and image download, so pages
+    are only invalidated for new assets or changes to `Asset.PAGE_FIELDS`.
+    An asset moved to another item invalidates the pages for both items.
+
+    Args:
+        sender (type[Asset]): The Asset model class.
+        instance (Asset): The saved asset.
+        created (bool): True if the asset was created.
+        **kwargs: Additional signal data (ignored).
+
+    Returns:
+        None
+    """
+    previous = getattr(instance, "saved_page_values", None)
+    instance.saved_page_values = instance.get_page_values()
+    if not created and previous == instance.saved_page_values:
+        return
+
+    invalidate_item_pages(instance.item_id)
+    previous_item_pk = (previous or {}).get("item_id", instance.item_id)
+    if previous_item_pk != instance.item_id:
+        invalidate_item_pages(previous_item_pk)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def on_anonymous_user_change(sender: Any, *, instance: User, **kwargs: Any) -> None:
+    """
+    Discard the process-local cached anonymous user when it changes.
+
+    Args:
+        sender (Any): The user model class.
+        instance (User): The changed user.
+        **kwargs: Additional signal data (ignored).
+
+    Returns:
+        None
+    """
+    if instance.username == "anonymous":
+        get_anonymous_user.invalidate()
+
+
+@receiver(post_save, sender=CardFamily)
+@receiver(post_delete, sender=CardFamily)
+def on_card_family_change(sender: Any, **kwargs: Any) -> None:
+    """
+    Discard the process-local cached default card family.
+
+    Saving a card family may change which one is the default, so any change
+    invalidates it.
+
+    Args:
+        sender (Any): The CardFamily model class.
+        **kwargs: Additional signal data (ignored).
+
+    Returns:
+        None
+    """
+    get_default_card_family.invalidate()
+
+
+@receiver(post_migrate)
+def on_post_migrate(sender: Any, **kwargs: Any) -> None:
+    """
+    Discard every process-local cached singleton.
+
+    The flush command sends this signal after emptying the database, which
+    deletes cached rows without sending delete signals.
+
+    Args:
+        sender (Any): The migrated app config.
+        **kwargs: Additional signal data (ignored).
+
+    Returns:
+        None
+    """
+    invalidate_singletons()
+
+
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
 def create_user_profile(
     sender: Any,
@@ -521,6 +853,106 @@ def on_transcription_save(
         )
 
 
+def count_activity(asset_id: int, event: str) -> None:
+    """
+    Count activity for the activity charts once the current transaction
+    commits.
+
+    Counting is best effort: a failure is logged rather than raised, so it
+    can't fail the request which did the work.
+
+    Args:
+        asset_id (int): ID of the asset the activity belongs to.
+        event (str): One of `ACTIVITY_EVENTS`.
+    """
+
+    def increment() -> None:
+        try:
+            activity_counter.increment(asset_id, event)
+        except Exception:
+            structured_logger.exception(
+                "Failed to count activity.",
+                event_code="activity_series_increment_failed",
+                reason="The activity counter could not be updated.",
+                reason_code="activity_counter_error",
+                asset_id=asset_id,
+                activity_event=event,
+            )
+
+    transaction.on_commit(increment)
+
+
+@receiver(post_save, sender=Transcription)
+def on_transcription_activity(
+    sender: type[Transcription],
+    *,
+    instance: Transcription,
+    created: bool,
+    **kwargs: Any,
+) -> None:
+    """
+    Count a transcription save, submission or review for the activity charts.
+
+    Behavior:
+        A new transcription counts as its latest step: accepted or rejected,
+        then submitted, and otherwise saved. The blank transcription created
+        for the anonymous user so OCR can be undone isn't counted. Later
+        saves count each step whose timestamp was set by that save, compared
+        with the values the transcription was loaded with.
+
+    Args:
+        sender (type[Transcription]): The Transcription model class.
+        instance (Transcription): The saved transcription.
+        created (bool): True if the transcription was just created.
+
+    Returns:
+        None
+    """
+    previous = getattr(instance, "saved_review_values", None)
+    current = instance.saved_review_values = instance.get_review_values()
+
+    if created:
+        event = next(
+            (field for field in Transcription.REVIEW_FIELDS if current.get(field)),
+            "saved",
+        )
+        if (
+            event == "saved"
+            and not instance.text
+            and instance.user_id == get_anonymous_user().pk
+        ):
+            return
+        count_activity(instance.asset_id, event)
+        return
+
+    if previous is None:
+        # Without the loaded values there's no telling what this save changed
+        return
+    for field in Transcription.REVIEW_FIELDS:
+        if current.get(field) and current.get(field) != previous.get(field):
+            count_activity(instance.asset_id, field)
+
+
+@receiver(reservation_obtained)
+def on_reservation_activity(sender: Any, **kwargs: Any) -> None:
+    """
+    Count a new asset reservation for the activity charts.
+
+    Renewals of an existing reservation, which send the same signal, are
+    not counted.
+
+    Args:
+        sender (Any): The caller that obtained the reservation.
+        **kwargs: Expected keys are "asset_pk" and, for new reservations,
+            "created".
+
+    Returns:
+        None
+    """
+    if kwargs.get("created"):
+        count_activity(int(kwargs["asset_pk"]), "reserved")
+
+
 @receiver(signals.update_failure_response)
 @receiver(signals.bind_extra_request_finished_metadata)
 def add_request_id_to_response(
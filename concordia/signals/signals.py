@@ -2,12 +2,15 @@
 Signals emitted by Concordia to announce reservation lifecycle events.
 
 Signals:
-    reservation_obtained (Signal): Emitted when an asset reservation is created.
+    reservation_obtained (Signal): Emitted when an asset reservation is created
+        or renewed.
         Sender:
             The actor that initiated the reservation (for example, a view).
         Keyword arguments:
             asset_pk (int): Primary key of the reserved asset.
             reservation_token (str): Reservation token.
+            created (bool, optional): True if the reservation is new rather
+                than a renewal.
 
     reservation_released (Signal): Emitted when an asset reservation is released.
         Sender:
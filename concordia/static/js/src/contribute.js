@@ -67,6 +67,43 @@ $(document).on('keydown', function (event) {
     }
 });
 
+// How often to check on work, such as OCR, that the server has queued
+var QUEUED_RESULT_POLL_INTERVAL = 2000;
+// How long to wait for queued work before giving up. The server times out
+// queued OCR sooner than this, so this only applies if it never answers.
+var QUEUED_RESULT_MAX_WAIT = 6 * 60 * 1000;
+
+function waitForQueuedResult(statusUrl) {
+    /*
+    Poll a status URL returned in a 202 response until the queued work has
+    finished. The returned promise resolves or rejects with the same arguments
+    as the $.ajax callbacks for the final, non-202 response, or rejects with a
+    timeout error if the work hasn't finished within QUEUED_RESULT_MAX_WAIT.
+    */
+    var deferred = $.Deferred();
+    var deadline = Date.now() + QUEUED_RESULT_MAX_WAIT;
+
+    function poll() {
+        $.ajax({url: statusUrl, method: 'GET', dataType: 'json'})
+            .done(function (data, textStatus, jqXHR) {
+                if (jqXHR.status !== 202) {
+                    deferred.resolve(data, textStatus, jqXHR);
+                } else if (Date.now() < deadline) {
+                    setTimeout(poll, QUEUED_RESULT_POLL_INTERVAL);
+                } else {
+                    jqXHR.responseJSON = {
+                        error: 'Timed out waiting for the server. Please try again.',
+                    };
+                    deferred.reject(jqXHR, 'timeout', '');
+                }
+            })
+            .fail(deferred.reject);
+    }
+
+    setTimeout(poll, QUEUED_RESULT_POLL_INTERVAL);
+    return deferred.promise();
+}
+
 function resetTurnstile() {
     if (window.turnstile) {
         window.turnstile.reset('.cf-turnstile');
@@ -114,6 +151,14 @@ function setupPage() {
                 dataType: 'json',
                 data: $.param(formData),
             })
+                .then(function (data, textStatus, jqXHR) {
+                    // Some work is queued rather than done in the request; in
+                    // that case we wait for the result before reporting back
+                    if (jqXHR.status === 202 && data.statusUrl) {
+                        return waitForQueuedResult(data.statusUrl);
+                    }
+                    return jqXHR;
+                })
                 .done(function (data, textStatus) {
                     $form.trigger('form-submit-success', {
                         textStatus: textStatus,
@@ -1,4 +1,5 @@
 import os.path
+from collections import defaultdict
 from logging import getLogger
 from tempfile import NamedTemporaryFile
 
@@ -6,7 +7,7 @@ import requests
 from more_itertools.more import chunked
 
 from concordia.logging import ConcordiaLogger
-from concordia.models import Asset
+from concordia.models import Asset, Transcription
 from concordia.storage import ASSET_STORAGE
 
 from ..celery import app as celery_app
@@ -64,6 +65,68 @@ def calculate_difficulty_values(asset_qs=None):
     return updated_count
 
 
+@celery_app.task
+def refresh_asset_transcription_state(asset_qs=None):
+    """
+    Recompute the stored transcription summary of assets and fix stale values.
+
+    The ``contributor_count``, ``undo_available`` and ``redo_available``
+    fields are normally maintained by the Transcription signal handlers.
+    This checks them against the transcription history, for example after
+    transcriptions were changed with queryset updates which don't send
+    signals. Assets without transcriptions are fixed with a single update;
+    the rest are processed in 500-row chunks, with contributors counted for
+    a whole chunk at once, and only assets whose values changed are saved.
+
+    Args:
+        asset_qs: Optional queryset of Asset instances to process. If omitted,
+            every asset is processed.
+
+    Returns:
+        int: The number of Asset records whose stored values were updated.
+    """
+
+    if asset_qs is None:
+        asset_qs = Asset.objects.all()
+
+    updated_count = (
+        asset_qs.filter(transcription__isnull=True)
+        .exclude(contributor_count=0, undo_available=False, redo_available=False)
+        .update(contributor_count=0, undo_available=False, redo_available=False)
+    )
+
+    transcribed_assets = asset_qs.filter(transcription__isnull=False).distinct()
+    for asset_chunk in chunked(transcribed_assets.order_by("pk").iterator(), 500):
+        contributors = defaultdict(set)
+        for asset_id, user_id, reviewer_id in Transcription.objects.filter(
+            asset__in=asset_chunk
+        ).values_list("asset_id", "user_id", "reviewed_by_id"):
+            contributors[asset_id].add(user_id)
+            if reviewer_id is not None:
+                contributors[asset_id].add(reviewer_id)
+
+        changed_assets = []
+        for asset in asset_chunk:
+            state = {
+                "contributor_count": len(contributors[asset.pk]),
+                "undo_available": asset.can_rollback()[0],
+                "redo_available": asset.can_rollforward()[0],
+            }
+            if any(getattr(asset, field) != value for field, value in state.items()):
+                for field, value in state.items():
+                    setattr(asset, field, value)
+                changed_assets.append(asset)
+
+        if changed_assets:
+            Asset.objects.bulk_update(
+                changed_assets,
+                ["contributor_count", "undo_available", "redo_available"],
+            )
+            updated_count += len(changed_assets)
+
+    return updated_count
+
+
 @celery_app.task
 def populate_asset_years():
     """
@@ -0,0 +1,51 @@
+import requests
+from more_itertools.more import chunked
+
+from concordia.cdn import get_purge_transport, pop_pending_purges
+from concordia.logging import ConcordiaLogger
+
+from ..celery import app as celery_app
+
+structured_logger = ConcordiaLogger.get_logger(__name__)
+
+
+@celery_app.task(
+    autoretry_for=(requests.RequestException,),
+    retry_backoff=5,
+    max_retries=5,
+    ignore_result=True,
+)
+def purge_surrogate_keys_task(keys: list[str]) -> None:
+    """
+    Purge CDN pages tagged with any of the given surrogate keys.
+
+    Keys are sent in batches of the transport's `max_keys_per_request`.
+    Failed requests are retried with backoff; since a retry resends every
+    batch, transports must treat purging the same key twice as harmless.
+
+    Args:
+        keys: Surrogate keys to purge.
+    """
+    transport = get_purge_transport()
+    for batch in chunked(keys, transport.max_keys_per_request):
+        transport.purge(batch)
+
+    structured_logger.info(
+        "CDN purge sent.",
+        event_code="cdn_purge_sent",
+        transport=transport.__class__.__name__,
+        key_count=len(keys),
+    )
+
+
+@celery_app.task(ignore_result=True)
+def flush_pending_purges() -> None:
+    """
+    Purge every surrogate key collected since the last run.
+
+    Runs periodically, so changes anywhere on the site within one interval
+    are purged together in as few requests as the transport allows.
+    """
+    keys = pop_pending_purges()
+    if keys:
+        purge_surrogate_keys_task.delay(sorted(keys))
@@ -0,0 +1,175 @@
+import io
+from logging import getLogger
+from typing import Optional
+
+import pytesseract
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import transaction
+from PIL import Image
+
+from concordia.logging import ConcordiaLogger
+from concordia.models import Asset, AssetOcrResult, Transcription
+
+from ..celery import app as celery_app
+
+logger = getLogger(__name__)
+structured_logger = ConcordiaLogger.get_logger(__name__)
+
+
+@celery_app.task(acks_late=True)
+def generate_ocr_transcription_task(
+    asset_pk: int,
+    user_pk: int,
+    superseded_pk: int,
+    language: Optional[str] = None,
+) -> dict:
+    """
+    Run OCR for an asset and save the result as a new transcription.
+
+    This is the out-of-request half of OCR transcription generation. The web
+    request validates the request, creates the blank transcription to
+    supersede if needed and queues this task; tesseract then runs here, on a
+    worker consuming the ``ocr`` queue, without holding a database transaction
+    open. Once the text is available the supersession check is repeated
+    inside a transaction, since another transcription may have been saved
+    while OCR was running.
+
+    Args:
+        asset_pk: Primary key of the asset to OCR.
+        user_pk: Primary key of the user who requested the OCR.
+        superseded_pk: Primary key of the transcription the OCR result
+            supersedes.
+        language: Optional Tesseract language code.
+
+    Returns:
+        dict: ``{"transcription_id": <pk>}`` on success, or
+        ``{"error": <message>, "status": <HTTP status>}`` if the superseded
+        transcription was superseded while OCR was running.
+    """
+    asset = Asset.objects.get(pk=asset_pk)
+    user = User.objects.get(pk=user_pk)
+
+    transcription_text = asset.get_ocr_transcript(language)
+
+    with transaction.atomic():
+        superseded = Transcription.objects.select_for_update().get(
+            pk=superseded_pk, asset=asset
+        )
+        if Transcription.objects.filter(supersedes=superseded).exists():
+            structured_logger.warning(
+                "OCR generation aborted: transcription superseded during OCR.",
+                event_code="ocr_generation_aborted",
+                reason="Superseded transcription was superseded while OCR ran",
+                reason_code="superseded_invalid",
+                user=user,
+                asset=asset,
+                supersedes_pk=superseded_pk,
+            )
+            return {
+                "error": "This transcription has been superseded",
+                "status": 409,
+            }
+
+        transcription = Transcription(
+            asset=asset,
+            user=user,
+            supersedes=superseded,
+            text=transcription_text,
+            ocr_generated=True,
+            ocr_originated=True,
+        )
+        transcription.full_clean()
+        transcription.save()
+
+    structured_logger.info(
+        "OCR transcription successfully created.",
+        event_code="ocr_generation_success",
+        user=user,
+        transcription=transcription,
+    )
+    return {"transcription_id": transcription.pk}
+
+
+@celery_app.task
+def pre_ocr_asset_task(asset_pk: int) -> int:
+    """
+    Run OCR ahead of time for a newly imported asset.
+
+    Queued by the importer once the asset's image has been downloaded, so
+    that the "Transcribe with OCR" button only has to look up an
+    ``AssetOcrResult`` rather than run tesseract. OCR is run in each language
+    in ``settings.PRE_OCR_LANGUAGES``. Assets with OCR turned off, directly
+    or on their item, project or campaign, are skipped, as are languages
+    which already have a result for the current image.
+
+    Each task runs one tesseract process at a time and is routed to the
+    ``pre_ocr`` queue, whose worker's concurrency alone decides how many run
+    on a host; OCR requested by volunteers is queued separately and never
+    waits behind an import. The image is read and decoded once and reused
+    for every language.
+
+    Args:
+        asset_pk: Primary key of the asset to OCR.
+
+    Returns:
+        int: The number of OCR results stored.
+    """
+    languages = [
+        language
+        for language in settings.PRE_OCR_LANGUAGES
+        if language in settings.PYTESSERACT_ALLOWED_LANGUAGES
+    ]
+    if not languages:
+        return 0
+
+    asset = (
+        Asset.objects.filter(
+            pk=asset_pk,
+            disable_ocr=False,
+            item__disable_ocr=False,
+            item__project__disable_ocr=False,
+            item__project__campaign__disable_ocr=False,
+        )
+        .exclude(storage_image="")
+        .first()
+    )
+    if asset is None:
+        return 0
+
+    try:
+        image_data, checksum = asset.get_storage_image_data()
+        existing = set(
+            AssetOcrResult.objects.filter(asset=asset, checksum=checksum).values_list(
+                "language", flat=True
+            )
+        )
+        missing = [language for language in languages if language not in existing]
+        if not missing:
+            return 0
+        image = Image.open(io.BytesIO(image_data))
+        image.load()
+    except Exception:
+        logger.exception("Unable to read the image for asset %s", asset.pk)
+        return 0
+
+    results = []
+    for language in missing:
+        try:
+            text = pytesseract.image_to_string(image, lang=language)
+        except Exception:
+            logger.exception("OCR of asset %s in %s failed", asset.pk, language)
+            continue
+        results.append(
+            AssetOcrResult(asset=asset, checksum=checksum, language=language, text=text)
+        )
+
+    AssetOcrResult.objects.bulk_create(results, ignore_conflicts=True)
+
+    structured_logger.info(
+        "Pre-OCR of imported asset complete.",
+        event_code="pre_ocr_complete",
+        asset=asset,
+        result_count=len(results),
+    )
+    return len(results)
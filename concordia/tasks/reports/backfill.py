@@ -1,9 +1,10 @@
 import datetime
 import time
 from logging import getLogger
-from typing import Iterable, Optional
 
-from django.db.models import Sum
+from django.db import connection
+from django.db.models import F, QuerySet, Value, Window
+from django.db.models.functions import Coalesce, Greatest, Lag
 
 from concordia.decorators import locked_task
 from concordia.logging import ConcordiaLogger
@@ -11,11 +12,6 @@ from concordia.models import SiteReport
 
 from ...celery import app as celery_app
 
-# Heartbeat / streaming tuning
-HEARTBEAT_EVERY_ROWS = 1000
-HEARTBEAT_EVERY_SECONDS = 10.0
-ITERATOR_CHUNK_SIZE = 2000
-
 # Matching window for associating campaign reports with a site-wide TOTAL
 # snapshot. Reports in a single daily run are created within minutes of
 # one another, but we use a wider band to make backfill resilient.
@@ -25,6 +21,111 @@ logger = getLogger(__name__)
 structured_logger = ConcordiaLogger.get_logger(__name__)
 
 
+def _series_deltas(queryset: QuerySet, partition_field: str) -> QuerySet:
+    """
+    Annotate each snapshot with its ``assets_started`` delta.
+
+    ``LAG()`` over each series compares a snapshot with the one before it
+    using the same formula as ``SiteReport.calculate_assets_started``. The
+    first snapshot in a series is compared with itself, giving 0.
+
+    Args:
+        queryset: Snapshots of every series to compute.
+        partition_field: Field identifying a snapshot's series, such as
+            ``"campaign_id"``.
+
+    Returns:
+        QuerySet: ``id`` and ``calculated`` values for every snapshot.
+    """
+    started = Greatest(
+        Coalesce(F("assets_total"), 0) - Coalesce(F("assets_not_started"), 0), 0
+    )
+    previous_started = Window(
+        Lag(started, default=started),
+        partition_by=F(partition_field),
+        order_by=(F("created_on").asc(), F("id").asc()),
+    )
+    return (
+        queryset.annotate(calculated=Greatest(started - previous_started, 0))
+        .order_by()
+        .values("id", "calculated")
+    )
+
+
+def _total_rollups() -> tuple[str, tuple]:
+    """
+    Build SQL summing campaign ``assets_started`` around each TOTAL snapshot.
+
+    Every site-wide TOTAL snapshot is range-joined to the campaign snapshots
+    created within ``TOTAL_ROLLUP_WINDOW_HOURS`` of it and grouped, so the
+    whole series is computed by one query.
+
+    Returns:
+        tuple: SQL selecting ``id`` and ``calculated`` for every TOTAL
+            snapshot, and its parameters.
+    """
+    window = datetime.timedelta(hours=TOTAL_ROLLUP_WINDOW_HOURS)
+    # The ORM compiles the date arithmetic for the database in use
+    totals_sql, totals_params = (
+        SiteReport.objects.filter(
+            report_name=SiteReport.ReportName.TOTAL,
+            campaign__isnull=True,
+            topic__isnull=True,
+        )
+        .annotate(
+            window_start=F("created_on") - window, window_end=F("created_on") + window
+        )
+        .order_by()
+        .values("id", "window_start", "window_end")
+        .query.sql_with_params()
+    )
+    table = connection.ops.quote_name(SiteReport._meta.db_table)
+    sql = f"""
+        SELECT total.id AS id, COALESCE(SUM(campaign.assets_started), 0) AS calculated
+        FROM ({totals_sql}) AS total
+        LEFT JOIN {table} AS campaign
+            ON campaign.campaign_id IS NOT NULL
+            AND campaign.created_on >= total.window_start
+            AND campaign.created_on <= total.window_end
+        GROUP BY total.id
+    """
+    return sql, totals_params
+
+
+def _update_assets_started(sql: str, params: tuple, *, skip_existing: bool) -> int:
+    """
+    Set ``assets_started`` from calculated values with one UPDATE.
+
+    Args:
+        sql: Query selecting ``id`` and ``calculated`` columns.
+        params: Parameters for ``sql``.
+        skip_existing: If true, only rows with a null ``assets_started`` are
+            updated.
+
+    Returns:
+        int: Number of rows whose value changed.
+    """
+    table = connection.ops.quote_name(SiteReport._meta.db_table)
+    if skip_existing:
+        condition = f"{table}.assets_started IS NULL"
+    else:
+        condition = (
+            f"({table}.assets_started IS NULL"
+            f" OR {table}.assets_started <> calculated.calculated)"
+        )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {table}
+            SET assets_started = calculated.calculated
+            FROM ({sql}) AS calculated
+            WHERE {table}.id = calculated.id AND {condition}
+            """,
+            params,
+        )
+        return cursor.rowcount
+
+
 @celery_app.task(bind=True, ignore_result=True)
 @locked_task(lock_by_args=False)
 def backfill_assets_started_for_site_reports(self, skip_existing: bool = True) -> int:
@@ -35,6 +136,10 @@ def backfill_assets_started_for_site_reports(self, skip_existing: bool = True) -
     relevant ``SiteReport`` rows. It should be removed after it has been run in
     production and the backfill is no longer needed.
 
+    Each kind of series is computed by a single set-based UPDATE, rather than
+    row by row, so the task runs a handful of statements however many
+    snapshots there are.
+
     Series processed:
 
     * Site-wide TOTAL (``report_name=TOTAL``)
@@ -65,13 +170,11 @@ def backfill_assets_started_for_site_reports(self, skip_existing: bool = True) -
 
     * By default, rows that already have a non-null ``assets_started`` value
       are skipped (``skip_existing=True``), so the task can be re-run to
-      resume where it left off. In this mode, only series that still contain
-      at least one snapshot with ``assets_started`` set to ``NULL`` are
-      processed.
+      resume where it left off. Skipped rows are still used as the previous
+      snapshot of the rows after them.
     * To recompute all rows, for example after changing the formula, call the
-      task with ``skip_existing=False``. In this mode, any series that has at
-      least one snapshot is processed, even if all snapshots already have
-      non-null ``assets_started`` values.
+      task with ``skip_existing=False``. Only rows whose value changes are
+      written.
 
     Args:
         skip_existing: If true, skip rows where ``assets_started`` is already
@@ -80,228 +183,62 @@ def backfill_assets_started_for_site_reports(self, skip_existing: bool = True) -
     Returns:
         The number of ``SiteReport`` rows updated across all series.
     """
+    task_id = getattr(self.request, "id", None)
     structured_logger.info(
         "Starting backfill for assets_started across all series.",
         event_code="assets_started_backfill_start",
         skip_existing=skip_existing,
-        task_id=getattr(self.request, "id", None),
+        task_id=task_id,
     )
 
-    updated_count = 0
-
-    def process_series_queryset(
-        qs: Iterable[SiteReport],
-        *,
-        series_label: str,
-        force_zero_assets_started: bool = False,
-        rollup_total_from_campaigns: bool = False,
-    ) -> int:
-        """
-        Process a single series in chronological order and backfill values.
-
-        This helper walks one site-report series and computes
-        ``assets_started`` for each row. It saves updated rows and logs progress,
-        including periodic heartbeat messages for monitoring long-running scans.
-
-        For rollup series whose membership can change over time (for example,
-        ``RETIRED_TOTAL``), the delta-based ``assets_started`` calculation is
-        not meaningful. In those cases, callers should set
-        ``force_zero_assets_started=True`` to backfill a consistent zero value.
-
-        For the site-wide TOTAL series, callers should set
-        ``rollup_total_from_campaigns=True`` to derive values by summing
-        per-campaign ``assets_started`` from the same daily reporting run.
-
-        Args:
-            qs: Queryset or iterable of ``SiteReport`` objects ordered by
-                ``created_on`` and primary key.
-            series_label: Short label for logging, such as ``"TOTAL"`` or
-                ``"CAMPAIGN:<id>"``.
-            force_zero_assets_started: If True, set ``assets_started`` to 0 for
-                every row in the series instead of computing deltas between
-                snapshots.
-            rollup_total_from_campaigns: If True, compute ``assets_started`` for
-                each row by rolling up per-campaign values within a time window
-                around the row's ``created_on``.
-
-        Returns:
-            The number of rows in the series that were updated.
-        """
-        changed = 0
-        scanned = 0
-        previous: Optional[SiteReport] = None
-
+    def backfill_series(series_label: str, sql: str, params: tuple) -> int:
         series_start_t = time.monotonic()
-        last_hb_t = series_start_t
-        last_hb_rows = 0
-
+        changed = _update_assets_started(sql, params, skip_existing=skip_existing)
         structured_logger.info(
-            "Starting series scan.",
-            event_code="assets_started_backfill_series_start",
-            series=series_label,
-        )
-
-        window = datetime.timedelta(hours=TOTAL_ROLLUP_WINDOW_HOURS)
-
-        for current in qs.iterator(chunk_size=ITERATOR_CHUNK_SIZE):
-            scanned += 1
-
-            if force_zero_assets_started:
-                calculated = 0
-            elif rollup_total_from_campaigns:
-                window_start = current.created_on - window
-                window_end = current.created_on + window
-                agg = SiteReport.objects.filter(
-                    campaign__isnull=False,
-                    created_on__gte=window_start,
-                    created_on__lte=window_end,
-                ).aggregate(total=Sum("assets_started"))
-                calculated = int(agg["total"] or 0)
-            elif previous is None:
-                calculated = 0
-            else:
-                calculated = SiteReport.calculate_assets_started(
-                    previous_assets_total=previous.assets_total,
-                    previous_assets_not_started=previous.assets_not_started,
-                    current_assets_total=current.assets_total,
-                    current_assets_not_started=current.assets_not_started,
-                )
-
-            # Resume behavior: optionally skip already-populated rows.
-            if skip_existing and current.assets_started is not None:
-                previous = current
-                now_t = time.monotonic()
-                if (
-                    scanned - last_hb_rows >= HEARTBEAT_EVERY_ROWS
-                    or (now_t - last_hb_t) >= HEARTBEAT_EVERY_SECONDS
-                ):
-                    structured_logger.info(
-                        "Scanning series...",
-                        event_code="assets_started_backfill_series_heartbeat",
-                        series=series_label,
-                        scanned_rows=scanned,
-                        updated_rows=changed,
-                        last_seen_site_report_id=current.id,
-                    )
-                    last_hb_rows = scanned
-                    last_hb_t = now_t
-                continue
-
-            if current.assets_started != calculated:
-                current.assets_started = calculated
-                current.save(update_fields=["assets_started"])
-                changed += 1
-
-                structured_logger.info(
-                    "Backfilled assets_started for SiteReport.",
-                    event_code="assets_started_backfill_row",
-                    site_report_id=current.id,
-                    created_on=current.created_on.isoformat(),
-                    series=series_label,
-                    assets_started=calculated,
-                    previous_site_report_id=(previous.id if previous else None),
-                    campaign_id=current.campaign_id,
-                    topic_id=current.topic_id,
-                )
-
-            previous = current
-
-            now_t = time.monotonic()
-            if (
-                scanned - last_hb_rows >= HEARTBEAT_EVERY_ROWS
-                or (now_t - last_hb_t) >= HEARTBEAT_EVERY_SECONDS
-            ):
-                structured_logger.info(
-                    "Scanning series...",
-                    event_code="assets_started_backfill_series_heartbeat",
-                    series=series_label,
-                    scanned_rows=scanned,
-                    updated_rows=changed,
-                    last_seen_site_report_id=current.id,
-                )
-                last_hb_rows = scanned
-                last_hb_t = now_t
-
-        structured_logger.info(
-            "Finished series scan.",
+            "Finished series backfill.",
             event_code="assets_started_backfill_series_done",
             series=series_label,
-            scanned_rows=scanned,
             updated_rows=changed,
             elapsed_seconds=round(time.monotonic() - series_start_t, 3),
+            task_id=task_id,
         )
         return changed
 
-    # Per-campaign (includes retired campaigns; their historical reports remain)
-    campaign_base_qs = SiteReport.objects.filter(campaign__isnull=False)
-    if skip_existing:
-        campaign_ids_source = campaign_base_qs.filter(assets_started__isnull=True)
-    else:
-        campaign_ids_source = campaign_base_qs
+    updated_count = 0
 
-    campaign_ids = campaign_ids_source.values_list("campaign_id", flat=True).distinct()
-    for campaign_id in campaign_ids.iterator():
-        campaign_series = campaign_base_qs.filter(campaign_id=campaign_id).order_by(
-            "created_on", "pk"
-        )
-        updated_count += process_series_queryset(
-            campaign_series, series_label=f"CAMPAIGN:{campaign_id}"
-        )
+    # Per-campaign (includes retired campaigns; their historical reports
+    # remain). These come first because the TOTAL series rolls them up.
+    campaign_deltas = _series_deltas(
+        SiteReport.objects.filter(campaign__isnull=False), "campaign_id"
+    )
+    updated_count += backfill_series(
+        "CAMPAIGN", *campaign_deltas.query.sql_with_params()
+    )
 
     # Per-topic
-    topic_base_qs = SiteReport.objects.filter(topic__isnull=False)
-    if skip_existing:
-        topic_ids_source = topic_base_qs.filter(assets_started__isnull=True)
-    else:
-        topic_ids_source = topic_base_qs
-
-    topic_ids = topic_ids_source.values_list("topic_id", flat=True).distinct()
-    for topic_id in topic_ids.iterator():
-        topic_series = topic_base_qs.filter(topic_id=topic_id).order_by(
-            "created_on", "pk"
-        )
-        updated_count += process_series_queryset(
-            topic_series, series_label=f"TOPIC:{topic_id}"
-        )
+    topic_deltas = _series_deltas(
+        SiteReport.objects.filter(topic__isnull=False), "topic_id"
+    )
+    updated_count += backfill_series("TOPIC", *topic_deltas.query.sql_with_params())
 
     # Site-wide TOTAL (roll up per-campaign assets_started)
-    total_base_qs = SiteReport.objects.filter(
-        report_name=SiteReport.ReportName.TOTAL,
-        campaign__isnull=True,
-        topic__isnull=True,
-    )
-    total_exists_qs = total_base_qs
-    if skip_existing:
-        total_exists_qs = total_exists_qs.filter(assets_started__isnull=True)
-
-    if total_exists_qs.exists():
-        total_qs = total_base_qs.order_by("created_on", "pk")
-        updated_count += process_series_queryset(
-            total_qs,
-            series_label="TOTAL",
-            rollup_total_from_campaigns=True,
-        )
+    updated_count += backfill_series("TOTAL", *_total_rollups())
 
     # Site-wide RETIRED_TOTAL
-    retired_base_qs = SiteReport.objects.filter(
-        report_name=SiteReport.ReportName.RETIRED_TOTAL
+    retired_zeros = (
+        SiteReport.objects.filter(report_name=SiteReport.ReportName.RETIRED_TOTAL)
+        .annotate(calculated=Value(0))
+        .order_by()
+        .values("id", "calculated")
+    )
+    updated_count += backfill_series(
+        "RETIRED_TOTAL", *retired_zeros.query.sql_with_params()
     )
-    retired_exists_qs = retired_base_qs
-    if skip_existing:
-        retired_exists_qs = retired_exists_qs.filter(assets_started__isnull=True)
-
-    if retired_exists_qs.exists():
-        retired_total_qs = retired_base_qs.order_by("created_on", "pk")
-        updated_count += process_series_queryset(
-            retired_total_qs,
-            series_label="RETIRED_TOTAL",
-            force_zero_assets_started=True,
-        )
 
     structured_logger.info(
         "Completed backfill for assets_started.",
         event_code="assets_started_backfill_complete",
         updated_rows=updated_count,
-        task_id=getattr(self.request, "id", None),
+        task_id=task_id,
     )
     return updated_count
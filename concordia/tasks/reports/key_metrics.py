@@ -1,8 +1,15 @@
 import datetime
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from decimal import Decimal
+from itertools import accumulate
 from logging import getLogger
+from typing import Optional
 
+from django.db import transaction
 from django.db.models import Max
 from django.utils import timezone
+from flags.state import flag_enabled
 
 from concordia.decorators import locked_task
 from concordia.logging import ConcordiaLogger
@@ -13,6 +20,284 @@ from ...celery import app as celery_app
 logger = getLogger(__name__)
 structured_logger = ConcordiaLogger.get_logger(__name__)
 
+#: SiteReport fields whose monthly value is the change between two snapshots
+SNAPSHOT_DELTA_FIELDS = (
+    "assets_published",
+    "assets_completed",
+    "users_activated",
+    "anonymous_transcriptions",
+    "transcriptions_saved",
+    "tag_uses",
+)
+
+#: Calendar months in each fiscal quarter
+FISCAL_QUARTER_MONTHS = {1: (10, 11, 12), 2: (1, 2, 3), 3: (4, 5, 6), 4: (7, 8, 9)}
+
+REPORT_UNIQUE_FIELDS = ("period_type", "period_start", "period_end")
+
+
+class _SiteReportSeries:
+    """
+    A site-wide SiteReport series loaded into memory as parallel lists.
+
+    Rows are kept in the order the ``SiteReportManager`` series helpers use
+    (``created_on``, then ``pk``), and each helper is answered with a binary
+    search over the rows' local dates instead of a query.
+    """
+
+    def __init__(self, report_name: str):
+        rows = (
+            SiteReport.objects.filter(
+                SiteReport.objects._series_filter(report_name=report_name)
+            )
+            .order_by("created_on", "pk")
+            .values_list(
+                "created_on",
+                "campaign_id",
+                "topic_id",
+                "assets_started",
+                *SNAPSHOT_DELTA_FIELDS,
+            )
+        )
+        self.dates = []
+        self.values = {field: [] for field in SNAPSHOT_DELTA_FIELDS}
+        assets_started = []
+        for created_on, campaign_id, topic_id, started, *values in rows:
+            self.dates.append(timezone.localtime(created_on).date())
+            for field, value in zip(SNAPSHOT_DELTA_FIELDS, values, strict=True):
+                self.values[field].append(int(value or 0))
+            # sum_assets_started_for_series_between_dates only counts
+            # site-wide rows, even for RETIRED_TOTAL
+            if campaign_id is None and topic_id is None:
+                assets_started.append(int(started or 0))
+            else:
+                assets_started.append(0)
+        self.assets_started_totals = [0, *accumulate(assets_started)]
+
+    def last_on_or_before(self, day: datetime.date) -> Optional[int]:
+        """Return the index of the last row on or before `day`, if any."""
+        index = bisect_right(self.dates, day) - 1
+        return index if index >= 0 else None
+
+    def last_before(self, day: datetime.date) -> Optional[int]:
+        """Return the index of the last row strictly before `day`, if any."""
+        index = bisect_left(self.dates, day) - 1
+        return index if index >= 0 else None
+
+    def first_between(self, start: datetime.date, end: datetime.date) -> Optional[int]:
+        """Return the index of the first row between `start` and `end`, if any."""
+        index = bisect_left(self.dates, start)
+        if index < len(self.dates) and self.dates[index] <= end:
+            return index
+        return None
+
+    def value(self, index: Optional[int], field: str) -> int:
+        """Return a field of the row at `index`, treating no row as zero."""
+        if index is None:
+            return 0
+        return self.values[field][index]
+
+    def sum_assets_started(self, start: datetime.date, end: datetime.date) -> int:
+        """Return the total ``assets_started`` between two dates, inclusive."""
+        return (
+            self.assets_started_totals[bisect_right(self.dates, end)]
+            - self.assets_started_totals[bisect_left(self.dates, start)]
+        )
+
+
+def _monthly_values(
+    total: _SiteReportSeries,
+    retired: _SiteReportSeries,
+    month_start: datetime.date,
+    month_end: datetime.date,
+) -> dict[str, int]:
+    """
+    Compute a month's derived metrics from in-memory series.
+
+    This follows ``KeyMetricsReport._monthly_from_sitereports`` exactly, and
+    returns an empty dict in the same case it does.
+    """
+    total_eom = total.last_on_or_before(month_end)
+    retired_eom = retired.last_on_or_before(month_end)
+    if total_eom is None and retired_eom is None:
+        return {}
+
+    total_baseline = total.last_before(month_start)
+    if total_baseline is None and total_eom is not None:
+        total_baseline = total.first_between(month_start, month_end)
+    retired_baseline = retired.last_before(month_start)
+    if retired_baseline is None and retired_eom is not None:
+        retired_baseline = retired.first_between(month_start, month_end)
+
+    values = {}
+    for field in SNAPSHOT_DELTA_FIELDS:
+        current = total.value(total_eom, field) + retired.value(retired_eom, field)
+        baseline = total.value(total_baseline, field) + retired.value(
+            retired_baseline, field
+        )
+        values[field] = max(0, current - baseline)
+    values["assets_started"] = total.sum_assets_started(
+        month_start, month_end
+    ) + retired.sum_assets_started(month_start, month_end)
+    return values
+
+
+def _rollup(
+    report: KeyMetricsReport,
+    monthly_reports: list[KeyMetricsReport],
+    existing: Optional[KeyMetricsReport],
+) -> KeyMetricsReport:
+    """
+    Fill in a quarterly or fiscal-year report from its monthly reports.
+
+    This follows ``KeyMetricsReport.upsert_quarter``: derived fields are
+    summed, and manual fields are summed (or averaged) only if a month has a
+    value, keeping the existing report's value otherwise.
+    """
+    for field in KeyMetricsReport.CALCULATED_FIELDS:
+        setattr(
+            report,
+            field,
+            sum(getattr(monthly, field) or 0 for monthly in monthly_reports),
+        )
+
+    for field in KeyMetricsReport.MANUAL_FIELDS:
+        values = [
+            getattr(monthly, field)
+            for monthly in monthly_reports
+            if getattr(monthly, field) is not None
+        ]
+        if not values:
+            value = getattr(existing, field, None)
+        elif field == "avg_visit_seconds":
+            value = sum(values, Decimal(0)) / len(values)
+        else:
+            value = sum(values)
+        setattr(report, field, value)
+    return report
+
+
+def _bulk_upsert(reports: list[KeyMetricsReport], fields: tuple[str, ...]) -> None:
+    KeyMetricsReport.objects.bulk_create(
+        reports,
+        update_conflicts=True,
+        unique_fields=REPORT_UNIQUE_FIELDS,
+        update_fields=(*fields, "fiscal_year", "fiscal_quarter", "month", "updated_on"),
+    )
+
+
+@transaction.atomic
+def rebuild_key_metrics_reports(
+    first_month_start: datetime.date, last_month_start: datetime.date
+) -> int:
+    """
+    Recompute every KeyMetricsReport from SiteReport data in bulk.
+
+    This produces the same rows as calling ``KeyMetricsReport.upsert_month``
+    for every month in the range and then ``upsert_quarter`` and
+    ``upsert_fiscal_year`` for every period with monthly rows, but reads the
+    TOTAL and RETIRED_TOTAL series once and writes each period type with a
+    single upsert, rather than making several queries per period.
+
+    Args:
+        first_month_start: First day of the first month to compute.
+        last_month_start: First day of the last month to compute.
+
+    Returns:
+        int: Count of KeyMetricsReport rows created or updated.
+    """
+    total = _SiteReportSeries(SiteReport.ReportName.TOTAL)
+    retired = _SiteReportSeries(SiteReport.ReportName.RETIRED_TOTAL)
+
+    monthly_reports = []
+    month_start = first_month_start
+    while month_start <= last_month_start:
+        _, month_end = KeyMetricsReport.month_bounds(month_start)
+        values = _monthly_values(total, retired, month_start, month_end)
+        if values:
+            monthly_reports.append(
+                KeyMetricsReport(
+                    period_type=KeyMetricsReport.PeriodType.MONTHLY,
+                    period_start=month_start,
+                    period_end=month_end,
+                    fiscal_year=KeyMetricsReport.get_fiscal_year_for_date(month_end),
+                    fiscal_quarter=KeyMetricsReport.get_fiscal_quarter_for_date(
+                        month_end
+                    ),
+                    month=month_start.month,
+                    **values,
+                )
+            )
+        month_start = month_end + datetime.timedelta(days=1)
+    _bulk_upsert(monthly_reports, KeyMetricsReport.CALCULATED_FIELDS)
+
+    # Rollups include every monthly row, not just the ones computed above,
+    # and need the months' manual values, so they are read back
+    months_by_quarter = defaultdict(list)
+    months_by_year = defaultdict(list)
+    for monthly in KeyMetricsReport.objects.filter(
+        period_type=KeyMetricsReport.PeriodType.MONTHLY
+    ):
+        months_by_year[monthly.fiscal_year].append(monthly)
+        for fiscal_quarter, months in FISCAL_QUARTER_MONTHS.items():
+            if monthly.month in months:
+                months_by_quarter[(monthly.fiscal_year, fiscal_quarter)].append(monthly)
+
+    existing_reports = {
+        (report.period_type, report.period_start, report.period_end): report
+        for report in KeyMetricsReport.objects.exclude(
+            period_type=KeyMetricsReport.PeriodType.MONTHLY
+        )
+    }
+
+    rollup_fields = KeyMetricsReport.CALCULATED_FIELDS + KeyMetricsReport.MANUAL_FIELDS
+
+    quarterly_reports = []
+    for (fiscal_year, fiscal_quarter), months in sorted(months_by_quarter.items()):
+        first_month, *_, last_month = FISCAL_QUARTER_MONTHS[fiscal_quarter]
+        period_start = datetime.date(
+            fiscal_year - 1 if fiscal_quarter == 1 else fiscal_year, first_month, 1
+        )
+        _, period_end = KeyMetricsReport.month_bounds(
+            period_start.replace(month=last_month)
+        )
+        key = (KeyMetricsReport.PeriodType.QUARTERLY, period_start, period_end)
+        quarterly_reports.append(
+            _rollup(
+                KeyMetricsReport(
+                    period_type=KeyMetricsReport.PeriodType.QUARTERLY,
+                    period_start=period_start,
+                    period_end=period_end,
+                    fiscal_year=fiscal_year,
+                    fiscal_quarter=fiscal_quarter,
+                ),
+                months,
+                existing_reports.get(key),
+            )
+        )
+    _bulk_upsert(quarterly_reports, rollup_fields)
+
+    yearly_reports = []
+    for fiscal_year, months in sorted(months_by_year.items()):
+        period_start = datetime.date(fiscal_year - 1, 10, 1)
+        period_end = datetime.date(fiscal_year, 9, 30)
+        key = (KeyMetricsReport.PeriodType.FISCAL_YEAR, period_start, period_end)
+        yearly_reports.append(
+            _rollup(
+                KeyMetricsReport(
+                    period_type=KeyMetricsReport.PeriodType.FISCAL_YEAR,
+                    period_start=period_start,
+                    period_end=period_end,
+                    fiscal_year=fiscal_year,
+                ),
+                months,
+                existing_reports.get(key),
+            )
+        )
+    _bulk_upsert(yearly_reports, rollup_fields)
+
+    return len(monthly_reports) + len(quarterly_reports) + len(yearly_reports)
+
 
 @celery_app.task(bind=True, ignore_result=True)
 @locked_task(lock_by_args=False)
@@ -28,6 +313,8 @@ def build_key_metrics_reports(self, recompute_all: bool = False) -> int:
         - Recompute all quarters that have at least one monthly row.
         - Recompute all fiscal years that have at least one quarterly
           row.
+        - When the ``KEY_METRICS_BULK_REBUILD`` flag is enabled, this is
+          done in bulk by ``rebuild_key_metrics_reports``.
     - If ``recompute_all`` is False (incremental mode):
         - Create any missing monthly rows.
         - Refresh a monthly row if any SiteReport in that month has
@@ -100,6 +387,18 @@ def build_key_metrics_reports(self, recompute_all: bool = False) -> int:
         )
         return 0
 
+    if recompute_all and flag_enabled("KEY_METRICS_BULK_REBUILD"):
+        rows_changed = rebuild_key_metrics_reports(first_month_start, last_month_start)
+        structured_logger.info(
+            "Completed KeyMetricsReport build.",
+            event_code="key_metrics_build_complete",
+            rows_changed=rows_changed,
+            task_id=task_id,
+            recompute_all=recompute_all,
+            bulk=True,
+        )
+        return rows_changed
+
     # Monthly
 
     months_processed: list[datetime.date] = []
@@ -1,5 +1,6 @@
 import datetime
 from logging import getLogger
+from typing import Optional
 
 from django.conf import settings
 from django.contrib.sites.models import Site
@@ -19,7 +20,7 @@ ENV_MAPPING = {"development": "DEV", "test": "TEST", "staging": "STAGE"}
 
 
 @celery_app.task(ignore_result=True)
-def unusual_activity(ignore_env: bool = False) -> None:
+def unusual_activity(ignore_env: bool = False, hours: Optional[int] = None) -> None:
     """
     Send an email report about suspect transcription or review activity.
 
@@ -36,9 +37,18 @@ def unusual_activity(ignore_env: bool = False) -> None:
     Both plain text and HTML versions of the report are rendered from
     templates and emailed to the monitoring recipients.
 
+    Passing ``hours`` runs the report incrementally, for example from an
+    hourly schedule. Only incidents which began in the ``hours`` whole hours
+    before the last minute are reported, so consecutive runs cover
+    consecutive periods while still seeing each incident's full minute, and
+    no email is sent if there is nothing to report. Hourly runs should be
+    scheduled a few minutes past the hour, away from the boundary between
+    one period and the next.
+
     Args:
         ignore_env: Generate and send the report even if the current
             environment is not production.
+        hours: Report on this many hours instead of the past day.
 
     Returns:
         None
@@ -47,16 +57,34 @@ def unusual_activity(ignore_env: bool = False) -> None:
     if settings.CONCORDIA_ENVIRONMENT == "production" or ignore_env:
         site = Site.objects.get_current()
         display_time = timezone.localtime().strftime("%b %d %Y, %I:%M %p")
-        ONE_DAY_AGO = timezone.now() - datetime.timedelta(days=1)
+        if hours is None:
+            start = timezone.now() - datetime.timedelta(days=1)
+            end = None
+        else:
+            # Whole hours ending before the last minute, so consecutive runs
+            # tile exactly even if a run starts late
+            end = (timezone.now() - datetime.timedelta(minutes=1)).replace(
+                minute=0, second=0, microsecond=0
+            )
+            start = end - datetime.timedelta(hours=hours)
         title = "Unusual User Activity Report for " + display_time
         if ignore_env:
             title += " [%s]" % ENV_MAPPING[settings.CONCORDIA_ENVIRONMENT]
         context = {
             "title": title,
             "domain": "https://" + site.domain,
-            "transcriptions": Transcription.objects.transcribe_incidents(ONE_DAY_AGO),
-            "reviews": Transcription.objects.review_incidents(ONE_DAY_AGO),
+            "transcriptions": Transcription.objects.transcribe_incidents(
+                start, end=end
+            ),
+            "reviews": Transcription.objects.review_incidents(start, end=end),
         }
+        if hours is not None and not (context["transcriptions"] or context["reviews"]):
+            structured_logger.info(
+                "No unusual activity found; skipping report.",
+                event_code="unusual_activity_report_skipped",
+                hours=hours,
+            )
+            return
 
         text_body_template = loader.get_template("emails/unusual_activity.txt")
         text_body_message = text_body_template.render(context)
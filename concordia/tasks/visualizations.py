@@ -1,16 +1,25 @@
 import csv
-from datetime import timedelta
+from collections import Counter, defaultdict
+from datetime import UTC, datetime, timedelta
 from io import StringIO
 from logging import getLogger
 
 from django.core.cache import caches
 from django.core.files.base import ContentFile
-from django.db.models import Count
+from django.db import transaction
+from django.db.models import Count, Sum
 from django.utils import timezone
 
+from concordia.activity_series import ACTIVITY_EVENTS, activity_counter
 from concordia.decorators import locked_task
 from concordia.logging import ConcordiaLogger
-from concordia.models import Asset, Campaign, SiteReport, TranscriptionStatus
+from concordia.models import (
+    Asset,
+    Campaign,
+    CampaignActivity,
+    SiteReport,
+    TranscriptionStatus,
+)
 from concordia.storage import VISUALIZATION_STORAGE
 
 from ..celery import app as celery_app
@@ -18,6 +27,9 @@ from ..celery import app as celery_app
 logger = getLogger(__name__)
 structured_logger = ConcordiaLogger.get_logger(__name__)
 
+#: Hourly activity rows are combined into daily rows after this long
+HOURLY_ACTIVITY_RETENTION = timedelta(days=7)
+
 
 @celery_app.task(bind=True, ignore_result=True)
 @locked_task
@@ -320,3 +332,215 @@ def populate_daily_activity_visualization_cache(self) -> None:
         "Daily activity visualization task completed successfully.",
         event_code="daily_activity_vis_complete",
     )
+
+
+def _add_campaign_activity(resolution: str, counts: dict) -> int:
+    """
+    Add counts to the CampaignActivity rows for a resolution.
+
+    Args:
+        resolution (str): A `CampaignActivity.Resolution` value.
+        counts (dict[tuple[int, datetime], Counter]): Event counts keyed by
+            campaign ID and period start.
+
+    Returns:
+        int: Number of rows created or updated.
+    """
+    if not counts:
+        return 0
+    campaign_ids = {campaign_id for campaign_id, _ in counts}
+
+    existing = CampaignActivity.objects.select_for_update().filter(
+        resolution=resolution,
+        campaign_id__in=campaign_ids,
+        period_start__in={period_start for _, period_start in counts},
+    )
+    rows = {}
+    for row in existing:
+        rows[row.campaign_id, row.period_start] = row
+    for (campaign_id, period_start), events in counts.items():
+        row = rows.setdefault(
+            (campaign_id, period_start),
+            CampaignActivity(
+                campaign_id=campaign_id,
+                resolution=resolution,
+                period_start=period_start,
+            ),
+        )
+        for event, count in events.items():
+            setattr(row, event, getattr(row, event) + count)
+
+    CampaignActivity.objects.bulk_create(
+        rows.values(),
+        update_conflicts=True,
+        unique_fields=["campaign", "resolution", "period_start"],
+        update_fields=list(ACTIVITY_EVENTS),
+    )
+    return len(rows)
+
+
+def _compact_activity_series(
+    now: datetime, minutes: dict[int, dict[tuple[int, str], int]]
+) -> tuple[int, int]:
+    """
+    Add minutes of activity to hourly rows for each campaign, and combine
+    old hourly rows into daily rows.
+
+    Args:
+        now (datetime): The current time.
+        minutes (dict[int, dict[tuple[int, str], int]]): Counts claimed from
+            ``activity_counter``.
+
+    Returns:
+        tuple[int, int]: Numbers of hourly and daily rows written.
+    """
+    # Activity on assets deleted since it was counted is dropped
+    asset_campaigns = dict(
+        Asset.objects.filter(
+            pk__in={asset_id for counts in minutes.values() for asset_id, _ in counts}
+        ).values_list("pk", "campaign_id")
+    )
+    hourly = defaultdict(Counter)
+    for minute, counts in minutes.items():
+        hour = datetime.fromtimestamp(minute - minute % 3600, tz=UTC)
+        for (asset_id, event), count in counts.items():
+            if asset_id in asset_campaigns:
+                hourly[asset_campaigns[asset_id], hour][event] += count
+    hours_written = _add_campaign_activity(CampaignActivity.Resolution.HOUR, hourly)
+
+    # Only whole local days are combined, so each daily row is written once
+    cutoff = timezone.make_aware(
+        datetime.combine(
+            timezone.localdate(now) - HOURLY_ACTIVITY_RETENTION, datetime.min.time()
+        )
+    )
+    old_hours = CampaignActivity.objects.filter(
+        resolution=CampaignActivity.Resolution.HOUR, period_start__lt=cutoff
+    )
+    daily = defaultdict(Counter)
+    for row in old_hours:
+        day = timezone.make_aware(
+            datetime.combine(timezone.localdate(row.period_start), datetime.min.time())
+        )
+        for event in ACTIVITY_EVENTS:
+            daily[row.campaign_id, day][event] += getattr(row, event)
+    days_written = _add_campaign_activity(CampaignActivity.Resolution.DAY, daily)
+    old_hours.delete()
+    return hours_written, days_written
+
+
+def _activity_datasets(totals: dict, periods: list) -> list[dict]:
+    return [
+        {
+            "label": event.title(),
+            "data": [totals.get(period, {}).get(event, 0) for period in periods],
+        }
+        for event in ACTIVITY_EVENTS
+    ]
+
+
+def _activity_totals(queryset, period_key) -> dict:
+    """
+    Sum activity across campaigns into the periods returned by `period_key`.
+    """
+    totals = defaultdict(Counter)
+    rows = queryset.values("period_start").annotate(
+        **{event: Sum(event) for event in ACTIVITY_EVENTS}
+    )
+    for row in rows:
+        period = period_key(row["period_start"])
+        for event in ACTIVITY_EVENTS:
+            totals[period][event] += row[event]
+    return totals
+
+
+def _populate_activity_series_cache(now: datetime) -> None:
+    """
+    Store the hourly and daily activity charts in the visualization cache.
+
+    Args:
+        now (datetime): The current time. The charts end with its hour and
+            day.
+    """
+    visualization_cache = caches["visualization_cache"]
+    # Hours are counted in UTC so they stay evenly spaced across clock changes
+    current_hour = now.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+    hour_starts = [current_hour - timedelta(hours=i) for i in reversed(range(24))]
+    hourly_totals = _activity_totals(
+        CampaignActivity.objects.filter(
+            resolution=CampaignActivity.Resolution.HOUR,
+            period_start__gte=hour_starts[0],
+        ),
+        lambda period_start: period_start,
+    )
+    visualization_cache.set(
+        "activity-last-24-hours",
+        {
+            "labels": [
+                timezone.localtime(hour).strftime("%Y-%m-%d %H:%M")
+                for hour in hour_starts
+            ],
+            "activity_datasets": _activity_datasets(hourly_totals, hour_starts),
+        },
+        None,
+    )
+
+    today = timezone.localdate(now)
+    days = [today - timedelta(days=i) for i in reversed(range(28))]
+    first_day = timezone.make_aware(datetime.combine(days[0], datetime.min.time()))
+    daily_totals = _activity_totals(
+        CampaignActivity.objects.filter(period_start__gte=first_day),
+        timezone.localdate,
+    )
+    visualization_cache.set(
+        "activity-last-28-days",
+        {
+            "labels": [day.strftime("%Y-%m-%d") for day in days],
+            "activity_datasets": _activity_datasets(daily_totals, days),
+        },
+        None,
+    )
+
+
+@celery_app.task(bind=True, ignore_result=True)
+@locked_task
+def update_activity_series(self) -> None:
+    """
+    Compact counted activity into the database and refresh the activity
+    charts.
+
+    Transcription and reservation activity is counted per minute by the
+    signal handlers using ``concordia.activity_series``. This task adds
+    every finished minute to hourly ``CampaignActivity`` rows, combines
+    hourly rows older than ``HOURLY_ACTIVITY_RETENTION`` into daily rows,
+    then stores the following in the ``"visualization_cache"``:
+
+        - ``"activity-last-24-hours"``: hourly totals across campaigns, with
+          `labels` of "YYYY-MM-DD HH:MM" local hour starts
+        - ``"activity-last-28-days"``: daily totals across campaigns, with
+          `labels` of "YYYY-MM-DD" local dates
+
+    Each has an `activity_datasets` list with one ``{"label", "data"}``
+    series for each of the saved, submitted, accepted, rejected and
+    reserved counts.
+    """
+    now = timezone.now()
+    # The current minute is left in the cache since it may still be counting.
+    # Claimed minutes are only released once their counts are committed, so
+    # if this fails they are compacted by the next run instead.
+    minutes = activity_counter.claim_minutes(int(now.timestamp() // 60) * 60)
+    with transaction.atomic():
+        hours_written, days_written = _compact_activity_series(now, minutes)
+    activity_counter.release_claimed()
+    structured_logger.debug(
+        "Activity series compacted.",
+        event_code="activity_series_compacted",
+        hours_written=hours_written,
+        days_written=days_written,
+    )
+
+    _populate_activity_series_cache(now)
+    structured_logger.debug(
+        "Activity series visualization cache updated.",
+        event_code="activity_series_vis_cache_set",
+    )
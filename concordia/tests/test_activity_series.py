@@ -0,0 +1,87 @@
+from unittest import mock
+
+from django.core.cache import caches
+from django.test import SimpleTestCase
+
+from concordia.activity_series import ActivityCounter
+
+
+class ActivityCounterTests(SimpleTestCase):
+    def setUp(self):
+        caches["default"].clear()
+        self.counter = ActivityCounter(prefix="activity-test")
+
+    def tearDown(self):
+        caches["default"].clear()
+
+    def test_counts_per_minute(self):
+        with mock.patch("concordia.activity_series.time", return_value=6000.0):
+            self.counter.increment(1, "saved")
+            self.counter.increment(1, "saved")
+            self.counter.increment(2, "accepted")
+        with mock.patch("concordia.activity_series.time", return_value=6059.0):
+            self.counter.increment(1, "saved")
+        with mock.patch("concordia.activity_series.time", return_value=6060.0):
+            self.counter.increment(1, "reserved")
+
+        self.assertEqual(
+            self.counter.claim_minutes(6060),
+            {6000: {(1, "saved"): 3, (2, "accepted"): 1}},
+        )
+        # Claimed minutes are returned again until they are released
+        with mock.patch("concordia.activity_series.time", return_value=6000.0):
+            self.counter.increment(1, "saved")
+        self.assertEqual(
+            self.counter.claim_minutes(6060),
+            {6000: {(1, "saved"): 4, (2, "accepted"): 1}},
+        )
+        self.counter.release_claimed()
+        self.assertEqual(self.counter.claim_minutes(6060), {})
+        # Later minutes are kept
+        self.assertEqual(self.counter.claim_minutes(6120), {6060: {(1, "reserved"): 1}})
+
+    def test_rejects_unknown_events(self):
+        with self.assertRaises(ValueError):
+            self.counter.increment(1, "deleted")
+
+    @mock.patch("concordia.activity_series.get_redis_connection")
+    def test_redis_commands(self, get_redis_connection):
+        connection = get_redis_connection.return_value
+        cache = caches["default"]
+
+        with mock.patch("concordia.activity_series.time", return_value=6030.0):
+            self.counter.increment(3, "submitted")
+
+        pipeline = connection.pipeline.return_value
+        minute_key = cache.make_key("activity-test:6000")
+        pipeline.hincrby.assert_called_once_with(minute_key, "3:submitted", 1)
+        pipeline.zadd.assert_called_once_with(
+            cache.make_key("activity-test"), {6000: 6000}
+        )
+        pipeline.execute.assert_called_once_with()
+
+        connection.zrangebyscore.return_value = [b"6000"]
+        connection.smembers.return_value = [b"6000:abc"]
+        connection.hgetall.return_value = {b"3:submitted": b"2"}
+        with mock.patch("concordia.activity_series.uuid.uuid4") as uuid4:
+            uuid4.return_value.hex = "abc"
+            self.assertEqual(
+                self.counter.claim_minutes(6060), {6000: {(3, "submitted"): 2}}
+            )
+        connection.zrangebyscore.assert_called_once_with(
+            cache.make_key("activity-test"), "-inf", "(6060"
+        )
+        connection.pipeline.assert_called_with(transaction=True)
+        claim_key = cache.make_key("activity-test:claimed:6000:abc")
+        pipeline.rename.assert_called_once_with(minute_key, claim_key)
+        pipeline.sadd.assert_called_once_with(
+            cache.make_key("activity-test:claimed"), "6000:abc"
+        )
+        connection.hgetall.assert_called_once_with(claim_key)
+        pipeline.delete.assert_not_called()
+
+        self.counter.release_claimed()
+        pipeline.delete.assert_called_once_with(claim_key)
+        pipeline.srem.assert_called_once_with(
+            cache.make_key("activity-test:claimed"), "6000:abc"
+        )
@@ -1,4 +1,5 @@
 from django.contrib.admin import ModelAdmin
+from django.core.cache import cache
 from django.test import RequestFactory, TestCase
 from django.utils import timezone
 
@@ -181,6 +182,62 @@ class ItemFilterTests(CreateTestUsers, TestCase):
         items = f.queryset(None, Item.objects.all())
         self.assertEqual(items.count(), 1)
 
+    def test_project_filter_uses_autocomplete_without_campaign(self):
+        request = RequestFactory().get(
+            "/admin/concordia/item/?project__in=%s" % self.project.pk
+        )
+        f = ItemProjectListFilter(
+            request, {"project__in": (str(self.project.pk),)}, Item, ItemAdmin
+        )
+        self.assertEqual(f.template, "admin/autocomplete_filter.html")
+        self.assertTrue(f.has_output())
+        # Only the selected project is looked up
+        self.assertEqual(f.lookup_choices, [(str(self.project.pk), self.project.title)])
+
+        self.login_user()
+        request.user = self.user
+        item_admin = ItemAdmin(Item, ConcordiaAdminSite())
+        changelist = item_admin.get_changelist_instance(request)
+        choices = list(f.choices(changelist))
+        self.assertEqual(choices[0]["display"], "All")
+        self.assertTrue(choices[1]["autocomplete"])
+        self.assertEqual(choices[1]["selected_value"], str(self.project.pk))
+        self.assertEqual(choices[1]["selected_display"], self.project.title)
+        self.assertIn("admin/js/autocomplete.js", str(item_admin.media))
+
+    def test_project_filter_options_are_cached(self):
+        cache.clear()
+        campaign = self.project.campaign
+        request = RequestFactory().get(
+            "/admin/concordia/item/?project__campaign__id__exact=%s" % campaign.pk
+        )
+
+        def get_lookups():
+            return ItemProjectListFilter(
+                request,
+                {"project__campaign__id__exact": (str(campaign.pk),)},
+                Item,
+                ItemAdmin,
+            ).lookup_choices
+
+        self.assertEqual(get_lookups(), [(str(self.project.pk), self.project.title)])
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                get_lookups(), [(str(self.project.pk), self.project.title)]
+            )
+
+        # Saving a project invalidates the cached options
+        other_project = create_project(
+            campaign=campaign, title="Another Project", slug="another-project"
+        )
+        self.assertEqual(
+            get_lookups(),
+            [
+                (str(other_project.pk), other_project.title),
+                (str(self.project.pk), self.project.title),
+            ],
+        )
+
 
 class ProjectFilterTests(TestCase):
     def setUp(self):
@@ -0,0 +1,79 @@
+import json
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.test import TestCase
+
+from concordia.admin.paginators import EstimatedCountPaginator
+from concordia.models import Tag
+
+from .utils import create_tag
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        for i in range(25):
+            create_tag(value=f"tag-{i:02d}")
+
+    def test_count_without_estimate(self):
+        # SQLite and other databases have no planner estimate, so the count is
+        # exact
+        paginator = EstimatedCountPaginator(Tag.objects.all(), 10)
+        self.assertIsNone(paginator.get_estimated_count())
+        self.assertEqual(paginator.count, 25)
+
+    def test_count_uses_large_estimates(self):
+        with mock.patch.object(
+            EstimatedCountPaginator, "get_estimated_count", return_value=5_000_000
+        ):
+            paginator = EstimatedCountPaginator(Tag.objects.all(), 10)
+            self.assertEqual(paginator.count, 5_000_000)
+
+        # Small estimates are replaced by an exact count
+        with mock.patch.object(
+            EstimatedCountPaginator, "get_estimated_count", return_value=30
+        ):
+            paginator = EstimatedCountPaginator(Tag.objects.all(), 10)
+            self.assertEqual(paginator.count, 25)
+
+    def test_filtered_estimate_uses_explain(self):
+        plan = json.dumps([{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 123456}}])
+        with (
+            mock.patch("concordia.admin.paginators.connections") as connections,
+            mock.patch(
+                "django.db.models.QuerySet.explain", return_value=plan
+            ) as explain,
+        ):
+            connections.__getitem__.return_value.vendor = "postgresql"
+            paginator = EstimatedCountPaginator(
+                Tag.objects.filter(value__startswith="tag"), 10
+            )
+            self.assertEqual(paginator.count, 123456)
+        explain.assert_called_once_with(format="json")
+
+    def test_pages_match_default_paginator(self):
+        for ordering in (("-pk",), ("pk",), ("value",), ("-value", "pk")):
+            queryset = Tag.objects.order_by(*ordering)
+            expected = Paginator(queryset, 10)
+            paginator = EstimatedCountPaginator(queryset, 10)
+            for number in (1, 2, 3):
+                with self.subTest(ordering=ordering, page=number):
+                    self.assertEqual(
+                        list(paginator.page(number).object_list),
+                        list(expected.page(number).object_list),
+                    )
+
+    def test_next_page_seeks_from_cached_boundary(self):
+        queryset = Tag.objects.order_by("-pk")
+        paginator = EstimatedCountPaginator(queryset, 10)
+        paginator.count  # noqa: B018
+        list(paginator.page(2).object_list)
+
+        # The last key of page 2 is known, so page 3 is a single query which
+        # seeks past it rather than offsetting
+        with self.assertNumQueries(1) as queries:
+            page = list(paginator.page(3).object_list)
+        self.assertNotIn("OFFSET", queries.captured_queries[0]["sql"])
+        self.assertEqual(page, list(queryset[20:]))
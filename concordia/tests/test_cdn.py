@@ -0,0 +1,153 @@
+from unittest import mock
+
+from django.core.cache import caches
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from concordia import cdn
+from concordia.tasks.cdn import flush_pending_purges, purge_surrogate_keys_task
+
+from .utils import CreateTestUsers, create_asset, create_item
+
+
+@override_settings(RATELIMIT_ENABLE=False, CDN_PAGE_TTL=86400)
+class SurrogateKeyTests(CreateTestUsers, TestCase):
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.asset = create_asset()
+        cdn.pop_pending_purges()
+        cdn.purged_keys.clear()
+        self.item = self.asset.item
+        self.project = self.item.project
+        self.campaign = self.project.campaign
+
+    def tearDown(self):
+        for cache in caches.all():
+            cache.clear()
+
+    def test_pages_are_tagged(self):
+        # Tags are added whether or not the page came from the page cache
+        for _ in range(2):
+            response = self.client.get(self.item.get_absolute_url())
+            self.assertEqual(
+                response[cdn.SURROGATE_KEY_HEADER],
+                "site,item:test-campaign/test-project/testitem.0123456789",
+            )
+            self.assertEqual(response[cdn.CDN_CACHE_CONTROL_HEADER], "max-age=86400")
+
+        response = self.client.get(self.campaign.get_absolute_url())
+        self.assertEqual(
+            response[cdn.SURROGATE_KEY_HEADER], "site,campaign:test-campaign"
+        )
+        self.assertIn("public", response["Cache-Control"])
+
+    def test_signed_in_pages_are_private(self):
+        self.login_user()
+        response = self.client.get(self.campaign.get_absolute_url())
+        self.assertNotIn(cdn.SURROGATE_KEY_HEADER, response)
+        self.assertNotIn(cdn.CDN_CACHE_CONTROL_HEADER, response)
+        self.assertIn("private", response["Cache-Control"])
+        self.assertNotIn("public", response["Cache-Control"])
+
+    def test_non_ascii_keys_match_purges(self):
+        self.campaign.slug = "cafe-\u00e9t\u00e9"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.campaign.save()
+        cdn.pop_pending_purges()
+
+        response = self.client.get(self.campaign.get_absolute_url())
+        tag = response[cdn.SURROGATE_KEY_HEADER].split(",")[1]
+        self.assertEqual(tag, "campaign:cafe-%C3%A9t%C3%A9")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.item.save()
+        self.assertIn(tag, cdn.pop_pending_purges())
+
+    def test_changes_are_purged_together(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            other_item = create_item(project=self.project, item_id="other-item")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.asset.published = False
+            self.asset.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            other_item.save()
+        # Nothing is purged until the periodic flush
+        self.assertEqual(cdn.purged_keys, [])
+
+        flush_pending_purges()
+        self.assertEqual(
+            cdn.purged_keys,
+            [
+                [
+                    "campaign:test-campaign",
+                    "item:test-campaign/test-project/other-item",
+                    "item:test-campaign/test-project/testitem.0123456789",
+                    "project:test-campaign/test-project",
+                ]
+            ],
+        )
+
+    def test_rolled_back_changes_are_not_purged(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    self.asset.published = False
+                    self.asset.save()
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            self.campaign.save()
+
+        self.assertEqual(cdn.pop_pending_purges(), {"site"})
+
+    def test_flush_without_pending_keys(self):
+        flush_pending_purges()
+        self.assertEqual(cdn.purged_keys, [])
+
+    @mock.patch("concordia.cdn.get_redis_connection")
+    def test_redis_pending_set(self, get_redis_connection):
+        connection = get_redis_connection.return_value
+        pipeline = connection.pipeline.return_value
+        pipeline.execute.return_value = [{b"site", b"campaign:a"}, 1]
+        key = caches["default"].make_key(cdn.PENDING_PURGES_KEY)
+
+        cdn.add_pending_purges(["site", "campaign:a"])
+        connection.sadd.assert_called_once()
+        self.assertEqual(connection.sadd.call_args.args[0], key)
+        self.assertCountEqual(
+            connection.sadd.call_args.args[1:], ["site", "campaign:a"]
+        )
+
+        self.assertEqual(cdn.pop_pending_purges(), {"site", "campaign:a"})
+        pipeline.smembers.assert_called_once_with(key)
+        pipeline.delete.assert_called_once_with(key)
+
+    def test_purge_task_batches_keys(self):
+        with mock.patch.object(cdn.LocMemPurgeTransport, "max_keys_per_request", 2):
+            purge_surrogate_keys_task(["a", "b", "c"])
+        self.assertEqual(cdn.purged_keys, [["a", "b"], ["c"]])
+
+    @override_settings(CLOUDFLARE_ZONE_ID="zone", CLOUDFLARE_PURGE_API_TOKEN="token")
+    @mock.patch("concordia.cdn.requests.post")
+    def test_cloudflare_transport(self, post):
+        cdn.CloudflarePurgeTransport().purge(["site", "campaign:test-campaign"])
+        post.assert_called_once_with(
+            "https://api.cloudflare.com/client/v4/zones/zone/purge_cache",
+            headers={"Authorization": "Bearer token"},
+            json={"tags": ["site", "campaign:test-campaign"]},
+            timeout=10,
+        )
+        post.return_value.raise_for_status.assert_called_once_with()
+
+
+class PurgeOutsideTransactionTests(TransactionTestCase):
+    def setUp(self):
+        cdn.pop_pending_purges()
+
+    def test_added_immediately(self):
+        cdn.purge_surrogate_keys(["site"])
+        cdn.purge_surrogate_keys(["campaign:test-campaign"])
+        self.assertEqual(cdn.pop_pending_purges(), {"site", "campaign:test-campaign"})
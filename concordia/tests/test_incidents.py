@@ -0,0 +1,117 @@
+import datetime
+import random
+
+from django.test import SimpleTestCase
+
+from concordia.incidents import (
+    count_review_incidents,
+    count_transcribe_incidents,
+    group_incidents,
+)
+
+BASE = datetime.datetime(2025, 1, 1, 12, 0, tzinfo=datetime.UTC)
+
+
+def seconds(*offsets):
+    return [BASE + datetime.timedelta(seconds=offset) for offset in offsets]
+
+
+def naive_review_incidents(timestamps, threshold):
+    # The nested loop the detector replaced
+    incidents = 0
+    for i in range(len(timestamps)):
+        count = 1
+        for j in range(i + 1, len(timestamps)):
+            if (timestamps[j] - timestamps[i]).seconds <= 60:
+                count += 1
+                if count == threshold:
+                    incidents += 1
+                    break
+            else:
+                break
+    return incidents
+
+
+def naive_transcribe_incidents(events):
+    # One lookup per transcription, as the per-row COUNT queries did
+    incidents = 0
+    for submitted, asset_id in events:
+        end = submitted + datetime.timedelta(minutes=1)
+        if any(
+            submitted < other_submitted <= end and other_asset_id != asset_id
+            for other_submitted, other_asset_id in events
+        ):
+            incidents += 1
+    return incidents
+
+
+class CountReviewIncidentsTests(SimpleTestCase):
+    def test_counts_accepts_starting_a_burst(self):
+        self.assertEqual(count_review_incidents(seconds(0, 29, 58, 200), 2), 2)
+        self.assertEqual(count_review_incidents(seconds(0, 20, 40), 3), 1)
+
+    def test_window_compares_whole_seconds(self):
+        self.assertEqual(count_review_incidents(seconds(0, 60.9), 2), 1)
+        self.assertEqual(count_review_incidents(seconds(0, 61), 2), 0)
+
+    def test_until_limits_where_incidents_start(self):
+        timestamps = seconds(0, 30, 100, 130)
+        self.assertEqual(
+            count_review_incidents(timestamps, 2, until=seconds(100)[0]), 1
+        )
+        self.assertEqual(count_review_incidents(timestamps, 2, until=seconds(30)[0]), 1)
+
+    def test_matches_nested_loop(self):
+        rng = random.Random(49)
+        for _ in range(200):
+            timestamps = sorted(
+                seconds(*(rng.uniform(0, 600) for _ in range(rng.randint(0, 30))))
+            )
+            for threshold in (2, 3, 4):
+                self.assertEqual(
+                    count_review_incidents(timestamps, threshold),
+                    naive_review_incidents(timestamps, threshold),
+                )
+
+
+class CountTranscribeIncidentsTests(SimpleTestCase):
+    def test_only_other_assets_count(self):
+        events = list(zip(seconds(0, 29, 58, 119, 178), [1, 1, 2, 3, 3], strict=True))
+        self.assertEqual(count_transcribe_incidents(events), 2)
+
+    def test_simultaneous_submissions_do_not_count(self):
+        events = list(zip(seconds(0, 0), [1, 2], strict=True))
+        self.assertEqual(count_transcribe_incidents(events), 0)
+
+    def test_until_limits_where_incidents_start(self):
+        events = list(zip(seconds(0, 30, 100, 130), [1, 2, 3, 4], strict=True))
+        self.assertEqual(count_transcribe_incidents(events), 2)
+        self.assertEqual(count_transcribe_incidents(events, until=seconds(100)[0]), 1)
+
+    def test_matches_pairwise_check(self):
+        rng = random.Random(49)
+        for _ in range(200):
+            events = sorted(
+                (timestamp, rng.randint(1, 4))
+                for timestamp in seconds(
+                    *(rng.randint(0, 300) for _ in range(rng.randint(0, 30)))
+                )
+            )
+            self.assertEqual(
+                count_transcribe_incidents(events), naive_transcribe_incidents(events)
+            )
+
+
+class GroupIncidentsTests(SimpleTestCase):
+    def test_groups_rows_by_user(self):
+        rows = [(1, t) for t in seconds(0, 10)] + [(2, t) for t in seconds(0, 100)]
+        self.assertEqual(
+            group_incidents(rows, lambda events: count_review_incidents(events, 2)),
+            {1: 1},
+        )
+
+    def test_passes_remaining_columns(self):
+        rows = [
+            (1, t, asset_id) for t, asset_id in zip(seconds(0, 10), [1, 2], strict=True)
+        ]
+        self.assertEqual(group_incidents(rows, count_transcribe_incidents), {1: 1})
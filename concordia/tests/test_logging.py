@@ -1,10 +1,11 @@
+import logging
 import warnings
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
-from concordia.logging import ConcordiaLogger
+from concordia.logging import BackgroundHandler, ConcordiaLogger
 
 
 class ConcordiaLoggerTests(TestCase):
@@ -213,3 +214,51 @@ class ConcordiaLoggerTests(TestCase):
         self.assertEqual(kwargs["reason_code"], "value_error")
         self.assertEqual(kwargs["extra"], "context")
         self.assertTrue(kwargs.get("exc_info"))
+
+    @override_settings(STRUCTURED_LOG_SAMPLE_RATES={"heartbeat": 0.25})
+    def test_sampled_events(self):
+        with patch("concordia.logging.random.random", return_value=0.5):
+            self.logger.info("beat", event_code="heartbeat")
+        self.mock_structlog_logger.info.assert_not_called()
+
+        with patch("concordia.logging.random.random", return_value=0.1):
+            self.logger.info("beat", event_code="heartbeat")
+        _args, kwargs = self.mock_structlog_logger.info.call_args
+        self.assertEqual(kwargs["sample_rate"], 0.25)
+
+        # Warnings are never sampled
+        with patch("concordia.logging.random.random", return_value=0.5):
+            self.logger.warning(
+                "beat", event_code="heartbeat", reason="r", reason_code="c"
+            )
+        _args, kwargs = self.mock_structlog_logger.warning.call_args
+        self.assertNotIn("sample_rate", kwargs)
+
+    def test_disabled_level_skips_extraction(self):
+        self.mock_structlog_logger.is_enabled_for.return_value = False
+        extractor = MagicMock(return_value={})
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self.logger.register_extractor("asset", extractor)
+
+        self.logger.debug("msg", event_code="debug_event", asset=object())
+        extractor.assert_not_called()
+        self.mock_structlog_logger.debug.assert_not_called()
+
+
+class BackgroundHandlerTests(TestCase):
+    def test_records_written_by_target_handler(self):
+        handler = BackgroundHandler(
+            "logging.handlers.MemoryHandler", capacity=100, flushLevel=100
+        )
+        formatter = logging.Formatter()
+        handler.setFormatter(formatter)
+        event = {"event": "msg", "event_code": "test_event"}
+        handler.handle(
+            logging.LogRecord("structlog.test", logging.INFO, "", 0, event, None, None)
+        )
+        # Closing drains the queue
+        handler.close()
+
+        self.assertIs(handler.target.formatter, formatter)
+        self.assertEqual([record.msg for record in handler.target.buffer], [event])
@@ -5,6 +5,7 @@ from secrets import token_hex
 from unittest import mock
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db.models import signals
 from django.test import TestCase
@@ -80,6 +81,25 @@ class AssetTestCase(CreateTestUsers, TestCase):
         )
         self.assertTrue(phrase in self.asset.get_ocr_transcript(language="spa"))
 
+    @mock.patch("concordia.models.pytesseract.image_to_string")
+    def test_get_ocr_transcript_cached(self, ocr_mock):
+        self.asset.storage_image = "tests/test-european.jpg"
+        self.asset.save()
+        cache.clear()
+        ocr_mock.return_value = "OCR text"
+
+        self.assertEqual(self.asset.get_ocr_transcript(language="spa"), "OCR text")
+        self.assertEqual(self.asset.get_ocr_transcript(language="spa"), "OCR text")
+        self.assertEqual(ocr_mock.call_count, 1)
+
+        # Each language is cached separately
+        self.assertEqual(self.asset.get_ocr_transcript(), "OCR text")
+        self.assertEqual(ocr_mock.call_count, 2)
+
+        # Requests without a language use the default language's result
+        self.assertEqual(self.asset.get_ocr_transcript(language="eng"), "OCR text")
+        self.assertEqual(ocr_mock.call_count, 2)
+
     def test_get_contributor_count(self):
         self.assertEqual(self.asset.get_contributor_count(), 2)
 
@@ -347,6 +367,36 @@ class TranscriptionManagerTestCase(CreateTestUsers, TestCase):
             (self.transcription1.user.id, self.transcription1.user.username, 3, 6),
         )
 
+    def test_incidents_with_end(self):
+        reviewer = self.create_user(username="rev-end")
+        asset = self.transcription1.asset
+        base = timezone.now() - timedelta(hours=2)
+        for offset in (0, 30, 3600, 3630):
+            create_transcription(
+                asset=asset,
+                user=self.transcription1.user,
+                reviewed_by=reviewer,
+                accepted=base + timedelta(seconds=offset),
+            )
+
+        # The burst starting just before the end is counted in full, and the
+        # one starting after it is left for the next period
+        with self.assertNumQueries(3):
+            users = Transcription.objects.review_incidents(
+                base, end=base + timedelta(seconds=10)
+            )
+        self.assertEqual(users, [(reviewer.id, reviewer.username, 1, 4)])
+
+        users = Transcription.objects.review_incidents(
+            base + timedelta(seconds=10), end=base + timedelta(hours=1, seconds=10)
+        )
+        self.assertEqual(users, [(reviewer.id, reviewer.username, 1, 4)])
+
+        users = Transcription.objects.review_incidents(
+            base + timedelta(hours=1, seconds=10), end=timezone.now()
+        )
+        self.assertEqual(users, [])
+
     def test_review_incidents_returns_empty_when_counts_zero(self):
         reviewer = self.create_user(username="rev-zero")
         asset = self.transcription1.asset
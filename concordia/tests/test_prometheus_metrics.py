@@ -0,0 +1,146 @@
+import os
+import tempfile
+
+from celery import Celery
+from django.core.cache import caches
+from django.test import SimpleTestCase, TestCase, override_settings
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, generate_latest
+from prometheus_client.mmap_dict import MmapedDict, mmap_key
+
+from concordia.tasks.cdn import purge_surrogate_keys_task
+from prometheus_metrics.instrumentation import (
+    finish_request_metrics,
+    start_request_metrics,
+)
+from prometheus_metrics.multiprocess import get_registry
+from prometheus_metrics.queues import QueueLengthCollector
+
+from .utils import create_campaign
+
+INSTRUMENTED_CACHES = {
+    alias: {"BACKEND": "prometheus_metrics.cache.LocMemCache", "LOCATION": alias}
+    for alias in ("default", "view_cache", "configuration_cache", "visualization_cache")
+}
+
+
+def get_sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@override_settings(RATELIMIT_ENABLE=False, CACHES=INSTRUMENTED_CACHES)
+class ViewInstrumentationTests(TestCase):
+    def setUp(self):
+        self.campaign = create_campaign()
+
+    def tearDown(self):
+        for cache in caches.all():
+            cache.clear()
+
+    def test_view_metrics_recorded(self):
+        view = "campaign_detail"
+        before = {
+            "requests": get_sample("django_view_db_queries_count", view=view),
+            "queries": get_sample("django_view_db_queries_sum", view=view),
+            "misses": get_sample(
+                "django_view_cache_misses_sum", view=view, cache="view_cache"
+            ),
+            "renders": get_sample(
+                "django_view_template_render_duration_seconds_sum", view=view
+            ),
+        }
+
+        self.client.get(self.campaign.get_absolute_url())
+
+        self.assertEqual(
+            get_sample("django_view_db_queries_count", view=view),
+            before["requests"] + 1,
+        )
+        self.assertGreater(
+            get_sample("django_view_db_queries_sum", view=view), before["queries"]
+        )
+        self.assertGreater(
+            get_sample("django_view_cache_misses_sum", view=view, cache="view_cache"),
+            before["misses"],
+        )
+        self.assertGreater(
+            get_sample("django_view_template_render_duration_seconds_sum", view=view),
+            before["renders"],
+        )
+
+    @override_settings(PROMETHEUS_SLOW_REQUEST_SECONDS=0)
+    def test_slow_requests_logged(self):
+        with self.assertLogs("prometheus_metrics.middleware", "WARNING") as logs:
+            self.client.get(self.campaign.get_absolute_url())
+        self.assertIn("Slow request to campaign_detail", logs.output[0])
+        self.assertIn("'sql': 'SELECT", logs.output[0])
+
+    def test_get_many_counted_once(self):
+        cache = caches["default"]
+        cache.set("present", 1)
+        metrics, token = start_request_metrics()
+        try:
+            cache.get_many(["present", "absent"])
+            cache.get("absent", "default")
+        finally:
+            finish_request_metrics(token)
+        self.assertEqual(dict(metrics.cache), {"default": [1, 2]})
+
+
+class CeleryMetricsTests(SimpleTestCase):
+    def test_task_runtime_recorded(self):
+        labels = {"task": purge_surrogate_keys_task.name, "state": "SUCCESS"}
+        before = get_sample("celery_task_runtime_seconds_count", **labels)
+        purge_surrogate_keys_task.delay(["site"])
+        self.assertEqual(
+            get_sample("celery_task_runtime_seconds_count", **labels), before + 1
+        )
+
+
+class MultiprocessRegistryTests(SimpleTestCase):
+    def write_counter(self, directory, pid, value):
+        os.makedirs(directory, exist_ok=True)
+        values = MmapedDict(os.path.join(directory, f"counter_{pid}.db"))
+        values.write_value(
+            mmap_key("test_total", "test_total", ["view"], ["home"], "Test"),
+            value,
+            0,
+        )
+        values.close()
+
+    def test_metrics_merged_across_services(self):
+        with tempfile.TemporaryDirectory() as root:
+            # The same PID in two services is two processes
+            self.write_counter(os.path.join(root, "app"), 1, 2)
+            self.write_counter(os.path.join(root, "importer"), 1, 3)
+            self.write_counter(os.path.join(root, "importer"), 2, 4)
+
+            with self.settings(
+                PROMETHEUS_MULTIPROC_ROOT=root, PROMETHEUS_CELERY_APP=""
+            ):
+                registry = get_registry()
+                self.assertIn(b'test_total{view="home"} 9.0', generate_latest(registry))
+
+    def test_single_process_registry_without_root(self):
+        Counter("test_single_process", "Test", registry=REGISTRY).inc()
+        with self.settings(PROMETHEUS_MULTIPROC_ROOT="", PROMETHEUS_CELERY_APP=""):
+            self.assertIn(
+                b"test_single_process_total 1.0", generate_latest(get_registry())
+            )
+
+
+class QueueLengthCollectorTests(SimpleTestCase):
+    def test_queue_lengths(self):
+        app = Celery("test", broker="memory://")
+        app.conf.task_routes = {"ocr.*": {"queue": "ocr"}}
+        app.send_task("ocr.run")
+        app.send_task("ocr.run")
+
+        registry = CollectorRegistry()
+        registry.register(QueueLengthCollector(app))
+        self.assertEqual(
+            registry.get_sample_value("celery_queue_length", {"queue": "ocr"}), 2
+        )
+        # Queues which have never had a message don't exist yet
+        self.assertEqual(
+            registry.get_sample_value("celery_queue_length", {"queue": "celery"}), 0
+        )
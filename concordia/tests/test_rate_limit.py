@@ -0,0 +1,70 @@
+import datetime
+from unittest import mock
+
+from django.core.cache import caches
+from django.test import SimpleTestCase
+
+from concordia.rate_limit import SLIDING_WINDOW_SCRIPT, SlidingWindowLimiter
+
+
+class SlidingWindowLimiterTests(SimpleTestCase):
+    def setUp(self):
+        caches["default"].clear()
+        self.limiter = SlidingWindowLimiter(datetime.timedelta(minutes=1))
+
+    def tearDown(self):
+        caches["default"].clear()
+
+    def test_hits_up_to_limit(self):
+        self.assertTrue(self.limiter.hit("limit-test", 2))
+        self.assertTrue(self.limiter.hit("limit-test", 2))
+        self.assertFalse(self.limiter.hit("limit-test", 2))
+        # Keys are limited independently
+        self.assertTrue(self.limiter.hit("other-limit-test", 2))
+
+    def test_rejected_hits_are_not_recorded(self):
+        with mock.patch("concordia.rate_limit.time", return_value=1000.0):
+            self.assertTrue(self.limiter.hit("limit-test", 1))
+        with mock.patch("concordia.rate_limit.time", return_value=1030.0):
+            self.assertFalse(self.limiter.hit("limit-test", 1))
+        # Only the first hit counts, so the window reopens a minute after it
+        with mock.patch("concordia.rate_limit.time", return_value=1061.0):
+            self.assertTrue(self.limiter.hit("limit-test", 1))
+
+    def test_window_slides(self):
+        with mock.patch("concordia.rate_limit.time", return_value=1000.0):
+            self.assertTrue(self.limiter.hit("limit-test", 2))
+        with mock.patch("concordia.rate_limit.time", return_value=1030.0):
+            self.assertTrue(self.limiter.hit("limit-test", 2))
+            self.assertFalse(self.limiter.hit("limit-test", 2))
+        with mock.patch("concordia.rate_limit.time", return_value=1061.0):
+            self.assertTrue(self.limiter.hit("limit-test", 2))
+            self.assertFalse(self.limiter.hit("limit-test", 2))
+
+    def test_reset(self):
+        self.assertTrue(self.limiter.hit("limit-test", 1))
+        self.assertFalse(self.limiter.hit("limit-test", 1))
+        self.limiter.reset("limit-test")
+        self.assertTrue(self.limiter.hit("limit-test", 1))
+
+    @mock.patch("concordia.rate_limit.get_redis_connection")
+    def test_redis_script(self, get_redis_connection):
+        connection = get_redis_connection.return_value
+        script = connection.register_script.return_value
+        script.side_effect = [1, 0]
+
+        self.assertTrue(self.limiter.hit("limit-test", 3))
+        self.assertFalse(self.limiter.hit("limit-test", 3))
+
+        connection.register_script.assert_called_once_with(SLIDING_WINDOW_SCRIPT)
+        self.assertEqual(script.call_count, 2)
+        first, second = script.call_args_list
+        self.assertEqual(
+            first.kwargs["keys"], [caches["default"].make_key("limit-test")]
+        )
+        self.assertEqual(first.kwargs["args"][:2], [60000, 3])
+        self.assertIs(first.kwargs["client"], connection)
+        # Each hit is recorded as a distinct member of the sorted set
+        self.assertNotEqual(first.kwargs["args"][2], second.kwargs["args"][2])
+        # Nothing is stored in the cache itself
+        self.assertIsNone(caches["default"].get("limit-test"))
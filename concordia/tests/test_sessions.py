@@ -0,0 +1,52 @@
+from django.contrib.sessions.backends.db import SessionStore as DBSessionStore
+from django.contrib.sessions.models import Session
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from concordia.sessions import SessionStore
+
+
+@override_settings(SESSION_ENGINE="concordia.sessions", SESSION_REFRESH_INTERVAL=60)
+class SessionStoreTests(TestCase):
+    def setUp(self):
+        caches["default"].clear()
+        self.session = SessionStore()
+        self.session["reservation_token"] = "token"
+        self.session.save()
+
+    def tearDown(self):
+        caches["default"].clear()
+
+    def test_unchanged_session_not_written(self):
+        session = SessionStore(self.session.session_key)
+        session["reservation_token"] = "token"
+        with self.assertNumQueries(0):
+            session.save()
+
+    def test_changed_session_written(self):
+        session = SessionStore(self.session.session_key)
+        session["turnstile_last_validated"] = 1
+        session.save()
+
+        session = DBSessionStore(self.session.session_key)
+        self.assertEqual(session["turnstile_last_validated"], 1)
+
+    def test_unchanged_session_refreshed_after_interval(self):
+        session = SessionStore(self.session.session_key)
+        session.load()
+        session._session["_session_refreshed_at"] = 0
+        with CaptureQueriesContext(connection) as queries:
+            session.save()
+        self.assertTrue(any("UPDATE" in query["sql"] for query in queries))
+
+    def test_reads_sessions_saved_by_database_engine(self):
+        # Sessions from before the switch are loaded from the database
+        old_session = DBSessionStore()
+        old_session["reservation_token"] = "old-token"
+        old_session.save()
+
+        session = SessionStore(old_session.session_key)
+        self.assertEqual(session["reservation_token"], "old-token")
+        self.assertTrue(Session.objects.filter(pk=old_session.session_key).exists())
@@ -11,8 +11,10 @@ from django.utils import timezone
 from django_registration.signals import user_activated, user_registered
 from structlog.contextvars import bind_contextvars, clear_contextvars
 
-from concordia.models import TranscriptionStatus
+from concordia.models import Asset, Transcription, TranscriptionStatus
 from concordia.signals.handlers import add_request_id_to_response
+from concordia.signals.signals import reservation_obtained
+from concordia.utils import get_anonymous_user
 
 from .utils import CreateTestUsers, create_asset, create_transcription
 
@@ -147,6 +149,157 @@ class UpdateAssetStatusSignalTests(CreateTestUsers, TestCase):
         self.assertEqual(list(args[0].values_list("pk", flat=True)), [self.asset.pk])
 
 
+class UpdateAssetTranscriptionStateSignalTests(CreateTestUsers, TestCase):
+    def setUp(self):
+        self.user1 = self.create_user("user-1")
+        self.user2 = self.create_user("user-2")
+        self.asset = create_asset()
+
+    def assertState(self, contributor_count, undo_available, redo_available):
+        stored = Asset.objects.values(
+            "contributor_count", "undo_available", "redo_available"
+        ).get(pk=self.asset.pk)
+        expected = {
+            "contributor_count": contributor_count,
+            "undo_available": undo_available,
+            "redo_available": redo_available,
+        }
+        self.assertEqual(stored, expected)
+        self.assertEqual(self.asset.get_transcription_state(), expected)
+
+    def test_state_follows_transcription_history(self):
+        self.assertState(0, False, False)
+
+        t1 = create_transcription(asset=self.asset, user=self.user1)
+        self.assertState(1, False, False)
+
+        create_transcription(asset=self.asset, user=self.user1, supersedes=t1)
+        self.assertState(1, True, False)
+
+        rollback = self.asset.rollback_transcription(self.user2)
+        # The in-memory asset is updated along with the stored one
+        self.assertEqual(self.asset.contributor_count, 2)
+        self.assertState(2, False, True)
+
+        self.asset.rollforward_transcription(self.user2)
+        self.assertState(2, True, False)
+
+        rollback.reviewed_by = self.create_user("reviewer")
+        rollback.rejected = timezone.now()
+        rollback.save()
+        self.assertState(3, True, False)
+
+    def test_deleting_transcription_updates_state(self):
+        t1 = create_transcription(asset=self.asset, user=self.user1)
+        t2 = create_transcription(asset=self.asset, user=self.user2, supersedes=t1)
+        self.assertState(2, True, False)
+
+        t2.delete()
+        self.assertState(1, False, False)
+
+    def test_cascading_delete_skips_update(self):
+        create_transcription(asset=self.asset, user=self.user1)
+
+        with mock.patch.object(Asset, "update_transcription_state") as update_mock:
+            self.asset.delete()
+        update_mock.assert_not_called()
+
+
+class ActivityCountSignalTests(CreateTestUsers, TestCase):
+    def setUp(self):
+        self.asset = create_asset()
+        self.user = self.create_test_user("activity-user")
+        patcher = mock.patch("concordia.signals.handlers.activity_counter")
+        self.counter = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assertCounted(self, *events):
+        self.assertEqual(
+            self.counter.increment.call_args_list,
+            [mock.call(self.asset.pk, event) for event in events],
+        )
+        self.counter.reset_mock()
+
+    def test_transcription_activity_is_counted_on_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            transcription = create_transcription(asset=self.asset, user=self.user)
+        self.counter.increment.assert_not_called()
+        for callback in callbacks:
+            callback()
+        self.assertCounted("saved")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            transcription.submitted = timezone.now()
+            transcription.save()
+        self.assertCounted("submitted")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            transcription.rejected = timezone.now()
+            transcription.save()
+        self.assertCounted("rejected")
+
+        # Saves which don't set a timestamp aren't counted
+        with self.captureOnCommitCallbacks(execute=True):
+            transcription.text = "Edited"
+            transcription.save()
+        self.assertCounted()
+
+        # Values loaded from the database are compared too
+        reviewer = self.create_test_user("activity-reviewer")
+        with self.captureOnCommitCallbacks(execute=True):
+            loaded = Transcription.objects.get(pk=transcription.pk)
+            loaded.rejected = None
+            loaded.accepted = timezone.now()
+            loaded.reviewed_by = reviewer
+            loaded.save()
+        self.assertCounted("accepted")
+
+    def test_new_transcriptions_count_as_their_latest_step(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            create_transcription(
+                asset=self.asset, user=self.user, submitted=timezone.now()
+            )
+            create_transcription(
+                asset=self.asset,
+                user=self.user,
+                submitted=timezone.now(),
+                accepted=timezone.now(),
+                reviewed_by=self.create_test_user("activity-reviewer"),
+            )
+        self.assertCounted("submitted", "accepted")
+
+    def test_blank_ocr_transcription_is_not_counted(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            create_transcription(asset=self.asset, user=get_anonymous_user(), text="")
+        self.assertCounted()
+
+    def test_counting_failures_are_logged(self):
+        self.counter.increment.side_effect = ConnectionError
+        with (
+            mock.patch("concordia.signals.handlers.structured_logger") as logger,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            create_transcription(asset=self.asset, user=self.user)
+        logger.exception.assert_called_once()
+
+    def test_only_new_reservations_are_counted(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            reservation_obtained.send(
+                sender="test", asset_pk=self.asset.pk, reservation_token="token"
+            )
+        self.counter.increment.assert_not_called()
+
+        # Reservations are counted without touching the database
+        with self.assertNumQueries(0), self.captureOnCommitCallbacks(execute=True):
+            reservation_obtained.send(
+                sender="test",
+                asset_pk=self.asset.pk,
+                reservation_token="token",
+                created=True,
+            )
+        self.assertCounted("reserved")
+
+
 class RequestIDHeaderTests(TestCase):
     def setUp(self):
         self.factory = RequestFactory()
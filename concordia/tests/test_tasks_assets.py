@@ -8,6 +8,7 @@ from concordia.tasks.assets import (
     calculate_difficulty_values,
     fix_storage_images,
     populate_asset_years,
+    refresh_asset_transcription_state,
 )
 
 from .utils import (
@@ -86,6 +87,45 @@ class CalculateDifficultyValuesTests(CreateTestUsers, TestCase):
         self.assertEqual(last.difficulty, 1)
 
 
+class RefreshAssetTranscriptionStateTests(CreateTestUsers, TestCase):
+    def setUp(self):
+        self.user1 = self.create_test_user("rats-user-1")
+        self.user2 = self.create_test_user("rats-user-2")
+        self.item = create_item(item_id="rats-i")
+
+    def test_no_changes_when_state_matches(self):
+        asset = create_asset(item=self.item, slug="rats-a1")
+        create_transcription(asset=asset, user=self.user1)
+        updated = refresh_asset_transcription_state(Asset.objects.filter(pk=asset.pk))
+        self.assertEqual(updated, 0)
+
+    def test_corrects_stale_state(self):
+        untranscribed = create_asset(item=self.item, slug="rats-a2")
+        transcribed = create_asset(item=self.item, slug="rats-a3")
+        first = create_transcription(asset=transcribed, user=self.user1)
+        create_transcription(asset=transcribed, user=self.user2, supersedes=first)
+
+        Asset.objects.filter(pk=untranscribed.pk).update(
+            contributor_count=3, undo_available=True
+        )
+        Asset.objects.filter(pk=transcribed.pk).update(
+            contributor_count=0, undo_available=False, redo_available=True
+        )
+
+        updated = refresh_asset_transcription_state()
+        self.assertEqual(updated, 2)
+
+        untranscribed.refresh_from_db()
+        self.assertEqual(untranscribed.contributor_count, 0)
+        self.assertFalse(untranscribed.undo_available)
+        self.assertFalse(untranscribed.redo_available)
+
+        transcribed.refresh_from_db()
+        self.assertEqual(transcribed.contributor_count, 2)
+        self.assertTrue(transcribed.undo_available)
+        self.assertFalse(transcribed.redo_available)
+
+
 class PopulateAssetYearsTests(TestCase):
     def setUp(self):
         self.campaign = create_campaign(slug="pay-c")
@@ -0,0 +1,120 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from concordia.celery import app as celery_app
+from concordia.models import Asset, AssetOcrResult, Transcription
+from concordia.tasks.ocr import generate_ocr_transcription_task, pre_ocr_asset_task
+from concordia.utils import get_anonymous_user
+
+from .utils import CreateTestUsers, create_asset, create_transcription
+
+
+class GenerateOcrTranscriptionTaskTests(CreateTestUsers, TestCase):
+    def setUp(self):
+        self.asset = create_asset(storage_image="tests/test-european.jpg")
+        self.user = self.create_test_user("ocr-user")
+        self.superseded = create_transcription(
+            asset=self.asset, user=get_anonymous_user(), text=""
+        )
+
+    @mock.patch.object(Asset, "get_ocr_transcript", return_value="OCR text")
+    def test_creates_transcription(self, ocr_mock):
+        result = generate_ocr_transcription_task.run(
+            self.asset.pk, self.user.pk, self.superseded.pk, "spa"
+        )
+
+        ocr_mock.assert_called_once_with("spa")
+        transcription = Transcription.objects.get(pk=result["transcription_id"])
+        self.assertEqual(transcription.text, "OCR text")
+        self.assertEqual(transcription.user, self.user)
+        self.assertEqual(transcription.supersedes, self.superseded)
+        self.assertTrue(transcription.ocr_generated)
+        self.assertTrue(transcription.ocr_originated)
+
+    @mock.patch.object(Asset, "get_ocr_transcript", return_value="OCR text")
+    def test_superseded_while_running(self, ocr_mock):
+        # Another transcription was saved after OCR was queued
+        create_transcription(
+            asset=self.asset, user=self.user, supersedes=self.superseded
+        )
+
+        result = generate_ocr_transcription_task.run(
+            self.asset.pk, self.user.pk, self.superseded.pk, None
+        )
+
+        self.assertEqual(result["status"], 409)
+        self.assertFalse(
+            self.asset.transcription_set.filter(ocr_generated=True).exists()
+        )
+
+
+@override_settings(PRE_OCR_LANGUAGES=["eng", "spa", "not-a-language"])
+class PreOcrAssetTaskTests(TestCase):
+    def setUp(self):
+        self.asset = create_asset(storage_image="tests/test-european.jpg")
+
+    @mock.patch("concordia.tasks.ocr.pytesseract.image_to_string")
+    def test_stores_results(self, ocr_mock):
+        ocr_mock.side_effect = lambda image, lang: f"{lang} text"
+
+        self.assertEqual(pre_ocr_asset_task.run(self.asset.pk), 2)
+        self.assertEqual(
+            sorted(call.kwargs["lang"] for call in ocr_mock.call_args_list),
+            ["eng", "spa"],
+        )
+        # The image is decoded once and reused for each language
+        self.assertIs(
+            ocr_mock.call_args_list[0].args[0], ocr_mock.call_args_list[1].args[0]
+        )
+        self.assertEqual(
+            dict(
+                AssetOcrResult.objects.filter(asset=self.asset).values_list(
+                    "language", "text"
+                )
+            ),
+            {"eng": "eng text", "spa": "spa text"},
+        )
+
+        # Existing results aren't recomputed
+        ocr_mock.reset_mock()
+        self.assertEqual(pre_ocr_asset_task.run(self.asset.pk), 0)
+        self.assertFalse(ocr_mock.called)
+
+    @mock.patch("pytesseract.image_to_string")
+    def test_get_ocr_transcript_uses_stored_result(self, ocr_mock):
+        ocr_mock.return_value = "Pre-OCR text"
+        pre_ocr_asset_task.run(self.asset.pk)
+        ocr_mock.reset_mock()
+
+        cache.clear()
+        self.assertEqual(self.asset.get_ocr_transcript("spa"), "Pre-OCR text")
+        self.assertEqual(self.asset.get_ocr_transcript(), "Pre-OCR text")
+        self.assertFalse(ocr_mock.called)
+
+    def test_routed_to_own_queue(self):
+        router = celery_app.amqp.router
+        self.assertEqual(
+            router.route({}, pre_ocr_asset_task.name)["queue"].name, "pre_ocr"
+        )
+        self.assertEqual(
+            router.route({}, generate_ocr_transcription_task.name)["queue"].name,
+            "ocr",
+        )
+
+    @mock.patch("concordia.tasks.ocr.pytesseract.image_to_string")
+    def test_skips_assets_with_ocr_turned_off(self, ocr_mock):
+        self.asset.disable_ocr = True
+        self.asset.save()
+        other_asset = create_asset(
+            item=self.asset.item,
+            slug="other-asset",
+            storage_image="tests/test-european.jpg",
+        )
+        other_asset.item.project.campaign.disable_ocr = True
+        other_asset.item.project.campaign.save()
+
+        self.assertEqual(pre_ocr_asset_task.run(self.asset.pk), 0)
+        self.assertEqual(pre_ocr_asset_task.run(other_asset.pk), 0)
+        self.assertFalse(ocr_mock.called)
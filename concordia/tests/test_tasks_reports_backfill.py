@@ -1,3 +1,5 @@
+from unittest import mock
+
 from django.test import TestCase
 from django.utils import timezone
 
@@ -213,104 +215,69 @@ class BackfillAssetsStartedTaskTests(TestCase):
         self.assertEqual(cr.assets_started, 0)
         self.assertEqual(tr.assets_started, 0)
 
-    def test_skip_existing_branch_emits_heartbeat_due_to_time(self):
-        # First row already populated (skipped); second row needs update.
-        from unittest import mock
-
-        prev = SiteReport.objects.create(
-            report_name=SiteReport.ReportName.TOTAL,
-            assets_not_started=100,
-            assets_published=10,
-            assets_started=0,
-        )
-        curr = SiteReport.objects.create(
-            report_name=SiteReport.ReportName.TOTAL,
-            assets_not_started=90,
-            assets_published=15,
-            assets_started=None,
-        )
-
-        SiteReport.objects.filter(pk=prev.pk).update(created_on=self._dt(2))
-        SiteReport.objects.filter(pk=curr.pk).update(created_on=self._dt(1))
-
-        # Use a monotonic function that always advances time enough to trip the
-        # heartbeat-by-time condition, without exhausting side effects.
-        def make_monotonic(step=11.0):
-            state = {"t": 0.0}
-
-            def _mono():
-                state["t"] += step
-                return state["t"]
-
-            return _mono
+    def test_logs_each_series_and_runs_one_statement_per_series(self):
+        camp = Campaign.objects.create(title="C", slug="c")
+        for days_ago, not_started in ((3, 10), (2, 8), (1, 5)):
+            report = SiteReport.objects.create(
+                campaign=camp,
+                assets_total=10,
+                assets_not_started=not_started,
+            )
+            SiteReport.objects.filter(pk=report.pk).update(
+                created_on=self._dt(days_ago)
+            )
+        total = SiteReport.objects.create(report_name=SiteReport.ReportName.TOTAL)
+        SiteReport.objects.filter(pk=total.pk).update(created_on=self._dt(1))
 
         with (
             mock.patch("concordia.tasks.reports.backfill.structured_logger") as slog,
-            mock.patch(
-                "concordia.tasks.reports.backfill.time.monotonic",
-                new=make_monotonic(),
-            ),
+            self.assertNumQueries(4),
         ):
             updated = backfill_assets_started_for_site_reports.run()
-            self.assertEqual(updated, 1)
-
-            hb_calls = [
-                c
-                for c in slog.info.call_args_list
-                if c.kwargs.get("event_code")
-                == "assets_started_backfill_series_heartbeat"
-                and c.kwargs.get("series") == "TOTAL"
-                and c.kwargs.get("scanned_rows") == 1
-                and c.kwargs.get("last_seen_site_report_id") == prev.id
-            ]
-            self.assertTrue(hb_calls)
-
-    def test_post_scan_heartbeat_emitted_due_to_time(self):
-        # Single-row series where a save occurs, then a heartbeat fires due to
-        # elapsed time.
-        from unittest import mock
-
-        single = SiteReport.objects.create(
-            report_name=SiteReport.ReportName.TOTAL,
-            assets_not_started=50,
-            assets_published=5,
-            assets_started=None,
-        )
-        SiteReport.objects.filter(pk=single.pk).update(created_on=self._dt(1))
+        self.assertEqual(updated, 4)
 
-        def make_monotonic(step=11.0):
-            state = {"t": 0.0}
+        series_logs = {
+            c.kwargs["series"]: c.kwargs["updated_rows"]
+            for c in slog.info.call_args_list
+            if c.kwargs.get("event_code") == "assets_started_backfill_series_done"
+        }
+        self.assertEqual(
+            series_logs, {"CAMPAIGN": 3, "TOPIC": 0, "TOTAL": 1, "RETIRED_TOTAL": 0}
+        )
+        total.refresh_from_db()
+        # Only the last campaign snapshot is within the rollup window
+        self.assertEqual(total.assets_started, 3)
 
-            def _mono():
-                state["t"] += step
-                return state["t"]
+    def test_skipped_rows_are_used_as_previous_snapshot(self):
+        camp = Campaign.objects.create(title="C", slug="c")
+        first = SiteReport.objects.create(
+            campaign=camp, assets_total=10, assets_not_started=10
+        )
+        # Populated with a wrong value, which resumption leaves alone
+        second = SiteReport.objects.create(
+            campaign=camp, assets_total=10, assets_not_started=6, assets_started=9
+        )
+        third = SiteReport.objects.create(
+            campaign=camp, assets_total=10, assets_not_started=1
+        )
+        for days_ago, report in ((3, first), (2, second), (1, third)):
+            SiteReport.objects.filter(pk=report.pk).update(
+                created_on=self._dt(days_ago)
+            )
 
-            return _mono
+        updated = backfill_assets_started_for_site_reports.run()
+        self.assertEqual(updated, 2)
 
-        with (
-            mock.patch("concordia.tasks.reports.backfill.structured_logger") as slog,
-            mock.patch(
-                "concordia.tasks.reports.backfill.time.monotonic",
-                new=make_monotonic(),
-            ),
-        ):
-            updated = backfill_assets_started_for_site_reports.run()
-            self.assertEqual(updated, 1)
-
-            slog.info.assert_any_call(
-                "Scanning series...",
-                event_code="assets_started_backfill_series_heartbeat",
-                series="TOTAL",
-                scanned_rows=1,
-                updated_rows=1,
-                last_seen_site_report_id=single.id,
-            )
+        first.refresh_from_db()
+        second.refresh_from_db()
+        third.refresh_from_db()
+        self.assertEqual(first.assets_started, 0)
+        self.assertEqual(second.assets_started, 9)
+        self.assertEqual(third.assets_started, 5)
 
     def test_no_update_when_equal_with_skip_existing_false(self):
         # First row already equals the calculated value (zero for first snapshot),
-        # so no save should occur on that row when recomputing.
-        from unittest import mock
-
+        # so it is not counted as updated when recomputing.
         prev = SiteReport.objects.create(
             report_name=SiteReport.ReportName.TOTAL,
             assets_not_started=100,
@@ -327,20 +294,13 @@ class BackfillAssetsStartedTaskTests(TestCase):
         SiteReport.objects.filter(pk=prev.pk).update(created_on=self._dt(2))
         SiteReport.objects.filter(pk=curr.pk).update(created_on=self._dt(1))
 
-        with mock.patch("concordia.tasks.reports.backfill.structured_logger") as slog:
-            updated = backfill_assets_started_for_site_reports.run(skip_existing=False)
-            self.assertEqual(updated, 1)
-
-            # Row logs should not include the first row, since it already matched.
-            row_logs = [
-                c.kwargs
-                for c in slog.info.call_args_list
-                if c.kwargs.get("event_code") == "assets_started_backfill_row"
-            ]
-            self.assertTrue(any(kw.get("site_report_id") == curr.id for kw in row_logs))
-            self.assertFalse(
-                any(kw.get("site_report_id") == prev.id for kw in row_logs)
-            )
+        updated = backfill_assets_started_for_site_reports.run(skip_existing=False)
+        self.assertEqual(updated, 1)
+
+        prev.refresh_from_db()
+        curr.refresh_from_db()
+        self.assertEqual(prev.assets_started, 0)
+        self.assertEqual(curr.assets_started, 0)
 
     def test_total_assets_started_is_rolled_up_from_campaign_series(self):
         # Ensure the TOTAL series does not derive assets_started from its own
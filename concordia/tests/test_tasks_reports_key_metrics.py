@@ -1,4 +1,5 @@
 from datetime import date, datetime
+from decimal import Decimal
 from types import SimpleNamespace
 from unittest import mock
 
@@ -8,6 +9,8 @@ from django.utils import timezone
 from concordia.models import KeyMetricsReport, SiteReport
 from concordia.tasks.reports.key_metrics import build_key_metrics_reports
 
+from .utils import create_campaign
+
 
 class BuildKeyMetricsReportsTaskTests(TestCase):
     def _dt(self, days_ago):
@@ -1387,3 +1390,148 @@ class BuildKeyMetricsReportsTaskTests(TestCase):
 
         self.assertEqual(changed, 1)
         self.assertEqual(mock_upsert_year.call_count, 1)
+
+
+class BulkRebuildKeyMetricsReportsTests(TestCase):
+    def _site_report(self, when, report_name=SiteReport.ReportName.TOTAL, **kwargs):
+        site_report = SiteReport.objects.create(report_name=report_name, **kwargs)
+        SiteReport.objects.filter(pk=site_report.pk).update(
+            created_on=timezone.make_aware(when)
+        )
+
+    def _seed_manual_reports(self):
+        KeyMetricsReport.objects.filter(pk__isnull=False).delete()
+        KeyMetricsReport.objects.create(
+            period_type=KeyMetricsReport.PeriodType.MONTHLY,
+            period_start=date(2024, 1, 1),
+            period_end=date(2024, 1, 31),
+            fiscal_year=2024,
+            fiscal_quarter=2,
+            month=1,
+            crowd_visits=100,
+            avg_visit_seconds=Decimal("12.50"),
+        )
+        KeyMetricsReport.objects.create(
+            period_type=KeyMetricsReport.PeriodType.MONTHLY,
+            period_start=date(2024, 2, 1),
+            period_end=date(2024, 2, 29),
+            fiscal_year=2024,
+            fiscal_quarter=2,
+            month=2,
+            avg_visit_seconds=Decimal("13.50"),
+        )
+        # Manual values set only on rollups are kept
+        KeyMetricsReport.objects.create(
+            period_type=KeyMetricsReport.PeriodType.QUARTERLY,
+            period_start=date(2024, 1, 1),
+            period_end=date(2024, 3, 31),
+            fiscal_year=2024,
+            fiscal_quarter=2,
+            crowd_page_views=500,
+        )
+        KeyMetricsReport.objects.create(
+            period_type=KeyMetricsReport.PeriodType.FISCAL_YEAR,
+            period_start=date(2023, 10, 1),
+            period_end=date(2024, 9, 30),
+            fiscal_year=2024,
+            transcriptions_added_to_loc_gov=7,
+        )
+
+    def _snapshot(self):
+        fields = (
+            *KeyMetricsReport.CALCULATED_FIELDS,
+            *KeyMetricsReport.MANUAL_FIELDS,
+            "fiscal_year",
+            "fiscal_quarter",
+            "month",
+        )
+        return {
+            (report.period_type, report.period_start, report.period_end): {
+                field: getattr(report, field) for field in fields
+            }
+            for report in KeyMetricsReport.objects.all()
+        }
+
+    def _build(self, bulk):
+        with mock.patch(
+            "concordia.tasks.reports.key_metrics.flag_enabled", return_value=bulk
+        ):
+            return build_key_metrics_reports.run(recompute_all=True)
+
+    @mock.patch("concordia.tasks.reports.key_metrics.timezone.localdate")
+    def test_matches_upserts(self, mock_localdate):
+        mock_localdate.return_value = date(2024, 4, 10)
+        campaign = create_campaign()
+
+        snapshots = [
+            (datetime(2023, 8, 20, 12), 10, 0),
+            (datetime(2023, 9, 5, 12), 14, 3),
+            (datetime(2023, 9, 28, 12), 20, 5),
+            # No snapshot in October
+            (datetime(2023, 11, 2, 12), 31, 7),
+            # Either side of midnight local time on December 1
+            (datetime(2023, 11, 30, 23, 30), 40, 2),
+            (datetime(2023, 12, 1, 0, 30), 41, 1),
+            (datetime(2024, 1, 15, 12), 39, 4),
+            (datetime(2024, 2, 10, 12), 55, 6),
+            (datetime(2024, 2, 10, 12), 56, 1),
+            (datetime(2024, 3, 31, 23, 0), 70, 9),
+        ]
+        for index, (when, total, started) in enumerate(snapshots):
+            self._site_report(
+                when,
+                assets_published=total,
+                assets_started=started,
+                assets_completed=total // 2,
+                users_activated=index,
+                anonymous_transcriptions=total * 2,
+                transcriptions_saved=total * 3,
+                tag_uses=total + index,
+            )
+        for when, total, started in (
+            (datetime(2023, 11, 20, 12), 5, 0),
+            (datetime(2024, 2, 1, 12), 8, 2),
+        ):
+            self._site_report(
+                when,
+                SiteReport.ReportName.RETIRED_TOTAL,
+                assets_published=total,
+                assets_started=started,
+                transcriptions_saved=total,
+            )
+        # Campaign rows aren't part of the site-wide TOTAL series, and only
+        # count towards assets_started for RETIRED_TOTAL if site-wide
+        self._site_report(
+            datetime(2024, 1, 20, 12), campaign=campaign, assets_published=1000
+        )
+        self._site_report(
+            datetime(2024, 3, 1, 12),
+            SiteReport.ReportName.RETIRED_TOTAL,
+            campaign=campaign,
+            assets_published=9,
+            assets_started=50,
+        )
+
+        self._seed_manual_reports()
+        expected_changed = self._build(bulk=False)
+        expected = self._snapshot()
+
+        self._seed_manual_reports()
+        with mock.patch.object(KeyMetricsReport, "upsert_month") as upsert_month:
+            changed = self._build(bulk=True)
+        upsert_month.assert_not_called()
+
+        self.assertEqual(changed, expected_changed)
+        self.assertEqual(self._snapshot(), expected)
+        # Sanity check that the data covered the interesting cases
+        quarter = expected[
+            (
+                KeyMetricsReport.PeriodType.QUARTERLY,
+                date(2024, 1, 1),
+                date(2024, 3, 31),
+            )
+        ]
+        self.assertEqual(quarter["crowd_page_views"], 500)
+        self.assertEqual(quarter["crowd_visits"], 100)
+        self.assertEqual(quarter["avg_visit_seconds"], Decimal("13.00"))
+        self.assertEqual(len(expected), 9 + 4 + 2)
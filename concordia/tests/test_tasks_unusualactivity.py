@@ -166,3 +166,64 @@ class UnusualActivityTaskTests(TestCase):
         self.assertEqual(m_mgr.review_incidents.call_args[0][0], expected_one_day_ago)
         msg.attach_alternative.assert_called_once_with("HTML2", "text/html")
         msg.send.assert_called_once()
+
+    @override_settings(CONCORDIA_ENVIRONMENT="production")
+    def test_incremental_report_covers_hours_and_skips_empty_report(self):
+        fixed_now_dt = timezone.make_aware(datetime(2025, 1, 3, 9, 30), timezone=UTC)
+        expected_end = timezone.make_aware(datetime(2025, 1, 3, 9), timezone=UTC)
+
+        with (
+            mock.patch("concordia.tasks.unusualactivity.Site.objects.get_current"),
+            mock.patch(
+                "concordia.tasks.unusualactivity.timezone.now",
+                return_value=fixed_now_dt,
+            ),
+            mock.patch(
+                "concordia.tasks.unusualactivity.loader.get_template"
+            ) as m_get_tmpl,
+            mock.patch(
+                "concordia.tasks.unusualactivity.EmailMultiAlternatives"
+            ) as m_email,
+            mock.patch(
+                "concordia.tasks.unusualactivity.Transcription.objects"
+            ) as m_mgr,
+        ):
+            m_mgr.transcribe_incidents.return_value = []
+            m_mgr.review_incidents.return_value = []
+
+            unusual_activity(hours=1)
+
+        for method in (m_mgr.transcribe_incidents, m_mgr.review_incidents):
+            method.assert_called_once_with(
+                expected_end - timedelta(hours=1), end=expected_end
+            )
+        m_get_tmpl.assert_not_called()
+        m_email.assert_not_called()
+
+    @override_settings(CONCORDIA_ENVIRONMENT="production")
+    def test_incremental_reports_tile_whole_hours(self):
+        windows = []
+        # One run on time and the next delayed, as a busy worker might be
+        for minute, hour in ((5, 9), (40, 10)):
+            now = timezone.make_aware(datetime(2025, 1, 3, hour, minute), timezone=UTC)
+            with (
+                mock.patch("concordia.tasks.unusualactivity.Site.objects.get_current"),
+                mock.patch(
+                    "concordia.tasks.unusualactivity.timezone.now", return_value=now
+                ),
+                mock.patch(
+                    "concordia.tasks.unusualactivity.Transcription.objects"
+                ) as m_mgr,
+            ):
+                m_mgr.transcribe_incidents.return_value = []
+                m_mgr.review_incidents.return_value = []
+
+                unusual_activity(hours=1)
+
+            args, kwargs = m_mgr.transcribe_incidents.call_args
+            windows.append((args[0], kwargs["end"]))
+
+        first, second = windows
+        self.assertEqual(first[0].minute, 0)
+        self.assertEqual(first[1], second[0])
+        self.assertEqual(second[1] - second[0], timedelta(hours=1))
@@ -1,14 +1,17 @@
-from datetime import timedelta
+from datetime import UTC, datetime, timedelta
 from unittest import mock
 
 from django.core.cache import caches
+from django.db import DatabaseError
 from django.test import TestCase, override_settings
 from django.utils import timezone
 
-from concordia.models import Campaign, SiteReport, TranscriptionStatus
+from concordia.activity_series import ActivityCounter
+from concordia.models import Campaign, CampaignActivity, SiteReport, TranscriptionStatus
 from concordia.tasks.visualizations import (
     populate_asset_status_visualization_cache,
     populate_daily_activity_visualization_cache,
+    update_activity_series,
 )
 
 from .utils import create_asset, create_campaign, create_item, create_project
@@ -347,3 +350,143 @@ class VisualizationCacheTasksTests(TestCase):
                 mock_log.exception.call_args.kwargs.get("event_code"),
                 "daily_activity_vis_csv_missing_url_error",
             )
+
+
+@override_settings(
+    TIME_ZONE="UTC",
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+        "visualization_cache": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+    },
+)
+class UpdateActivitySeriesTests(TestCase):
+    def setUp(self):
+        caches["default"].clear()
+        self.cache = caches["visualization_cache"]
+        self.cache.clear()
+        self.campaign = create_campaign()
+        item = create_item(project=create_project(campaign=self.campaign))
+        self.asset = create_asset(item=item)
+        self.now = datetime(2025, 3, 20, 15, 30, 20, tzinfo=UTC)
+        self.counter = ActivityCounter()
+        patcher = mock.patch(
+            "concordia.tasks.visualizations.activity_counter", self.counter
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def count(self, when, event, times=1, asset=None):
+        with mock.patch(
+            "concordia.activity_series.time", return_value=when.timestamp()
+        ):
+            for _ in range(times):
+                self.counter.increment((asset or self.asset).pk, event)
+
+    def run_task(self):
+        with mock.patch(
+            "concordia.tasks.visualizations.timezone.now", return_value=self.now
+        ):
+            update_activity_series.run()
+
+    def test_compacts_minutes_into_hours(self):
+        other_asset = create_asset(item=self.asset.item, slug="other-asset")
+        deleted_asset = create_asset(item=self.asset.item, slug="deleted-asset")
+        self.count(self.now - timedelta(hours=1), "saved")
+        self.count(self.now - timedelta(hours=1), "saved", asset=other_asset)
+        self.count(self.now - timedelta(minutes=5), "saved")
+        # Activity on assets deleted before compaction is dropped
+        self.count(self.now - timedelta(minutes=5), "saved", asset=deleted_asset)
+        deleted_asset.delete()
+        self.count(self.now - timedelta(minutes=5), "accepted")
+        # The current minute may still be counting, so it is left alone
+        self.count(self.now, "reserved")
+
+        self.run_task()
+
+        hours = {
+            row.period_start: (row.saved, row.accepted, row.reserved)
+            for row in CampaignActivity.objects.filter(
+                resolution=CampaignActivity.Resolution.HOUR
+            )
+        }
+        self.assertEqual(
+            hours,
+            {
+                datetime(2025, 3, 20, 14, tzinfo=UTC): (2, 0, 0),
+                datetime(2025, 3, 20, 15, tzinfo=UTC): (1, 1, 0),
+            },
+        )
+
+        # Later runs add to the existing rows
+        self.now += timedelta(minutes=1)
+        self.count(self.now - timedelta(minutes=1), "saved")
+        self.run_task()
+        row = CampaignActivity.objects.get(
+            period_start=datetime(2025, 3, 20, 15, tzinfo=UTC)
+        )
+        self.assertEqual((row.saved, row.accepted, row.reserved), (2, 1, 1))
+
+        data = self.cache.get("activity-last-24-hours")
+        self.assertEqual(len(data["labels"]), 24)
+        self.assertEqual(data["labels"][-1], "2025-03-20 15:00")
+        datasets = {ds["label"]: ds["data"] for ds in data["activity_datasets"]}
+        self.assertEqual(datasets["Saved"][-2:], [2, 2])
+        self.assertEqual(datasets["Accepted"][-2:], [0, 1])
+        self.assertEqual(datasets["Reserved"][-1], 1)
+
+    def test_failed_compaction_keeps_counts(self):
+        self.count(self.now - timedelta(minutes=5), "saved", times=2)
+
+        with mock.patch(
+            "concordia.tasks.visualizations._add_campaign_activity",
+            side_effect=DatabaseError,
+        ):
+            with self.assertRaises(DatabaseError):
+                self.run_task()
+        self.assertFalse(CampaignActivity.objects.exists())
+
+        self.run_task()
+        row = CampaignActivity.objects.get(resolution=CampaignActivity.Resolution.HOUR)
+        self.assertEqual(row.saved, 2)
+
+    def test_combines_old_hours_into_days(self):
+        for hour in (1, 13):
+            CampaignActivity.objects.create(
+                campaign=self.campaign,
+                resolution=CampaignActivity.Resolution.HOUR,
+                period_start=datetime(2025, 3, 10, hour, tzinfo=UTC),
+                submitted=2,
+            )
+        recent = CampaignActivity.objects.create(
+            campaign=self.campaign,
+            resolution=CampaignActivity.Resolution.HOUR,
+            period_start=datetime(2025, 3, 19, 1, tzinfo=UTC),
+            submitted=1,
+        )
+
+        self.run_task()
+
+        day = CampaignActivity.objects.get(resolution=CampaignActivity.Resolution.DAY)
+        self.assertEqual(day.period_start, datetime(2025, 3, 10, tzinfo=UTC))
+        self.assertEqual(day.submitted, 4)
+        self.assertEqual(
+            list(
+                CampaignActivity.objects.filter(
+                    resolution=CampaignActivity.Resolution.HOUR
+                )
+            ),
+            [recent],
+        )
+
+        data = self.cache.get("activity-last-28-days")
+        self.assertEqual(data["labels"][-1], "2025-03-20")
+        submitted = next(
+            ds["data"] for ds in data["activity_datasets"] if ds["label"] == "Submitted"
+        )
+        self.assertEqual(submitted[-11], 4)
+        self.assertEqual(submitted[-2], 1)
+        self.assertEqual(sum(submitted), 5)
@@ -0,0 +1,122 @@
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+
+from concordia.cdn import pop_pending_purges
+from concordia.models import Asset, Campaign, Project, TranscriptionStatus
+from concordia.utils.page_cache import (
+    SITE_SCOPE,
+    campaign_scope,
+    get_scope_versions,
+    item_scope,
+    project_scope,
+)
+
+from .utils import CreateTestUsers, create_asset, create_item, create_transcription
+
+
+@override_settings(RATELIMIT_ENABLE=False)
+class PageCacheTests(CreateTestUsers, TestCase):
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        self.asset = create_asset()
+        pop_pending_purges()
+        self.item = self.asset.item
+        self.project = self.item.project
+        self.campaign = self.project.campaign
+
+    def tearDown(self):
+        for cache in caches.all():
+            cache.clear()
+
+    def get_versions(self):
+        return dict(
+            zip(
+                ("site", "campaign", "project", "item"),
+                get_scope_versions(
+                    [
+                        SITE_SCOPE,
+                        campaign_scope(self.campaign.slug),
+                        project_scope(self.campaign.slug, self.project.slug),
+                        item_scope(
+                            self.campaign.slug, self.project.slug, self.item.item_id
+                        ),
+                    ]
+                ),
+                strict=True,
+            )
+        )
+
+    def test_pages_cached_until_subtree_changes(self):
+        urls = (
+            self.campaign.get_absolute_url(),
+            self.project.get_absolute_url(),
+            self.item.get_absolute_url(),
+        )
+        for url in urls:
+            with self.subTest(url=url):
+                self.assertContains(self.client.get(url), "Test Project")
+
+        # Changes which don't send signals aren't seen until a version is bumped
+        Project.objects.filter(pk=self.project.pk).update(title="Renamed Project")
+        for url in urls:
+            with self.subTest(url=url):
+                self.assertNotContains(self.client.get(url), "Renamed Project")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.asset.transcription_status = TranscriptionStatus.SUBMITTED
+            self.asset.save()
+        for url in urls:
+            with self.subTest(url=url):
+                self.assertContains(self.client.get(url), "Renamed Project")
+
+    def test_authenticated_requests_not_cached(self):
+        self.login_user()
+        url = self.campaign.get_absolute_url()
+        self.client.get(url)
+        Campaign.objects.filter(pk=self.campaign.pk).update(title="Renamed Campaign")
+        self.assertContains(self.client.get(url), "Renamed Campaign")
+
+    def test_asset_change_bumps_item_project_and_campaign(self):
+        before = self.get_versions()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.asset.transcription_status = TranscriptionStatus.SUBMITTED
+            self.asset.save()
+        after = self.get_versions()
+
+        self.assertEqual(before["site"], after["site"])
+        for scope in ("campaign", "project", "item"):
+            self.assertNotEqual(before[scope], after[scope])
+
+    def test_unchanged_asset_does_not_bump(self):
+        Asset.objects.filter(pk=self.asset.pk).update(
+            transcription_status=TranscriptionStatus.IN_PROGRESS
+        )
+        before = self.get_versions()
+        with self.captureOnCommitCallbacks(execute=True):
+            asset = Asset.objects.get(pk=self.asset.pk)
+            asset.save()
+            asset.title = "Renamed Asset"
+            asset.save()
+            # Draft saves don't change the asset's status
+            create_transcription(asset=asset, user=self.create_test_user())
+        self.assertEqual(before, self.get_versions())
+        self.assertEqual(pop_pending_purges(), set())
+
+    def test_moved_asset_bumps_both_items(self):
+        asset = Asset.objects.get(pk=self.asset.pk)
+        other_item = create_item(project=self.project, item_id="other-item")
+        before = self.get_versions()
+        with self.captureOnCommitCallbacks(execute=True):
+            asset.item = other_item
+            asset.save()
+        self.assertNotEqual(before["item"], self.get_versions()["item"])
+
+    def test_campaign_change_bumps_site(self):
+        before = self.get_versions()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.campaign.save()
+        after = self.get_versions()
+
+        self.assertNotEqual(before["site"], after["site"])
+        self.assertEqual(before["item"], after["item"])
@@ -0,0 +1,52 @@
+from django.db import transaction
+from django.test import TransactionTestCase
+from prometheus_client import REGISTRY
+
+from concordia.models import CardFamily
+from concordia.utils import get_anonymous_user, get_default_card_family
+from concordia.utils.singletons import invalidate_singletons
+
+
+class CachedSingletonTests(TransactionTestCase):
+    def setUp(self):
+        invalidate_singletons()
+
+    def tearDown(self):
+        invalidate_singletons()
+
+    def test_cached_until_changed(self):
+        anonymous_user = get_anonymous_user()
+        hits = REGISTRY.get_sample_value(
+            "concordia_singleton_lookups_total",
+            {"name": "anonymous_user", "result": "hit"},
+        )
+        with self.assertNumQueries(0):
+            cached_user = get_anonymous_user()
+        self.assertEqual(cached_user, anonymous_user)
+        # Callers get their own copy
+        self.assertIsNot(cached_user, get_anonymous_user())
+        self.assertEqual(
+            REGISTRY.get_sample_value(
+                "concordia_singleton_lookups_total",
+                {"name": "anonymous_user", "result": "hit"},
+            ),
+            (hits or 0) + 2,
+        )
+
+        anonymous_user.save()
+        with self.assertNumQueries(1):
+            get_anonymous_user()
+
+    def test_not_cached_inside_transaction(self):
+        with transaction.atomic():
+            get_anonymous_user()
+            with self.assertNumQueries(1):
+                get_anonymous_user()
+
+    def test_default_card_family(self):
+        self.assertIsNone(get_default_card_family())
+        card_family = CardFamily.objects.create(slug="default", default=True)
+        with self.assertNumQueries(1):
+            self.assertEqual(get_default_card_family(), card_family)
+        with self.assertNumQueries(0):
+            get_default_card_family()
@@ -1,6 +1,6 @@
 import json
 from datetime import date, timedelta
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from django import forms
 from django.contrib.auth.models import AnonymousUser
@@ -651,6 +651,96 @@ class ConcordiaViewTests(CreateTestUsers, JSONAssertMixin, TestCase):
             self.assertTrue(superseded_mock.called)
             self.assertTrue(mock.called)
 
+    @patch("concordia.views.ajax.generate_ocr_transcription_task")
+    @patch("concordia.views.ajax.flag_enabled", return_value=True)
+    def test_generate_ocr_transcription_queued(self, flag_mock, task_mock):
+        asset = create_asset(storage_image="tests/test-european.jpg")
+        url = reverse("generate-ocr-transcription", kwargs={"asset_pk": asset.pk})
+        self.login_user()
+        user = self.user
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(url, data={"language": "spa"})
+        self.assertEqual(202, response.status_code)
+        data = response.json()
+        superseded = asset.transcription_set.get()
+        self.assertEqual(superseded.text, "")
+        task_mock.apply_async.assert_called_once_with(
+            args=(asset.pk, user.pk, superseded.pk, "spa"),
+            task_id=data["ocrTaskId"],
+        )
+        self.assertEqual(
+            caches["default"].get(f"OCR_TASK_{data['ocrTaskId']}"), user.pk
+        )
+        self.assertEqual(
+            data["statusUrl"],
+            reverse(
+                "ocr-transcription-status",
+                kwargs={"asset_pk": asset.pk, "task_id": data["ocrTaskId"]},
+            ),
+        )
+
+    @patch("concordia.views.ajax.AsyncResult")
+    def test_ocr_transcription_status(self, result_mock):
+        asset = create_asset(storage_image="tests/test-european.jpg")
+        task_id = "8a6e0804-2bd0-4672-b79d-d97027f9071a"
+        url = reverse(
+            "ocr-transcription-status",
+            kwargs={"asset_pk": asset.pk, "task_id": task_id},
+        )
+        result = result_mock.return_value
+
+        # Anonymous user test; should redirect
+        response = self.client.get(url)
+        self.assertEqual(302, response.status_code)
+
+        self.login_user()
+        user = self.user
+
+        result.ready.return_value = False
+        caches["default"].set(f"OCR_TASK_{task_id}", user.pk)
+        response = self.client.get(url)
+        self.assertEqual(202, response.status_code)
+        self.assertEqual(response.json(), {"status": "pending"})
+        result_mock.assert_called_with(task_id, app=ANY)
+
+        # Tasks still pending after OCR_TASK_TIMEOUT, or queued by someone
+        # else, have timed out
+        caches["default"].delete(f"OCR_TASK_{task_id}")
+        response = self.client.get(url)
+        self.assertEqual(504, response.status_code)
+        self.assertIn("error", response.json())
+
+        result.ready.return_value = True
+        result.failed.return_value = True
+        response = self.client.get(url)
+        self.assertEqual(500, response.status_code)
+
+        result.failed.return_value = False
+        result.result = {
+            "error": "This transcription has been superseded",
+            "status": 409,
+        }
+        response = self.client.get(url)
+        self.assertEqual(409, response.status_code)
+
+        transcription = create_transcription(
+            asset=asset, user=user, text="OCR text", ocr_generated=True
+        )
+        result.result = {"transcription_id": transcription.pk}
+        response = self.client.get(url)
+        self.assertEqual(201, response.status_code)
+        data = response.json()
+        self.assertEqual(data["id"], transcription.pk)
+        self.assertEqual(data["text"], "OCR text")
+        self.assertEqual(data["asset"]["id"], asset.pk)
+
+        # Other users can't see the transcription
+        self.logout_user()
+        self.login_user(username="other-user")
+        response = self.client.get(url)
+        self.assertEqual(404, response.status_code)
+
     def test_project_detail_view(self):
         """
         Test GET on route /campaigns/<slug-value> (campaign)
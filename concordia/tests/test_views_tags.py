@@ -2,11 +2,13 @@ from unittest.mock import patch
 
 from django import forms
 from django.contrib.auth.models import User
+from django.db import connection
 from django.db.models.signals import post_save
 from django.test import (
     TransactionTestCase,
     override_settings,
 )
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from concordia.models import (
@@ -202,6 +204,46 @@ class TagSubmissionViewTests(CreateTestUsers, JSONAssertMixin, TransactionTestCa
         self.assertIn("all_tags", data)
         self.assertCountEqual(updated_tags, data["user_tags"])
 
+    def test_tag_submission_query_count_is_fixed(self):
+        asset = create_asset()
+        self.login_user()
+        submit_url = reverse("submit-tags", kwargs={"asset_pk": asset.pk})
+
+        # Prime the session and the user's tag collection. Each submission
+        # below both adds and removes tags.
+        self.client.post(submit_url, data={"tags": ["foo", "baaz"]})
+
+        with CaptureQueriesContext(connection) as few:
+            self.client.post(submit_url, data={"tags": ["foo", "bar"]})
+        with CaptureQueriesContext(connection) as many:
+            resp = self.client.post(
+                submit_url, data={"tags": [f"tag{i}" for i in range(20)]}
+            )
+
+        self.assertValidJSON(resp, expected_status=200)
+        self.assertEqual(len(few), len(many))
+
+    def test_tag_submission_discards_cached_asset_tags(self):
+        asset = create_asset()
+        self.login_user()
+        self.assertEqual(asset.get_tags(), [])
+
+        resp = self.client.post(
+            reverse("submit-tags", kwargs={"asset_pk": asset.pk}),
+            data={"tags": ["foo", "bar"]},
+        )
+        data = self.assertValidJSON(resp, expected_status=200)
+
+        # The values are read from the table once, then cached
+        with self.assertNumQueries(1):
+            self.assertEqual(asset.get_tags(), data["all_tags"])
+        with self.assertNumQueries(0):
+            self.assertEqual(asset.get_tags(), data["all_tags"])
+
+        # Changing a collection outside the view discards the cached values
+        asset.userassettagcollection_set.get().tags.clear()
+        self.assertEqual(asset.get_tags(), [])
+
     def tearDown(self):
         # We'll test the signal handler separately
         post_save.connect(on_transcription_save, sender=Transcription)
@@ -37,11 +37,21 @@ tx_urlpatterns = (
             exporter_views.ExportCampaignToCSV.as_view(),
             name="campaign-export-csv",
         ),
+        path(
+            "<uslug:campaign_slug>/export/parquet/",
+            exporter_views.ExportCampaignToParquet.as_view(),
+            name="campaign-export-parquet",
+        ),
         path(
             "<uslug:campaign_slug>/export/bagit/",
             exporter_views.ExportCampaignToBagIt.as_view(),
             name="campaign-export-bagit",
         ),
+        path(
+            "<uslug:campaign_slug>/<uslug:project_slug>/export/parquet/",
+            exporter_views.ExportProjectToParquet.as_view(),
+            name="project-export-parquet",
+        ),
         path(
             "<uslug:campaign_slug>/<uslug:project_slug>/export/bagit/",
             exporter_views.ExportProjectToBagIt.as_view(),
@@ -274,6 +284,11 @@ urlpatterns = [
         views.ajax.generate_ocr_transcription,
         name="generate-ocr-transcription",
     ),
+    path(
+        "assets/<int:asset_pk>/transcriptions/generate-ocr/<uuid:task_id>/",
+        views.ajax.ocr_transcription_status,
+        name="ocr-transcription-status",
+    ),
     path(
         "assets/<int:asset_pk>/transcriptions/rollback/",
         views.ajax.rollback_transcription,
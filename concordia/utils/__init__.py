@@ -3,10 +3,14 @@ from secrets import token_hex
 from django.contrib.auth.models import User
 
 from concordia.logging import ConcordiaLogger
+from concordia.models import CardFamily
 from concordia.templatetags.concordia_media_tags import asset_media_url
 
+from .singletons import cached_singleton
+
 __all__ = [
     "get_anonymous_user",
+    "get_default_card_family",
     "request_accepts_json",
     "get_or_create_reservation_token",
     "get_image_urls_from_asset",
@@ -15,11 +19,14 @@ __all__ = [
 structured_logger = ConcordiaLogger.get_logger(__name__)
 
 
+@cached_singleton("anonymous_user")
 def get_anonymous_user():
     """
     Get the user called "anonymous" if it exist. Create the user if it doesn't
     exist This is the default concordia user if someone is working on the site
     without logging in first.
+
+    The user is cached in process memory (see concordia.utils.singletons).
     """
 
     try:
@@ -28,6 +35,19 @@ def get_anonymous_user():
         return User.objects.create_user(username="anonymous")
 
 
+@cached_singleton("default_card_family")
+def get_default_card_family():
+    """
+    Get the card family shown for campaigns without their own, if one is
+    marked as the default.
+
+    The card family is cached in process memory (see
+    concordia.utils.singletons).
+    """
+
+    return CardFamily.objects.filter(default=True).first()
+
+
 def request_accepts_json(request):
     accept_header = request.headers.get("Accept", "*/*")
 
@@ -0,0 +1,56 @@
+import uuid
+from typing import Callable, Iterable, Optional
+
+from django.core.cache import cache
+
+# Admin list filter option lists change only when a campaign, project or topic
+# is saved or deleted, so they are cached under a shared version token which
+# is replaced whenever that happens. Replacing the token orphans every cached
+# option list at once without having to know their keys.
+FILTER_OPTIONS_VERSION_KEY = "admin:filter-options:version"
+FILTER_OPTIONS_CACHE_TIMEOUT = 60 * 60
+
+
+def get_filter_options_version() -> str:
+    """
+    Return the current admin filter option cache version.
+
+    Returns:
+        str: An opaque version token.
+    """
+    return cache.get_or_set(
+        FILTER_OPTIONS_VERSION_KEY, lambda: uuid.uuid4().hex, timeout=None
+    )
+
+
+def invalidate_filter_options() -> None:
+    """
+    Invalidate every cached admin filter option list.
+
+    The next lookup generates a new version, orphaning every list cached
+    under the old one.
+    """
+    cache.delete(FILTER_OPTIONS_VERSION_KEY)
+
+
+def get_cached_filter_options(
+    name: str,
+    build: Callable[[], Iterable[tuple]],
+    timeout: Optional[int] = FILTER_OPTIONS_CACHE_TIMEOUT,
+) -> list[tuple]:
+    """
+    Return an admin filter's option list, building it on a cache miss.
+
+    Args:
+        name (str): Identifies the option list, including any parameters it
+            depends on, such as a selected campaign.
+        build (Callable): Returns the `(value, label)` options when called.
+        timeout (int, optional): Cache timeout in seconds. Lists built from
+            data other than campaigns, projects and topics should use a short
+            timeout since saving that data does not invalidate them.
+
+    Returns:
+        list[tuple]: The `(value, label)` options.
+    """
+    key = f"admin:filter-options:{get_filter_options_version()}:{name}"
+    return cache.get_or_set(key, lambda: list(build()), timeout=timeout)
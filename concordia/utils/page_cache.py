@@ -0,0 +1,178 @@
+import hashlib
+import uuid
+from typing import Iterable
+
+from django.core.cache import caches
+from django.db import transaction
+
+from concordia.cdn import purge_surrogate_keys
+from concordia.models import Item
+
+# Public listing pages are cached in the view cache under a key built from the
+# versions of the scopes they depend on: the whole site, and the campaign,
+# project and item a page shows. Changes bump the versions of the scopes they
+# affect, which moves every page depending on them to a new key, so pages are
+# served from the cache until something in their subtree changes rather than
+# for a fixed time. The scopes double as the surrogate keys which pages are
+# tagged with for the CDN, and bumping a scope also purges it from the CDN.
+PAGE_CACHE_ALIAS = "view_cache"
+
+# Pages are still dropped after this long in case a change was made without
+# bumping a version, such as a bulk update in the Django shell.
+PAGE_CACHE_TIMEOUT = 24 * 60 * 60
+
+SITE_SCOPE = "site"
+
+
+def campaign_scope(campaign_slug: str) -> str:
+    """
+    Return the page cache scope for a campaign and everything in it.
+
+    Args:
+        campaign_slug (str): Slug of the campaign.
+
+    Returns:
+        str: The scope name.
+    """
+    return f"campaign:{campaign_slug}"
+
+
+def project_scope(campaign_slug: str, project_slug: str) -> str:
+    """
+    Return the page cache scope for a project and everything in it.
+
+    Args:
+        campaign_slug (str): Slug of the project's campaign.
+        project_slug (str): Slug of the project.
+
+    Returns:
+        str: The scope name.
+    """
+    return f"project:{campaign_slug}/{project_slug}"
+
+
+def item_scope(campaign_slug: str, project_slug: str, item_id: str) -> str:
+    """
+    Return the page cache scope for an item and its assets.
+
+    Args:
+        campaign_slug (str): Slug of the item's campaign.
+        project_slug (str): Slug of the item's project.
+        item_id (str): The item's `item_id`.
+
+    Returns:
+        str: The scope name.
+    """
+    return f"item:{campaign_slug}/{project_slug}/{item_id}"
+
+
+def topic_scope(topic_slug: str) -> str:
+    """
+    Return the page cache scope for a topic page.
+
+    Args:
+        topic_slug (str): Slug of the topic.
+
+    Returns:
+        str: The scope name.
+    """
+    return f"topic:{topic_slug}"
+
+
+def _version_key(scope: str) -> str:
+    return f"page-cache-version:{scope}"
+
+
+def get_scope_versions(scopes: Iterable[str]) -> list[str]:
+    """
+    Return the current version of each page cache scope.
+
+    Scopes without a version, because they have never been used or their
+    version was evicted, are given a new random one.
+
+    Args:
+        scopes (Iterable[str]): Scope names.
+
+    Returns:
+        list[str]: The version of each scope, in the same order.
+    """
+    cache = caches[PAGE_CACHE_ALIAS]
+    keys = [_version_key(scope) for scope in scopes]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            version = uuid.uuid4().hex
+            if not cache.add(key, version, timeout=None):
+                # Another request set the version first
+                version = cache.get(key, version)
+            versions[key] = version
+    return [versions[key] for key in keys]
+
+
+def get_page_cache_key_prefix(scopes: Iterable[str]) -> str:
+    """
+    Return a cache key prefix for a page depending on the given scopes.
+
+    Args:
+        scopes (Iterable[str]): Scope names the page depends on.
+
+    Returns:
+        str: A prefix which changes whenever any of the scopes is bumped.
+    """
+    versions = get_scope_versions([SITE_SCOPE, *scopes])
+    return hashlib.md5(":".join(versions).encode(), usedforsecurity=False).hexdigest()
+
+
+def bump_scope_versions(*scopes: str) -> None:
+    """
+    Invalidate cached pages depending on any of the given scopes.
+
+    The versions are replaced, and the scopes purged from the CDN, once the
+    current transaction commits, so that a request running before then cannot
+    cache a page built from the old data under the new version.
+
+    Args:
+        *scopes (str): Scope names.
+    """
+
+    def bump():
+        caches[PAGE_CACHE_ALIAS].set_many(
+            {_version_key(scope): uuid.uuid4().hex for scope in scopes},
+            timeout=None,
+        )
+
+    transaction.on_commit(bump)
+    purge_surrogate_keys(scopes)
+
+
+def invalidate_page_cache() -> None:
+    """
+    Invalidate every cached public page.
+
+    Used for changes whose effects are not limited to one campaign, such as
+    admin edits to campaigns, projects and topics and bulk publication
+    changes.
+    """
+    bump_scope_versions(SITE_SCOPE)
+
+
+def invalidate_item_pages(item_pk: int) -> None:
+    """
+    Invalidate cached pages for an item and the project and campaign it is in.
+
+    Args:
+        item_pk (int): Primary key of the item.
+    """
+    row = (
+        Item.objects.filter(pk=item_pk)
+        .values_list("item_id", "project__slug", "project__campaign__slug")
+        .first()
+    )
+    if row is None:
+        return
+    item_id, project_slug, campaign_slug = row
+    bump_scope_versions(
+        item_scope(campaign_slug, project_slug, item_id),
+        project_scope(campaign_slug, project_slug),
+        campaign_scope(campaign_slug),
+    )
@@ -0,0 +1,104 @@
+import copy
+from functools import wraps
+from time import monotonic
+from typing import Any, Callable
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from prometheus_client import Counter
+
+# Rows such as the anonymous user are read on nearly every request but almost
+# never change, so they are kept in process memory for SINGLETON_CACHE_TTL
+# seconds. Signal handlers invalidate them when they change in this process;
+# other processes see the change once the TTL expires.
+
+singleton_lookups_total = Counter(
+    "concordia_singleton_lookups_total",
+    "Lookups of process-local cached singleton rows",
+    ["name", "result"],
+)
+
+
+class CachedSingleton:
+    """
+    A value loaded by `loader` and cached in this process for a limited time.
+
+    Callers receive a copy of the cached value so changes they make to it
+    can't leak into other requests.
+    """
+
+    def __init__(self, name: str, loader: Callable[[], Any]):
+        self.name = name
+        self.loader = loader
+        self._value = None
+        self._expires_at = 0.0
+
+    def get(self) -> Any:
+        """
+        Return the cached value, loading it if it is missing or expired.
+
+        Returns:
+            Any: A copy of the value returned by the loader.
+        """
+        if monotonic() < self._expires_at:
+            singleton_lookups_total.labels(self.name, "hit").inc()
+            return copy.deepcopy(self._value)
+
+        singleton_lookups_total.labels(self.name, "miss").inc()
+        value = self.loader()
+        # A row read inside a transaction may never be committed, so only
+        # values read outside one are cached
+        if not connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            self._value = copy.deepcopy(value)
+            self._expires_at = monotonic() + settings.SINGLETON_CACHE_TTL
+        return value
+
+    def invalidate(self) -> None:
+        """
+        Discard the cached value so the next lookup reloads it.
+        """
+        self._value = None
+        self._expires_at = 0.0
+
+
+_registry: dict[str, CachedSingleton] = {}
+
+
+def cached_singleton(name: str) -> Callable[[Callable[[], Any]], Callable[[], Any]]:
+    """
+    Decorate a function which loads a singleton row to cache its result.
+
+    The decorated function gains an `invalidate` attribute, and can also be
+    invalidated by name with `invalidate_singletons`.
+
+    Args:
+        name (str): A unique name for the value, used in metrics.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(loader: Callable[[], Any]) -> Callable[[], Any]:
+        singleton = _registry[name] = CachedSingleton(name, loader)
+
+        @wraps(loader)
+        def get() -> Any:
+            return singleton.get()
+
+        get.invalidate = singleton.invalidate
+        return get
+
+    return decorator
+
+
+def invalidate_singletons(*names: str) -> None:
+    """
+    Discard cached singleton values.
+
+    Args:
+        *names (str): Names of the values to discard. Every value is
+            discarded if no names are given.
+    """
+    for name, singleton in _registry.items():
+        if not names or name in names:
+            singleton.invalidate()
@@ -1,13 +1,16 @@
 import logging
 import re
+import uuid
 from time import time
 from typing import Union
 
+from celery.result import AsyncResult
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.contrib.messages import get_messages
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.db import connection
+from django.db import connection, transaction
 from django.db.transaction import atomic
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404
@@ -17,7 +20,9 @@ from django.views.decorators.cache import cache_control, never_cache
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
 from django_ratelimit.decorators import ratelimit
+from flags.state import flag_enabled
 
+from concordia.celery import app as celery_app
 from concordia.exceptions import RateLimitExceededError
 from concordia.logging import ConcordiaLogger
 from concordia.models import (
@@ -28,10 +33,12 @@ from concordia.models import (
     Transcription,
     UserAssetTagCollection,
 )
+from concordia.signals.handlers import invalidate_asset_tags
 from concordia.signals.signals import (
     reservation_obtained,
     reservation_released,
 )
+from concordia.tasks.ocr import generate_ocr_transcription_task
 from concordia.utils import (
     get_anonymous_user,
     get_or_create_reservation_token,
@@ -378,6 +385,41 @@ def generate_ocr_transcription(
             transcription=superseded,
         )
 
+    if flag_enabled("ASYNC_OCR", request=request):
+        # Tesseract runs on the OCR worker pool rather than in this request.
+        # The task is only queued once the blank transcription created above
+        # has been committed so the worker can always see it.
+        task_id = str(uuid.uuid4())
+        # Lets the status view tell a task still waiting for a worker from
+        # one which was lost, since Celery reports both as pending
+        cache.set(
+            settings.OCR_TASK_CACHE_KEY.format(task_id=task_id),
+            user.pk,
+            settings.OCR_TASK_TIMEOUT,
+        )
+        transaction.on_commit(
+            lambda: generate_ocr_transcription_task.apply_async(
+                args=(asset.pk, user.pk, superseded.pk, language), task_id=task_id
+            )
+        )
+        structured_logger.info(
+            "OCR transcription generation queued.",
+            event_code="ocr_generation_queued",
+            user=user,
+            asset=asset,
+            task_id=task_id,
+        )
+        return JsonResponse(
+            {
+                "ocrTaskId": task_id,
+                "statusUrl": reverse(
+                    "ocr-transcription-status",
+                    kwargs={"asset_pk": asset.pk, "task_id": task_id},
+                ),
+            },
+            status=202,
+        )
+
     transcription_text = asset.get_ocr_transcript(language)
     transcription = Transcription(
         asset=asset,
@@ -397,6 +439,24 @@ def generate_ocr_transcription(
         transcription=transcription,
     )
 
+    return _ocr_transcription_response(transcription)
+
+
+def _ocr_transcription_response(transcription: Transcription) -> JsonResponse:
+    """
+    Build the success response for a newly created OCR transcription.
+
+    Shared by the synchronous OCR view and the status view used when OCR runs
+    on the worker pool, so clients receive the same payload either way.
+
+    Args:
+        transcription (Transcription): The OCR-generated transcription.
+
+    Returns:
+        response (JsonResponse): The 201 response described in
+            `generate_ocr_transcription`.
+    """
+    asset = transcription.asset
     return JsonResponse(
         {
             "id": transcription.pk,
@@ -404,17 +464,94 @@ def generate_ocr_transcription(
             "submissionUrl": reverse("submit-transcription", args=(transcription.pk,)),
             "text": transcription.text,
             "asset": {
-                "id": transcription.asset.id,
-                "status": transcription.asset.transcription_status,
-                "contributors": transcription.asset.get_contributor_count(),
+                "id": asset.id,
+                "status": asset.transcription_status,
+                "contributors": asset.contributor_count,
             },
-            "undo_available": asset.can_rollback()[0],
-            "redo_available": asset.can_rollforward()[0],
+            "undo_available": asset.undo_available,
+            "redo_available": asset.redo_available,
         },
         status=201,
     )
 
 
+@never_cache
+@login_required
+def ocr_transcription_status(
+    request: HttpRequest, *, asset_pk: Union[int, str], task_id: uuid.UUID
+) -> JsonResponse:
+    """
+    Report on an OCR transcription queued by `generate_ocr_transcription`.
+
+    Clients poll this view after receiving a 202 response from
+    `generate_ocr_transcription`. Only the user who requested the OCR can see
+    the resulting transcription.
+
+    Args:
+        request (HttpRequest): The polling request.
+        asset_pk (int or str): ID of the asset OCR was requested for.
+        task_id (UUID): The `ocrTaskId` returned when OCR was queued.
+
+    Celery reports lost, expired and unknown tasks as pending, so a task
+    which hasn't finished within `OCR_TASK_TIMEOUT` seconds of being queued
+    by this user is reported as having timed out.
+
+    Returns:
+        response (JsonResponse): 202 while OCR is still running, the same 201
+            payload as `generate_ocr_transcription` once the transcription has
+            been created, 504 if OCR didn't finish in time, or another error.
+
+    Response Format - Pending:
+        - `status` (str): `"pending"`.
+
+    Response Format - Error:
+        - `error` (str): Description of the failure.
+    """
+    result = AsyncResult(str(task_id), app=celery_app)
+
+    if not result.ready():
+        queued_by = cache.get(settings.OCR_TASK_CACHE_KEY.format(task_id=task_id))
+        if queued_by != request.user.pk:
+            structured_logger.warning(
+                "Queued OCR transcription timed out.",
+                event_code="ocr_generation_timed_out",
+                reason="The OCR task did not finish within OCR_TASK_TIMEOUT",
+                reason_code="task_timed_out",
+                user=request.user,
+                task_id=str(task_id),
+            )
+            return JsonResponse(
+                {"error": "OCR transcription timed out. Please try again."},
+                status=504,
+            )
+        return JsonResponse({"status": "pending"}, status=202)
+
+    if result.failed():
+        structured_logger.warning(
+            "Queued OCR transcription failed.",
+            event_code="ocr_generation_failed",
+            reason="The OCR task raised an exception",
+            reason_code="task_failed",
+            user=request.user,
+            task_id=str(task_id),
+        )
+        return JsonResponse(
+            {"error": "Unable to generate an OCR transcription"}, status=500
+        )
+
+    outcome = result.result
+    if "error" in outcome:
+        return JsonResponse({"error": outcome["error"]}, status=outcome["status"])
+
+    transcription = get_object_or_404(
+        Transcription.objects.select_related("asset"),
+        pk=outcome["transcription_id"],
+        asset_id=asset_pk,
+        user=request.user,
+    )
+    return _ocr_transcription_response(transcription)
+
+
 @require_POST
 @validate_anonymous_user
 @atomic
@@ -513,11 +650,11 @@ def rollback_transcription(
             "asset": {
                 "id": transcription.asset.id,
                 "status": transcription.asset.transcription_status,
-                "contributors": transcription.asset.get_contributor_count(),
+                "contributors": transcription.asset.contributor_count,
             },
             "message": "Successfully rolled back transcription to previous version",
-            "undo_available": transcription.asset.can_rollback()[0],
-            "redo_available": transcription.asset.can_rollforward()[0],
+            "undo_available": transcription.asset.undo_available,
+            "redo_available": transcription.asset.redo_available,
         },
         status=201,
     )
@@ -619,11 +756,11 @@ def rollforward_transcription(
             "asset": {
                 "id": transcription.asset.id,
                 "status": transcription.asset.transcription_status,
-                "contributors": transcription.asset.get_contributor_count(),
+                "contributors": transcription.asset.contributor_count,
             },
             "message": "Successfully restored transcription to next version",
-            "undo_available": transcription.asset.can_rollback()[0],
-            "redo_available": transcription.asset.can_rollforward()[0],
+            "undo_available": transcription.asset.undo_available,
+            "redo_available": transcription.asset.redo_available,
         },
         status=201,
     )
@@ -776,10 +913,10 @@ def save_transcription(
             "asset": {
                 "id": transcription.asset.id,
                 "status": transcription.asset.transcription_status,
-                "contributors": transcription.asset.get_contributor_count(),
+                "contributors": transcription.asset.contributor_count,
             },
-            "undo_available": transcription.asset.can_rollback()[0],
-            "redo_available": transcription.asset.can_rollforward()[0],
+            "undo_available": transcription.asset.undo_available,
+            "redo_available": transcription.asset.redo_available,
         },
         status=201,
     )
@@ -891,7 +1028,7 @@ def submit_transcription(request: HttpRequest, *, pk: Union[int, str]) -> JsonRe
             "asset": {
                 "id": transcription.asset.id,
                 "status": transcription.asset.transcription_status,
-                "contributors": transcription.asset.get_contributor_count(),
+                "contributors": transcription.asset.contributor_count,
             },
             "undo_available": False,
             "redo_available": False,
@@ -1054,7 +1191,7 @@ def review_transcription(request: HttpRequest, *, pk: Union[int, str]) -> JsonRe
             "asset": {
                 "id": transcription.asset.id,
                 "status": transcription.asset.transcription_status,
-                "contributors": transcription.asset.get_contributor_count(),
+                "contributors": transcription.asset.contributor_count,
             },
         },
         status=200,
@@ -1128,38 +1265,56 @@ def submit_tags(request: HttpRequest, *, asset_pk: Union[int, str]) -> JsonRespo
     Tag.objects.bulk_create(new_tags)
 
     # At this point we now have Tag objects for everything in the POSTed
-    # request. We'll add anything which wasn't previously in this user's tag
-    # collection and remove anything which is no longer present.
-
-    all_submitted_tags = list(existing_tags) + new_tags
-    existing_user_tags = user_tags.tags.all()
-
-    for tag in all_submitted_tags:
-        if tag not in existing_user_tags:
-            user_tags.tags.add(tag)
-
-    all_tags_qs = Tag.objects.filter(userassettagcollection__asset__pk=asset_pk)
-
-    for tag in all_tags_qs:
-        if tag not in all_submitted_tags:
-            for collection in asset.userassettagcollection_set.all():
-                collection.tags.remove(tag)
-
-    all_tags = all_tags_qs.order_by("value")
-    final_user_tags = user_tags.tags.order_by("value").values_list("value", flat=True)
-    all_tags = all_tags.values_list("value", flat=True).distinct()
+    # request. The changes to every user's tag collection on this asset are
+    # worked out from its current rows so they can be applied in one insert
+    # and one delete: anything which wasn't previously in this user's
+    # collection is added, and anything no longer present is removed from
+    # every collection.
+
+    submitted_tag_values = {tag.pk: tag.value for tag in existing_tags}
+    submitted_tag_values.update((tag.pk, tag.value) for tag in new_tags)
+
+    TagCollectionTags = UserAssetTagCollection.tags.through
+    current_rows = TagCollectionTags.objects.filter(
+        userassettagcollection__asset=asset
+    ).values_list("pk", "userassettagcollection_id", "tag_id")
+
+    existing_user_tag_ids = set()
+    removed_row_ids = []
+    for row_id, collection_id, tag_id in current_rows:
+        if tag_id not in submitted_tag_values:
+            removed_row_ids.append(row_id)
+        elif collection_id == user_tags.pk:
+            existing_user_tag_ids.add(tag_id)
+
+    TagCollectionTags.objects.bulk_create(
+        [
+            TagCollectionTags(userassettagcollection_id=user_tags.pk, tag_id=tag_id)
+            for tag_id in submitted_tag_values.keys() - existing_user_tag_ids
+        ],
+        ignore_conflicts=True,
+    )
+    if removed_row_ids:
+        TagCollectionTags.objects.filter(pk__in=removed_row_ids).delete()
+
+    # Every remaining tag was submitted and is now in this user's collection,
+    # so both lists are the submitted values. The bulk writes above don't
+    # send m2m_changed, so the cached values are discarded here; they're
+    # rebuilt from the table rather than from this request, which may commit
+    # before or after a concurrent submission.
+    final_user_tags = sorted(set(submitted_tag_values.values()))
+    all_tags = final_user_tags
+    transaction.on_commit(lambda: invalidate_asset_tags([asset.pk]))
 
     structured_logger.info(
         "Tags submitted successfully.",
         event_code="tag_submit_success",
         user=request.user,
         asset=asset,
-        user_tags=[tag.value for tag in user_tags.tags.all()],
+        user_tags=final_user_tags,
     )
 
-    return JsonResponse(
-        {"user_tags": list(final_user_tags), "all_tags": list(all_tags)}
-    )
+    return JsonResponse({"user_tags": final_user_tags, "all_tags": all_tags})
 
 
 @ratelimit(
@@ -1449,7 +1604,7 @@ def obtain_reservation(
     )
     # We'll pass the message to the WebSocket listeners before returning it:
     msg = {"asset_pk": asset_pk, "reservation_token": reservation_token}
-    reservation_obtained.send(sender="reserve_asset", **msg)
+    reservation_obtained.send(sender="reserve_asset", created=True, **msg)
     structured_logger.info(
         "Reservation successfully obtained; signal dispatched.",
         event_code="reservation_obtain_success",
@@ -22,16 +22,15 @@ from concordia.models import (
     Asset,
     AssetTranscriptionReservation,
     Campaign,
-    CardFamily,
     Guide,
     Topic,
     TranscriptionStatus,
     TutorialCard,
-    UserAssetTagCollection,
 )
 from concordia.templatetags.concordia_media_tags import asset_media_url
 from concordia.utils import (
     get_anonymous_user,
+    get_default_card_family,
     get_or_create_reservation_token,
 )
 from concordia.utils.next_asset import (
@@ -273,22 +272,14 @@ class AssetDetailView(AnonymousUserValidationCheckMixin, APIDetailView):
 
         ctx["current_asset_url"] = self.request.build_absolute_uri()
 
-        tag_groups = UserAssetTagCollection.objects.filter(asset__slug=asset.slug)
+        ctx["tags"] = asset.get_tags()
 
-        tags = set()
-
-        for tag_group in tag_groups:
-            for tag in tag_group.tags.all():
-                tags.add(tag.value)
-
-        ctx["tags"] = sorted(tags)
-
-        ctx["registered_contributors"] = asset.get_contributor_count()
+        ctx["registered_contributors"] = asset.contributor_count
 
         if project.campaign.card_family:
             card_family = project.campaign.card_family
         else:
-            card_family = CardFamily.objects.filter(default=True).first()
+            card_family = get_default_card_family()
         if card_family is not None:
             unordered_cards = TutorialCard.objects.filter(tutorial=card_family)
             ordered_cards = unordered_cards.order_by("order")
@@ -300,8 +291,8 @@ class AssetDetailView(AnonymousUserValidationCheckMixin, APIDetailView):
 
         ctx["languages"] = list(settings.LANGUAGE_CODES.items())
 
-        ctx["undo_available"] = asset.can_rollback()[0] if transcription else False
-        ctx["redo_available"] = asset.can_rollforward()[0] if transcription else False
+        ctx["undo_available"] = asset.undo_available
+        ctx["redo_available"] = asset.redo_available
 
         ctx["turnstile_form"] = TurnstileForm(auto_id=False)
 
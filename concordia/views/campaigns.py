@@ -21,15 +21,28 @@ from concordia.models import (
     TranscriptionStatus,
 )
 from concordia.utils.constants import ASSETS_PER_PAGE
+from concordia.utils.page_cache import campaign_scope
 
-from .decorators import default_cache_control, user_cache_control
+from .decorators import default_cache_control, scoped_cache_page, user_cache_control
 from .utils import (
     annotate_children_with_progress_stats,
     calculate_asset_stats,
 )
 
 
+def _campaign_list_scopes(request, **kwargs: Any) -> list[str]:
+    # The JSON version of the list includes each campaign's asset counts
+    slugs = (
+        Campaign.objects.published()
+        .listed()
+        .filter(status=Campaign.Status.ACTIVE)
+        .values_list("slug", flat=True)
+    )
+    return [campaign_scope(slug) for slug in slugs]
+
+
 @method_decorator(default_cache_control, name="dispatch")
+@method_decorator(scoped_cache_page(_campaign_list_scopes), name="dispatch")
 class CampaignListView(APIListView):
     """
     Display a list of active campaigns.
@@ -131,6 +144,7 @@ class CampaignListView(APIListView):
 
 
 @method_decorator(default_cache_control, name="dispatch")
+@method_decorator(scoped_cache_page(lambda request, **kwargs: []), name="dispatch")
 class CompletedCampaignListView(APIListView):
     """
     Display a list of completed and/or retired campaigns.
@@ -266,6 +280,10 @@ class CampaignTopicListView(TemplateView):
 
 
 @method_decorator(default_cache_control, name="dispatch")
+@method_decorator(
+    scoped_cache_page(lambda request, slug, **kwargs: [campaign_scope(slug)]),
+    name="dispatch",
+)
 class CampaignDetailView(APIDetailView):
     """
     Display details for a single campaign.
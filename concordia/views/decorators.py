@@ -1,21 +1,37 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from functools import wraps
 from time import time
 
 from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
-from django.http import HttpRequest, JsonResponse
-from django.views.decorators.cache import cache_control, never_cache
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.utils.cache import patch_cache_control
+from django.views.decorators.cache import cache_page, never_cache
 from django.views.decorators.vary import vary_on_headers
 
+from concordia.cdn import add_surrogate_keys
 from concordia.forms import TurnstileForm
 from concordia.logging import ConcordiaLogger
+from concordia.utils.page_cache import (
+    PAGE_CACHE_ALIAS,
+    PAGE_CACHE_TIMEOUT,
+    SITE_SCOPE,
+    get_page_cache_key_prefix,
+)
 from configuration.utils import configuration_value
 from configuration.validation import validate_rate
 
 structured_logger = ConcordiaLogger.get_logger(__name__)
 
 
+def _patch_public_cache_control(response: HttpResponse) -> None:
+    # Responses already marked private, such as pages `scoped_cache_page`
+    # rendered for a signed-in user, must stay out of shared caches
+    if "private" in response.get("Cache-Control", ""):
+        return
+    patch_cache_control(response, public=True, max_age=settings.DEFAULT_PAGE_TTL)
+
+
 def default_cache_control(view_function: Callable) -> Callable:
     """
     Decorator that applies default cache control headers to public-facing views.
@@ -32,10 +48,11 @@ def default_cache_control(view_function: Callable) -> Callable:
     """
 
     @vary_on_headers("Accept-Encoding")
-    @cache_control(public=True, max_age=settings.DEFAULT_PAGE_TTL)
     @wraps(view_function)
     def inner(*args, **kwargs):
-        return view_function(*args, **kwargs)
+        response = view_function(*args, **kwargs)
+        _patch_public_cache_control(response)
+        return response
 
     return inner
 
@@ -58,14 +75,67 @@ def user_cache_control(view_function: Callable) -> Callable:
     """
 
     @vary_on_headers("Accept-Encoding", "Cookie")
-    @cache_control(public=True, max_age=settings.DEFAULT_PAGE_TTL)
     @wraps(view_function)
     def inner(*args, **kwargs):
-        return view_function(*args, **kwargs)
+        response = view_function(*args, **kwargs)
+        _patch_public_cache_control(response)
+        return response
 
     return inner
 
 
+def scoped_cache_page(
+    get_scopes: Callable[..., Iterable[str]], timeout: int = PAGE_CACHE_TIMEOUT
+) -> Callable:
+    """
+    Decorator that caches a public page until its content changes.
+
+    Works like Django's `cache_page`, storing responses in the view cache,
+    except that the cache key includes the versions of the page cache scopes
+    returned by `get_scopes`. Changes bump those versions (see
+    `concordia.utils.page_cache`), so the page is rebuilt the first time it
+    is requested after something it shows has changed rather than after a
+    fixed time.
+
+    Only requests from anonymous users are served from or stored in the
+    cache, since pages rendered for a signed-in user include their account
+    details. Anonymous responses are tagged with the scopes as surrogate
+    keys, so that bumping a scope also purges the page from the CDN; pages
+    for signed-in users are marked private so the CDN never stores them.
+
+    Args:
+        get_scopes (Callable[..., Iterable[str]]): Called with the request and
+            the view's keyword arguments; returns the scopes the page depends
+            on.
+        timeout (int): Upper bound in seconds on how long a page is cached.
+
+    Returns:
+        Callable: A decorator for view functions.
+    """
+
+    def decorator(view_function: Callable) -> Callable:
+        @wraps(view_function)
+        def inner(request, *args, **kwargs):
+            scopes = list(get_scopes(request, **kwargs))
+            user = getattr(request, "user", None)
+            if user is None or user.is_authenticated:
+                response = view_function(request, *args, **kwargs)
+                patch_cache_control(response, private=True)
+                return response
+
+            key_prefix = get_page_cache_key_prefix(scopes)
+            cached_view = cache_page(
+                timeout, cache=PAGE_CACHE_ALIAS, key_prefix=key_prefix
+            )(view_function)
+            response = cached_view(request, *args, **kwargs)
+            add_surrogate_keys(response, [SITE_SCOPE, *scopes])
+            return response
+
+        return inner
+
+    return decorator
+
+
 def validate_anonymous_user(view: Callable) -> Callable:
     """
     Decorator that applies anonymous user validation for `POST` requests.
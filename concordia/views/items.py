@@ -8,12 +8,21 @@ from django.utils.decorators import method_decorator
 from concordia.api_views import APIListView
 from concordia.models import Campaign, Item, TranscriptionStatus
 from concordia.utils import get_image_urls_from_asset
+from concordia.utils.page_cache import item_scope
 
-from .decorators import default_cache_control, user_cache_control
+from .decorators import default_cache_control, scoped_cache_page, user_cache_control
 from .utils import calculate_asset_stats
 
 
 @method_decorator(default_cache_control, name="dispatch")
+@method_decorator(
+    scoped_cache_page(
+        lambda request, campaign_slug, project_slug, item_id, **kwargs: [
+            item_scope(campaign_slug, project_slug, item_id)
+        ]
+    ),
+    name="dispatch",
+)
 class ItemDetailView(APIListView):
     """
     Display a paginated list of assets for a specific item.
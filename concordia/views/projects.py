@@ -7,12 +7,21 @@ from django.utils.decorators import method_decorator
 
 from concordia.api_views import APIListView
 from concordia.models import Asset, Campaign, Project, TranscriptionStatus
+from concordia.utils.page_cache import project_scope
 
-from .decorators import default_cache_control, user_cache_control
+from .decorators import default_cache_control, scoped_cache_page, user_cache_control
 from .utils import annotate_children_with_progress_stats, calculate_asset_stats
 
 
 @method_decorator(default_cache_control, name="dispatch")
+@method_decorator(
+    scoped_cache_page(
+        lambda request, campaign_slug, slug, **kwargs: [
+            project_scope(campaign_slug, slug)
+        ]
+    ),
+    name="dispatch",
+)
 class ProjectDetailView(APIListView):
     """
     Display a paginated list of items for a single project.
@@ -3,17 +3,27 @@ from urllib.parse import urlencode
 
 from django.db.models import Count, F, FilteredRelation, Q
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
 
 from concordia.api_views import APIDetailView
-from concordia.models import Asset, Topic, TranscriptionStatus
+from concordia.models import Asset, Project, Topic, TranscriptionStatus
+from concordia.utils.page_cache import project_scope, topic_scope
 
-from .decorators import default_cache_control
+from .decorators import default_cache_control, scoped_cache_page
 from .utils import annotate_children_with_progress_stats, calculate_asset_stats
 
 
+def _topic_scopes(request, slug: str, **kwargs: Any) -> list[str]:
+    projects = Project.objects.filter(topics__slug=slug).values_list(
+        "campaign__slug", "slug"
+    )
+    return [topic_scope(slug)] + [
+        project_scope(campaign_slug, project_slug)
+        for campaign_slug, project_slug in projects
+    ]
+
+
 @method_decorator(default_cache_control, name="dispatch")
-@method_decorator(cache_page(60 * 60, cache="view_cache"), name="dispatch")
+@method_decorator(scoped_cache_page(_topic_scopes), name="dispatch")
 class TopicDetailView(APIDetailView):
     """
     Display a topic and its projects with aggregated progress stats.
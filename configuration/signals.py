@@ -2,7 +2,10 @@ from django.db.models.signals import post_save
 from django.dispatch import receiver
 
 from configuration.models import Configuration
-from configuration.utils import cache_configuration_value
+from configuration.utils import (
+    broadcast_configuration_change,
+    cache_configuration_value,
+)
 
 
 @receiver(post_save, sender=Configuration)
@@ -18,6 +21,7 @@ def update_cached_configuration_value(
           `cache_configuration_value`.
         - If parsing raises any exception, skip caching to avoid persisting an
           invalid value.
+        - Broadcast the change so every process discards its local copy.
 
     Signals:
         Connected to `django.db.models.signals.post_save` for
@@ -37,3 +41,4 @@ def update_cached_configuration_value(
         # Do not cache if value is invalid
         return
     cache_configuration_value(instance.key, value)
+    broadcast_configuration_change(instance.key)
@@ -1,13 +1,18 @@
 import json
+from unittest import mock
 
 from django.core.cache import caches
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from configuration.models import Configuration
 from configuration.utils import (
+    CONFIGURATION_INVALIDATION_CHANNEL,
     CONFIGURATION_KEY_PREFIX,
+    _listen_for_invalidations,
+    broadcast_configuration_change,
     cache_configuration_value,
     configuration_value,
+    invalidate_local_configuration_value,
 )
 
 
@@ -78,3 +83,58 @@ class TestCacheConfigurationValue(TestCase):
             self.cache.get(f"{CONFIGURATION_KEY_PREFIX}_fetched-key"),
             True,
         )
+
+
+@override_settings(CONFIGURATION_LOCAL_CACHE_TIMEOUT=30)
+class TestLocalConfigurationCache(TestCase):
+    def setUp(self):
+        self.cache = caches["configuration_cache"]
+        self.cache.clear()
+        invalidate_local_configuration_value()
+        self.config = Configuration.objects.create(
+            key="local-key", value="1", data_type=Configuration.DataType.NUMBER
+        )
+
+    def tearDown(self):
+        invalidate_local_configuration_value()
+
+    def test_value_kept_in_process_until_changed(self):
+        self.assertEqual(configuration_value("local-key"), 1)
+
+        # Reads after the first don't go to the shared cache
+        self.cache.set(f"{CONFIGURATION_KEY_PREFIX}_local-key", 2)
+        self.assertEqual(configuration_value("local-key"), 1)
+
+        self.config.value = "3"
+        self.config.save()
+        self.assertEqual(configuration_value("local-key"), 3)
+
+    @mock.patch("configuration.utils._get_redis_connection")
+    def test_change_is_published(self, get_redis_connection):
+        broadcast_configuration_change("local-key")
+        get_redis_connection.return_value.publish.assert_called_once_with(
+            CONFIGURATION_INVALIDATION_CHANNEL, "local-key"
+        )
+
+    def test_published_change_invalidates_value(self):
+        cache_key = f"{CONFIGURATION_KEY_PREFIX}_local-key"
+
+        def listen():
+            # Subscribing discards every value, so load it again first
+            self.assertEqual(configuration_value("local-key"), 1)
+            self.cache.set(cache_key, 2)
+            yield {"data": b"local-key"}
+            raise StopListening
+
+        connection = mock.MagicMock()
+        pubsub = connection.pubsub.return_value
+        pubsub.listen.side_effect = listen
+        with self.assertRaises(StopListening):
+            _listen_for_invalidations(connection)
+
+        pubsub.subscribe.assert_called_once_with(CONFIGURATION_INVALIDATION_CHANNEL)
+        self.assertEqual(configuration_value("local-key"), 2)
+
+
+class StopListening(BaseException):
+    pass
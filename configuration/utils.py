@@ -1,11 +1,129 @@
+import logging
+import os
+import threading
+import time
 from typing import Any
 
 from django.conf import settings
 from django.core.cache import caches
+from django_redis import get_redis_connection
 
 from configuration.models import Configuration
 
+logger = logging.getLogger(__name__)
+
 CONFIGURATION_KEY_PREFIX = "config"
+CONFIGURATION_INVALIDATION_CHANNEL = "configuration:invalidate"
+
+# Process-local cache in front of ``configuration_cache``: key -> (expiry, value)
+_local_values: dict[str, tuple[float, Any]] = {}
+# Incremented on every invalidation so a read which raced one can tell that
+# the value it fetched may be stale and shouldn't be kept
+_local_generation = 0
+_local_lock = threading.Lock()
+# PID of the process the invalidation listener was started in
+_listener_pid = None
+
+
+def _get_redis_connection():
+    """
+    Return a Redis client for ``configuration_cache``, or ``None`` if that
+    cache isn't backed by Redis.
+    """
+    try:
+        return get_redis_connection("configuration_cache")
+    except NotImplementedError:
+        return None
+
+
+def invalidate_local_configuration_value(key: str | None = None) -> None:
+    """
+    Discard process-local cached configuration values.
+
+    Args:
+        key (str | None): The key to discard. If ``None``, every value is
+            discarded.
+    """
+    global _local_generation
+
+    with _local_lock:
+        _local_generation += 1
+        if key is None:
+            _local_values.clear()
+        else:
+            _local_values.pop(key, None)
+
+
+def broadcast_configuration_change(key: str) -> None:
+    """
+    Tell every process to discard its local copy of a configuration value.
+
+    Behavior:
+        - Discard this process's copy immediately.
+        - Publish ``key`` on ``CONFIGURATION_INVALIDATION_CHANNEL`` so the
+          listener in every other process discards its copy.
+        - If ``configuration_cache`` isn't Redis, or publishing fails, other
+          processes pick up the change when their copy expires after
+          ``settings.CONFIGURATION_LOCAL_CACHE_TIMEOUT``.
+
+    Args:
+        key (str): The configuration key which changed.
+    """
+    invalidate_local_configuration_value(key)
+
+    connection = _get_redis_connection()
+    if connection is None:
+        return
+    try:
+        connection.publish(CONFIGURATION_INVALIDATION_CHANNEL, key)
+    except Exception:
+        logger.exception("Unable to publish configuration change for %s", key)
+
+
+def _listen_for_invalidations(connection) -> None:
+    while True:
+        try:
+            pubsub = connection.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(CONFIGURATION_INVALIDATION_CHANNEL)
+            # Changes published while we weren't subscribed were missed
+            invalidate_local_configuration_value()
+            for message in pubsub.listen():
+                key = message["data"]
+                if isinstance(key, bytes):
+                    key = key.decode()
+                invalidate_local_configuration_value(key)
+        except Exception:
+            logger.exception("Configuration invalidation listener failed")
+            invalidate_local_configuration_value()
+            time.sleep(1)
+
+
+def _ensure_invalidation_listener() -> None:
+    """
+    Start the invalidation listener thread once per process.
+
+    Threads don't survive a fork, so this checks the PID rather than a flag.
+    """
+    global _listener_pid
+
+    pid = os.getpid()
+    if _listener_pid == pid:
+        return
+    with _local_lock:
+        if _listener_pid == pid:
+            return
+        _listener_pid = pid
+        # Values inherited from the parent process were never invalidated here
+        _local_values.clear()
+
+    connection = _get_redis_connection()
+    if connection is not None:
+        threading.Thread(
+            target=_listen_for_invalidations,
+            args=(connection,),
+            name="configuration-invalidation",
+            daemon=True,
+        ).start()
 
 
 def configuration_value(key: str) -> Any:
@@ -13,8 +131,11 @@ def configuration_value(key: str) -> Any:
     Retrieve a configuration value by key with caching and type casting.
 
     Behavior:
-        - Look up the value in the ``configuration_cache`` using a namespaced
-          cache key.
+        - Return the value from the process-local cache if it was loaded
+          less than ``settings.CONFIGURATION_LOCAL_CACHE_TIMEOUT`` seconds ago
+          and hasn't been invalidated since.
+        - Otherwise look up the value in the ``configuration_cache`` using a
+          namespaced cache key.
         - If the value is missing, delegate to
           ``cache_configuration_value(key)`` to fetch, cast, cache, and return
           the value.
@@ -25,6 +146,12 @@ def configuration_value(key: str) -> Any:
         - Values are stored in the cache alias ``configuration_cache``.
         - Cache entries expire according to
           ``settings.CONFIGURATION_CACHE_TIMEOUT``.
+        - Each process also keeps the values it reads. Saving a
+          ``Configuration`` broadcasts the change over Redis pub/sub (see
+          ``broadcast_configuration_change``), so processes normally see it
+          immediately and at worst after
+          ``settings.CONFIGURATION_LOCAL_CACHE_TIMEOUT`` seconds. A timeout of
+          0 disables the process-local cache.
 
     Args:
         key (str): The configuration key to resolve.
@@ -36,6 +163,14 @@ def configuration_value(key: str) -> Any:
         Configuration.DoesNotExist: If the key is not present in the database
             when attempting to populate the cache.
     """
+    local_timeout = settings.CONFIGURATION_LOCAL_CACHE_TIMEOUT
+    if local_timeout:
+        _ensure_invalidation_listener()
+        entry = _local_values.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+    generation = _local_generation
+
     config_cache = caches["configuration_cache"]
     cache_key = f"{CONFIGURATION_KEY_PREFIX}_{key}"
     value = config_cache.get(cache_key)
@@ -43,6 +178,11 @@ def configuration_value(key: str) -> Any:
     if value is None:
         value = cache_configuration_value(key)
 
+    if local_timeout:
+        with _local_lock:
+            if generation == _local_generation:
+                _local_values[key] = (time.monotonic() + local_timeout, value)
+
     return value
 
 
@@ -5,6 +5,14 @@ set -e -u # Exit immediately for unhandled errors or undefined variables
 mkdir -p /app/logs
 touch /app/logs/concordia.log
 
+# Each service keeps its metrics in its own directory under the shared
+# PROMETHEUS_MULTIPROC_ROOT volume; files left by the previous run are removed
+if [ -n "${PROMETHEUS_MULTIPROC_ROOT:-}" ]; then
+    export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_ROOT}/app"
+    rm -rf "${PROMETHEUS_MULTIPROC_DIR}"
+    mkdir -p "${PROMETHEUS_MULTIPROC_DIR}"
+fi
+
 echo "Running makemigrations"
 ./manage.py makemigrations --merge --noinput
 
@@ -2,7 +2,13 @@
 """Exports to tabular (2D) formats
 
 This module contains functions which take (headers, rows) pairs and return
-HttpResponses with either XLSX or CSV downloads
+HttpResponses with either XLSX, CSV or Parquet downloads
+
+``export_to_excel_response`` builds the workbook with xlsxwriter and returns
+it in a single response. ``export_to_streaming_excel_response`` writes a
+minimal single-worksheet workbook itself so the zip container can be streamed
+as it is produced, which is what the admin export action uses for large
+querysets.
 
 The ``export_to_FORMAT_response`` functions accept a ``filename``, and
 ``headers`` and ``rows``. This allows full control over the data using
@@ -16,6 +22,12 @@ intentionally does not attempt to handle foreign-key fields to avoid
 performance issues. If you need to include such data, prepare it in advance
 using whatever optimizations are possible and pass the data in directly.
 
+Parquet exports are typed. Callers exporting a QuerySet should pass the
+schema built by ``get_arrow_schema_for_queryset`` so column types come from
+the model fields rather than being inferred from the first chunk of data.
+Parquet is written in bounded memory: rows are consumed in chunks which
+become row groups and are streamed to the client as they are produced.
+
 If your Django settings module sets ``TABULAR_RESPONSE_DEBUG`` to ``True``
 the data will be dumped as an HTML table and will not be delivered as a
 download.
@@ -26,19 +38,178 @@ https://github.com/LibraryOfCongress/django-tabular-export/blob/master/tabular_e
 
 import csv
 import datetime
+import json
+import math
+import re
+import zipfile
+from decimal import Decimal
 from functools import wraps
 from itertools import chain
-from typing import Any, Callable, Iterable, Mapping, Sequence
+from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence
 from urllib.parse import quote
+from xml.sax.saxutils import escape
 
+import pyarrow
+import pyarrow.parquet
 import xlsxwriter
 from django.conf import settings
-from django.db.models import QuerySet
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Field, QuerySet
+from django.db.models.constants import LOOKUP_SEP
 from django.http import HttpResponse, StreamingHttpResponse
 from django.utils.encoding import force_str
 
 ResponseType = HttpResponse | StreamingHttpResponse
 
+# Number of rows fetched per server-side cursor round trip and written per
+# Parquet row group. This bounds how many rows are held in memory at once
+# while streaming an export.
+DEFAULT_CHUNK_SIZE = 10_000
+
+ARROW_TYPES_BY_INTERNAL_TYPE = {
+    "AutoField": pyarrow.int64(),
+    "BigAutoField": pyarrow.int64(),
+    "SmallAutoField": pyarrow.int64(),
+    "IntegerField": pyarrow.int64(),
+    "BigIntegerField": pyarrow.int64(),
+    "SmallIntegerField": pyarrow.int64(),
+    "PositiveIntegerField": pyarrow.int64(),
+    "PositiveBigIntegerField": pyarrow.int64(),
+    "PositiveSmallIntegerField": pyarrow.int64(),
+    "BooleanField": pyarrow.bool_(),
+    "FloatField": pyarrow.float64(),
+    "DateTimeField": pyarrow.timestamp("us", tz="UTC"),
+    "DateField": pyarrow.date32(),
+    "TimeField": pyarrow.time64("us"),
+    "DurationField": pyarrow.duration("us"),
+}
+
+# Excel refuses to open cells longer than this
+MAX_CELL_LENGTH = 32767
+
+# Excel refuses to open worksheets with more rows than this
+MAX_SHEET_ROWS = 1048576
+
+# Style index (into cellXfs in STYLES_XML) used for date and datetime cells
+DATE_STYLE_INDEX = 1
+
+EXCEL_EPOCH = datetime.datetime(1899, 12, 30)
+
+SPREADSHEETML_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+RELATIONSHIPS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+OFFICE_DOCUMENT_NS = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+)
+
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+WORKSHEET_CONTENT_TYPE = (
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"
+)
+
+ROOT_RELS_XML = (
+    XML_DECLARATION + f'<Relationships xmlns="{RELATIONSHIPS_NS}">'
+    f'<Relationship Id="rId1" Type="{OFFICE_DOCUMENT_NS}/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+
+STYLES_XML = (
+    XML_DECLARATION + f'<styleSheet xmlns="{SPREADSHEETML_NS}">'
+    '<numFmts count="1"><numFmt numFmtId="164" formatCode="yyyy-mm-dd"/></numFmts>'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border>'
+    "</borders>"
+    '<cellStyleXfs count="1">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0"/>'
+    "</cellStyleXfs>"
+    '<cellXfs count="2">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" '
+    'applyNumberFormat="1"/>'
+    "</cellXfs>"
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/>'
+    "</cellStyles>"
+    "</styleSheet>"
+)
+
+WORKSHEET_HEADER_XML = (
+    XML_DECLARATION + f'<worksheet xmlns="{SPREADSHEETML_NS}"><sheetData>'
+)
+
+WORKSHEET_FOOTER_XML = "</sheetData></worksheet>"
+
+
+def content_types_xml(sheet_count: int) -> str:
+    """
+    Return ``[Content_Types].xml`` for a workbook with ``sheet_count`` sheets.
+    """
+
+    sheets = "".join(
+        f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+        f'ContentType="{WORKSHEET_CONTENT_TYPE}"/>'
+        for i in range(1, sheet_count + 1)
+    )
+    return (
+        XML_DECLARATION
+        + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/'
+        'content-types">'
+        '<Default Extension="rels" '
+        'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        + sheets
+        + '<Override PartName="/xl/styles.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        "</Types>"
+    )
+
+
+def workbook_xml(sheet_count: int) -> str:
+    """
+    Return ``xl/workbook.xml`` for a workbook with ``sheet_count`` sheets.
+    """
+
+    sheets = "".join(
+        f'<sheet name="Sheet{i}" sheetId="{i}" r:id="rId{i}"/>'
+        for i in range(1, sheet_count + 1)
+    )
+    return (
+        XML_DECLARATION + f'<workbook xmlns="{SPREADSHEETML_NS}" '
+        f'xmlns:r="{OFFICE_DOCUMENT_NS}">'
+        f"<sheets>{sheets}</sheets>"
+        "</workbook>"
+    )
+
+
+def workbook_rels_xml(sheet_count: int) -> str:
+    """
+    Return ``xl/_rels/workbook.xml.rels`` for a workbook with ``sheet_count``
+    sheets.
+    """
+
+    sheets = "".join(
+        f'<Relationship Id="rId{i}" Type="{OFFICE_DOCUMENT_NS}/worksheet" '
+        f'Target="worksheets/sheet{i}.xml"/>'
+        for i in range(1, sheet_count + 1)
+    )
+    return (
+        XML_DECLARATION
+        + f'<Relationships xmlns="{RELATIONSHIPS_NS}">'
+        + sheets
+        + f'<Relationship Id="rId{sheet_count + 1}" '
+        f'Type="{OFFICE_DOCUMENT_NS}/styles" Target="styles.xml"/>'
+        "</Relationships>"
+    )
+
+
+# Control characters are not allowed in XML 1.0. Excel stores them using its
+# own _xHHHH_ escape, which we reproduce so the values survive a round trip.
+ILLEGAL_XML_CHARACTERS_RE = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
 
 def get_field_names_from_queryset(qs: QuerySet[Any]) -> list[str]:
     """
@@ -114,6 +285,88 @@ def flatten_queryset(
     return headers, qs.values_list(*field_names)
 
 
+def get_output_field(qs: QuerySet[Any], field_name: str) -> Field | None:
+    """
+    Resolve the model field or annotation output field behind a column name.
+
+    Related lookups such as ``item__project__title`` are followed across
+    relations. Foreign keys resolve to the field they point at so that
+    ``item_id``-style columns get the type of the target primary key.
+
+    Args:
+        qs: QuerySet the column is selected from.
+        field_name: Name as passed to ``values_list()``.
+
+    Returns:
+        The resolved field, or ``None`` if the name cannot be resolved (for
+        example, ``extra()`` selects).
+    """
+
+    annotations = getattr(qs.query, "annotations", {})
+    if field_name in annotations:
+        return annotations[field_name].output_field
+
+    model = qs.model
+    parts = field_name.split(LOOKUP_SEP)
+    try:
+        for part in parts[:-1]:
+            model = model._meta.get_field(part).related_model
+        field = model._meta.get_field(parts[-1])
+    except (AttributeError, FieldDoesNotExist):
+        return None
+
+    if field.is_relation and getattr(field, "target_field", None) is not None:
+        field = field.target_field
+    return field
+
+
+def get_arrow_type_for_field(field: Field | None) -> pyarrow.DataType:
+    """
+    Map a Django model field to the Arrow type used for columnar exports.
+
+    Fields without a direct Arrow equivalent (text, JSON, UUIDs, etc.) are
+    exported as UTF-8 strings. Decimals keep their declared precision.
+
+    Args:
+        field: Field to map, or ``None`` for columns without a known field.
+
+    Returns:
+        The Arrow data type for the column.
+    """
+
+    if field is None:
+        return pyarrow.string()
+
+    internal_type = field.get_internal_type()
+    if internal_type == "DecimalField":
+        return pyarrow.decimal128(field.max_digits, field.decimal_places)
+    return ARROW_TYPES_BY_INTERNAL_TYPE.get(internal_type, pyarrow.string())
+
+
+def get_arrow_schema_for_queryset(
+    qs: QuerySet[Any],
+    field_names: Iterable[str],
+    headers: Sequence[str],
+) -> pyarrow.Schema:
+    """
+    Build a typed Arrow schema for a flattened queryset.
+
+    Args:
+        qs: QuerySet the rows are selected from.
+        field_names: Field names passed to ``flatten_queryset``, in order.
+        headers: Column labels returned by ``flatten_queryset``; these become
+            the Arrow column names.
+
+    Returns:
+        Schema with one nullable column per field.
+    """
+
+    return pyarrow.schema(
+        pyarrow.field(header, get_arrow_type_for_field(get_output_field(qs, name)))
+        for name, header in zip(field_names, headers, strict=True)
+    )
+
+
 def convert_value_to_unicode(v: Any) -> str:
     """
     Convert a value to a display-safe string for tabular export.
@@ -203,6 +456,7 @@ def export_to_debug_html_response(
     filename: str,
     headers: Iterable[Any],
     rows: Iterable[Sequence[Any]],
+    **kwargs: Any,
 ) -> StreamingHttpResponse:
     """
     Build an HTML table response for inspection of tabular export data.
@@ -215,6 +469,8 @@ def export_to_debug_html_response(
         filename: Suggested filename for the export (kept for API parity).
         headers: Iterable of header labels.
         rows: Iterable of row sequences.
+        **kwargs: Format-specific options of the wrapped export function
+            (for example an Arrow ``schema``); ignored.
 
     Returns:
         StreamingHttpResponse streaming the HTML document.
@@ -274,9 +530,9 @@ def export_to_excel_response(
     # See http://technet.microsoft.com/en-us/library/ee309278%28office.12%29.aspx
     content_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
 
-    # This cannot be a StreamingHttpResponse because XLSX files are .zip format and
-    # the Python ZipFile library doesn't offer a generator form (which would also
-    # not be called per-row but per-chunk)
+    # This is not a StreamingHttpResponse because xlsxwriter only assembles the
+    # .zip container when the workbook is closed. See
+    # export_to_streaming_excel_response for the streaming equivalent.
 
     resp = HttpResponse(content_type=content_type)
 
@@ -351,7 +607,7 @@ def export_to_csv_response(
 
     # This works because csv.writer.writerow calls the underlying
     # file-like .write method *and* returns the result. We cannot
-    # use the same approach for Excel because xlsxwriter doesn't
+    # use the same approach for xlsxwriter because it doesn't
     # have a way to emit chunks from ZipFile and StreamingHttpResponse
     # does not offer a file-like handle.
 
@@ -361,6 +617,402 @@ def export_to_csv_response(
     )
 
 
+class ByteChunkSink(object):
+    """
+    Write-only file-like object which buffers bytes until they are drained.
+
+    The Parquet writer and ``zipfile`` (for unseekable output) only append,
+    so handing them this object and draining it periodically lets the encoded
+    file be yielded to a ``StreamingHttpResponse`` chunk by chunk.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iterate_row_chunks(
+    rows: Iterable[Sequence[Any]], chunk_size: int
+) -> Iterator[list[Sequence[Any]]]:
+    """
+    Yield lists of at most ``chunk_size`` rows.
+
+    QuerySets are consumed with ``iterator()`` so PostgreSQL uses a server-side
+    cursor and the full result set is never cached in memory.
+
+    Args:
+        rows: Iterable of row sequences or a ``values_list()`` QuerySet.
+        chunk_size: Maximum number of rows per chunk.
+
+    Yields:
+        Lists of row sequences.
+    """
+
+    if isinstance(rows, QuerySet):
+        rows = rows.iterator(chunk_size=chunk_size)
+
+    chunk: list[Sequence[Any]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def convert_value_for_arrow(v: Any, arrow_type: pyarrow.DataType) -> Any:
+    """
+    Convert a Python value so Arrow can store it in a column of ``arrow_type``.
+
+    ``None`` is preserved as a null. Values for string columns are coerced
+    with ``force_str``, except dictionaries and lists (``JSONField`` values)
+    which are serialized as JSON. Other values are passed through unchanged.
+
+    Args:
+        v: Value to convert.
+        arrow_type: Type of the destination column.
+
+    Returns:
+        Value suitable for ``pyarrow.array``.
+    """
+
+    if v is None:
+        return None
+    elif pyarrow.types.is_string(arrow_type):
+        if isinstance(v, (dict, list)):
+            return json.dumps(v)
+        return force_str(v)
+    else:
+        return v
+
+
+def infer_arrow_schema(
+    headers: Sequence[Any], chunk: Sequence[Sequence[Any]]
+) -> pyarrow.Schema:
+    """
+    Infer an Arrow schema from the first chunk of rows.
+
+    Columns which are entirely null or which Arrow cannot infer a type for
+    are exported as strings.
+
+    Args:
+        headers: Column labels.
+        chunk: First chunk of row sequences.
+
+    Returns:
+        Inferred schema.
+    """
+
+    fields = []
+    for index, header in enumerate(headers):
+        try:
+            arrow_type = pyarrow.array([row[index] for row in chunk]).type
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+            arrow_type = pyarrow.string()
+        if pyarrow.types.is_null(arrow_type):
+            arrow_type = pyarrow.string()
+        fields.append(pyarrow.field(force_str(header), arrow_type))
+    return pyarrow.schema(fields)
+
+
+def iterate_record_batches(
+    headers: Iterable[Any],
+    rows: Iterable[Sequence[Any]],
+    schema: pyarrow.Schema | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> tuple[pyarrow.Schema, Iterator[pyarrow.RecordBatch]]:
+    """
+    Convert rows into Arrow record batches of at most ``chunk_size`` rows.
+
+    Args:
+        headers: Column labels, used when ``schema`` must be inferred.
+        rows: Iterable of row sequences or a ``values_list()`` QuerySet.
+        schema: Optional schema for the output. When omitted it is inferred
+            from the first chunk with ``infer_arrow_schema``.
+        chunk_size: Maximum number of rows per record batch.
+
+    Returns:
+        A 2-tuple of the output schema and an iterator of record batches.
+    """
+
+    headers = list(headers)
+    chunks = iterate_row_chunks(rows, chunk_size)
+    first_chunk = next(chunks, [])
+
+    if schema is None:
+        schema = infer_arrow_schema(headers, first_chunk)
+
+    def batch_generator() -> Iterator[pyarrow.RecordBatch]:
+        for chunk in chain((first_chunk,), chunks):
+            if not chunk:
+                continue
+            yield pyarrow.record_batch(
+                [
+                    pyarrow.array(
+                        [convert_value_for_arrow(row[i], field.type) for row in chunk],
+                        type=field.type,
+                    )
+                    for i, field in enumerate(schema)
+                ],
+                schema=schema,
+            )
+
+    return schema, batch_generator()
+
+
+def escape_cell_text(value: str) -> str:
+    """
+    Escape a string for use as inline cell text.
+
+    Args:
+        value: Text to escape.
+
+    Returns:
+        XML-safe text, truncated to Excel's maximum cell length.
+    """
+
+    value = ILLEGAL_XML_CHARACTERS_RE.sub(
+        lambda match: "_x%04X_" % ord(match.group()), value[:MAX_CELL_LENGTH]
+    )
+    return escape(value)
+
+
+def to_excel_serial(value: datetime.date) -> float:
+    """
+    Convert a date or datetime to an Excel serial date number.
+
+    Timezone information is discarded, matching ``export_to_excel_response``.
+
+    Args:
+        value: Date or datetime to convert.
+
+    Returns:
+        Number of days since the Excel epoch, with the time as a fraction.
+    """
+
+    if not isinstance(value, datetime.datetime):
+        value = datetime.datetime.combine(value, datetime.time())
+    delta = value.replace(tzinfo=None) - EXCEL_EPOCH
+    return delta.days + delta.seconds / 86400 + delta.microseconds / 86400e6
+
+
+def render_cell(value: Any) -> str:
+    """
+    Render a single ``<c>`` element for a worksheet row.
+
+    Numbers and booleans keep their types, dates use the ``yyyy-mm-dd`` style
+    and everything else is written as an inline string.
+
+    Args:
+        value: Cell value.
+
+    Returns:
+        XML for the cell.
+    """
+
+    if value is None:
+        return "<c/>"
+    elif isinstance(value, bool):
+        return '<c t="b"><v>%d</v></c>' % value
+    elif isinstance(value, (int, float, Decimal)) and math.isfinite(value):
+        return "<c><v>%s</v></c>" % value
+    elif isinstance(value, datetime.date):
+        return '<c s="%d"><v>%r</v></c>' % (DATE_STYLE_INDEX, to_excel_serial(value))
+    else:
+        return '<c t="inlineStr"><is><t xml:space="preserve">%s</t></is></c>' % (
+            escape_cell_text(force_str(value))
+        )
+
+
+def render_row(row_number: int, row: Iterable[Any]) -> str:
+    """
+    Render a ``<row>`` element.
+
+    Args:
+        row_number: 1-based worksheet row number.
+        row: Cell values for the row.
+
+    Returns:
+        XML for the row.
+    """
+
+    return '<row r="%d">%s</row>' % (row_number, "".join(map(render_cell, row)))
+
+
+def generate_xlsx(
+    headers: Iterable[Any],
+    rows: Iterable[Sequence[Any]],
+    max_sheet_rows: int = MAX_SHEET_ROWS,
+) -> Iterator[bytes]:
+    """
+    Yield the bytes of an XLSX workbook containing ``headers`` and ``rows``.
+
+    The worksheet XML is deflated row by row. ``ByteChunkSink`` has no
+    ``seek`` method so ``zipfile`` uses data descriptors rather than
+    rewriting local file headers, which keeps the output strictly
+    sequential. Only compressed output is held in memory between yields;
+    rows are read from ``rows`` lazily.
+
+    Excel will not open a worksheet with more than ``MAX_SHEET_ROWS`` rows,
+    so once a worksheet is full the remaining rows continue on a new one,
+    each starting with the headers. The parts listing the worksheets are
+    written after them, once the number of worksheets is known.
+
+    Strings are stored inline (``t="inlineStr"``) rather than in a shared
+    string table, which would require every string to be known before the
+    worksheet is written.
+
+    Args:
+        headers: Header labels for the first row of each worksheet.
+        rows: Iterable of row sequences.
+        max_sheet_rows: Maximum number of rows, including the headers, in
+            each worksheet.
+
+    Yields:
+        Consecutive chunks of the XLSX file.
+    """
+
+    headers = list(headers)
+    rows = iter(rows)
+    sink = ByteChunkSink()
+
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("_rels/.rels", ROOT_RELS_XML)
+        zf.writestr("xl/styles.xml", STYLES_XML)
+        yield sink.drain()
+
+        sheet_count = 0
+        row = next(rows, None)
+        while sheet_count == 0 or row is not None:
+            sheet_count += 1
+            with zf.open(
+                "xl/worksheets/sheet%d.xml" % sheet_count, "w", force_zip64=True
+            ) as sheet:
+                sheet.write(WORKSHEET_HEADER_XML.encode("utf-8"))
+                sheet.write(render_row(1, headers).encode("utf-8"))
+
+                row_number = 2
+                while row is not None and row_number <= max_sheet_rows:
+                    sheet.write(render_row(row_number, row).encode("utf-8"))
+                    # The compressor buffers internally, so most rows produce
+                    # no output and there is nothing to yield yet:
+                    data = sink.drain()
+                    if data:
+                        yield data
+                    row_number += 1
+                    row = next(rows, None)
+
+                sheet.write(WORKSHEET_FOOTER_XML.encode("utf-8"))
+
+        zf.writestr("[Content_Types].xml", content_types_xml(sheet_count))
+        zf.writestr("xl/workbook.xml", workbook_xml(sheet_count))
+        zf.writestr("xl/_rels/workbook.xml.rels", workbook_rels_xml(sheet_count))
+
+    yield sink.drain()
+
+
+@return_debug_reponse
+@set_content_disposition
+def export_to_streaming_excel_response(
+    filename: str,
+    headers: Iterable[Any],
+    rows: Iterable[Sequence[Any]],
+) -> StreamingHttpResponse:
+    """
+    Return an XLSX ``StreamingHttpResponse`` for the given headers and rows.
+
+    Unlike ``export_to_excel_response`` the workbook is never held in memory
+    or on disk: the zip container is produced incrementally by
+    ``generate_xlsx`` and streamed as it is compressed. Dates use the
+    ``yyyy-mm-dd`` format, numbers and booleans keep their types and all other
+    values are written as strings.
+
+    Args:
+        filename: Download filename used in the ``Content-Disposition``
+            header.
+        headers: Iterable of header labels for the first row.
+        rows: Iterable of row sequences or a ``values_list()`` QuerySet.
+
+    Returns:
+        StreamingHttpResponse streaming the XLSX file.
+    """
+
+    if isinstance(rows, QuerySet):
+        rows = rows.iterator(chunk_size=DEFAULT_CHUNK_SIZE)
+
+    return StreamingHttpResponse(
+        generate_xlsx(headers, rows),
+        content_type=(
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        ),
+    )
+
+
+@return_debug_reponse
+@set_content_disposition
+def export_to_parquet_response(
+    filename: str,
+    headers: Iterable[Any],
+    rows: Iterable[Sequence[Any]],
+    schema: pyarrow.Schema | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> StreamingHttpResponse:
+    """
+    Return a zstd-compressed Parquet ``StreamingHttpResponse``.
+
+    Each chunk of ``chunk_size`` rows becomes one Parquet row group which is
+    encoded and streamed as soon as it is complete; the file footer follows
+    the last row group.
+
+    Args:
+        filename: Download filename used in the ``Content-Disposition``
+            header.
+        headers: Iterable of header labels used as column names.
+        rows: Iterable of row sequences or a ``values_list()`` QuerySet.
+        schema: Optional typed schema, usually from
+            ``get_arrow_schema_for_queryset``.
+        chunk_size: Number of rows per row group.
+
+    Returns:
+        StreamingHttpResponse streaming the Parquet file.
+    """
+
+    schema, batches = iterate_record_batches(headers, rows, schema, chunk_size)
+
+    def output_generator() -> Iterator[bytes]:
+        sink = ByteChunkSink()
+        with pyarrow.parquet.ParquetWriter(sink, schema, compression="zstd") as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+                yield sink.drain()
+        yield sink.drain()
+
+    return StreamingHttpResponse(
+        output_generator(), content_type="application/vnd.apache.parquet"
+    )
+
+
 def force_utf8_encoding(
     f: Callable[[], Iterable[Sequence[Any]]],
 ) -> Callable[[], Iterable[Sequence[bytes]]]:
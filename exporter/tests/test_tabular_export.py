@@ -1,6 +1,11 @@
 import datetime
+import io
+from decimal import Decimal
 from unittest.mock import Mock
 
+import openpyxl
+import pyarrow
+import pyarrow.parquet
 from django.db import models
 from django.http import HttpResponse, StreamingHttpResponse
 from django.test import TestCase, override_settings
@@ -8,6 +13,7 @@ from django.test import TestCase, override_settings
 from exporter.tabular_export.admin import (
     export_to_csv_action,
     export_to_excel_action,
+    export_to_parquet_action,
 )
 from exporter.tabular_export.core import (
     Echo,
@@ -15,10 +21,17 @@ from exporter.tabular_export.core import (
     export_to_csv_response,
     export_to_debug_html_response,
     export_to_excel_response,
+    export_to_parquet_response,
+    export_to_streaming_excel_response,
     flatten_queryset,
     force_utf8_encoding,
+    generate_xlsx,
+    get_arrow_schema_for_queryset,
     get_field_names_from_queryset,
+    iterate_row_chunks,
+    render_cell,
     set_content_disposition,
+    to_excel_serial,
 )
 
 
@@ -172,6 +185,134 @@ class CoreTests(TestCase):
         content = b"".join(resp.streaming_content)
         self.assertIn(b"<table", content)
 
+    @override_settings(TABULAR_RESPONSE_DEBUG=False)
+    def test_export_to_streaming_excel_response(self):
+        headers = ["h1", "h2", "h3", "h4"]
+        rows = [
+            ["x", datetime.date(2022, 1, 1), 12, True],
+            ["a & <b>\x01", datetime.datetime(2022, 1, 1, 12, 0), 1.5, None],
+            [None, None, Decimal("2.25"), False],
+        ]
+        resp = export_to_streaming_excel_response("file.xlsx", headers, rows)
+        self.assertIsInstance(resp, StreamingHttpResponse)
+        self.assertEqual(
+            resp["Content-Type"],
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
+        self.assertEqual(
+            "attachment; filename*=UTF-8''file.xlsx", resp["Content-Disposition"]
+        )
+
+        workbook = openpyxl.load_workbook(io.BytesIO(b"".join(resp.streaming_content)))
+        values = list(workbook.active.iter_rows(values_only=True))
+        self.assertEqual(
+            values,
+            [
+                ("h1", "h2", "h3", "h4"),
+                ("x", datetime.datetime(2022, 1, 1), 12, True),
+                ("a & <b>_x0001_", datetime.datetime(2022, 1, 1, 12, 0), 1.5, None),
+                (None, None, 2.25, False),
+            ],
+        )
+        self.assertEqual(workbook.active["B2"].number_format, "yyyy-mm-dd")
+
+    @override_settings(TABULAR_RESPONSE_DEBUG=False)
+    def test_export_to_streaming_excel_response_is_incremental(self):
+        rows = ([i, "row %d" % i] for i in range(20000))
+        resp = export_to_streaming_excel_response("big.xlsx", ["n", "s"], rows)
+        chunks = list(resp.streaming_content)
+        self.assertGreater(len(chunks), 2)
+
+        workbook = openpyxl.load_workbook(io.BytesIO(b"".join(chunks)), read_only=True)
+        self.assertEqual(sum(1 for _ in workbook.active.iter_rows()), 20001)
+
+    def test_generate_xlsx_splits_full_worksheets(self):
+        rows = ([i] for i in range(5))
+        content = b"".join(generate_xlsx(["n"], rows, max_sheet_rows=3))
+
+        workbook = openpyxl.load_workbook(io.BytesIO(content))
+        self.assertEqual(workbook.sheetnames, ["Sheet1", "Sheet2", "Sheet3"])
+        self.assertEqual(
+            [list(sheet.iter_rows(values_only=True)) for sheet in workbook],
+            [
+                [("n",), (0,), (1,)],
+                [("n",), (2,), (3,)],
+                [("n",), (4,)],
+            ],
+        )
+
+        # A workbook always has a worksheet, even without any rows
+        workbook = openpyxl.load_workbook(
+            io.BytesIO(b"".join(generate_xlsx(["n"], [], max_sheet_rows=3)))
+        )
+        self.assertEqual(list(workbook.active.iter_rows(values_only=True)), [("n",)])
+
+    def test_render_cell(self):
+        self.assertEqual(render_cell(None), "<c/>")
+        self.assertEqual(render_cell(float("nan")), render_cell("nan"))
+        self.assertIn("x" * 32767 + "</t>", render_cell("x" * 40000))
+
+    def test_to_excel_serial(self):
+        self.assertEqual(to_excel_serial(datetime.date(1900, 1, 1)), 2)
+        self.assertEqual(to_excel_serial(datetime.datetime(2022, 1, 1, 12, 0)), 44562.5)
+
+    @override_settings(TABULAR_RESPONSE_DEBUG=False)
+    def test_export_to_parquet_response(self):
+        headers = ["h1", "h2"]
+        rows = [[i, datetime.date(2022, 1, 1)] for i in range(25)]
+        resp = export_to_parquet_response("file.parquet", headers, rows, chunk_size=10)
+        self.assertIsInstance(resp, StreamingHttpResponse)
+        self.assertEqual(resp["Content-Type"], "application/vnd.apache.parquet")
+        self.assertEqual(
+            "attachment; filename*=UTF-8''file.parquet", resp["Content-Disposition"]
+        )
+
+        parquet_file = pyarrow.parquet.ParquetFile(
+            io.BytesIO(b"".join(resp.streaming_content))
+        )
+        self.assertEqual(parquet_file.num_row_groups, 3)
+        self.assertEqual(parquet_file.schema_arrow.field("h1").type, pyarrow.int64())
+        self.assertEqual(parquet_file.schema_arrow.field("h2").type, pyarrow.date32())
+        table = parquet_file.read()
+        self.assertEqual(table.column("h1").to_pylist(), list(range(25)))
+
+    @override_settings(TABULAR_RESPONSE_DEBUG=False)
+    def test_export_to_parquet_response_with_schema(self):
+        schema = pyarrow.schema([("h1", pyarrow.string()), ("h2", pyarrow.string())])
+        rows = [[None, {"key": "value"}], [1, ["a"]]]
+        resp = export_to_parquet_response("file.parquet", ["h1", "h2"], rows, schema)
+        table = pyarrow.parquet.read_table(io.BytesIO(b"".join(resp.streaming_content)))
+        self.assertEqual(table.schema, schema)
+        self.assertEqual(table.column("h1").to_pylist(), [None, "1"])
+        self.assertEqual(table.column("h2").to_pylist(), ['{"key": "value"}', '["a"]'])
+
+    @override_settings(TABULAR_RESPONSE_DEBUG=False)
+    def test_export_to_parquet_response_empty(self):
+        resp = export_to_parquet_response("file.parquet", ["h1"], [])
+        table = pyarrow.parquet.read_table(io.BytesIO(b"".join(resp.streaming_content)))
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(table.schema.field("h1").type, pyarrow.string())
+
+    @override_settings(TABULAR_RESPONSE_DEBUG=True)
+    def test_export_to_parquet_response_debug(self):
+        resp = export_to_parquet_response("debug.parquet", ["h1"], [["x"]])
+        content = b"".join(resp.streaming_content)
+        self.assertIn(b"<table", content)
+        self.assertNotIn("Content-Disposition", resp)
+
+    def test_iterate_row_chunks(self):
+        chunks = list(iterate_row_chunks(([i] for i in range(5)), 2))
+        self.assertEqual(chunks, [[[0], [1]], [[2], [3]], [[4]]])
+
+    def test_get_arrow_schema_for_queryset(self):
+        qs = DummyQuerySet([], ["name", "created"])
+        schema = get_arrow_schema_for_queryset(
+            qs, ["name", "created", "extra"], ["Name", "Created", "extra"]
+        )
+        self.assertEqual(schema.field("Name").type, pyarrow.string())
+        self.assertEqual(schema.field("Created").type, pyarrow.date32())
+        self.assertEqual(schema.field("extra").type, pyarrow.string())
+
 
 class AdminTests(TestCase):
     def setUp(self):
@@ -185,7 +326,7 @@ class AdminTests(TestCase):
 
     def test_export_to_excel_action_default_filename(self):
         response = export_to_excel_action(self.modeladmin, self.request, self.queryset)
-        self.assertIsInstance(response, HttpResponse)
+        self.assertIsInstance(response, StreamingHttpResponse)
         self.assertIn(
             "application/vnd.openxmlformats-officedocument", response["Content-Type"]
         )
@@ -203,7 +344,7 @@ class AdminTests(TestCase):
             field_names=["name"],
             extra_verbose_names={"name": "Custom Name"},
         )
-        self.assertIsInstance(response, HttpResponse)
+        self.assertIsInstance(response, StreamingHttpResponse)
         self.assertIn(
             "application/vnd.openxmlformats-officedocument", response["Content-Type"]
         )
@@ -230,3 +371,29 @@ class AdminTests(TestCase):
         self.assertIsInstance(response, StreamingHttpResponse)
         content = b"".join(response.streaming_content)
         self.assertIn(b"val1", content)
+
+    def test_export_to_parquet_action_with_custom_fields(self):
+        queryset = DummyQuerySet(
+            data=[("val1", datetime.date(2020, 1, 1)), ("val3", None)],
+            field_names=["name", "created"],
+        )
+        response = export_to_parquet_action(
+            self.modeladmin,
+            self.request,
+            queryset,
+            field_names=["name", "created"],
+            extra_verbose_names={"name": "Custom Name"},
+        )
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertEqual(
+            "attachment; filename*=UTF-8''dummy%20models.parquet",
+            response["Content-Disposition"],
+        )
+        table = pyarrow.parquet.read_table(
+            io.BytesIO(b"".join(response.streaming_content))
+        )
+        self.assertEqual(table.column_names, ["Custom Name", "Created"])
+        self.assertEqual(table.column("Custom Name").to_pylist(), ["val1", "val3"])
+        self.assertEqual(
+            table.column("Created").to_pylist(), [datetime.date(2020, 1, 1), None]
+        )
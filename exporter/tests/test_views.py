@@ -4,6 +4,8 @@ import zipfile
 from pathlib import Path
 from unittest.mock import patch
 
+import pyarrow
+import pyarrow.parquet
 from django.http import HttpResponse, HttpResponseRedirect
 from django.test import TestCase, override_settings
 from django.urls import reverse
@@ -25,6 +27,7 @@ from concordia.tests.utils import (
 )
 from exporter.views import (
     ExportProjectToCSV,
+    ExportProjectToParquet,
     do_bagit_export,
     get_latest_transcription_data,
     get_original_asset_id,
@@ -93,6 +96,49 @@ class ViewTests(TestCase):
         self.assertIn("TestAsset", response_content)
         self.assertIn("Sample", response_content)
 
+    def test_parquet_export(self):
+        response = self.client.get(
+            reverse(
+                "transcriptions:campaign-export-parquet", args=(self.campaign.slug,)
+            )
+        )
+        self.assertEqual(response.status_code, 200)
+        table = pyarrow.parquet.read_table(
+            io.BytesIO(b"".join(response.streaming_content))
+        )
+        self.assertEqual(
+            table.column_names[:7],
+            [
+                "Campaign",
+                "Project",
+                "Item",
+                "ItemId",
+                "Asset",
+                "AssetId",
+                "AssetStatus",
+            ],
+        )
+        self.assertEqual(table.schema.field("AssetId").type, pyarrow.int64())
+        self.assertEqual(table.column("Asset").to_pylist(), ["TestAsset"])
+        self.assertEqual(table.column("AssetId").to_pylist(), [self.asset.pk])
+        self.assertEqual(table.column("Transcription").to_pylist(), ["Sample"])
+
+    def test_project_parquet_export(self):
+        request = self.client.get("/").wsgi_request
+        request.user = self.user
+        request.user.is_staff = True
+
+        response = ExportProjectToParquet.as_view()(
+            request, campaign_slug=self.campaign.slug, project_slug=self.project.slug
+        )
+
+        self.assertEqual(response.status_code, 200)
+        table = pyarrow.parquet.read_table(
+            io.BytesIO(b"".join(response.streaming_content))
+        )
+        self.assertEqual(table.column("Asset").to_pylist(), ["TestAsset"])
+        self.assertEqual(table.column("Transcription").to_pylist(), ["Sample"])
+
     def test_campaign_bagit_export(self):
         response = self.client.get(
             reverse("transcriptions:campaign-export-bagit", args=(self.campaign.slug,))
@@ -5,6 +5,28 @@ import OcrConfirmModal from './ConfirmModal';
 import OcrLanguageModal from './LanguageModal';
 import OcrHelpModal from './HelpModal';
 
+const OCR_POLL_INTERVAL = 2000;
+// How long to wait for queued OCR before giving up. The server times out
+// queued OCR sooner than this, so this only applies if it never answers.
+const OCR_MAX_WAIT = 6 * 60 * 1000;
+
+/**
+ * Poll the status URL of a queued OCR request until it has finished.
+ *
+ * @param {string} statusUrl - `statusUrl` from the 202 OCR response.
+ * @returns {Promise<Response>} The first non-202 status response.
+ * @throws {Error} If OCR hasn't finished within `OCR_MAX_WAIT`.
+ */
+async function waitForOcr(statusUrl) {
+    const deadline = Date.now() + OCR_MAX_WAIT;
+    while (Date.now() < deadline) {
+        await new Promise((resolve) => setTimeout(resolve, OCR_POLL_INTERVAL));
+        const response = await fetch(statusUrl);
+        if (response.status !== 202) return response;
+    }
+    throw new Error('Timed out waiting for the server. Please try again.');
+}
+
 /**
  * Orchestrates the OCR flow for the transcription editor.
  *
@@ -13,7 +35,8 @@ import OcrHelpModal from './HelpModal';
  * 2) Confirm opens a language selection modal.
  * 3) Submit posts to `/api/assets/{assetId}/transcriptions/ocr` with
  *    `{language, supersedes}` then calls `onTranscriptionUpdate` with
- *    the server response.
+ *    the server response. If OCR was queued (202), the returned status URL
+ *    is polled until the transcription is ready.
  *
  * State:
  * - showConfirm: controls the confirm modal.
@@ -85,12 +108,18 @@ export default function OcrHandler({
                 },
             );
 
-            if (!response.ok) {
-                const data = await response.json();
+            let result = response;
+            if (response.status === 202) {
+                const {statusUrl} = await response.json();
+                result = await waitForOcr(statusUrl);
+            }
+
+            if (!result.ok) {
+                const data = await result.json();
                 throw new Error(data.detail || data.error || 'OCR failed');
             }
 
-            const updated = await response.json();
+            const updated = await result.json();
             setShowLanguage(false);
             if (onTranscriptionUpdate) onTranscriptionUpdate(updated);
         } catch (err) {
@@ -5,8 +5,29 @@ set -e -u # Exit immediately for unhandled errors or undefined variables
 mkdir -p /app/logs
 touch /app/logs/concordia.log
 
+# Each service keeps its metrics in its own directory under the shared
+# PROMETHEUS_MULTIPROC_ROOT volume; files left by the previous run are removed
+if [ -n "${PROMETHEUS_MULTIPROC_ROOT:-}" ]; then
+    export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_ROOT}/importer"
+    rm -rf "${PROMETHEUS_MULTIPROC_DIR}"
+    mkdir -p "${PROMETHEUS_MULTIPROC_DIR}"
+fi
+
 #  To avoid trace and reporting of errors in the X-Ray SDK
 export AWS_XRAY_CONTEXT_MISSING=LOG_ERROR
 
+# OCR is CPU-bound, so it gets its own worker consuming only the "ocr" queue
+# with one process per core, separate from the general-purpose worker below.
+OCR_WORKER_CONCURRENCY="${OCR_WORKER_CONCURRENCY:-$(nproc)}"
+echo "Running OCR celery worker"
+celery -A concordia worker -l info -Q ocr -n "ocr@%h" -c "${OCR_WORKER_CONCURRENCY}" &
+
+# Pre-OCR of imported assets is queued an asset at a time and can run to
+# thousands of tasks, so it has a small worker of its own at a lower CPU
+# priority, leaving the OCR worker free for volunteers' requests.
+PRE_OCR_WORKER_CONCURRENCY="${PRE_OCR_WORKER_CONCURRENCY:-1}"
+echo "Running pre-OCR celery worker"
+nice -n 10 celery -A concordia worker -l info -Q pre_ocr -n "pre_ocr@%h" -c "${PRE_OCR_WORKER_CONCURRENCY}" &
+
 echo "Running celery worker"
-celery -A concordia worker -l info -c 10
+celery -A concordia worker -l info -Q celery -c 10
@@ -1,17 +1,24 @@
 import hashlib
+import io
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from logging import getLogger
-from tempfile import NamedTemporaryFile
+from typing import Any, Iterable, Iterator, Optional
 from urllib.parse import urlparse
 
 import boto3
 import requests
+from botocore.config import Config as BotoConfig
 from celery import Task
 from django.conf import settings
+from django.core.files import File
 from flags.state import flag_enabled
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
 
 from concordia.storage import ASSET_STORAGE
+from concordia.tasks.ocr import pre_ocr_asset_task
 from importer import models
 from importer.celery import app
 from importer.exceptions import ImageImportFailure
@@ -20,6 +27,145 @@ from .decorators import update_task_status
 
 logger = getLogger(__name__)
 
+# Number of keep-alive connections each worker process keeps open per host,
+# for both image downloads and S3 requests.
+HTTP_POOL_SIZE = 16
+
+# Number of images fetched at once by download_item_assets_task.
+ITEM_DOWNLOAD_CONCURRENCY = 8
+
+# Size of each S3 multipart upload part. This matches the boto3 TransferConfig
+# defaults that django-storages uploads with (objects of at least this size are
+# uploaded in parts of this size), which lets us compute the expected ETag while
+# the image is being streamed.
+MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+
+@lru_cache(maxsize=1)
+def _get_http_session_for_process(pid: int) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=1)
+def _get_s3_client_for_process(pid: int) -> Any:
+    return boto3.client("s3", config=BotoConfig(max_pool_connections=HTTP_POOL_SIZE))
+
+
+def get_http_session() -> requests.Session:
+    """
+    Return the pooled HTTP session for the current worker process.
+
+    The session is created on first use and keeps connections to the image
+    servers alive between downloads. It is keyed on the process ID so a
+    session inherited from the parent of a forked worker is never reused.
+
+    Returns:
+        A ``requests.Session`` shared by every download in this process.
+    """
+    return _get_http_session_for_process(os.getpid())
+
+
+def get_s3_client() -> Any:
+    """
+    Return the shared boto3 S3 client for the current worker process.
+
+    boto3 clients are thread-safe, so a single client (and its connection
+    pool) is used for every checksum lookup instead of one client per asset.
+
+    Returns:
+        A boto3 S3 client.
+    """
+    return _get_s3_client_for_process(os.getpid())
+
+
+class HashingStreamReader(io.RawIOBase):
+    """
+    Read-only, non-seekable file object over an iterator of byte chunks.
+
+    Data is hashed as it is read so that the MD5 of the whole file and the
+    ETag S3 will report for it (the plain MD5 for single part uploads or the
+    MD5 of the part MD5s for multipart uploads) are known once the upload
+    finishes, without spooling the image to disk or holding it in memory.
+    """
+
+    def __init__(
+        self, chunks: Iterator[bytes], part_size: int = MULTIPART_CHUNKSIZE
+    ) -> None:
+        super().__init__()
+        self._chunks = chunks
+        self._buffer = b""
+        self._part_size = part_size
+        self._part_hasher = hashlib.md5(usedforsecurity=False)
+        self._part_length = 0
+        self._part_digests: list[bytes] = []
+        self.md5 = hashlib.md5(usedforsecurity=False)
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read up to ``size`` bytes, or everything left when ``size`` is negative.
+
+        Unlike a raw socket read this only returns fewer bytes than requested
+        at the end of the stream, since boto3 uses each read of a non-seekable
+        file as one upload part.
+        """
+        pieces = []
+        remaining = size
+        while remaining != 0:
+            if not self._buffer:
+                self._buffer = next(self._chunks, b"")
+                if not self._buffer:
+                    break
+            if remaining < 0:
+                piece, self._buffer = self._buffer, b""
+            else:
+                piece = self._buffer[:remaining]
+                self._buffer = self._buffer[remaining:]
+                remaining -= len(piece)
+            self._update_hashes(piece)
+            pieces.append(piece)
+        return b"".join(pieces)
+
+    def readinto(self, buffer: Any) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def _update_hashes(self, data: bytes) -> None:
+        self.md5.update(data)
+        self.bytes_read += len(data)
+        while data:
+            piece = data[: self._part_size - self._part_length]
+            data = data[len(piece) :]
+            self._part_hasher.update(piece)
+            self._part_length += len(piece)
+            if self._part_length == self._part_size:
+                self._part_digests.append(self._part_hasher.digest())
+                self._part_hasher = hashlib.md5(usedforsecurity=False)
+                self._part_length = 0
+
+    @property
+    def etag(self) -> str:
+        """
+        The ETag S3 is expected to report for the data read so far.
+        """
+        if self.bytes_read < self._part_size:
+            return self.md5.hexdigest()
+        digests = list(self._part_digests)
+        if self._part_length:
+            digests.append(self._part_hasher.digest())
+        combined = hashlib.md5(b"".join(digests), usedforsecurity=False)
+        return "%s-%d" % (combined.hexdigest(), len(digests))
+
 
 @app.task(
     bind=True,
@@ -58,24 +204,160 @@ def download_asset_task(self: Task, import_asset_pk: int) -> None:
         )
         raise
 
-    download_asset(self, import_asset)
+    # Jobs which were already completed are skipped and return nothing
+    if download_asset(self, import_asset):
+        queue_pre_ocr([import_asset.asset_id])
 
 
-@update_task_status
-def download_asset(self: Task, job: "models.ImportItemAsset") -> None:
+@app.task(bind=True)
+def download_item_assets_task(self: Task, import_item_pk: int) -> dict[str, int]:
     """
-    Download the image for the given job and save it to working storage.
+    Download every outstanding asset image of an ImportItem concurrently.
+
+    This is the batch alternative to one ``download_asset_task`` per asset.
+    See ``download_import_assets`` for how the downloads are run.
+
+    Args:
+        import_item_pk: Primary key of the ImportItem whose assets to download.
+
+    Returns:
+        Counts of the assets that were downloaded and that failed.
+    """
+    jobs = (
+        models.ImportItemAsset.objects.select_related("asset__item__project__campaign")
+        .filter(import_item_id=import_item_pk, completed__isnull=True)
+        .order_by("sequence_number")
+    )
+    counts = download_import_assets(self, jobs)
+    logger.info(
+        "Downloaded %d and failed %d asset images for ImportItem %s",
+        counts["downloaded"],
+        counts["failed"],
+        import_item_pk,
+    )
+    return counts
+
+
+@app.task(bind=True)
+def download_asset_batch_task(
+    self: Task, import_asset_pks: list[int]
+) -> dict[str, int]:
+    """
+    Download the asset images for a chunk of ImportItemAssets concurrently.
+
+    Used by the bulk import pipeline, which splits the assets of a whole page
+    of items into fixed size chunks instead of queueing a task per asset.
+    Jobs which have already completed are skipped.
+
+    Args:
+        import_asset_pks: Primary keys of the ImportItemAssets to process.
+
+    Returns:
+        Counts of the assets that were downloaded and that failed.
+    """
+    jobs = (
+        models.ImportItemAsset.objects.select_related("asset__item__project__campaign")
+        .filter(pk__in=import_asset_pks, completed__isnull=True)
+        .order_by("pk")
+    )
+    counts = download_import_assets(self, jobs)
+    logger.info(
+        "Downloaded %d and failed %d of %d queued asset images",
+        counts["downloaded"],
+        counts["failed"],
+        len(import_asset_pks),
+    )
+    return counts
+
+
+def download_import_assets(
+    task: Task, jobs: Iterable["models.ImportItemAsset"]
+) -> dict[str, int]:
+    """
+    Download the images for several ImportItemAssets at once.
+
+    Up to ``ITEM_DOWNLOAD_CONCURRENCY`` images are streamed at once over the
+    process's pooled keep-alive connections straight into asset storage.
+    Database updates happen on the calling thread as each download finishes,
+    and each ImportItemAsset still goes through ``update_task_status``, so a
+    failed image is recorded and retried with ``download_asset_task`` exactly
+    as in the per-asset mode. The successfully downloaded assets are then
+    queued for pre-OCR as one batch; see ``queue_pre_ocr``.
+
+    Args:
+        task: Celery task the downloads run under.
+        jobs: ImportItemAssets to download, with their assets, items,
+            projects and campaigns selected.
+
+    Returns:
+        Counts of the assets that were downloaded and that failed.
+    """
+    jobs = list(jobs)
+    counts = {"downloaded": 0, "failed": 0}
+    if not jobs:
+        return counts
+
+    downloaded_asset_pks = []
+
+    with ThreadPoolExecutor(
+        max_workers=min(ITEM_DOWNLOAD_CONCURRENCY, len(jobs)),
+        thread_name_prefix="asset-download",
+    ) as executor:
+        downloads = [
+            (
+                job,
+                executor.submit(
+                    download_and_store_asset_image,
+                    *get_download_url_and_filename(job),
+                ),
+            )
+            for job in jobs
+        ]
+        for job, future in downloads:
+            try:
+                storage_image = store_downloaded_asset_image(task, job, future)
+            except Exception:
+                logger.exception("Downloading %s failed", job)
+                counts["failed"] += 1
+            else:
+                counts["downloaded"] += 1
+                if storage_image:
+                    downloaded_asset_pks.append(job.asset_id)
+
+    queue_pre_ocr(downloaded_asset_pks)
+    return counts
+
+
+def queue_pre_ocr(asset_pks: list[int]) -> None:
+    """
+    Queue OCR of freshly downloaded asset images if pre-OCR is enabled.
+
+    Pre-OCR is controlled by the ``IMPORT_PRE_OCR`` flag. Each asset is
+    queued as its own task on the OCR worker pool, so OCR requested by
+    volunteers can run in between; see
+    ``concordia.tasks.ocr.pre_ocr_asset_task``.
+
+    Args:
+        asset_pks: Primary keys of the assets whose images were downloaded.
+    """
+    if asset_pks and flag_enabled("IMPORT_PRE_OCR"):
+        for asset_pk in asset_pks:
+            pre_ocr_asset_task.delay(asset_pk)
+
+
+def get_download_url_and_filename(job: "models.ImportItemAsset") -> tuple[str, str]:
+    """
+    Return the image URL for a job and the storage key to save it under.
 
     The URL is taken from ``job.url`` when present, otherwise from
     ``job.asset.download_url``. The extension is inferred from the URL path
-    and normalized so ``jpeg`` becomes ``jpg``. On success the asset's
-    ``storage_image`` field is updated.
+    and normalized so ``jpeg`` becomes ``jpg``.
 
     Args:
-        job: ImportItemAsset containing the target asset and optional URL.
+        job: ImportItemAsset or DownloadAssetImageJob for the target asset.
 
-    Raises:
-        ImageImportFailure: If the download, upload or checksum check fails.
+    Returns:
+        A ``(download_url, asset_image_filename)`` pair.
     """
     asset = job.asset
     download_url: str = job.url if hasattr(job, "url") else asset.download_url
@@ -86,7 +368,54 @@ def download_asset(self: Task, job: "models.ImportItemAsset") -> None:
     if not file_extension or file_extension == "jpeg":
         file_extension = "jpg"
 
-    asset_image_filename = asset.get_asset_image_filename(file_extension)
+    return download_url, asset.get_asset_image_filename(file_extension)
+
+
+@update_task_status
+def store_downloaded_asset_image(
+    self: Task, job: "models.ImportItemAsset", download: Future
+) -> Optional[str]:
+    """
+    Wait for a batch download to finish and record it on the asset.
+
+    Args:
+        job: ImportItemAsset the download was started for.
+        download: Future returned when submitting
+            ``download_and_store_asset_image`` to the download pool.
+
+    Returns:
+        The storage key the image was saved under, or None if the job had
+        already been completed.
+
+    Raises:
+        ImageImportFailure: If the download, upload or checksum check failed.
+    """
+    storage_image = download.result()
+    job.asset.storage_image = storage_image
+    job.asset.save()
+    return storage_image
+
+
+@update_task_status
+def download_asset(self: Task, job: "models.ImportItemAsset") -> Optional[str]:
+    """
+    Download the image for the given job and save it to working storage.
+
+    See ``get_download_url_and_filename`` for how the URL and storage key are
+    chosen. On success the asset's ``storage_image`` field is updated.
+
+    Args:
+        job: ImportItemAsset containing the target asset and optional URL.
+
+    Returns:
+        The storage key the image was saved under, or None if the job had
+        already been completed.
+
+    Raises:
+        ImageImportFailure: If the download, upload or checksum check fails.
+    """
+    asset = job.asset
+    download_url, asset_image_filename = get_download_url_and_filename(job)
 
     storage_image = download_and_store_asset_image(download_url, asset_image_filename)
     logger.info(
@@ -98,17 +427,22 @@ def download_asset(self: Task, job: "models.ImportItemAsset") -> None:
     )
     asset.storage_image = storage_image
     asset.save()
+    return storage_image
 
 
 def download_and_store_asset_image(download_url: str, asset_image_filename: str) -> str:
     """
-    Stream a remote image to a temp file, upload it to storage, then verify.
+    Stream a remote image into asset storage, then verify the upload.
+
+    The image is fetched over the worker's pooled HTTP session and piped
+    straight into ``ASSET_STORAGE`` (an S3 multipart upload for large files)
+    while it is hashed, so nothing is spooled to disk. The object metadata is
+    then fetched with S3 ``head_object`` and its ETag is compared to the one
+    computed from the streamed bytes. When the ``IMPORT_IMAGE_CHECKSUM`` flag
+    is enabled a mismatch raises ``ImageImportFailure``. When disabled a
+    warning is logged.
 
-    The file is streamed and hashed with MD5, uploaded to ``ASSET_STORAGE``,
-    then the object metadata is fetched via S3 ``head_object`` and the ETag is
-    compared to the computed MD5. When the ``IMPORT_IMAGE_CHECKSUM`` flag is
-    enabled a mismatch raises ``ImageImportFailure``. When disabled a warning
-    is logged.
+    This is safe to call from several threads at once.
 
     Args:
         download_url: HTTP(S) URL of the image to fetch.
@@ -121,19 +455,16 @@ def download_and_store_asset_image(download_url: str, asset_image_filename: str)
         ImageImportFailure: On HTTP errors, I/O errors or checksum mismatch.
     """
     try:
-        hasher = hashlib.md5(usedforsecurity=False)
-        # Download the remote file to a temp file then upload to storage.
-        with NamedTemporaryFile(mode="x+b") as temp_file:
-            resp = requests.get(download_url, stream=True, timeout=30)
+        resp = get_http_session().get(download_url, stream=True, timeout=30)
+        try:
             resp.raise_for_status()
-
-            for chunk in resp.iter_content(chunk_size=256 * 1024):
-                temp_file.write(chunk)
-                hasher.update(chunk)
-
-            temp_file.flush()
-            temp_file.seek(0)
-            ASSET_STORAGE.save(asset_image_filename, temp_file)
+            reader = HashingStreamReader(
+                iter(resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE))
+            )
+            ASSET_STORAGE.save(asset_image_filename, File(reader))
+        finally:
+            # Hand the connection back to the pool even if the upload failed
+            resp.close()
     except Exception as exc:
         logger.exception(
             "Unable to download %s to %s", download_url, asset_image_filename
@@ -142,8 +473,8 @@ def download_and_store_asset_image(download_url: str, asset_image_filename: str)
             f"Unable to download {download_url} to {asset_image_filename}"
         ) from exc
 
-    filehash = hasher.hexdigest()
-    response = boto3.client("s3").head_object(
+    filehash = reader.etag
+    response = get_s3_client().head_object(
         Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=asset_image_filename
     )
     etag = response.get("ETag")[1:-1]  # trim quotes around hash
@@ -1,10 +1,15 @@
+import asyncio
+from collections import defaultdict
+from collections.abc import Callable
 from logging import getLogger
-from typing import Optional
+from typing import Any, Optional
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import requests
 from celery import Task
 from django.core.cache import cache
+from flags.state import flag_enabled
+from more_itertools import chunked
 from requests import Session
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
@@ -13,10 +18,26 @@ from importer import models
 from importer.celery import app
 
 from .decorators import update_task_status
-from .items import create_item_import_task, get_item_info_from_result
+from .items import (
+    ITEM_DATA_CACHE_TIMEOUT,
+    ITEM_IMPORT_BATCH_SIZE,
+    create_item_import_task,
+    get_item_data_cache_key,
+    get_item_info_from_result,
+    import_items_batch_task,
+)
 
 logger = getLogger(__name__)
 
+#: Maximum number of requests the collection crawler has in flight at once
+CRAWL_CONCURRENCY = 8
+
+#: Maximum number of requests per second the crawler sends to any single host
+CRAWL_REQUESTS_PER_SECOND = 4.0
+
+#: Parsed search result pages are cached for 48 hours
+PAGE_CACHE_TIMEOUT = 3600 * 48
+
 # Tasks
 
 
@@ -44,13 +65,36 @@ def import_collection(
     """
     Enqueue item import tasks for every item in a normalized collection URL.
 
+    Tasks for each page of the collection are queued as soon as that page's
+    item JSON has been prefetched, so items start importing while the rest
+    of the collection is still being crawled.
+
+    When the ``IMPORT_ITEM_BATCHES`` flag is enabled the items are imported
+    by ``import_items_batch_task`` in chunks of ``ITEM_IMPORT_BATCH_SIZE``
+    rather than by one ``create_item_import_task`` each.
+
     Args:
         import_job: The ImportJob that initiated the collection import.
         redownload: If true, force re-download of assets.
     """
-    item_info = get_collection_items(normalize_collection_url(import_job.url))
-    for _, item_url in item_info:
-        create_item_import_task.delay(import_job.pk, item_url, redownload)
+    import_in_batches = flag_enabled("IMPORT_ITEM_BATCHES")
+
+    def queue_items(item_info: list[tuple[str, str]]) -> None:
+        if import_in_batches:
+            for chunk in chunked(item_info, ITEM_IMPORT_BATCH_SIZE):
+                import_items_batch_task.delay(
+                    import_job.pk, [item_url for _, item_url in chunk], redownload
+                )
+            return
+
+        for _, item_url in item_info:
+            create_item_import_task.delay(import_job.pk, item_url, redownload)
+
+    get_collection_items(
+        normalize_collection_url(import_job.url),
+        prefetch_items=True,
+        on_items=queue_items,
+    )
 
 
 # End tasks
@@ -61,6 +105,7 @@ def requests_retry_session(
     backoff_factor: float = 60 * 60,
     status_forcelist: tuple[int, ...] = (429, 500, 502, 503, 504),
     session: Optional[Session] = None,
+    pool_maxsize: int = 10,
 ) -> Session:
     """
     Build a ``requests.Session`` with retry behavior for transient failures.
@@ -70,6 +115,7 @@ def requests_retry_session(
         backoff_factor: Multiplier for exponential backoff in seconds.
         status_forcelist: HTTP status codes that trigger a retry.
         session: Optional existing session to configure.
+        pool_maxsize: Number of connections to keep open per host.
 
     Returns:
         A ``requests.Session`` with retry adapters mounted.
@@ -82,7 +128,7 @@ def requests_retry_session(
         backoff_factor=backoff_factor,
         status_forcelist=status_forcelist,
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = HTTPAdapter(max_retries=retry, pool_maxsize=pool_maxsize)
     sess.mount("http://", adapter)
     sess.mount("https://", adapter)
     return sess
@@ -114,50 +160,299 @@ def normalize_collection_url(original_url: str) -> str:
     )
 
 
-def get_collection_items(collection_url: str) -> list[tuple[str, str]]:
+def get_collection_items(
+    collection_url: str,
+    prefetch_items: bool = False,
+    on_items: Optional[Callable[[list[tuple[str, str]]], None]] = None,
+) -> list[tuple[str, str]]:
     """
     Walk a P1 collection or search endpoint and collect item IDs and URLs.
 
-    Caches each page response for 48 hours to reduce repeated network calls.
+    Runs a ``CollectionCrawler`` to completion. The parsed JSON of each page is
+    cached for 48 hours to reduce repeated network calls.
 
     Args:
         collection_url: URL of a loc.gov collection or search results page.
+        prefetch_items: Also fetch and cache the JSON of every item found so
+            ``create_item_import_task`` does not have to.
+        on_items: Called with the items of each page as soon as the page has
+            been read and, when prefetching, its items' JSON cached.
 
     Returns:
         A list of ``(item_id, item_url)`` tuples discovered across pages.
     """
-    items: list[tuple[str, str]] = []
-    current_page_url: Optional[str] = collection_url
-
-    while current_page_url:
-        resp = cache.get(current_page_url)
-        if resp is None:
-            resp = requests_retry_session().get(current_page_url)
-            # 48-hour timeout
-            cache.set(current_page_url, resp, timeout=(3600 * 48))
-
-        data = resp.json()
-
-        results = data.get("results", None)
-        if results:
-            for result in results:
-                try:
-                    item_info = get_item_info_from_result(result)
-                    if item_info:
-                        items.append(item_info)
-                except Exception:
-                    logger.warning(
-                        "Skipping result from %s which did not match expected format:",
-                        current_page_url,
-                        exc_info=True,
-                        extra={"data": {"result": result, "url": current_page_url}},
-                    )
-        else:
-            logger.error('Expected URL %s to include "results"', current_page_url)
-
-        current_page_url = data.get("pagination", {}).get("next", None)
+    crawler = CollectionCrawler()
+    items = asyncio.run(
+        crawler.crawl(collection_url, prefetch_items=prefetch_items, on_items=on_items)
+    )
 
     if not items:
         logger.warning("No valid items found for collection url: %s", collection_url)
 
     return items
+
+
+def get_items_from_page(page_url: str, data: dict) -> list[tuple[str, str]]:
+    """
+    Return the ``(item_id, item_url)`` pairs for the results of a search page.
+
+    Results which do not match the expected format are logged and skipped.
+
+    Args:
+        page_url: URL the page was loaded from, used for logging.
+        data: Parsed JSON of the page.
+
+    Returns:
+        A list of ``(item_id, item_url)`` tuples.
+    """
+    items: list[tuple[str, str]] = []
+
+    results = data.get("results", None)
+    if results:
+        for result in results:
+            try:
+                item_info = get_item_info_from_result(result)
+                if item_info:
+                    items.append(item_info)
+            except Exception:
+                logger.warning(
+                    "Skipping result from %s which did not match expected format:",
+                    page_url,
+                    exc_info=True,
+                    extra={"data": {"result": result, "url": page_url}},
+                )
+    else:
+        logger.error('Expected URL %s to include "results"', page_url)
+
+    return items
+
+
+def get_remaining_page_urls(pagination: dict) -> Optional[list[str]]:
+    """
+    Build the URLs of pages 2 through N from the first page's pagination.
+
+    P1 numbers pages with the ``sp`` query parameter and reports the page
+    count as ``total``, so every page can be requested at once rather than
+    one ``next`` link at a time.
+
+    Args:
+        pagination: The ``pagination`` object from the first page.
+
+    Returns:
+        A list of page URLs in order, or None when the pagination does not
+        have the expected shape and the ``next`` links must be followed.
+    """
+    next_url = pagination.get("next")
+    total = pagination.get("total")
+    if not next_url or not isinstance(total, int):
+        return None
+
+    parsed_url = urlsplit(next_url)
+    query = parse_qsl(parsed_url.query)
+    if ("sp", "2") not in query:
+        return None
+
+    return [
+        urlunsplit(
+            parsed_url._replace(
+                query=urlencode([(k, str(page) if k == "sp" else v) for k, v in query])
+            )
+        )
+        for page in range(2, total + 1)
+    ]
+
+
+class HostRateLimiter:
+    """
+    Space out request start times so each host sees at most a fixed rate.
+    """
+
+    def __init__(self, requests_per_second: float) -> None:
+        self.interval = 1 / requests_per_second
+        self.next_slot: defaultdict[str, float] = defaultdict(float)
+
+    async def wait(self, host: str) -> None:
+        """
+        Sleep until the next request slot for ``host`` and claim it.
+
+        Args:
+            host: Network location the request is for.
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        # Claiming the slot happens without awaiting, so it cannot race with
+        # other coroutines on the same loop.
+        slot = max(now, self.next_slot[host])
+        self.next_slot[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class CollectionCrawler:
+    """
+    Fetch every page of a P1 collection and, optionally, each item's JSON.
+
+    The crawler runs on asyncio. Requests are made with ``requests`` in
+    worker threads over one pooled session, bounded by a semaphore to
+    ``concurrency`` requests in flight and by a ``HostRateLimiter`` to
+    ``requests_per_second`` per host. Only parsed JSON is cached.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = CRAWL_CONCURRENCY,
+        requests_per_second: float = CRAWL_REQUESTS_PER_SECOND,
+    ) -> None:
+        self.concurrency = concurrency
+        self.requests_per_second = requests_per_second
+        self.session = requests_retry_session(pool_maxsize=concurrency)
+        # Prefetching is opportunistic, so item requests are not retried with
+        # the long backoff used for pages
+        self.item_session = requests_retry_session(retries=0, pool_maxsize=concurrency)
+
+    async def crawl(
+        self,
+        collection_url: str,
+        prefetch_items: bool = False,
+        on_items: Optional[Callable[[list[tuple[str, str]]], None]] = None,
+    ) -> list[tuple[str, str]]:
+        """
+        Collect the items of every page of ``collection_url``.
+
+        When the first page reports how many pages there are, the remaining
+        pages are requested concurrently, otherwise ``next`` links are
+        followed in turn. Item JSON prefetches start as soon as the page
+        listing the item has been read.
+
+        Each page is handed to ``on_items`` once its own prefetches have
+        finished rather than after the whole collection, so callers can
+        start on the first pages while later ones are still being fetched,
+        and prefetched JSON is used soon after it was cached.
+
+        Args:
+            collection_url: Normalized collection or search URL.
+            prefetch_items: Fetch and cache each item's JSON.
+            on_items: Called with the ``(item_id, item_url)`` tuples of each
+                page.
+
+        Returns:
+            A list of ``(item_id, item_url)`` tuples in page order.
+        """
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self.rate_limiter = HostRateLimiter(self.requests_per_second)
+
+        pages: list[list[tuple[str, str]]] = []
+        pages_done: list[asyncio.Task] = []
+
+        async def finish_page(page_items: list[tuple[str, str]]) -> None:
+            if prefetch_items:
+                await asyncio.gather(
+                    *(self.prefetch_item(item_url) for _, item_url in page_items)
+                )
+            if on_items is not None and page_items:
+                on_items(page_items)
+
+        def add_page(index: int, page_url: str, data: dict) -> None:
+            pages[index] = get_items_from_page(page_url, data)
+            pages_done.append(asyncio.create_task(finish_page(pages[index])))
+
+        async def read_page(index: int, page_url: str) -> None:
+            add_page(index, page_url, await self.get_page(page_url))
+
+        data = await self.get_page(collection_url)
+        pages.append([])
+        add_page(0, collection_url, data)
+
+        pagination = data.get("pagination", {})
+        page_urls = get_remaining_page_urls(pagination)
+        if page_urls is not None:
+            # Each page is handled as soon as it arrives, so prefetching the
+            # first pages' items doesn't wait for the last page
+            pages.extend([] for _ in page_urls)
+            await asyncio.gather(
+                *(
+                    read_page(index, page_url)
+                    for index, page_url in enumerate(page_urls, start=1)
+                )
+            )
+        else:
+            next_url = pagination.get("next", None)
+            while next_url:
+                data = await self.get_page(next_url)
+                pages.append([])
+                add_page(len(pages) - 1, next_url, data)
+                next_url = data.get("pagination", {}).get("next", None)
+
+        await asyncio.gather(*pages_done)
+
+        return [item for page_items in pages for item in page_items]
+
+    async def get_page(self, page_url: str) -> dict:
+        """
+        Return the parsed JSON for a search page, from the cache if possible.
+
+        Args:
+            page_url: Absolute URL of the page, including ``fo=json``.
+
+        Returns:
+            The decoded page.
+        """
+        cache_key = f"importer:collection-page:{page_url}"
+        data = await asyncio.to_thread(cache.get, cache_key)
+        if data is None:
+            data = await self.fetch_json(page_url)
+            await asyncio.to_thread(cache.set, cache_key, data, PAGE_CACHE_TIMEOUT)
+        return data
+
+    async def prefetch_item(self, item_url: str) -> None:
+        """
+        Fetch an item's JSON and cache it for ``create_item_import_task``.
+
+        Failures are logged and otherwise ignored since the import task will
+        request the item itself when there is nothing cached.
+
+        Args:
+            item_url: Absolute item URL on loc.gov.
+        """
+        cache_key = get_item_data_cache_key(item_url)
+        try:
+            data = await self.fetch_json(
+                item_url, params={"fo": "json"}, session=self.item_session
+            )
+        except Exception:
+            logger.warning(
+                "Unable to prefetch item data for %s", item_url, exc_info=True
+            )
+            return
+        await asyncio.to_thread(cache.set, cache_key, data, ITEM_DATA_CACHE_TIMEOUT)
+
+    async def fetch_json(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        session: Optional[Session] = None,
+    ) -> Any:
+        """
+        GET a URL within the concurrency and per-host rate limits.
+
+        Args:
+            url: Absolute URL to request.
+            params: Optional query parameters.
+            session: Session to use instead of the page session.
+
+        Returns:
+            The decoded JSON body.
+
+        Raises:
+            requests.HTTPError: If the server returns an error status.
+        """
+        async with self.semaphore:
+            await self.rate_limiter.wait(urlsplit(url).netloc)
+            return await asyncio.to_thread(
+                self._get_json, session or self.session, url, params
+            )
+
+    def _get_json(self, session: Session, url: str, params: Optional[dict]) -> Any:
+        resp = session.get(url, params=params, timeout=30)
+        resp.raise_for_status()
+        return resp.json()
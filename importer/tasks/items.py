@@ -3,16 +3,19 @@ import mimetypes
 import os
 import re
 from logging import getLogger
-from typing import Any, List, Optional, Tuple
+from typing import Any, Iterable, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
 import requests
 from celery import Task, group
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile
 from django.db import transaction
 from django.utils.text import slugify
 from django.utils.timezone import now
+from flags.state import flag_enabled
+from more_itertools import chunked
 from PIL import Image, UnidentifiedImageError
 from requests.exceptions import HTTPError
 
@@ -20,7 +23,11 @@ from concordia.models import Asset, Item, MediaType
 from importer import models
 from importer.celery import app
 
-from .assets import download_asset_task
+from .assets import (
+    download_asset_batch_task,
+    download_asset_task,
+    download_item_assets_task,
+)
 from .decorators import update_task_status
 
 #: P1 has generic search / item pages and a number of top-level format-specific
@@ -43,6 +50,16 @@ ACCEPTED_P1_URL_PREFIXES = [
 
 logger = getLogger(__name__)
 
+
+#: How long item JSON prefetched by the collection crawler is kept
+ITEM_DATA_CACHE_TIMEOUT = 3600 * 6
+
+#: Number of collection items created by each import_items_batch_task
+ITEM_IMPORT_BATCH_SIZE = 50
+
+#: Number of asset images downloaded by each download_asset_batch_task
+ASSET_DOWNLOAD_BATCH_SIZE = 25
+
 # Tasks
 
 
@@ -62,7 +79,8 @@ def create_item_import_task(
     Create an ImportItem for the given job and item URL, then enqueue its
     import.
 
-    Fetches item metadata from the remote URL, ensures the Item and
+    Fetches item metadata from the remote URL (or uses the copy prefetched
+    by the collection crawler), ensures the Item and
     ImportItem exist, skips fully-imported items when not redownloading, and
     finally schedules ``import_item_task``.
 
@@ -77,9 +95,7 @@ def create_item_import_task(
     import_job = models.ImportJob.objects.get(pk=import_job_pk)
 
     # Load the Item record with metadata from the remote URL:
-    resp = requests.get(item_url, params={"fo": "json"}, timeout=30)
-    resp.raise_for_status()
-    item_data = resp.json()
+    item_data = get_item_data(item_url)
 
     item, item_created = Item.objects.get_or_create(
         item_id=get_item_id_from_item_url(item_data["item"]["id"]),
@@ -156,6 +172,9 @@ def import_item(self: Task, import_item: Any) -> Any:
     Create Asset rows for an ImportItem, create ImportItemAsset rows, then
     enqueue downloads for all assets.
 
+    When the ``IMPORT_ITEM_BATCH_DOWNLOAD`` flag is enabled the downloads run
+    in a single ``download_item_assets_task`` instead of one task per asset.
+
     Wrapped with ``update_task_status`` to keep job fields updated.
 
     Args:
@@ -163,58 +182,16 @@ def import_item(self: Task, import_item: Any) -> Any:
         import_item: ImportItem instance being processed.
 
     Returns:
-        A celery group result for the scheduled download tasks.
+        A celery group result for the scheduled download tasks, or the
+        result of the batch download task.
     """
     # Using transaction.atomic here ensures the data is available in the
     # database for the download_asset_task calls. If we do not do this some
     # tasks could execute before the transaction is committed, causing failures.
     with transaction.atomic():
-        item_assets: List[Asset] = []
         import_assets: List[Any] = []
-        item_resource_url: Optional[str] = None
-
-        asset_urls, item_resource_url = get_asset_urls_from_item_resources(
-            import_item.item.metadata.get("resources", [])
-        )
-        relative_asset_file_path = "/".join(
-            [
-                import_item.item.project.campaign.slug,
-                import_item.item.project.slug,
-                import_item.item.item_id,
-            ]
-        )
-
-        for sequence, asset_url in enumerate(asset_urls, start=1):
-            asset_title = f"{import_item.item.item_id}-{sequence}"
-            file_extension = (
-                os.path.splitext(urlparse(asset_url).path)[1].lstrip(".").lower()
-            )
-            item_asset = Asset(
-                item=import_item.item,
-                campaign=import_item.item.project.campaign,
-                title=asset_title,
-                slug=slugify(asset_title, allow_unicode=True),
-                sequence=sequence,
-                media_type=MediaType.IMAGE,
-                download_url=asset_url,
-                resource_url=item_resource_url,
-                storage_image="/".join(
-                    [relative_asset_file_path, f"{sequence}.{file_extension}"]
-                ),
-            )
-            # Previously any asset that raised a validation error was ignored.
-            # We want validation errors to fail the import.
-            try:
-                item_asset.full_clean()
-            except ValidationError as exc:
-                raise ValidationError(
-                    f"Importing asset with slug '{item_asset.slug}' for "
-                    f"item '{item_asset.item}' with resource URL "
-                    f"'{item_asset.resource_url}' failed with the following "
-                    f"exception: {exc}"
-                ) from exc
-            item_assets.append(item_asset)
 
+        item_assets = build_item_assets(import_item.item)
         Asset.objects.bulk_create(item_assets)
 
         for asset in item_assets:
@@ -232,13 +209,260 @@ def import_item(self: Task, import_item: Any) -> Any:
         import_item.full_clean()
         import_item.save()
 
+    if flag_enabled("IMPORT_ITEM_BATCH_DOWNLOAD"):
+        # One task fetches all of the item's images concurrently over pooled
+        # connections instead of queueing a rate-limited task per image
+        return download_item_assets_task.delay(import_item.pk)
+
     download_asset_group = group(download_asset_task.s(i.pk) for i in import_assets)
     return download_asset_group()
 
 
+@app.task(bind=True)
+def import_items_batch_task(
+    self: Task, import_job_pk: int, item_urls: list[str], redownload: bool = False
+) -> int:
+    """
+    Import a page of collection items for a job in a few bulk statements.
+
+    Args:
+        import_job_pk: Primary key of the ImportJob.
+        item_urls: Absolute item URLs on loc.gov.
+        redownload: Passed on to items handed to ``create_item_import_task``.
+
+    Returns:
+        The number of asset images queued for download.
+    """
+    import_job = models.ImportJob.objects.select_related("project__campaign").get(
+        pk=import_job_pk
+    )
+    return import_items_batch(self, import_job, item_urls, redownload)
+
+
+def import_items_batch(
+    task: Task,
+    import_job: "models.ImportJob",
+    item_urls: Iterable[str],
+    redownload: bool = False,
+) -> int:
+    """
+    Create Items, ImportItems, Assets and ImportItemAssets for many new items.
+
+    This does the work of ``create_item_import_task`` and ``import_item`` for
+    a whole page of items: the item JSON is loaded (usually prefetched by the
+    collection crawler), then each kind of row is written with a single
+    ``bulk_create`` and the asset images are queued in chunks of
+    ``ASSET_DOWNLOAD_BATCH_SIZE`` with ``download_asset_batch_task``.
+
+    Items which already exist, and items whose data cannot be loaded or
+    validated, are handed to ``create_item_import_task`` so they are skipped,
+    reprocessed, retried or recorded as failed exactly as before. An item
+    whose assets cannot be built has its ImportItem marked failed. If the
+    rows cannot be written, for example because of a clashing slug, the
+    whole batch is handed to ``create_item_import_task`` instead.
+
+    Args:
+        task: Celery task the import runs under.
+        import_job: ImportJob the items belong to.
+        item_urls: Absolute item URLs on loc.gov.
+        redownload: Passed on to items handed to ``create_item_import_task``.
+
+    Returns:
+        The number of asset images queued for download.
+    """
+    item_urls = list(item_urls)
+    project = import_job.project
+    existing_item_ids = set(
+        Item.objects.filter(
+            item_id__in=[get_item_id_from_item_url(i) for i in item_urls]
+        ).values_list("item_id", flat=True)
+    )
+
+    new_items: dict[str, Item] = {}
+    thumbnail_urls: dict[str, Optional[str]] = {}
+    for item_url in item_urls:
+        # Existing items may need to be skipped or have missing assets
+        # reprocessed, which the per-item task already takes care of.
+        if get_item_id_from_item_url(item_url) in existing_item_ids:
+            create_item_import_task.delay(import_job.pk, item_url, redownload)
+            continue
+
+        try:
+            item_data = get_item_data(item_url)
+            item_id = get_item_id_from_item_url(item_data["item"]["id"])
+            if item_id in existing_item_ids or item_id in new_items:
+                create_item_import_task.delay(import_job.pk, item_url, redownload)
+                continue
+
+            item = Item(
+                item_id=item_id,
+                item_url=item_url,
+                project=project,
+                metadata=item_data,
+            )
+            thumbnail_urls[item_id] = populate_item_from_data(item, item_data["item"])
+            item.full_clean(validate_unique=False, validate_constraints=False)
+        except Exception:
+            logger.warning(
+                "Unable to import %s as part of a batch, queueing it on its own",
+                item_url,
+                exc_info=True,
+            )
+            create_item_import_task.delay(import_job.pk, item_url, redownload)
+            continue
+        new_items[item_id] = item
+
+    if not new_items:
+        return 0
+
+    try:
+        import_items, import_assets = _create_batch_rows(
+            task, import_job, list(new_items.values())
+        )
+    except Exception:
+        # One bad row rolls back the whole batch, so each item is imported on
+        # its own instead, where a failure is recorded against that item.
+        # The item data is cached again so it needn't be refetched.
+        logger.exception(
+            "Unable to import a batch of %d items for %s, queueing them on their own",
+            len(new_items),
+            import_job,
+        )
+        for item in new_items.values():
+            cache.set(
+                get_item_data_cache_key(item.item_url),
+                item.metadata,
+                ITEM_DATA_CACHE_TIMEOUT,
+            )
+            create_item_import_task.delay(import_job.pk, item.item_url, redownload)
+        return 0
+
+    for chunk in chunked((i.pk for i in import_assets), ASSET_DOWNLOAD_BATCH_SIZE):
+        download_asset_batch_task.delay(chunk)
+
+    logger.info(
+        "Imported %d items with %d assets for %s",
+        len(new_items),
+        len(import_assets),
+        import_job,
+    )
+
+    for item_id, thumbnail_url in thumbnail_urls.items():
+        if not thumbnail_url:
+            continue
+        try:
+            download_and_set_item_thumbnail(new_items[item_id], thumbnail_url)
+        except Exception:
+            logger.exception("Unable to download the thumbnail for %s", item_id)
+
+    return len(import_assets)
+
+
+def _create_batch_rows(
+    task: Task, import_job: "models.ImportJob", new_items: list[Item]
+) -> tuple[list["models.ImportItem"], list["models.ImportItemAsset"]]:
+    """
+    Bulk-create the rows for a batch of new items in one transaction.
+
+    Items whose assets cannot be built get an ImportItem marked failed.
+
+    Args:
+        task: Celery task the import runs under.
+        import_job: ImportJob the items belong to.
+        new_items: Unsaved, validated Items.
+
+    Returns:
+        The created ImportItems and ImportItemAssets.
+    """
+    started = now()
+    import_items: list[models.ImportItem] = []
+    item_assets: list[Asset] = []
+    with transaction.atomic():
+        Item.objects.bulk_create(new_items)
+
+        for item in new_items:
+            import_item = models.ImportItem(
+                job=import_job,
+                url=item.item_url,
+                item=item,
+                last_started=started,
+                task_id=task.request.id,
+            )
+            try:
+                # These items were just created, so their assets cannot clash
+                # with existing rows and the per-row uniqueness checks can be
+                # skipped.
+                assets = build_item_assets(item, validate_unique=False)
+            except Exception as exc:
+                logger.warning("Unable to import the assets for %s: %s", item, exc)
+                import_item.status = f"Unhandled exception: {exc}"
+                import_item.failed = started
+            else:
+                import_item.status = "Completed"
+                import_item.completed = started
+                item_assets.extend(assets)
+            import_items.append(import_item)
+
+        models.ImportItem.objects.bulk_create(import_items)
+        Asset.objects.bulk_create(item_assets)
+
+        import_items_by_item = {i.item_id: i for i in import_items}
+        import_assets = models.ImportItemAsset.objects.bulk_create(
+            models.ImportItemAsset(
+                import_item=import_items_by_item[asset.item_id],
+                asset=asset,
+                url=asset.download_url,
+                sequence_number=asset.sequence,
+            )
+            for asset in item_assets
+        )
+
+    return import_items, import_assets
+
+
 # End tasks
 
 
+def get_item_data_cache_key(item_url: str) -> str:
+    """
+    Return the cache key for prefetched item JSON.
+
+    Args:
+        item_url: Absolute item URL on loc.gov.
+
+    Returns:
+        The cache key.
+    """
+    return f"importer:item-data:{item_url}"
+
+
+def get_item_data(item_url: str) -> dict:
+    """
+    Return the JSON for an item, preferring a prefetched copy.
+
+    A prefetched copy is removed from the cache when it is used, so each
+    import only reuses data fetched for it and a retry always refetches.
+
+    Args:
+        item_url: Absolute item URL on loc.gov.
+
+    Returns:
+        The decoded item JSON.
+
+    Raises:
+        requests.HTTPError: If the item request fails.
+    """
+    cache_key = get_item_data_cache_key(item_url)
+    item_data = cache.get(cache_key)
+    if item_data is not None:
+        cache.delete(cache_key)
+        return item_data
+
+    resp = requests.get(item_url, params={"fo": "json"}, timeout=30)
+    resp.raise_for_status()
+    return resp.json()
+
+
 def import_item_count_from_url(import_url: str) -> Tuple[str, int]:
     """
     Return a tuple of status string and asset count for a loc.gov item URL.
@@ -413,6 +637,70 @@ def populate_item_from_data(item: Item, item_info: dict) -> Optional[str]:
     return None
 
 
+def build_item_assets(item: Item, validate_unique: bool = True) -> List[Asset]:
+    """
+    Build validated, unsaved Asset rows for every image of an item.
+
+    The image URLs are chosen from the ``resources`` in the item's metadata
+    with ``get_asset_urls_from_item_resources``.
+
+    Args:
+        item: Saved Item whose metadata has been loaded.
+        validate_unique: Run the uniqueness checks of ``full_clean``, which
+            cost queries per asset. Only skip them for a newly created item.
+
+    Returns:
+        The Asset instances, in sequence order.
+
+    Raises:
+        ValidationError: If any asset does not validate.
+    """
+    item_assets: List[Asset] = []
+
+    asset_urls, item_resource_url = get_asset_urls_from_item_resources(
+        item.metadata.get("resources", [])
+    )
+    relative_asset_file_path = "/".join(
+        [item.project.campaign.slug, item.project.slug, item.item_id]
+    )
+
+    for sequence, asset_url in enumerate(asset_urls, start=1):
+        asset_title = f"{item.item_id}-{sequence}"
+        file_extension = (
+            os.path.splitext(urlparse(asset_url).path)[1].lstrip(".").lower()
+        )
+        item_asset = Asset(
+            item=item,
+            campaign=item.project.campaign,
+            title=asset_title,
+            slug=slugify(asset_title, allow_unicode=True),
+            sequence=sequence,
+            media_type=MediaType.IMAGE,
+            download_url=asset_url,
+            resource_url=item_resource_url,
+            storage_image="/".join(
+                [relative_asset_file_path, f"{sequence}.{file_extension}"]
+            ),
+        )
+        # Previously any asset that raised a validation error was ignored.
+        # We want validation errors to fail the import.
+        try:
+            item_asset.full_clean(
+                validate_unique=validate_unique,
+                validate_constraints=validate_unique,
+            )
+        except ValidationError as exc:
+            raise ValidationError(
+                f"Importing asset with slug '{item_asset.slug}' for "
+                f"item '{item_asset.item}' with resource URL "
+                f"'{item_asset.resource_url}' failed with the following "
+                f"exception: {exc}"
+            ) from exc
+        item_assets.append(item_asset)
+
+    return item_assets
+
+
 def get_asset_urls_from_item_resources(
     resources: List[dict],
 ) -> Tuple[List[str], str]:
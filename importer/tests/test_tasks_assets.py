@@ -1,3 +1,4 @@
+import hashlib
 import uuid
 from unittest import mock
 
@@ -187,6 +188,20 @@ class AssetImportTests(TestCase):
                 tasks.assets.download_asset_task(max_pk + 1)
             self.assertFalse(task_mock.called)
 
+    @mock.patch("importer.tasks.assets.pre_ocr_asset_task")
+    @mock.patch("importer.tasks.assets.download_and_store_asset_image")
+    def test_download_asset_task_queues_pre_ocr(self, mock_download, mock_pre_ocr):
+        mock_download.side_effect = lambda url, filename: filename
+        with mock.patch("importer.tasks.assets.flag_enabled", return_value=True):
+            tasks.assets.download_asset_task(self.import_asset.pk)
+            mock_pre_ocr.delay.assert_called_once_with(self.import_asset.asset_id)
+
+            # Jobs which were already completed aren't downloaded or queued again
+            mock_pre_ocr.reset_mock()
+            with self.assertLogs("importer.tasks.decorators", level="WARNING"):
+                tasks.assets.download_asset_task(self.import_asset.pk)
+            self.assertFalse(mock_pre_ocr.delay.called)
+
     @override_settings(
         STORAGES={
             "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"},
@@ -196,10 +211,11 @@ class AssetImportTests(TestCase):
     )
     def test_download_asset_valid(self):
         with (
-            mock.patch("importer.tasks.assets.requests.get") as get_mock,
-            mock.patch("importer.tasks.assets.boto3.client") as boto_mock,
+            mock.patch("importer.tasks.assets.get_http_session") as session_mock,
+            mock.patch("importer.tasks.assets.get_s3_client") as boto_mock,
             mock.patch("importer.tasks.assets.flag_enabled") as flag_mock,
         ):
+            get_mock = session_mock.return_value.get
             get_mock.return_value.iter_content.return_value = self.get_return_value
             boto_mock.return_value = self.s3_client_mock
             flag_mock.return_value = True
@@ -219,10 +235,11 @@ class AssetImportTests(TestCase):
     )
     def test_download_asset_valid_checksum_fail(self):
         with (
-            mock.patch("importer.tasks.assets.requests.get") as get_mock,
-            mock.patch("importer.tasks.assets.boto3.client") as boto_mock,
+            mock.patch("importer.tasks.assets.get_http_session") as session_mock,
+            mock.patch("importer.tasks.assets.get_s3_client") as boto_mock,
             mock.patch("importer.tasks.assets.flag_enabled") as flag_mock,
         ):
+            get_mock = session_mock.return_value.get
             get_mock.return_value.iter_content.return_value = self.get_return_value
             boto_mock.return_value = self.s3_client_mock
             flag_mock.return_value = True
@@ -246,10 +263,11 @@ class AssetImportTests(TestCase):
     )
     def test_download_asset_valid_checksum_fail_without_flag(self):
         with (
-            mock.patch("importer.tasks.assets.requests.get") as get_mock,
-            mock.patch("importer.tasks.assets.boto3.client") as boto_mock,
+            mock.patch("importer.tasks.assets.get_http_session") as session_mock,
+            mock.patch("importer.tasks.assets.get_s3_client") as boto_mock,
             self.assertLogs("importer.tasks", level="WARN") as log,
         ):
+            get_mock = session_mock.return_value.get
             get_mock.return_value.iter_content.return_value = self.get_return_value
             boto_mock.return_value = self.s3_client_mock
             self.head_object_mock.return_value = {"ETag": f'"{self.invalid_hash}"'}
@@ -271,9 +289,10 @@ class AssetImportTests(TestCase):
     )
     def test_download_asset_invalid(self):
         with (
-            mock.patch("importer.tasks.assets.requests.get") as get_mock,
+            mock.patch("importer.tasks.assets.get_http_session") as session_mock,
             self.assertLogs("importer.tasks", level="ERROR") as log,
         ):
+            get_mock = session_mock.return_value.get
             get_mock.return_value.raise_for_status.side_effect = AttributeError
             with self.assertRaises(exceptions.ImageImportFailure):
                 tasks.assets.download_asset(self.task_mock, self.import_asset)
@@ -893,3 +912,185 @@ class DownloadAssetImageTaskTests(TestCase):
             tasks.images.download_asset_image_task(
                 self.asset.pk, self.batch_id, create_job=True
             )
+
+
+class DownloadItemAssetsTaskTests(TestCase):
+    def setUp(self):
+        self.import_asset = create_import_asset(url="http://example.com/1.jpg")
+        self.import_item = self.import_asset.import_item
+        self.second_import_asset = create_import_asset(
+            sequence_number=2,
+            import_item=self.import_item,
+            url="http://example.com/2.jpeg",
+        )
+
+    @mock.patch("importer.tasks.assets.download_and_store_asset_image")
+    def test_download_item_assets(self, mock_download):
+        mock_download.side_effect = lambda url, filename: filename
+
+        result = tasks.assets.download_item_assets_task(self.import_item.pk)
+
+        self.assertEqual(result, {"downloaded": 2, "failed": 0})
+        self.assertEqual(
+            sorted(call.args[0] for call in mock_download.call_args_list),
+            ["http://example.com/1.jpg", "http://example.com/2.jpeg"],
+        )
+        for import_asset in (self.import_asset, self.second_import_asset):
+            import_asset.refresh_from_db()
+            self.assertIsNotNone(import_asset.completed)
+            self.assertEqual(
+                import_asset.asset.storage_image.name,
+                import_asset.asset.get_asset_image_filename("jpg"),
+            )
+
+    @mock.patch("importer.models.ImportItemAsset.retry_if_possible")
+    @mock.patch("importer.tasks.assets.download_and_store_asset_image")
+    def test_download_item_assets_failure(self, mock_download, mock_retry):
+        def download(url, filename):
+            if url.endswith("2.jpeg"):
+                raise exceptions.ImageImportFailure("Unable to download")
+            return filename
+
+        mock_download.side_effect = download
+        mock_retry.return_value = False
+
+        with self.assertLogs("importer.tasks.assets", level="ERROR"):
+            result = tasks.assets.download_item_assets_task(self.import_item.pk)
+
+        self.assertEqual(result, {"downloaded": 1, "failed": 1})
+        self.import_asset.refresh_from_db()
+        self.second_import_asset.refresh_from_db()
+        self.assertIsNotNone(self.import_asset.completed)
+        self.assertIsNotNone(self.second_import_asset.failed)
+        self.assertEqual(
+            self.second_import_asset.failure_reason,
+            TaskStatusModel.FailureReason.IMAGE,
+        )
+        self.assertTrue(mock_retry.called)
+
+    @mock.patch("importer.tasks.assets.pre_ocr_asset_task")
+    @mock.patch("importer.models.ImportItemAsset.retry_if_possible")
+    @mock.patch("importer.tasks.assets.download_and_store_asset_image")
+    def test_download_item_assets_queues_pre_ocr(
+        self, mock_download, mock_retry, mock_pre_ocr
+    ):
+        def download(url, filename):
+            if url.endswith("2.jpeg"):
+                raise exceptions.ImageImportFailure("Unable to download")
+            return filename
+
+        mock_download.side_effect = download
+        mock_retry.return_value = False
+
+        with mock.patch("importer.tasks.assets.flag_enabled", return_value=False):
+            with self.assertLogs("importer.tasks.assets", level="ERROR"):
+                tasks.assets.download_item_assets_task(self.import_item.pk)
+        self.assertFalse(mock_pre_ocr.delay.called)
+
+        self.import_asset.completed = None
+        self.import_asset.save()
+        self.second_import_asset.failed = None
+        self.second_import_asset.save()
+        with mock.patch("importer.tasks.assets.flag_enabled", return_value=True):
+            with self.assertLogs("importer.tasks.assets", level="ERROR"):
+                tasks.assets.download_item_assets_task(self.import_item.pk)
+        # Only the successfully downloaded asset is queued
+        mock_pre_ocr.delay.assert_called_once_with(self.import_asset.asset_id)
+
+    @mock.patch("importer.tasks.assets.download_and_store_asset_image")
+    def test_completed_assets_skipped(self, mock_download):
+        self.import_asset.completed = timezone.now()
+        self.import_asset.save()
+        mock_download.side_effect = lambda url, filename: filename
+
+        result = tasks.assets.download_item_assets_task(self.import_item.pk)
+
+        self.assertEqual(result, {"downloaded": 1, "failed": 0})
+        mock_download.assert_called_once()
+
+    @mock.patch("importer.tasks.assets.download_and_store_asset_image")
+    def test_no_assets(self, mock_download):
+        ImportItemAsset.objects.all().delete()
+        result = tasks.assets.download_item_assets_task(self.import_item.pk)
+        self.assertEqual(result, {"downloaded": 0, "failed": 0})
+        self.assertFalse(mock_download.called)
+
+
+class DownloadAssetBatchTaskTests(TestCase):
+    @mock.patch("importer.tasks.assets.download_and_store_asset_image")
+    def test_download_asset_batch(self, mock_download):
+        first = create_import_asset(url="http://example.com/1.jpg")
+        second = create_import_asset(
+            sequence_number=2,
+            import_item=first.import_item,
+            url="http://example.com/2.jpg",
+        )
+        other = create_import_asset(
+            sequence_number=3,
+            import_item=first.import_item,
+            url="http://example.com/3.jpg",
+        )
+        mock_download.side_effect = lambda url, filename: filename
+
+        result = tasks.assets.download_asset_batch_task([first.pk, second.pk])
+
+        self.assertEqual(result, {"downloaded": 2, "failed": 0})
+        self.assertEqual(
+            sorted(call.args[0] for call in mock_download.call_args_list),
+            ["http://example.com/1.jpg", "http://example.com/2.jpg"],
+        )
+        other.refresh_from_db()
+        self.assertIsNone(other.completed)
+
+
+class HashingStreamReaderTests(TestCase):
+    def test_single_part(self):
+        reader = tasks.assets.HashingStreamReader(iter([b"chunk1", b"chunk2"]))
+        self.assertEqual(reader.read(4), b"chun")
+        self.assertEqual(reader.read(), b"k1chunk2")
+        self.assertEqual(reader.read(), b"")
+        self.assertEqual(reader.bytes_read, 12)
+        self.assertEqual(reader.etag, hashlib.md5(b"chunk1chunk2").hexdigest())
+        self.assertFalse(reader.seekable())
+
+    def test_multipart(self):
+        data = bytes(range(256)) * 10
+        chunks = iter(data[i : i + 300] for i in range(0, len(data), 300))
+        reader = tasks.assets.HashingStreamReader(chunks, part_size=1000)
+
+        # Reads are only short at the end of the stream, since boto3 uploads
+        # each read of a non-seekable file as one part
+        parts = iter(lambda: reader.read(1000), b"")
+        self.assertEqual([len(part) for part in parts], [1000, 1000, 560])
+
+        part_digests = b"".join(
+            hashlib.md5(data[i : i + 1000]).digest() for i in range(0, len(data), 1000)
+        )
+        self.assertEqual(reader.etag, "%s-3" % hashlib.md5(part_digests).hexdigest())
+        self.assertEqual(reader.md5.hexdigest(), hashlib.md5(data).hexdigest())
+
+    def test_exact_part_size(self):
+        reader = tasks.assets.HashingStreamReader(iter([b"a" * 10]), part_size=10)
+        reader.read()
+        digest = hashlib.md5(hashlib.md5(b"a" * 10).digest()).hexdigest()
+        self.assertEqual(reader.etag, f"{digest}-1")
+
+
+class SharedClientTests(TestCase):
+    def test_http_session_reused_per_process(self):
+        session = tasks.assets.get_http_session()
+        self.assertIs(tasks.assets.get_http_session(), session)
+        adapter = session.get_adapter("https://tile.loc.gov/")
+        self.assertEqual(adapter._pool_maxsize, tasks.assets.HTTP_POOL_SIZE)
+
+        with mock.patch("importer.tasks.assets.os.getpid", return_value=-1):
+            self.assertIsNot(tasks.assets.get_http_session(), session)
+
+    @mock.patch("importer.tasks.assets.boto3.client")
+    def test_s3_client_reused_per_process(self, mock_client):
+        tasks.assets._get_s3_client_for_process.cache_clear()
+        self.addCleanup(tasks.assets._get_s3_client_for_process.cache_clear)
+
+        client = tasks.assets.get_s3_client()
+        self.assertIs(tasks.assets.get_s3_client(), client)
+        self.assertEqual(mock_client.call_count, 1)
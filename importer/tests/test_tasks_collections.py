@@ -1,16 +1,26 @@
+import asyncio
+import json
 import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import mock
+from urllib.parse import parse_qs, urlsplit
 
 import requests
+from django.core.cache import cache
 from django.core.cache.backends.base import BaseCache
 from django.test import TestCase, override_settings
 
 from concordia.tests.utils import CreateTestUsers
 from importer import tasks
 from importer.tasks.collections import (
+    HostRateLimiter,
+    get_remaining_page_urls,
     import_collection_task,
     normalize_collection_url,
 )
+from importer.tasks.items import get_item_data_cache_key
 from importer.tests.utils import create_import_job
 
 
@@ -18,6 +28,9 @@ class MockResponse:
     def __init__(self, original_format="item"):
         self.original_format = original_format
 
+    def raise_for_status(self):
+        pass
+
     def json(self):
         url = "https://www.loc.gov/item/%s/" % "mss859430021"
         return {
@@ -39,8 +52,7 @@ class MockCache(BaseCache):
         super().__init__(params, **kwargs)
 
     def get(self, key, default=None, version=None):
-        resp = MockResponse()
-        return resp
+        return MockResponse().json()
 
 
 # Ensure dotted path used in override_settings still resolves after splitting.
@@ -179,6 +191,191 @@ class GetCollectionItemsTests(TestCase):
             )
 
 
+class StubLocHandler(BaseHTTPRequestHandler):
+    """
+    Serve a three page collection in the shape of the P1 JSON API.
+
+    Item URLs include "loc.gov/item/" in their path so they are accepted by
+    get_item_info_from_result.
+    """
+
+    pages = 3
+    per_page = 2
+    paginate_with_total = True
+    missing_items = set()
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        self.server.requested.append(self.path)
+
+        if url.path == "/collections/example/":
+            data = self.get_page(int(query.get("sp", ["1"])[0]))
+        elif url.path.startswith("/loc.gov/item/"):
+            if url.path.split("/")[3] in self.missing_items:
+                self.send_error(404)
+                return
+            data = {"item": {"id": self.path}}
+        else:
+            self.send_error(404)
+            return
+
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def get_page(self, page):
+        base_url = "http://%s:%d" % self.server.server_address
+        results = []
+        for i in range(self.per_page):
+            item_id = "mss%d" % ((page - 1) * self.per_page + i)
+            results.append(
+                {
+                    "id": item_id,
+                    "image_url": ["%s/image.jpg" % base_url],
+                    "original_format": ["manuscript/mixed material"],
+                    "url": "%s/loc.gov/item/%s/" % (base_url, item_id),
+                }
+            )
+        pagination = {"current": page, "next": None}
+        if page < self.pages:
+            pagination["next"] = "%s/collections/example/?fo=json&sp=%d" % (
+                base_url,
+                page + 1,
+            )
+        if self.paginate_with_total:
+            pagination["total"] = self.pages
+        return {"results": results, "pagination": pagination}
+
+    def log_message(self, *args):
+        pass
+
+
+class CollectionCrawlerTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubLocHandler)
+        self.server.requested = []
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.base_url = "http://%s:%d" % self.server.server_address
+        self.collection_url = "%s/collections/example/?fo=json" % self.base_url
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_crawl_with_prefetch(self):
+        items = tasks.collections.get_collection_items(
+            self.collection_url, prefetch_items=True
+        )
+
+        self.assertEqual(
+            [item_id for item_id, _ in items], [f"mss{i}" for i in range(6)]
+        )
+        for item_id, item_url in items:
+            self.assertEqual(
+                cache.get(get_item_data_cache_key(item_url)),
+                {"item": {"id": f"/loc.gov/item/{item_id}/?fo=json"}},
+            )
+
+        # Pages are only requested once and the parsed pages are cached
+        page_requests = [
+            path for path in self.server.requested if "collections" in path
+        ]
+        self.assertEqual(len(page_requests), 3)
+        tasks.collections.get_collection_items(self.collection_url)
+        self.assertEqual(
+            len([path for path in self.server.requested if "collections" in path]),
+            3,
+        )
+
+    def test_items_handed_on_page_by_page(self):
+        pages = []
+
+        def on_items(page_items):
+            # Each page is handed on once its own items have been prefetched
+            for _, item_url in page_items:
+                self.assertIsNotNone(cache.get(get_item_data_cache_key(item_url)))
+            pages.append([item_id for item_id, _ in page_items])
+
+        items = tasks.collections.get_collection_items(
+            self.collection_url, prefetch_items=True, on_items=on_items
+        )
+
+        self.assertEqual(
+            sorted(pages), [["mss0", "mss1"], ["mss2", "mss3"], ["mss4", "mss5"]]
+        )
+        self.assertEqual(len(items), 6)
+
+    def test_crawl_following_next_links(self):
+        with mock.patch.object(StubLocHandler, "paginate_with_total", False):
+            items = tasks.collections.get_collection_items(self.collection_url)
+
+        self.assertEqual(len(items), 6)
+        # Nothing is prefetched unless requested
+        self.assertFalse([path for path in self.server.requested if "/item/" in path])
+
+    def test_prefetch_failure_ignored(self):
+        with (
+            mock.patch.object(StubLocHandler, "missing_items", {"mss1"}),
+            self.assertLogs("importer.tasks.collections", level="WARNING") as log,
+        ):
+            items = tasks.collections.get_collection_items(
+                self.collection_url, prefetch_items=True
+            )
+
+        self.assertEqual(len(items), 6)
+        self.assertIsNone(cache.get(get_item_data_cache_key(items[1][1])))
+        self.assertIsNotNone(cache.get(get_item_data_cache_key(items[0][1])))
+        self.assertIn(
+            "WARNING:importer.tasks.collections:Unable to prefetch item data for "
+            + items[1][1],
+            log.output[0],
+        )
+
+    def test_get_remaining_page_urls(self):
+        self.assertEqual(
+            get_remaining_page_urls(
+                {
+                    "next": "https://www.loc.gov/collections/example/?fo=json&sp=2",
+                    "total": 4,
+                }
+            ),
+            [
+                "https://www.loc.gov/collections/example/?fo=json&sp=2",
+                "https://www.loc.gov/collections/example/?fo=json&sp=3",
+                "https://www.loc.gov/collections/example/?fo=json&sp=4",
+            ],
+        )
+        self.assertIsNone(get_remaining_page_urls({}))
+        self.assertIsNone(
+            get_remaining_page_urls(
+                {"next": "https://www.loc.gov/collections/example/?c=10", "total": 4}
+            )
+        )
+
+    def test_host_rate_limiter(self):
+        async def make_requests():
+            limiter = HostRateLimiter(requests_per_second=20)
+            start = time.monotonic()
+            for _ in range(3):
+                await limiter.wait("www.loc.gov")
+            await limiter.wait("tile.loc.gov")
+            return time.monotonic() - start
+
+        elapsed = asyncio.run(make_requests())
+        # The first request to each host is immediate and the next two are
+        # spaced 50ms apart
+        self.assertGreaterEqual(elapsed, 0.1)
+        self.assertLess(elapsed, 0.5)
+
+
 class ImportCollectionTests(CreateTestUsers, TestCase):
     def setUp(self):
         self.login_user()
@@ -202,10 +399,12 @@ class ImportCollectionTests(CreateTestUsers, TestCase):
     ):
         import_job = create_import_job(created_by=self.user)
         mock_normalize.return_value = "https://www.loc.gov/collections/example/?fo=json"
-        mock_get.return_value = [
-            ("mss1", "https://www.loc.gov/item/mss1/"),
-            ("mss2", "https://www.loc.gov/item/mss2/"),
-        ]
+        mock_get.side_effect = lambda url, prefetch_items, on_items: on_items(
+            [
+                ("mss1", "https://www.loc.gov/item/mss1/"),
+                ("mss2", "https://www.loc.gov/item/mss2/"),
+            ]
+        )
 
         # redownload=True so we can assert the third arg is propagated
         import_collection_task(import_job.pk, redownload=True)
@@ -219,6 +418,38 @@ class ImportCollectionTests(CreateTestUsers, TestCase):
             ],
         )
 
+    @mock.patch("importer.tasks.collections.flag_enabled", return_value=True)
+    @mock.patch("importer.tasks.collections.ITEM_IMPORT_BATCH_SIZE", 2)
+    @mock.patch("importer.tasks.collections.import_items_batch_task.delay")
+    @mock.patch("importer.tasks.collections.create_item_import_task.delay")
+    @mock.patch("importer.tasks.collections.get_collection_items")
+    def test_import_collection_in_batches(
+        self, mock_get, mock_item_delay, mock_batch_delay, mock_flag
+    ):
+        import_job = create_import_job(created_by=self.user)
+        mock_get.side_effect = lambda url, prefetch_items, on_items: on_items(
+            [(f"mss{i}", f"https://www.loc.gov/item/mss{i}/") for i in range(3)]
+        )
+
+        import_collection_task(import_job.pk)
+
+        mock_flag.assert_called_with("IMPORT_ITEM_BATCHES")
+        self.assertFalse(mock_item_delay.called)
+        self.assertEqual(
+            mock_batch_delay.call_args_list,
+            [
+                mock.call(
+                    import_job.pk,
+                    [
+                        "https://www.loc.gov/item/mss0/",
+                        "https://www.loc.gov/item/mss1/",
+                    ],
+                    False,
+                ),
+                mock.call(import_job.pk, ["https://www.loc.gov/item/mss2/"], False),
+            ],
+        )
+
 
 class CollectionURLNormalizationTests(TestCase):
     def test_basic_normalization(self):
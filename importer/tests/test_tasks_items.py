@@ -4,13 +4,15 @@ import tempfile
 from unittest import mock
 
 import requests
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
+from django.db import IntegrityError
 from django.test import TestCase, override_settings
 from PIL import Image
 
-from concordia.models import Item
+from concordia.models import Asset, Item
 from concordia.tests.utils import (
     CreateTestUsers,
     create_asset,
@@ -18,7 +20,7 @@ from concordia.tests.utils import (
     create_project,
 )
 from importer import tasks
-from importer.models import ImportItem
+from importer.models import ImportItem, ImportItemAsset
 from importer.tasks.items import (
     _guess_extension,
     download_and_set_item_thumbnail,
@@ -388,6 +390,38 @@ class CreateItemImportTaskTests(TestCase):
         self.assertIn("Unhandled exception: save failed", import_item.status)
 
 
+class GetItemDataTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.item_url = "https://www.loc.gov/item/mss859430021/"
+
+    def tearDown(self):
+        cache.clear()
+
+    @mock.patch("importer.tasks.items.requests.get")
+    def test_prefetched(self, get_mock):
+        cache_key = tasks.items.get_item_data_cache_key(self.item_url)
+        cache.set(cache_key, {"item": {"id": "mss859430021"}})
+
+        self.assertEqual(
+            tasks.items.get_item_data(self.item_url), {"item": {"id": "mss859430021"}}
+        )
+        self.assertFalse(get_mock.called)
+        # The prefetched copy is only used once
+        self.assertIsNone(cache.get(cache_key))
+
+    @mock.patch("importer.tasks.items.requests.get")
+    def test_not_prefetched(self, get_mock):
+        get_mock.return_value.json.return_value = {"item": {"id": "mss859430021"}}
+
+        self.assertEqual(
+            tasks.items.get_item_data(self.item_url), {"item": {"id": "mss859430021"}}
+        )
+        get_mock.assert_called_once_with(
+            self.item_url, params={"fo": "json"}, timeout=30
+        )
+
+
 class ItemImportTests(TestCase):
     def setUp(self):
         self.item_url = "http://example.com"
@@ -443,6 +477,30 @@ class ItemImportTests(TestCase):
             self.assertFalse(download_mock.called)
             self.assertTrue(group_mock.called)
 
+    def test_import_item_batch_download(self):
+        with (
+            mock.patch(
+                "importer.tasks.items.get_asset_urls_from_item_resources"
+            ) as asset_url_mock,
+            mock.patch(
+                "importer.tasks.items.download_item_assets_task.delay"
+            ) as batch_mock,
+            mock.patch("importer.tasks.items.group") as group_mock,
+            mock.patch("importer.tasks.items.flag_enabled") as flag_mock,
+        ):
+            task_mock = mock.MagicMock()
+            task_mock.request.id = "f81d4fae-7dec-11d0-a765-00a0c91e6bf6"
+            flag_mock.return_value = True
+            asset_url_mock.return_value = [
+                ["http://example.com/test.jpg"],
+                self.item_url,
+            ]
+
+            tasks.items.import_item(task_mock, self.import_item)
+            flag_mock.assert_called_with("IMPORT_ITEM_BATCH_DOWNLOAD")
+            batch_mock.assert_called_once_with(self.import_item.pk)
+            self.assertFalse(group_mock.called)
+
     def test_populate_item_from_data(self):
         item = Item(item_url="http://example.com")
         item_info = {
@@ -484,6 +542,181 @@ class ItemImportTests(TestCase):
 
 
 @override_settings(DEFAULT_FILE_STORAGE="django.core.files.storage.FileSystemStorage")
+class ImportItemsBatchTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.job = create_import_job()
+        self.task_mock = mock.MagicMock()
+        self.task_mock.request.id = "f81d4fae-7dec-11d0-a765-00a0c91e6bf6"
+
+        patcher = mock.patch("importer.tasks.items.download_and_set_item_thumbnail")
+        self.thumbnail_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch("importer.tasks.items.create_item_import_task.delay")
+        self.create_item_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch("importer.tasks.items.download_asset_batch_task.delay")
+        self.download_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        cache.clear()
+
+    def prefetch_item(self, item_id, asset_count):
+        item_url = f"https://www.loc.gov/item/{item_id}/"
+        files = [
+            [
+                {
+                    "url": f"https://tile.loc.gov/{item_id}/{i}.jpg",
+                    "height": 100,
+                    "width": 100,
+                    "mimetype": "image/jpeg",
+                }
+            ]
+            for i in range(asset_count)
+        ]
+        cache.set(
+            tasks.items.get_item_data_cache_key(item_url),
+            {
+                "item": {
+                    "id": item_url,
+                    "title": f"Item {item_id}",
+                    "image_url": [f"https://tile.loc.gov/{item_id}/thumb.jpg"],
+                },
+                "resources": [{"url": item_url, "files": files}],
+            },
+        )
+        return item_url
+
+    def test_import_items_batch(self):
+        item_urls = [self.prefetch_item("mss1", 2), self.prefetch_item("mss2", 3)]
+
+        with mock.patch("importer.tasks.items.ASSET_DOWNLOAD_BATCH_SIZE", 2):
+            queued = tasks.items.import_items_batch(self.task_mock, self.job, item_urls)
+
+        self.assertEqual(queued, 5)
+        items = Item.objects.filter(project=self.job.project).order_by("item_id")
+        self.assertEqual([i.item_id for i in items], ["mss1", "mss2"])
+        self.assertEqual(items[0].title, "Item mss1")
+        self.assertEqual(Asset.objects.filter(item__in=items).count(), 5)
+        self.assertEqual(
+            Asset.objects.get(item=items[1], sequence=3).download_url,
+            "https://tile.loc.gov/mss2/2.jpg",
+        )
+
+        import_items = ImportItem.objects.filter(job=self.job)
+        self.assertEqual(import_items.count(), 2)
+        for import_item in import_items:
+            self.assertIsNotNone(import_item.completed)
+            self.assertEqual(str(import_item.task_id), self.task_mock.request.id)
+
+        import_asset_pks = list(
+            ImportItemAsset.objects.filter(import_item__job=self.job)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        self.assertEqual(len(import_asset_pks), 5)
+        self.assertEqual(
+            self.download_mock.call_args_list,
+            [
+                mock.call(import_asset_pks[0:2]),
+                mock.call(import_asset_pks[2:4]),
+                mock.call(import_asset_pks[4:]),
+            ],
+        )
+        self.assertEqual(self.thumbnail_mock.call_count, 2)
+        self.assertFalse(self.create_item_mock.called)
+
+    def test_existing_and_failed_items_queued_individually(self):
+        existing = create_item(project=self.job.project, item_id="mss1")
+        item_urls = [
+            self.prefetch_item(existing.item_id, 1),
+            "https://www.loc.gov/item/mss2/",
+            self.prefetch_item("mss3", 1),
+        ]
+
+        with (
+            mock.patch("importer.tasks.items.requests.get") as get_mock,
+            self.assertLogs("importer.tasks.items", level="WARNING"),
+        ):
+            get_mock.return_value.raise_for_status.side_effect = (
+                requests.exceptions.HTTPError
+            )
+            queued = tasks.items.import_items_batch(
+                self.task_mock, self.job, item_urls, redownload=True
+            )
+
+        self.assertEqual(queued, 1)
+        self.assertEqual(
+            self.create_item_mock.call_args_list,
+            [
+                mock.call(self.job.pk, item_urls[0], True),
+                mock.call(self.job.pk, item_urls[1], True),
+            ],
+        )
+        self.assertTrue(Item.objects.filter(item_id="mss3").exists())
+
+    def test_invalid_assets_fail_import_item(self):
+        item_urls = [self.prefetch_item("mss1", 1), self.prefetch_item("mss2", 1)]
+
+        original_build_item_assets = tasks.items.build_item_assets
+
+        def build_item_assets(item, **kwargs):
+            if item.item_id == "mss1":
+                raise ValidationError("Bad asset")
+            return original_build_item_assets(item, **kwargs)
+
+        with (
+            mock.patch(
+                "importer.tasks.items.build_item_assets", side_effect=build_item_assets
+            ),
+            self.assertLogs("importer.tasks.items", level="WARNING"),
+        ):
+            queued = tasks.items.import_items_batch(self.task_mock, self.job, item_urls)
+
+        self.assertEqual(queued, 1)
+        failed = ImportItem.objects.get(job=self.job, item__item_id="mss1")
+        self.assertIsNotNone(failed.failed)
+        self.assertIsNone(failed.completed)
+        self.assertIn("Bad asset", failed.status)
+
+    def test_failed_batch_queued_individually(self):
+        item_urls = [self.prefetch_item("mss1", 1), self.prefetch_item("mss2", 1)]
+
+        with (
+            mock.patch.object(Asset.objects, "bulk_create", side_effect=IntegrityError),
+            self.assertLogs("importer.tasks.items", level="ERROR"),
+        ):
+            queued = tasks.items.import_items_batch(self.task_mock, self.job, item_urls)
+
+        self.assertEqual(queued, 0)
+        self.assertFalse(Item.objects.filter(item_id__in=["mss1", "mss2"]).exists())
+        self.assertFalse(ImportItem.objects.filter(job=self.job).exists())
+        self.assertEqual(
+            self.create_item_mock.call_args_list,
+            [
+                mock.call(self.job.pk, item_urls[0], False),
+                mock.call(self.job.pk, item_urls[1], False),
+            ],
+        )
+        # The item data is cached again for the individual imports
+        self.assertIsNotNone(
+            cache.get(tasks.items.get_item_data_cache_key(item_urls[0]))
+        )
+        self.assertFalse(self.download_mock.called)
+        self.assertFalse(self.thumbnail_mock.called)
+
+    def test_import_items_batch_task(self):
+        with mock.patch("importer.tasks.items.import_items_batch") as batch_mock:
+            tasks.items.import_items_batch_task(
+                self.job.pk, ["https://www.loc.gov/item/mss1/"]
+            )
+        self.assertEqual(batch_mock.call_args.args[1], self.job)
+        self.assertEqual(
+            batch_mock.call_args.args[2], ["https://www.loc.gov/item/mss1/"]
+        )
+
+
 class DownloadItemThumbnailTests(TestCase):
     class FakeResponse:
         """Minimal streamable response for mocking requests.get(...)."""
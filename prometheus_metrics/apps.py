@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class PrometheusMetricsConfig(AppConfig):
     name = "prometheus_metrics"
     verbose_name = "Prometheus Metrics"
+
+    def ready(self):
+        from . import celery_signals  # NOQA
@@ -0,0 +1,66 @@
+"""
+Cache backends which count hits and misses for the current request.
+
+Use these in place of the usual backends in `settings.CACHES`; they behave
+identically apart from recording lookups into the request's
+`RequestMetrics`, labeled with the cache's alias.
+"""
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends import locmem
+from django_redis import cache as django_redis_cache
+
+from .instrumentation import get_current_metrics
+
+_MISSING = object()
+
+
+class CacheMetricsMixin:
+    _metrics_alias = None
+    _metrics_nested = False
+
+    @property
+    def metrics_alias(self):
+        # Backends aren't told their alias, but each thread has a single
+        # instance per alias so it can be found by identity
+        if self._metrics_alias is None:
+            for alias in settings.CACHES:
+                if caches[alias] is self:
+                    self._metrics_alias = alias
+                    break
+            else:
+                return "<unknown>"
+        return self._metrics_alias
+
+    def _record(self, hits, misses):
+        metrics = get_current_metrics()
+        if metrics is not None and not self._metrics_nested:
+            metrics.record_cache(self.metrics_alias, hits, misses)
+
+    def get(self, key, default=None, *args, **kwargs):
+        value = super().get(key, _MISSING, *args, **kwargs)
+        if value is _MISSING:
+            self._record(0, 1)
+            return default
+        self._record(1, 0)
+        return value
+
+    def get_many(self, keys, *args, **kwargs):
+        keys = list(keys)
+        # Some backends implement get_many by calling get for each key
+        nested, self._metrics_nested = self._metrics_nested, True
+        try:
+            values = super().get_many(keys, *args, **kwargs)
+        finally:
+            self._metrics_nested = nested
+        self._record(len(values), len(keys) - len(values))
+        return values
+
+
+class LocMemCache(CacheMetricsMixin, locmem.LocMemCache):
+    pass
+
+
+class RedisCache(CacheMetricsMixin, django_redis_cache.RedisCache):
+    pass
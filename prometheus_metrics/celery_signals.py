@@ -0,0 +1,70 @@
+"""
+Metrics for Celery tasks, recorded from Celery's signals.
+
+Queue wait is measured from a timestamp added to each message's headers
+when it is published, so it is only recorded for tasks published by a
+process which has these handlers connected.
+"""
+
+import time
+from timeit import default_timer
+
+from celery import signals
+from prometheus_client import Counter, Histogram
+
+from .multiprocess import mark_current_process_dead
+
+PUBLISHED_AT_HEADER = "prometheus_published_at"
+
+task_runtime = Histogram(
+    "celery_task_runtime_seconds",
+    "Histogram of task run time",
+    ["task", "state"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 120, 300, 600, float("inf")),
+)
+task_queue_wait = Histogram(
+    "celery_task_queue_wait_seconds",
+    "Histogram of time between a task being published and starting",
+    ["task"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300, 900, 3600, float("inf")),
+)
+task_retries_total = Counter(
+    "celery_task_retries_total", "Total count of task retries", ["task"]
+)
+
+# Task ID -> start time, for tasks running in this process
+_task_starts = {}
+
+
+@signals.before_task_publish.connect
+def add_published_at(headers=None, **kwargs):
+    if headers is not None:
+        headers[PUBLISHED_AT_HEADER] = time.time()
+
+
+@signals.task_prerun.connect
+def record_task_start(task_id=None, task=None, **kwargs):
+    _task_starts[task_id] = default_timer()
+
+    published_at = getattr(task.request, PUBLISHED_AT_HEADER, None)
+    if published_at is not None:
+        task_queue_wait.labels(task.name).observe(max(time.time() - published_at, 0))
+
+
+@signals.task_postrun.connect
+def record_task_runtime(task_id=None, task=None, state=None, **kwargs):
+    start = _task_starts.pop(task_id, None)
+    if start is not None:
+        task_runtime.labels(task.name, state or "UNKNOWN").observe(
+            default_timer() - start
+        )
+
+
+@signals.task_retry.connect
+def record_task_retry(sender=None, **kwargs):
+    task_retries_total.labels(sender.name).inc()
+
+
+@signals.worker_process_shutdown.connect
+def record_worker_process_exit(**kwargs):
+    mark_current_process_dead()
@@ -0,0 +1,131 @@
+"""
+Per-request collection of database, cache and template timings.
+
+`PrometheusViewInstrumentationMiddleware` starts a `RequestMetrics` for each
+request and makes it available through `get_current_metrics` while the view
+runs. The instrumented cache and template backends in
+`prometheus_metrics.cache` and `prometheus_metrics.templates` record into it,
+and the middleware records every database query through
+`connection.execute_wrapper`.
+"""
+
+from collections import defaultdict
+from contextvars import ContextVar
+from timeit import default_timer
+from typing import Optional
+
+_current_metrics: ContextVar[Optional["RequestMetrics"]] = ContextVar(
+    "prometheus_request_metrics", default=None
+)
+
+
+class RequestMetrics:
+    """
+    Database, cache and template work done while handling one request.
+
+    Queries are grouped by their SQL, before parameters are substituted, so
+    an N+1 pattern shows up as one statement with a large count.
+    """
+
+    def __init__(self):
+        self.query_count = 0
+        self.query_seconds = 0.0
+        # SQL -> [count, total seconds]
+        self.queries = defaultdict(lambda: [0, 0.0])
+        # Cache alias -> [hits, misses]
+        self.cache = defaultdict(lambda: [0, 0])
+        self.template_seconds = 0.0
+        self._template_depth = 0
+
+    def record_query(self, execute, sql, params, many, context):
+        """
+        Time a database query. Used with `connection.execute_wrapper`.
+        """
+        start = default_timer()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = default_timer() - start
+            self.query_count += 1
+            self.query_seconds += duration
+            entry = self.queries[sql]
+            entry[0] += 1
+            entry[1] += duration
+
+    def record_cache(self, alias: str, hits: int, misses: int) -> None:
+        """
+        Record the result of a cache lookup.
+
+        Args:
+            alias (str): Name of the cache in `settings.CACHES`.
+            hits (int): Number of keys which were found.
+            misses (int): Number of keys which were not found.
+        """
+        entry = self.cache[alias]
+        entry[0] += hits
+        entry[1] += misses
+
+    def start_template(self) -> Optional[float]:
+        """
+        Note that a template has started rendering.
+
+        Returns:
+            Optional[float]: The start time if this is the outermost render,
+                otherwise None so templates rendered from within another
+                template aren't counted twice.
+        """
+        self._template_depth += 1
+        if self._template_depth == 1:
+            return default_timer()
+        return None
+
+    def finish_template(self, start: Optional[float]) -> None:
+        """
+        Note that a template started by `start_template` has finished.
+        """
+        self._template_depth -= 1
+        if start is not None:
+            self.template_seconds += default_timer() - start
+
+    def top_queries(self, limit: int) -> list[dict]:
+        """
+        Return the statements which took the most total time.
+
+        Args:
+            limit (int): Maximum number of statements to return.
+
+        Returns:
+            list[dict]: The SQL, execution count and total seconds of each
+                statement, slowest first.
+        """
+        ranked = sorted(self.queries.items(), key=lambda i: i[1][1], reverse=True)
+        return [
+            {"sql": sql, "count": count, "seconds": round(seconds, 6)}
+            for sql, (count, seconds) in ranked[:limit]
+        ]
+
+
+def get_current_metrics() -> Optional[RequestMetrics]:
+    """
+    Return the metrics for the request being handled, if any.
+    """
+    return _current_metrics.get()
+
+
+def start_request_metrics() -> tuple[RequestMetrics, object]:
+    """
+    Start collecting metrics for a new request.
+
+    Returns:
+        tuple: The new `RequestMetrics` and a token to pass to
+            `finish_request_metrics`.
+    """
+    metrics = RequestMetrics()
+    return metrics, _current_metrics.set(metrics)
+
+
+def finish_request_metrics(token) -> None:
+    """
+    Stop collecting metrics for the request started with `token`.
+    """
+    _current_metrics.reset(token)
@@ -1,8 +1,18 @@
+import logging
+from contextlib import ExitStack
 from timeit import default_timer
 
+from django.conf import settings
+from django.db import connections
 from django.utils.deprecation import MiddlewareMixin
 from prometheus_client import Counter, Histogram
 
+from .instrumentation import finish_request_metrics, start_request_metrics
+
+logger = logging.getLogger(__name__)
+
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, float("inf"))
+
 requests_total = Counter(
     "django_http_requests_total",
     "Total count of requests",
@@ -13,6 +23,44 @@ requests_latency = Histogram(
     "Histogram of requests processing time",
     ["status_code", "method", "view"],
 )
+view_db_queries = Histogram(
+    "django_view_db_queries",
+    "Histogram of database queries per request",
+    ["view"],
+    buckets=COUNT_BUCKETS,
+)
+view_db_query_duration = Histogram(
+    "django_view_db_query_duration_seconds",
+    "Histogram of total database query time per request",
+    ["view"],
+)
+view_cache_hits = Histogram(
+    "django_view_cache_hits",
+    "Histogram of cache hits per request",
+    ["view", "cache"],
+    buckets=COUNT_BUCKETS,
+)
+view_cache_misses = Histogram(
+    "django_view_cache_misses",
+    "Histogram of cache misses per request",
+    ["view", "cache"],
+    buckets=COUNT_BUCKETS,
+)
+view_template_render_duration = Histogram(
+    "django_view_template_render_duration_seconds",
+    "Histogram of template rendering time per request",
+    ["view"],
+)
+
+
+def get_view_name(request):
+    resolver_match = getattr(request, "resolver_match", None)
+    if resolver_match:
+        handler = resolver_match.url_name
+        if not handler:
+            handler = resolver_match.view_name
+        return handler.replace("-", "_")
+    return "<unnamed view>"
 
 
 class PrometheusBeforeMiddleware(MiddlewareMixin):
@@ -20,14 +68,7 @@ class PrometheusBeforeMiddleware(MiddlewareMixin):
         request.prometheus_middleware_request_start = default_timer()
 
     def process_response(self, request, response):
-        resolver_match = request.resolver_match
-        if resolver_match:
-            handler = resolver_match.url_name
-            if not handler:
-                handler = resolver_match.view_name
-            handler = handler.replace("-", "_")
-        else:
-            handler = "<unnamed view>"
+        handler = get_view_name(request)
 
         requests_total.labels(response.status_code, request.method, handler).inc()
 
@@ -36,3 +77,60 @@ class PrometheusBeforeMiddleware(MiddlewareMixin):
                 response.status_code, request.method, handler
             ).observe(default_timer() - request.prometheus_middleware_request_start)
         return response
+
+
+class PrometheusViewInstrumentationMiddleware:
+    """
+    Record the database, cache and template work done by each view.
+
+    Query count and time are recorded for every database connection. Cache
+    hits and misses are only recorded for caches using a backend from
+    `prometheus_metrics.cache`, and template time only for the backend in
+    `prometheus_metrics.templates`.
+
+    Requests taking at least `PROMETHEUS_SLOW_REQUEST_SECONDS` are logged
+    with the `PROMETHEUS_SLOW_REQUEST_QUERIES` statements which took the
+    most total time.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = default_timer()
+        metrics, token = start_request_metrics()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(
+                        connection.execute_wrapper(metrics.record_query)
+                    )
+                response = self.get_response(request)
+        finally:
+            finish_request_metrics(token)
+        duration = default_timer() - start
+
+        view = get_view_name(request)
+        view_db_queries.labels(view).observe(metrics.query_count)
+        view_db_query_duration.labels(view).observe(metrics.query_seconds)
+        view_template_render_duration.labels(view).observe(metrics.template_seconds)
+        for alias, (hits, misses) in metrics.cache.items():
+            view_cache_hits.labels(view, alias).observe(hits)
+            view_cache_misses.labels(view, alias).observe(misses)
+
+        if duration >= getattr(settings, "PROMETHEUS_SLOW_REQUEST_SECONDS", 2.0):
+            logger.warning(
+                "Slow request to %s took %.3fs: %d queries in %.3fs, "
+                "%.3fs rendering templates, cache hits/misses %s; top queries: %s",
+                view,
+                duration,
+                metrics.query_count,
+                metrics.query_seconds,
+                metrics.template_seconds,
+                {alias: tuple(counts) for alias, counts in metrics.cache.items()},
+                metrics.top_queries(
+                    getattr(settings, "PROMETHEUS_SLOW_REQUEST_QUERIES", 5)
+                ),
+            )
+
+        return response
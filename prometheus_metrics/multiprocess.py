@@ -0,0 +1,73 @@
+"""
+Aggregation of metrics from every web and Celery process.
+
+prometheus_client keeps metrics in the memory of the process which records
+them, so a scrape normally only sees the process which handled it. When the
+`PROMETHEUS_MULTIPROC_DIR` environment variable is set, prometheus_client
+instead writes every metric to memory-mapped files in that directory.
+
+Each service (the web server, each Celery worker) is given its own
+directory under the `PROMETHEUS_MULTIPROC_ROOT` setting by its entrypoint,
+which empties it on startup. `get_registry` returns a registry which merges
+the files from all of those directories, so one scrape of `MetricsView`
+reports totals across every process of every service.
+"""
+
+import glob
+import os
+
+from django.conf import settings
+from prometheus_client import REGISTRY, CollectorRegistry
+from prometheus_client.multiprocess import MultiProcessCollector, mark_process_dead
+
+from .queues import get_queue_length_collector
+
+
+class MultiDirectoryCollector:
+    """
+    Merge the metric files from every subdirectory of a directory.
+
+    This is `prometheus_client.multiprocess.MultiProcessCollector` extended
+    to several directories, so services which don't share a process
+    namespace can't overwrite each other's files.
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def collect(self):
+        files = glob.glob(os.path.join(self.root, "*", "*.db"))
+        return MultiProcessCollector.merge(files, accumulate=True)
+
+
+def get_registry():
+    """
+    Return the registry to expose from the metrics endpoint.
+
+    Returns:
+        CollectorRegistry: A registry merging every process's metrics if
+            `PROMETHEUS_MULTIPROC_ROOT` is set, otherwise reporting the
+            metrics of this process, plus the Celery queue lengths.
+    """
+    registry = CollectorRegistry(auto_describe=False)
+    root = getattr(settings, "PROMETHEUS_MULTIPROC_ROOT", "")
+    if root:
+        registry.register(MultiDirectoryCollector(root))
+    else:
+        registry.register(REGISTRY)
+
+    queue_collector = get_queue_length_collector()
+    if queue_collector is not None:
+        registry.register(queue_collector)
+    return registry
+
+
+def mark_current_process_dead():
+    """
+    Remove the live gauge files of this process as it exits.
+
+    Counters and histograms are left in place so totals don't go backwards
+    when a worker process is replaced.
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        mark_process_dead(os.getpid())
@@ -0,0 +1,73 @@
+"""
+Lengths of the Celery broker queues, read when metrics are scraped.
+
+Queue lengths are read by the process serving the scrape rather than by a
+periodic task. A task would wait in the very backlog it is measuring.
+"""
+
+import logging
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+from kombu.exceptions import ChannelError, OperationalError
+from prometheus_client.core import GaugeMetricFamily
+
+logger = logging.getLogger(__name__)
+
+
+class QueueLengthCollector:
+    """
+    Report the number of messages waiting in each queue of a Celery app.
+
+    The queues are the app's default queue plus any named in its
+    `task_routes`.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    def get_queue_names(self):
+        names = {self.app.conf.task_default_queue}
+        routes = self.app.conf.task_routes or {}
+        if isinstance(routes, dict):
+            names.update(
+                route["queue"] for route in routes.values() if "queue" in route
+            )
+        return sorted(names)
+
+    def collect(self):
+        family = GaugeMetricFamily(
+            "celery_queue_length",
+            "Number of messages waiting in each Celery queue",
+            labels=["queue"],
+        )
+        try:
+            with self.app.connection_for_read() as connection:
+                channel = connection.default_channel
+                for name in self.get_queue_names():
+                    try:
+                        length = channel.queue_declare(
+                            queue=name, passive=True
+                        ).message_count
+                    except ChannelError:
+                        # Redis removes empty lists, so empty queues don't exist
+                        length = 0
+                    family.add_metric([name], length)
+        except (OperationalError, OSError):
+            logger.exception("Unable to read Celery queue lengths")
+            return
+        yield family
+
+
+def get_queue_length_collector():
+    """
+    Return a collector for the app named by `PROMETHEUS_CELERY_APP`.
+
+    Returns:
+        Optional[QueueLengthCollector]: The collector, or None if the setting
+            is empty.
+    """
+    app_path = getattr(settings, "PROMETHEUS_CELERY_APP", "")
+    if not app_path:
+        return None
+    return QueueLengthCollector(import_string(app_path))
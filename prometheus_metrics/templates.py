@@ -0,0 +1,32 @@
+"""
+Django template backend which times rendering for the current request.
+
+Use `prometheus_metrics.templates.DjangoTemplates` as the `BACKEND` in
+`settings.TEMPLATES`. Only the outermost render is timed, so templates
+rendered from template tags are included in their parent's time.
+"""
+
+from django.template.backends import django as django_backend
+
+from .instrumentation import get_current_metrics
+
+
+class Template(django_backend.Template):
+    def render(self, context=None, request=None):
+        metrics = get_current_metrics()
+        if metrics is None:
+            return super().render(context, request)
+
+        start = metrics.start_template()
+        try:
+            return super().render(context, request)
+        finally:
+            metrics.finish_template(start)
+
+
+class DjangoTemplates(django_backend.DjangoTemplates):
+    def from_string(self, template_code):
+        return Template(super().from_string(template_code).template, self)
+
+    def get_template(self, template_name):
+        return Template(super().get_template(template_name).template, self)
@@ -2,10 +2,12 @@ import prometheus_client
 from django.http import HttpResponse
 from django.views import View
 
+from .multiprocess import get_registry
+
 
 class MetricsView(View):
     def get(self, request, *args, **kwargs):
-        metrics_page = prometheus_client.generate_latest()
+        metrics_page = prometheus_client.generate_latest(get_registry())
         return HttpResponse(
             metrics_page, content_type=prometheus_client.CONTENT_TYPE_LATEST
         )
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+XLSX Export Benchmark
+
+Compares the buffered xlsxwriter export (`export_to_excel_response`) with the
+streaming export used by the admin "Export to Excel" action
+(`export_to_streaming_excel_response`) on synthetic rows shaped like an asset
+export: text, integers, a status, a URL, a timestamp and a transcription.
+
+For each writer it reports wall time, the peak Python heap allocation
+(tracemalloc) while producing the response, the size of the largest single
+chunk held at once and the total file size.
+
+Run from the repository root:
+
+    python tools/benchmark_xlsx_export.py            # 1,000,000 rows
+    python tools/benchmark_xlsx_export.py --rows 50000
+
+Note that tracemalloc slows both writers down considerably; use
+`--no-tracemalloc` for wall-time comparisons.
+"""
+
+import argparse
+import datetime
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from django.conf import settings  # noqa: E402
+
+settings.configure(DEFAULT_CHARSET="utf-8", USE_TZ=True)
+
+from exporter.tabular_export.core import (  # noqa: E402
+    export_to_excel_response,
+    export_to_streaming_excel_response,
+)
+
+HEADERS = [
+    "Campaign",
+    "Project",
+    "Item",
+    "AssetId",
+    "AssetStatus",
+    "DownloadUrl",
+    "Created",
+    "Transcription",
+]
+
+
+def generate_rows(count: int) -> Iterator[list[Any]]:
+    """
+    Yield `count` synthetic export rows.
+    """
+    created = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    for i in range(count):
+        yield [
+            "Benchmark Campaign",
+            "Project %d" % (i // 10000),
+            "item-%d" % (i // 20),
+            i,
+            ("not_started", "in_progress", "submitted", "completed")[i % 4],
+            "https://tile.loc.gov/image-services/iiif/service:mss:%d/default.jpg" % i,
+            created + datetime.timedelta(minutes=i),
+            "Dear Sir, I write to you regarding the matter of line %d." % i,
+        ]
+
+
+def consume(response) -> tuple[int, int]:
+    """
+    Read a response the way a WSGI server would.
+
+    Returns the total number of bytes and the size of the largest chunk.
+    """
+    if response.streaming:
+        total = largest = 0
+        for chunk in response.streaming_content:
+            total += len(chunk)
+            largest = max(largest, len(chunk))
+        return total, largest
+
+    content = response.content
+    return len(content), len(content)
+
+
+def run(
+    name: str,
+    export: Callable[..., Any],
+    rows: int,
+    use_tracemalloc: bool,
+) -> None:
+    """
+    Time one export and print a result line.
+    """
+    if use_tracemalloc:
+        tracemalloc.start()
+
+    start = time.perf_counter()
+    total, largest = consume(export("benchmark.xlsx", HEADERS, generate_rows(rows)))
+    elapsed = time.perf_counter() - start
+
+    peak = None
+    if use_tracemalloc:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    print(
+        "%-10s rows=%d time=%.1fs size=%.1fMiB largest_chunk=%.1fMiB%s"
+        % (
+            name,
+            rows,
+            elapsed,
+            total / 2**20,
+            largest / 2**20,
+            "" if peak is None else " peak_heap=%.1fMiB" % (peak / 2**20),
+        )
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--no-tracemalloc", action="store_true")
+    parser.add_argument(
+        "--writer",
+        choices=("both", "buffered", "streaming"),
+        default="both",
+    )
+    args = parser.parse_args()
+
+    if args.writer in ("both", "buffered"):
+        run("buffered", export_to_excel_response, args.rows, not args.no_tracemalloc)
+    if args.writer in ("both", "streaming"):
+        run(
+            "streaming",
+            export_to_streaming_excel_response,
+            args.rows,
+            not args.no_tracemalloc,
+        )
+
+
+if __name__ == "__main__":
+    main()